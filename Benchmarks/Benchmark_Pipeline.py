@@ -0,0 +1,267 @@
+"""
+Benchmark del pipeline de limpieza sobre datos sintéticos a escala.
+
+Mide tiempo (mejor de N repeticiones) y pico de memoria (tracemalloc) de:
+- Cada estrategia de DataCleaner
+- Cada método de DataAnalyzer
+- CleaningReport.get_cleaning_summary
+- DataDiff (diferencias fila a fila por índice y por clave)
+- StrategyEvaluator.evaluate (las cinco estrategias básicas sobre una entrada compartida)
+- CSVManager.load_csv / save_csv
+- Escritores de salida (CSV gzip y formato por columnas) frente a DataFrame.to_csv
+- StarSchema.write / load (esquema en estrella)
+- SampledAnalyzer (análisis aproximado del CSV por bloques)
+- SQLiteStorage.write (carga por lotes en SQLite)
+
+Los resultados se guardan como JSON y se pueden comparar con una línea base:
+los casos que empeoran más que el umbral se marcan como regresión y el
+proceso termina con código 1.
+
+Uso:
+    python Benchmarks/Benchmark_Pipeline.py --rows 10000 1000000 --save
+    python Benchmarks/Benchmark_Pipeline.py --rows 10000 --compare --threshold 0.25
+    python Benchmarks/Benchmark_Pipeline.py --compare otra_maquina.json
+
+Con 10M+ filas sin tipos el limpiador necesita varias copias del DataFrame
+(~1.5 GB cada una); --schema auto reduce la memoria con tipos categóricos.
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from Clean.analyzer import DataAnalyzer, DataProfile, SampledAnalyzer
+from Clean.cleaner import DataCleaner, StreamingCleaner
+from Clean.csv_manager import CSVManager
+from Clean.evaluation import StrategyEvaluator
+from Clean.export import StarSchema
+from Clean.writer import CSVWriter, ColumnarWriter
+from Clean.report import CleaningReport, DataDiff
+from Clean.storage import SQLiteStorage
+from SyntheticQualifying import generate
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(PROJECT_ROOT, "Benchmarks", "baselines", "pipeline.json")
+DEFAULT_ROWS = [10_000, 1_000_000, 10_000_000]
+STRATEGIES = StreamingCleaner.STRATEGIES + ['fill_group_mean', 'fill_group_median', 'fill_group_mode']
+ANALYZER_METHODS = ['analyze_null_values', 'get_data_quality_score', 'get_columns_by_null_percentage',
+                    'get_basic_statistics']
+
+
+def _fresh(data):
+    """Descarta el perfil memorizado para medir el cálculo completo."""
+    DataProfile.invalidate(data)
+    return data
+
+
+def build_cases(data, work_dir, schema=None):
+    """
+    Casos del benchmark: nombre -> función sin argumentos.
+
+    Args:
+        data (pd.DataFrame): Datos sintéticos
+        work_dir (str): Carpeta temporal para los CSV de load/save
+        schema: Esquema de carga de CSVManager.load_csv
+
+    Returns:
+        dict: Casos a medir
+    """
+    cases = {}
+    for strategy in STRATEGIES:
+        cases[f'DataCleaner.{strategy}'] = (
+            lambda strategy=strategy: DataCleaner(_fresh(data)).clean_data(strategy=strategy))
+
+    for method in ANALYZER_METHODS:
+        cases[f'DataAnalyzer.{method}'] = (
+            lambda method=method: getattr(DataAnalyzer(_fresh(data)), method)())
+
+    cleaned = DataCleaner(data).clean_data(strategy='remove_rows')
+    cases['CleaningReport.get_cleaning_summary'] = (
+        lambda: CleaningReport(_fresh(data), _fresh(cleaned)).get_cleaning_summary())
+    filled = DataCleaner(data).clean_data(strategy='fill_mean')
+    cases['DataDiff.index'] = lambda: DataDiff(data, filled).summary()
+    cases['DataDiff.key'] = lambda: DataDiff(data, filled, key=['Season', 'Round', 'DriverID']).summary()
+    cases['StrategyEvaluator.evaluate'] = lambda: StrategyEvaluator().evaluate(_fresh(data))
+
+    csv_path = os.path.join(work_dir, 'synthetic.csv')
+    cases['CSVManager.save_csv'] = lambda: CSVManager.save_csv(data, csv_path, show_preview=False)
+    cases['CSVManager.load_csv'] = lambda: CSVManager.load_csv(csv_path, schema=schema, use_cache=False)
+    cases['SampledAnalyzer.block'] = lambda: SampledAnalyzer(csv_path, seed=0).analyze_null_values()
+    cases['DataFrame.to_csv'] = lambda: data.to_csv(csv_path + '.plain', index=False)
+    cases['DataFrame.to_csv(gzip)'] = lambda: data.to_csv(csv_path + '.plain.gz', index=False)
+    cases['CSVWriter(gzip).write'] = lambda: CSVWriter('gzip').write(data, csv_path + '.gz')
+    cases['ColumnarWriter.write'] = lambda: ColumnarWriter().write(data, os.path.join(work_dir, 'synthetic.npz'))
+    star_dir = os.path.join(work_dir, 'star')
+    cases['StarSchema.write'] = lambda: StarSchema().write(data, star_dir)
+    cases['StarSchema.load'] = lambda: StarSchema.load(star_dir, lap_times='ms', categorical=True)
+    db_path = os.path.join(work_dir, 'synthetic.db')
+    cases['SQLiteStorage.write'] = lambda: SQLiteStorage(db_path).write(data, mode='replace')
+    return cases
+
+
+def measure(function, repeat=3):
+    """
+    Mide una función: mejor tiempo de `repeat` ejecuciones y pico de memoria
+    de una ejecución adicional bajo tracemalloc (que ralentiza el código).
+
+    Returns:
+        dict: seconds y peak_mb
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = function()
+        timings.append(time.perf_counter() - start)
+        del result
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {'seconds': min(timings), 'peak_mb': peak / 1024 ** 2}
+
+
+def run(rows_list=None, repeat=3, schema=None, seed=0):
+    """
+    Ejecuta el benchmark para cada tamaño.
+
+    Args:
+        rows_list (list): Tamaños (filas) a medir
+        repeat (int): Repeticiones de tiempo por caso (1 a partir de 5M filas)
+        schema: None (tipos de pd.read_csv) o 'auto' (tipos compactos)
+        seed (int): Semilla del generador sintético
+
+    Returns:
+        dict: Metadatos y resultados {filas: {caso: {seconds, peak_mb}}}
+    """
+    rows_list = rows_list or DEFAULT_ROWS
+    results = {}
+    work_dir = tempfile.mkdtemp(prefix='f1_bench_')
+    try:
+        for rows in rows_list:
+            print(f"\n🏗️  Generando {rows:,} filas sintéticas...")
+            data = generate(rows, seed=seed, schema=schema)
+            cases = build_cases(data, work_dir, schema=schema)
+            # save_csv va antes que load_csv: la carga lee el archivo guardado
+            results[str(rows)] = {}
+            print(f"{'caso':<46}{'tiempo (s)':>12}{'pico (MB)':>12}")
+            for name, function in cases.items():
+                measurement = measure(function, repeat if rows < 5_000_000 else 1)
+                results[str(rows)][name] = measurement
+                print(f"{name:<46}{measurement['seconds']:>12.4f}{measurement['peak_mb']:>12.1f}")
+            del data, cases
+            gc.collect()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'schema': schema,
+        'repeat': repeat,
+        'environment': {
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+        },
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold=0.25, min_seconds=0.005, min_mb=1.0):
+    """
+    Compara unos resultados con una línea base.
+
+    Args:
+        current (dict): Resultados de run()
+        baseline (dict): Resultados guardados
+        threshold (float): Empeoramiento relativo tolerado (0.25 = 25%)
+        min_seconds (float): Diferencia mínima de tiempo para considerarla (ruido)
+        min_mb (float): Diferencia mínima de memoria para considerarla
+
+    Returns:
+        list: Regresiones (filas, caso, métrica, base, actual, ratio)
+    """
+    regressions = []
+    for rows, cases in current['results'].items():
+        for name, measurement in cases.items():
+            base = baseline.get('results', {}).get(rows, {}).get(name)
+            if base is None:
+                continue
+            for metric, minimum in (('seconds', min_seconds), ('peak_mb', min_mb)):
+                old, new = base[metric], measurement[metric]
+                if new - old > minimum and new > old * (1 + threshold):
+                    regressions.append({'rows': int(rows), 'case': name, 'metric': metric,
+                                        'baseline': old, 'current': new,
+                                        'ratio': new / old if old else float('inf')})
+    return regressions
+
+
+def print_comparison(regressions, threshold):
+    """Imprime las regresiones encontradas."""
+    if not regressions:
+        print(f"\n✅ Sin regresiones (umbral {threshold:.0%})")
+        return
+    print(f"\n❌ {len(regressions)} regresiones (umbral {threshold:.0%}):")
+    for item in regressions:
+        print(f"  - {item['case']} [{item['rows']:,} filas] {item['metric']}: "
+              f"{item['baseline']:.4f} -> {item['current']:.4f} ({item['ratio']:.2f}x)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark del pipeline de limpieza sobre datos sintéticos")
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS, help="Tamaños a medir")
+    parser.add_argument('--repeat', type=int, default=3, help="Repeticiones de tiempo por caso")
+    parser.add_argument('--schema', default=None, help="Esquema de tipos ('auto' para tipos compactos)")
+    parser.add_argument('--seed', type=int, default=0, help="Semilla del generador sintético")
+    parser.add_argument('--save', metavar='JSON', nargs='?', const=DEFAULT_BASELINE,
+                        help="Guardar los resultados como línea base (por defecto Benchmarks/baselines/pipeline.json)")
+    parser.add_argument('--compare', metavar='JSON', nargs='?', const=DEFAULT_BASELINE,
+                        help="Comparar con una línea base (por defecto Benchmarks/baselines/pipeline.json)")
+    parser.add_argument('--threshold', type=float, default=0.25, help="Empeoramiento tolerado (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    current = run(args.rows, repeat=args.repeat, schema=args.schema, seed=args.seed)
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+        print(f"\n💾 Línea base guardada en {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold)
+        print_comparison(regressions, args.threshold)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Micro-benchmark de las consultas indexadas (QualifyingIndex) frente a
+máscaras booleanas sobre el DataFrame completo.
+
+Uso:
+    python Benchmarks/Benchmark_QualifyingIndex.py [filas]   (por defecto 10.000.000)
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Extract.QualifyingIndex import QualifyingIndex
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_CSV = os.path.join(PROJECT_ROOT, "Sources", "qualifying_results.csv")
+COLUMNS = ['Season', 'Round', 'CircuitID', 'Position', 'DriverID', 'ConstructorID', 'Q1']
+QUERIES_PER_KIND = 20
+
+
+def build_dataset(rows):
+    """
+    Repite el dataset real hasta `rows` filas desplazando las temporadas en
+    cada copia, de modo que los datos siguen ordenados por (Season, Round).
+    """
+    source = pd.read_csv(SOURCE_CSV, usecols=COLUMNS)
+    copies = rows // len(source) + 1
+    season_span = int(source['Season'].max() - source['Season'].min() + 1)
+    data = pd.DataFrame({col: np.tile(source[col].to_numpy(), copies)[:rows] for col in COLUMNS})
+    data['Season'] += np.repeat(np.arange(copies) * season_span, len(source))[:rows]
+    return data
+
+
+def naive(data, season=None, round=None, driver=None, constructor=None):
+    """Consulta con máscaras booleanas sobre todas las filas."""
+    mask = np.ones(len(data), dtype=bool)
+    if season is not None:
+        first, last = season if isinstance(season, tuple) else (season, season)
+        mask &= (data['Season'] >= first).to_numpy() & (data['Season'] <= last).to_numpy()
+    if round is not None:
+        mask &= (data['Round'] == round).to_numpy()
+    if driver is not None:
+        mask &= (data['DriverID'] == driver).to_numpy()
+    if constructor is not None:
+        mask &= (data['ConstructorID'] == constructor).to_numpy()
+    return data[mask]
+
+
+def run(rows=10_000_000, seed=0):
+    """
+    Ejecuta el benchmark e imprime los tiempos medios por consulta.
+
+    Returns:
+        dict: Tiempos medios (ms) por tipo de consulta para índice y máscara
+    """
+    print(f"🏗️  Generando {rows:,} filas...")
+    data = build_dataset(rows)
+
+    start = time.perf_counter()
+    index = QualifyingIndex(data)
+    print(f"🗂️  Índices construidos en {time.perf_counter() - start:.2f}s")
+
+    rng = np.random.default_rng(seed)
+    seasons = data['Season'].unique()
+    drivers = data['DriverID'].unique()
+    constructors = data['ConstructorID'].unique()
+
+    kinds = {
+        'grid (season, round)': lambda: {'season': int(rng.choice(seasons)), 'round': int(rng.integers(1, 16))},
+        'season range': lambda: (lambda s: {'season': (s, s + 2)})(int(rng.choice(seasons))),
+        'driver history': lambda: {'driver': rng.choice(drivers)},
+        'constructor season': lambda: {'season': int(rng.choice(seasons)), 'constructor': rng.choice(constructors)},
+        'driver + season range': lambda: (lambda s: {'season': (s, s + 10), 'driver': rng.choice(drivers)})(
+            int(rng.choice(seasons))),
+    }
+
+    results = {}
+    print(f"\n{'consulta':<24}{'índice (ms)':>14}{'máscara (ms)':>14}{'aceleración':>13}")
+    for kind, make_filters in kinds.items():
+        filters = [make_filters() for _ in range(QUERIES_PER_KIND)]
+
+        start = time.perf_counter()
+        indexed = [index.query(**f) for f in filters]
+        index_ms = (time.perf_counter() - start) / len(filters) * 1000
+
+        start = time.perf_counter()
+        masked = [naive(data, **f) for f in filters]
+        naive_ms = (time.perf_counter() - start) / len(filters) * 1000
+
+        for got, expected in zip(indexed, masked):
+            assert got.equals(expected), f"Resultados distintos en '{kind}'"
+        results[kind] = {'index_ms': index_ms, 'naive_ms': naive_ms}
+        print(f"{kind:<24}{index_ms:>14.3f}{naive_ms:>14.1f}{naive_ms / index_ms:>12.0f}x")
+    return results
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -0,0 +1,71 @@
+"""
+Benchmark del arranque en frío de la línea de comandos.
+
+Cada caso se ejecuta como un proceso nuevo de Python (mejor de N
+repeticiones), midiendo el tiempo hasta que el proceso termina:
+- import Clean (carga perezosa, sin pandas)
+- python -m Clean --help
+- python -m Clean analyze ... --quiet (primera salida útil)
+- from Clean import CSVManager (importación completa, como referencia)
+
+Uso:
+    python Benchmarks/Benchmark_Startup.py [--repeat 5]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_CSV = os.path.join("Sources", "qualifying_results.csv")
+
+CASES = {
+    'python (sin imports)': ['-c', 'pass'],
+    'import Clean': ['-c', 'import Clean'],
+    'python -m Clean --help': ['-m', 'Clean', '--help'],
+    'python -m Clean analyze --quiet': ['-m', 'Clean', 'analyze', SOURCE_CSV, '--quiet'],
+    'from Clean import CSVManager': ['-c', 'from Clean import CSVManager'],
+}
+
+
+def measure(arguments, repeat=5):
+    """
+    Mejor tiempo de `repeat` ejecuciones de `python <arguments>` desde la raíz del proyecto.
+
+    Returns:
+        float: Segundos
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *arguments], cwd=PROJECT_ROOT, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(repeat=5):
+    """
+    Returns:
+        dict: caso -> segundos
+    """
+    results = {}
+    print(f"{'caso':<40}{'tiempo (s)':>12}")
+    for name, arguments in CASES.items():
+        results[name] = measure(arguments, repeat)
+        print(f"{name:<40}{results[name]:>12.3f}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark del arranque de python -m Clean")
+    parser.add_argument('--repeat', type=int, default=5, help="Repeticiones por caso")
+    args = parser.parse_args(argv)
+    run(args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
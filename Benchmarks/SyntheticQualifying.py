@@ -0,0 +1,129 @@
+"""
+Generador de datos sintéticos con el esquema y los patrones de nulos de
+Sources/qualifying_results.csv, a cualquier escala (10k, 1M, 10M+ filas).
+
+Se remuestrean carreras completas del dataset real, de modo que cada
+parrilla conserva su época: los códigos de piloto ausentes (Code nulo) y
+los marcadores "0" de Q2/Q3 siguen el mismo patrón que en los datos
+originales. Cada carrera sintética recibe una clave (Season, Round) nueva y
+ordenada, y los tiempos de vuelta se perturban unos milisegundos para que
+no sean copias exactas.
+
+Uso:
+    python Benchmarks/SyntheticQualifying.py filas salida.csv [semilla]
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Clean.schema import LapTimeParser, SchemaRegistry
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_CSV = os.path.join(PROJECT_ROOT, "Sources", "qualifying_results.csv")
+FIRST_SEASON = 2000
+ROUNDS_PER_SEASON = 24
+JITTER_MS = 400
+
+_source = None
+
+
+def _load_source():
+    """Dataset real (texto, como lo lee pd.read_csv) y sus tiempos en milisegundos."""
+    global _source
+    if _source is None:
+        data = pd.read_csv(SOURCE_CSV)
+        times = {col: LapTimeParser.parse(data[col]).to_numpy(dtype='float64', na_value=np.nan)
+                 for col in LapTimeParser.LAP_TIME_COLUMNS}
+        starts = np.flatnonzero(np.r_[True, (data['Season'].to_numpy()[1:] != data['Season'].to_numpy()[:-1])
+                                      | (data['Round'].to_numpy()[1:] != data['Round'].to_numpy()[:-1])])
+        lengths = np.diff(np.r_[starts, len(data)])
+        _source = (data, times, starts, lengths)
+    return _source
+
+
+def generate(rows, seed=0, schema=None):
+    """
+    Genera `rows` filas sintéticas.
+
+    Args:
+        rows (int): Número de filas
+        seed (int): Semilla del generador aleatorio
+        schema: None (tipos de pd.read_csv, texto como object) o 'auto'/nombre
+            de esquema para aplicar los tipos de SchemaRegistry
+
+    Returns:
+        pd.DataFrame: Datos con las 17 columnas de qualifying_results.csv
+    """
+    data, times, starts, lengths = _load_source()
+    rng = np.random.default_rng(seed)
+
+    # Carreras reales elegidas al azar hasta cubrir las filas pedidas
+    races = rng.integers(0, len(starts), size=rows // int(lengths.min()) + 1)
+    race_lengths = lengths[races]
+    races = races[:int(np.searchsorted(np.cumsum(race_lengths), rows)) + 1]
+    race_lengths = race_lengths[:len(races)]
+
+    # Posiciones de las filas de cada carrera (sin bucles por carrera)
+    race_offsets = np.repeat(np.cumsum(race_lengths) - race_lengths, race_lengths)
+    positions = (np.repeat(starts[races], race_lengths) + np.arange(race_lengths.sum()) - race_offsets)[:rows]
+    race_numbers = np.repeat(np.arange(len(races)), race_lengths)[:rows]
+
+    result = {}
+    for col in data.columns:
+        if col == 'Season':
+            result[col] = (FIRST_SEASON + race_numbers // ROUNDS_PER_SEASON).astype(np.int64)
+        elif col == 'Round':
+            result[col] = (race_numbers % ROUNDS_PER_SEASON + 1).astype(np.int64)
+        elif col in times:
+            milliseconds = times[col][positions]
+            milliseconds += rng.integers(-JITTER_MS, JITTER_MS + 1, size=rows)
+            # El formato devuelve los nulos como el marcador "0", igual que el CSV real
+            result[col] = LapTimeParser.format(pd.array(milliseconds.round(), dtype='Int64')).to_numpy()
+        else:
+            result[col] = data[col].to_numpy()[positions]
+    synthetic = pd.DataFrame(result, columns=data.columns)
+
+    if schema is not None:
+        dataset_schema = SchemaRegistry.resolve(schema, SOURCE_CSV)
+        synthetic = dataset_schema.apply(synthetic, copy=False)
+    return synthetic
+
+
+def write_csv(rows, path, seed=0, chunk_rows=1_000_000):
+    """
+    Escribe un CSV sintético por bloques (para no tener 10M+ filas en memoria).
+
+    Args:
+        rows (int): Número de filas
+        path (str): Ruta del CSV de salida
+        seed (int): Semilla del generador aleatorio
+        chunk_rows (int): Filas generadas por bloque
+
+    Returns:
+        str: Ruta del CSV escrito
+    """
+    # Temporadas que puede ocupar un bloque: se desplazan para que las claves no se repitan
+    seasons_per_block = chunk_rows // int(_load_source()[3].min()) // ROUNDS_PER_SEASON + 1
+    written = 0
+    block = 0
+    while written < rows or block == 0:
+        chunk = generate(min(chunk_rows, rows - written), seed=seed + block)
+        chunk['Season'] += block * seasons_per_block
+        chunk.to_csv(path, mode='w' if block == 0 else 'a', header=block == 0, index=False)
+        written += len(chunk)
+        block += 1
+    return path
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+    output = write_csv(int(sys.argv[1]), sys.argv[2], int(sys.argv[3]) if len(sys.argv) > 3 else 0)
+    print(f"💾 {int(sys.argv[1]):,} filas sintéticas guardadas en {output}")
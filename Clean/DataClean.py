@@ -20,21 +20,27 @@ class DataClean:
     Esta clase actúa como un wrapper que usa internamente los módulos especializados.
     """
     
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, lean=False, verbose=False):
         """
         Inicializa la clase DataClean con un DataFrame.
         
         Args:
             data (pd.DataFrame): Los datos a limpiar
+            lean (bool): Modo ligero: limpia `data` en el sitio sin copias y
+                conserva solo una instantánea compacta de los datos originales
+            verbose (bool): Si mostrar los consejos de migración a las clases modulares
         """
-        print("💡 Consejo: Para nuevos proyectos considera usar las clases modulares especializadas.")
+        self.verbose = verbose
+        if verbose:
+            print("💡 Consejo: Para nuevos proyectos considera usar las clases modulares especializadas.")
         
-        self.data = data.copy()
+        self.data = data if lean else data.copy()
         self.original_shape = data.shape
         
-        # Usar las nuevas clases modulares internamente
-        self._analyzer = DataAnalyzer(data)
-        self._cleaner = DataCleaner(data)
+        # Usar las nuevas clases modulares internamente; el analizador y el reporte
+        # comparten el mismo DataFrame original y, por tanto, su perfil memorizado
+        self._cleaner = DataCleaner(data, lean=lean)
+        self._analyzer = DataAnalyzer(self._cleaner.original_data)
         
     def analyze_null_values(self):
         """Método de compatibilidad - usa DataAnalyzer internamente"""
@@ -54,17 +60,27 @@ class DataClean:
         """Método de compatibilidad"""
         return self.data
     
+    def get_original_data(self):
+        """Datos originales (reconstruidos desde la instantánea en modo ligero)"""
+        return self._cleaner.get_original_data()
+    
+    def get_original_snapshot(self):
+        """Instantánea compacta de los datos originales (solo en modo ligero, si no None)"""
+        return self._cleaner.original_data if self._cleaner.lean else None
+    
     def print_null_analysis(self):
         """Método de compatibilidad - usa DataAnalyzer internamente"""
         self._analyzer.print_null_analysis()
     
     def generate_clean_csv(self, csv_filename, strategy='remove_rows', threshold=0.5):
         """Método de compatibilidad - usa CSVManager internamente"""
-        print("💡 Consejo: Usa CSVManager.process_csv_file() para mayor funcionalidad")
+        if self.verbose:
+            print("💡 Consejo: Usa CSVManager.process_csv_file() para mayor funcionalidad")
         return CSVManager.process_csv_file(csv_filename, strategy, threshold, show_detailed_report=False)
     
     @staticmethod
-    def process_csv_file(csv_filename, strategy='remove_rows', threshold=0.5):
-        """Método de compatibilidad - usa CSVManager internamente"""
-        print("💡 Consejo: Usa CSVManager.process_csv_file() directamente")
+    def process_csv_file(csv_filename, strategy='remove_rows', threshold=0.5, verbose=False):
+        """Método de compatibilidad - usa CSVManager internamente (verbose muestra el consejo de migración)"""
+        if verbose:
+            print("💡 Consejo: Usa CSVManager.process_csv_file() directamente")
         return CSVManager.process_csv_file(csv_filename, strategy, threshold, show_detailed_report=False)
\ No newline at end of file
@@ -11,14 +11,22 @@ Estructura modular:
 Uso recomendado:
     from Clean.csv_manager import CSVManager
     CSVManager.process_csv_file("archivo.csv")
+
+Línea de comandos:
+    python -m Clean {analyze,clean,report,batch} ...
 """
 
-# Importaciones principales para facilidad de uso
-from .analyzer import DataAnalyzer
-from .cleaner import DataCleaner
-from .report import CleaningReport
-from .csv_manager import CSVManager
-from .DataClean import DataClean  # Clase unificada con compatibilidad
+import importlib
+
+# Las clases principales se importan en el primer acceso (Clean.CSVManager,
+# from Clean import DataCleaner...): importar el paquete no carga pandas
+_LAZY_IMPORTS = {
+    'DataAnalyzer': '.analyzer',
+    'DataCleaner': '.cleaner',
+    'CleaningReport': '.report',
+    'CSVManager': '.csv_manager',
+    'DataClean': '.DataClean',  # Clase unificada con compatibilidad
+}
 
 __all__ = [
     'DataAnalyzer',
@@ -26,4 +34,16 @@ __all__ = [
     'CleaningReport',
     'CSVManager',
     'DataClean'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
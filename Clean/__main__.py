@@ -0,0 +1,340 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+
+
+def _quiet_output(quiet):
+    """Descarta la salida de las clases del módulo en modo silencioso."""
+    return contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext()
+
+
+def _load(path, schema, quiet):
+    """Carga un CSV desde una ruta relativa al directorio actual o absoluta."""
+    from .csv_manager import CSVManager
+
+    with _quiet_output(quiet):
+        data = CSVManager.load_csv(os.path.abspath(path), schema=schema)
+    if data is None:
+        print(f"❌ Error: No se pudo cargar {path}", file=sys.stderr)
+    return data
+
+
+def analyze(args):
+    """Subcomando analyze: calidad de los datos de un CSV."""
+    if args.sample:
+        return analyze_sample(args)
+
+    data = _load(args.csv, args.schema, args.quiet)
+    if data is None:
+        return 1
+
+    from .analyzer import DataAnalyzer
+    analyzer = DataAnalyzer(data)
+    if args.quiet:
+        profile = analyzer.profile
+        print(f"{args.csv}: {profile.total_rows} filas, {len(profile.columns)} columnas, "
+              f"{profile.total_nulls} nulos, calidad {profile.quality_score:.2f}%")
+        return 0
+
+    print("\n📄 Vista previa de datos:")
+    print(data.head())
+    analyzer.print_null_analysis()
+    print(f"\n🎯 Puntuación de calidad: {analyzer.get_data_quality_score():.2f}%")
+    return 0
+
+
+def analyze_sample(args):
+    """analyze --sample: calidad aproximada a partir de una muestra, sin cargar el CSV."""
+    from .analyzer import SampledAnalyzer
+
+    try:
+        analyzer = SampledAnalyzer(os.path.abspath(args.csv), sample_rows=args.sample, method=args.sample_method)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+    if args.quiet:
+        info = analyzer.analyze_null_values()
+        low, high = analyzer.quality_interval
+        print(f"{args.csv}: ~{info['total_rows']} filas, {info['total_columns']} columnas, "
+              f"~{info['total_null_values']} nulos, calidad {analyzer.get_data_quality_score():.2f}% "
+              f"(IC {low:.2f}-{high:.2f}%)")
+        return 0
+
+    print("\n📄 Vista previa de la muestra:")
+    print(analyzer.sample.head())
+    analyzer.print_null_analysis()
+    print(f"\n🎯 Puntuación de calidad estimada: {analyzer.get_data_quality_score():.2f}%")
+    return 0
+
+
+def clean(args):
+    """Subcomando clean: limpia un CSV y guarda el resultado."""
+    from .csv_manager import CSVManager
+
+    csv_path = os.path.abspath(args.csv)
+    if not os.path.exists(csv_path):
+        print(f"❌ Error: No se encontró el archivo {args.csv}", file=sys.stderr)
+        return 1
+    output = args.output or os.path.join(os.path.dirname(csv_path),
+                                         CSVManager.generate_clean_filename(csv_path))
+
+    try:
+        with _quiet_output(args.quiet):
+            result = CSVManager.process_csv_file(
+                csv_path, strategy=args.strategy, threshold=args.threshold,
+                show_detailed_report=not args.quiet, chunksize=args.chunksize, schema=args.schema,
+                parse_lap_times=args.parse_lap_times, lean=args.lean, incremental=args.incremental,
+                metrics_path=args.metrics, output_path=os.path.abspath(output), quiet=args.quiet,
+                storage=os.path.abspath(args.sqlite) if args.sqlite else None, dedup=args.dedup)
+    except ValueError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 2
+
+    output_path = result[0] if isinstance(result, tuple) else result
+    if output_path is None:
+        print(f"❌ Error: No se pudo procesar {args.csv}", file=sys.stderr)
+        return 1
+    if args.quiet:
+        print(output_path)
+    return 0
+
+
+def report(args):
+    """Subcomando report: compara un CSV original con su versión limpia."""
+    original = _load(args.original, args.schema, args.quiet)
+    if original is None:
+        return 1
+
+    validation_stats = None
+    if args.cleaned:
+        cleaned = _load(args.cleaned, args.schema, args.quiet)
+        if cleaned is None:
+            return 1
+    else:
+        from .cleaner import DataCleaner
+        try:
+            cleaner = DataCleaner(original)
+            cleaned = cleaner.clean_data(strategy=args.strategy, threshold=args.threshold)
+            validation_stats = cleaner.validation_stats
+        except ValueError as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            return 2
+
+    from .report import CleaningReport
+    cleaning_report = CleaningReport(original, cleaned, validation_stats=validation_stats)
+    diff = None
+    if args.diff:
+        key = args.key
+        if key is None and args.cleaned:
+            # Dos archivos: el índice no se conserva, se empareja por la clave natural
+            from .cleaner import Deduplicator
+            key = Deduplicator.KEY if all(col in original.columns and col in cleaned.columns
+                                          for col in Deduplicator.KEY) else 'content'
+        elif key == ['content']:
+            key = 'content'
+        try:
+            diff = cleaning_report.get_row_diff(key=key)
+        except ValueError as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            return 2
+
+    if args.quiet:
+        summary = cleaning_report.get_cleaning_summary()
+        print(f"{summary['original_shape']} -> {summary['current_shape']}, "
+              f"nulos {summary['original_nulls']} -> {summary['remaining_nulls']}, "
+              f"calidad {summary['original_quality_score']:.2f}% -> {summary['data_quality_score']:.2f}%")
+        if diff is not None:
+            diff_summary = diff.summary()
+            print(f"filas -{diff_summary['rows_removed']} +{diff_summary['rows_added']} "
+                  f"~{diff_summary['rows_modified']}, celdas {diff_summary['cells_changed']} "
+                  f"({diff_summary['cells_filled']} rellenadas)")
+        return 0
+
+    cleaning_report.print_cleaning_summary()
+    cleaning_report.print_before_after_comparison()
+    if diff is not None:
+        diff.print_diff()
+    return 0
+
+
+def evaluate(args):
+    """Subcomando evaluate: compara estrategias de limpieza y opcionalmente guarda la mejor."""
+    from .csv_manager import CSVManager
+
+    csv_path = os.path.abspath(args.csv)
+    if not os.path.exists(csv_path):
+        print(f"❌ Error: No se encontró el archivo {args.csv}", file=sys.stderr)
+        return 1
+    output = args.output or os.path.join(os.path.dirname(csv_path),
+                                         CSVManager.generate_clean_filename(csv_path))
+
+    try:
+        with _quiet_output(args.quiet):
+            ranking = CSVManager.evaluate_strategies(
+                csv_path, strategies=args.strategies, threshold=args.threshold, schema=args.schema,
+                workers=args.workers, write_winner=args.write, output_path=os.path.abspath(output),
+                show_detailed_report=not args.quiet)
+    except ValueError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 2
+
+    if not ranking or ranking[0]['rank'] is None:
+        print(f"❌ Error: No se pudo evaluar {args.csv}", file=sys.stderr)
+        return 1
+    if args.quiet:
+        for entry in ranking:
+            if entry['rank'] is not None:
+                print(f"{entry['rank']}. {entry['strategy']} {entry['data_quality_score']:.2f}% "
+                      f"-{entry['data_reduction_percentage']:.2f}%")
+        if args.write:
+            print(ranking[0]['output_path'])
+    return 0
+
+
+def export(args):
+    """Subcomando export: esquema en estrella (dimensiones + tabla de hechos) de un CSV."""
+    from .csv_manager import CSVManager
+
+    csv_path = os.path.abspath(args.csv)
+    if not os.path.exists(csv_path):
+        print(f"❌ Error: No se encontró el archivo {args.csv}", file=sys.stderr)
+        return 1
+
+    try:
+        with _quiet_output(args.quiet):
+            stats = CSVManager.export_star_schema(csv_path, os.path.abspath(args.directory), strategy=args.strategy,
+                                                  threshold=args.threshold, schema=args.schema, format=args.format)
+    except ValueError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 2
+
+    if stats is None:
+        print(f"❌ Error: No se pudo exportar {args.csv}", file=sys.stderr)
+        return 1
+    if args.quiet:
+        print(stats['directory'])
+    return 0
+
+
+def batch(argv):
+    """Subcomando batch: procesamiento por lotes (ver python -m Clean.batch)."""
+    from .batch.__main__ import main as batch_main
+    return batch_main(argv)
+
+
+def build_parser():
+    """
+    Analizador de argumentos de la línea de comandos.
+
+    Returns:
+        argparse.ArgumentParser: Analizador con los subcomandos
+    """
+    parser = argparse.ArgumentParser(prog='python -m Clean',
+                                     description='Análisis y limpieza de CSV de resultados de Fórmula 1')
+    commands = parser.add_subparsers(dest='command', required=True, metavar='{analyze,clean,report,evaluate,export,batch}')
+
+    def add_common(command):
+        command.add_argument('--schema', default=None, help="Esquema de tipos ('auto' o nombre registrado)")
+        command.add_argument('-q', '--quiet', action='store_true',
+                             help='Solo el resultado, sin vistas previas ni análisis de nulos')
+        command.add_argument('--no-cache', action='store_true',
+                             help='No leer ni guardar los CSV en la caché por columnas')
+
+    analyze_parser = commands.add_parser('analyze', help='Analizar la calidad de un CSV')
+    analyze_parser.add_argument('csv', help='Archivo CSV')
+    analyze_parser.add_argument('--sample', type=int, metavar='N', default=None,
+                                help='Análisis aproximado con una muestra de N filas, sin cargar el archivo')
+    analyze_parser.add_argument('--sample-method', choices=['block', 'reservoir'], default='block',
+                                help='Muestreo por bloques aleatorios (rápido) o de reservorio (filas exactas)')
+    add_common(analyze_parser)
+    analyze_parser.set_defaults(handler=analyze)
+
+    clean_parser = commands.add_parser('clean', help='Limpiar un CSV')
+    clean_parser.add_argument('csv', help='Archivo CSV')
+    clean_parser.add_argument('-o', '--output', default=None,
+                              help='Salida (por defecto <nombre>_clean.csv junto al original); .gz, .bz2 '
+                                   'y .xz la comprimen y .npz la guarda en formato binario por columnas')
+    clean_parser.add_argument('-s', '--strategy', default='remove_rows', help='Estrategia de limpieza')
+    clean_parser.add_argument('--threshold', type=float, default=0.5, help='Umbral de nulos para remove_columns')
+    clean_parser.add_argument('--chunksize', type=int, default=None, help='Procesar por bloques de N filas')
+    clean_parser.add_argument('--parse-lap-times', action='store_true', help='Convertir Q1/Q2/Q3 a milisegundos')
+    clean_parser.add_argument('--lean', action='store_true', help='Limpiar en modo ligero (sin copias)')
+    clean_parser.add_argument('--incremental', action='store_true', help='Limpiar solo las filas nuevas')
+    clean_parser.add_argument('--dedup', choices=['latest', 'most_complete', 'merge'], default=None,
+                              help='Resolver filas con la misma (Season, Round, DriverID) antes de limpiar')
+    clean_parser.add_argument('--sqlite', metavar='DB', default=None,
+                              help='Cargar el resultado en esta base de datos SQLite en lugar de un CSV')
+    clean_parser.add_argument('--metrics', metavar='JSONL', default=None,
+                              help='Añadir las métricas por etapa a este archivo JSON lines')
+    add_common(clean_parser)
+    clean_parser.set_defaults(handler=clean)
+
+    report_parser = commands.add_parser('report', help='Reporte de limpieza de un CSV')
+    report_parser.add_argument('original', help='CSV original')
+    report_parser.add_argument('cleaned', nargs='?', default=None,
+                               help='CSV limpio (si se omite, se limpia en memoria con --strategy)')
+    report_parser.add_argument('-s', '--strategy', default='remove_rows', help='Estrategia de limpieza')
+    report_parser.add_argument('--threshold', type=float, default=0.5, help='Umbral de nulos para remove_columns')
+    report_parser.add_argument('--diff', action='store_true',
+                               help='Diferencias fila a fila: filas eliminadas, añadidas y celdas cambiadas')
+    report_parser.add_argument('--key', nargs='+', default=None, metavar='COL',
+                               help="Columnas para emparejar filas en --diff, o 'content' (por defecto el índice "
+                                    "en memoria y Season Round DriverID entre dos archivos)")
+    add_common(report_parser)
+    report_parser.set_defaults(handler=report)
+
+    evaluate_parser = commands.add_parser('evaluate', help='Comparar estrategias de limpieza')
+    evaluate_parser.add_argument('csv', help='Archivo CSV')
+    evaluate_parser.add_argument('-s', '--strategies', nargs='+', default=None,
+                                 help='Estrategias a comparar (por defecto las cinco básicas)')
+    evaluate_parser.add_argument('--threshold', type=float, default=0.5, help='Umbral de nulos para remove_columns')
+    evaluate_parser.add_argument('--workers', type=int, default=None, help='Hilos de evaluación')
+    evaluate_parser.add_argument('--write', action='store_true', help='Guardar el resultado de la mejor estrategia')
+    evaluate_parser.add_argument('-o', '--output', default=None,
+                                 help='CSV de la mejor estrategia (por defecto <nombre>_clean.csv junto al original)')
+    add_common(evaluate_parser)
+    evaluate_parser.set_defaults(handler=evaluate)
+
+    export_parser = commands.add_parser('export', help='Exportar un CSV como esquema en estrella')
+    export_parser.add_argument('csv', help='Archivo CSV')
+    export_parser.add_argument('directory', help='Directorio de salida')
+    export_parser.add_argument('-s', '--strategy', default=None,
+                               help='Estrategia de limpieza previa (por defecto se exporta tal cual)')
+    export_parser.add_argument('--threshold', type=float, default=0.5, help='Umbral de nulos para remove_columns')
+    export_parser.add_argument('--format', choices=['.npz', '.csv', '.csv.gz', '.csv.bz2', '.csv.xz'],
+                               default='.npz', help='Formato de las tablas')
+    add_common(export_parser)
+    export_parser.set_defaults(handler=export)
+
+    # batch tiene sus propias opciones: se delegan en python -m Clean.batch
+    commands.add_parser('batch', help='Limpiar muchos CSV en paralelo (ver batch --help)', add_help=False)
+    return parser
+
+
+def main(argv=None):
+    """
+    Punto de entrada por línea de comandos. Los módulos con pandas se
+    importan solo al ejecutar el subcomando, de modo que --help y los
+    errores de argumentos responden al instante.
+
+    Args:
+        argv (list): Argumentos (por defecto, los de sys.argv)
+
+    Returns:
+        int: Código de salida
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] == 'batch':
+        return batch(argv[1:])
+
+    args = build_parser().parse_args(argv)
+    if args.no_cache:
+        from Config.Config import Config
+        Config.USE_CACHE = False
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+from ..schema import LapTimeParser
+
+
+class QualifyingAnalytics:
+    """
+    Clase responsable de las estadísticas de clasificación: poles por piloto,
+    duelos entre compañeros de equipo y diferencia con la pole por sesión.
+
+    Todo se calcula con groupby/transform y operaciones de NumPy sobre el
+    historial completo, sin bucles por carrera ni por piloto.
+
+    Formato eliminatorio Q1/Q2/Q3: el mejor tiempo de un piloto es el de la
+    sesión más avanzada que disputó (Q3 si llegó, si no Q2, si no Q1); los
+    marcadores "0" indican que no participó en esa sesión.
+    """
+
+    SESSIONS = LapTimeParser.LAP_TIME_COLUMNS
+    RACE_KEYS = ['Season', 'Round']
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Prepara las columnas necesarias (sin copiar el resto de los datos).
+        Los tiempos en texto se convierten a milisegundos con LapTimeParser.
+
+        Args:
+            data (pd.DataFrame): Resultados de clasificación
+        """
+        columns = self.RACE_KEYS + ['DriverID', 'ConstructorID', 'Position']
+        missing = [col for col in columns + self.SESSIONS if col not in data.columns]
+        if missing:
+            raise ValueError(f"Faltan columnas necesarias para las estadísticas: {missing}")
+
+        times = LapTimeParser.parse_columns(data[self.SESSIONS])
+        self.data = pd.concat([data[columns], times], axis=1)
+        self._best = None
+
+    def best_times(self):
+        """
+        Mejor tiempo de cada piloto según el formato eliminatorio.
+
+        Returns:
+            pd.DataFrame: Season, Round, DriverID, ConstructorID, Position,
+                BestTime (ms) y BestSession (1, 2 o 3; 0 si no marcó tiempo)
+        """
+        if self._best is None:
+            # Matriz filas x sesiones; la sesión más avanzada con tiempo es la última no nula
+            times = np.column_stack([self.data[col].to_numpy(dtype='float64', na_value=np.nan)
+                                     for col in self.SESSIONS])
+            has_time = ~np.isnan(times)
+            reached = np.where(has_time.any(axis=1), len(self.SESSIONS) - np.argmax(has_time[:, ::-1], axis=1), 0)
+            best = times[np.arange(len(times)), np.maximum(reached - 1, 0)]
+            best[reached == 0] = np.nan
+
+            result = self.data[self.RACE_KEYS + ['DriverID', 'ConstructorID', 'Position']].copy()
+            result['BestTime'] = pd.array(best, dtype='Float64').astype('Int64')
+            result['BestSession'] = reached.astype('int8')
+            self._best = result
+        return self._best
+
+    def poles(self, by=None):
+        """
+        Número de poles (Position == 1) por piloto.
+
+        Args:
+            by (list): Columnas adicionales de agrupación (p. ej. ['Season'])
+
+        Returns:
+            pd.Series: Poles por piloto ordenadas de mayor a menor
+        """
+        keys = (list(by) if by else []) + ['DriverID']
+        pole_rows = self.data[self.data['Position'] == 1]
+        poles = pole_rows.groupby(keys, observed=True, sort=True).size().rename('Poles')
+        if by:
+            return poles
+        return poles.sort_values(ascending=False, kind='stable')
+
+    def teammate_head_to_head(self, by=None):
+        """
+        Duelos de clasificación entre compañeros de equipo (mismo Season, Round
+        y ConstructorID): gana quien clasifica en mejor posición.
+
+        Args:
+            by (list): Columnas adicionales de agrupación (p. ej. ['Season', 'ConstructorID'])
+
+        Returns:
+            pd.DataFrame: DriverA, DriverB (orden alfabético), Races, WinsA y WinsB
+        """
+        keys = self.RACE_KEYS + ['ConstructorID']
+        by = list(by) if by else []
+        base = self.data[list(dict.fromkeys(keys + by)) + ['DriverID', 'Position']].copy()
+        # Las categóricas no ordenadas no admiten comparaciones con "<"
+        for col in base.columns:
+            if isinstance(base[col].dtype, pd.CategoricalDtype):
+                base[col] = base[col].astype(object)
+
+        pairs = base.merge(base[keys + ['DriverID', 'Position']], on=keys, suffixes=('A', 'B'))
+        pairs = pairs[pairs['DriverIDA'] < pairs['DriverIDB']]
+        pairs = pairs.assign(WinA=(pairs['PositionA'] < pairs['PositionB']).astype('int64'))
+
+        result = pairs.groupby(by + ['DriverIDA', 'DriverIDB'], sort=True).agg(
+            Races=('WinA', 'size'), WinsA=('WinA', 'sum')).reset_index()
+        result['WinsB'] = result['Races'] - result['WinsA']
+        result = result.rename(columns={'DriverIDA': 'DriverA', 'DriverIDB': 'DriverB'})
+        if by:
+            return result
+        return result.sort_values('Races', ascending=False, kind='stable').reset_index(drop=True)
+
+    def gap_to_pole(self):
+        """
+        Diferencia de cada piloto con el más rápido de cada sesión y con la
+        pole (mejor tiempo del poleman según el formato eliminatorio).
+
+        Returns:
+            pd.DataFrame: best_times() más Q1Gap, Q2Gap, Q3Gap (ms respecto al
+                más rápido de la sesión), PoleGap (ms) y PoleGapPercentage
+        """
+        result = self.best_times().copy()
+        race = [result[col] for col in self.RACE_KEYS]
+
+        for session in self.SESSIONS:
+            times = self.data[session]
+            result[f'{session}Gap'] = times - times.groupby(race).transform('min')
+
+        pole_time = result['BestTime'].where(result['Position'] == 1).groupby(race).transform('max')
+        result['PoleGap'] = result['BestTime'] - pole_time
+        result['PoleGapPercentage'] = (result['PoleGap'].astype('Float64') / pole_time * 100)
+        return result
@@ -0,0 +1,11 @@
+"""
+Módulo Analytics - Estadísticas de clasificación
+
+Este módulo calcula estadísticas sobre el historial de clasificación
+(poles, duelos entre compañeros de equipo y diferencia con la pole)
+con operaciones vectorizadas de pandas y NumPy.
+"""
+
+from .QualifyingAnalytics import QualifyingAnalytics
+
+__all__ = ['QualifyingAnalytics']
@@ -1,5 +1,7 @@
 import pandas as pd
 import numpy as np
+from ..schema import DatasetSchema
+from .DataProfile import DataProfile
 
 
 class DataAnalyzer:
@@ -18,6 +20,16 @@ class DataAnalyzer:
         self.data = data
         self.null_info = {}
         
+    @property
+    def profile(self):
+        """
+        Perfil memorizado de los datos (nulos, tipos, memoria, duplicados).
+        
+        Returns:
+            DataProfile: Perfil compartido con otros analizadores de los mismos datos
+        """
+        return DataProfile.of(self.data)
+        
     def analyze_null_values(self):
         """
         Analiza los valores nulos en el dataset.
@@ -25,20 +37,22 @@ class DataAnalyzer:
         Returns:
             dict: Información detallada sobre valores nulos
         """
+        profile = self.profile
+        
         # Contar valores nulos por columna
-        null_counts = self.data.isnull().sum()
+        null_counts = profile.null_counts
         
         # Porcentaje de valores nulos por columna
-        null_percentages = (null_counts / len(self.data)) * 100
+        null_percentages = profile.null_percentages * 100
         
         # Crear resumen de información nula
         self.null_info = {
-            'total_rows': len(self.data),
-            'total_columns': len(self.data.columns),
+            'total_rows': profile.total_rows,
+            'total_columns': profile.total_columns,
             'columns_with_nulls': null_counts[null_counts > 0].to_dict(),
             'null_percentages': null_percentages[null_percentages > 0].to_dict(),
             'total_null_values': null_counts.sum(),
-            'columns_names': list(self.data.columns)
+            'columns_names': list(profile.columns)
         }
         
         return self.null_info
@@ -50,9 +64,7 @@ class DataAnalyzer:
         Returns:
             float: Puntuación de calidad (0-100%)
         """
-        total_cells = self.data.shape[0] * self.data.shape[1]
-        non_null_cells = self.data.notna().sum().sum()
-        return (non_null_cells / total_cells) * 100 if total_cells > 0 else 0
+        return self.profile.quality_score
     
     def get_columns_by_null_percentage(self, threshold=0.5):
         """
@@ -64,7 +76,7 @@ class DataAnalyzer:
         Returns:
             list: Lista de columnas que superan el umbral
         """
-        null_percentages = (self.data.isnull().sum() / len(self.data))
+        null_percentages = self.profile.null_percentages
         return null_percentages[null_percentages > threshold].index.tolist()
     
     def print_null_analysis(self):
@@ -93,13 +105,22 @@ class DataAnalyzer:
         """
         Obtiene estadísticas básicas del dataset.
         
+        Incluye la memoria que ocuparían los datos cargados sin esquema
+        y el ahorro obtenido con los tipos compactos.
+        
         Returns:
             dict: Estadísticas básicas
         """
+        profile = self.profile
+        memory_usage = profile.memory_usage
+        untyped_memory = DatasetSchema.estimate_untyped_memory(self.data)
         return {
-            'shape': self.data.shape,
-            'memory_usage': self.data.memory_usage(deep=True).sum(),
-            'dtypes': self.data.dtypes.to_dict(),
-            'null_count': self.data.isnull().sum().sum(),
-            'duplicate_rows': self.data.duplicated().sum()
+            'shape': profile.shape,
+            'memory_usage': memory_usage,
+            'untyped_memory_usage': untyped_memory,
+            'memory_saved': untyped_memory - memory_usage,
+            'memory_saved_percentage': ((untyped_memory - memory_usage) / untyped_memory) * 100 if untyped_memory > 0 else 0,
+            'dtypes': profile.dtypes,
+            'null_count': profile.null_counts.sum(),
+            'duplicate_rows': profile.duplicate_rows
         }
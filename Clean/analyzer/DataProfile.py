@@ -0,0 +1,200 @@
+import copy
+import weakref
+from functools import cached_property
+
+import pandas as pd
+
+
+class DataProfile:
+    """
+    Clase responsable de calcular una sola vez el perfil de un DataFrame:
+    máscara de nulos, conteos por columna, tipos, memoria y filas duplicadas.
+
+    Solo se memorizan los perfiles de los DataFrames que el pipeline de
+    limpieza crea y registra con DataProfile.register(data) (las copias de
+    DataCleaner, los datos que carga process_csv_file...), y se invalidan con
+    DataProfile.invalidate(data) cuando el propio pipeline los modifica en el
+    sitio. Los DataFrames del usuario pueden cambiar en el sitio sin aviso
+    (fillna(inplace=True), df.loc[...] = ...), así que se perfilan de nuevo
+    en cada llamada.
+    """
+
+    # id(DataFrame registrado) -> (referencia débil, perfil o None)
+    _cache = {}
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Calcula el perfil básico en una sola pasada sobre los datos.
+        La memoria y los duplicados se calculan al primer acceso.
+
+        Args:
+            data (pd.DataFrame): Los datos a perfilar
+        """
+        self._data_ref = weakref.ref(data)
+        self.shape = data.shape
+        self.columns = list(data.columns)
+        self.dtypes = data.dtypes.to_dict()
+
+        self.null_mask = data.isnull()
+        self.null_counts = self.null_mask.sum()
+        self.total_rows = data.shape[0]
+        self.total_columns = data.shape[1]
+        self.total_cells = self.total_rows * self.total_columns
+        self.total_nulls = int(self.null_counts.sum())
+
+    @classmethod
+    def of(cls, data):
+        """
+        Obtiene el perfil de unos datos: el memorizado si están registrados
+        (o lo calcula y lo memoriza), uno nuevo si no lo están. Una
+        CleaningSnapshot devuelve el perfil de los datos originales.
+
+        Args:
+            data (pd.DataFrame): Los datos a perfilar
+
+        Returns:
+            DataProfile: Perfil de los datos
+        """
+        if not isinstance(data, pd.DataFrame) and isinstance(getattr(data, 'profile', None), DataProfile):
+            return data.profile
+        entry = cls._entry(data)
+        if entry is None:
+            return cls(data)
+        if entry[1] is None:
+            cls._cache[id(data)] = (entry[0], cls(data))
+        return cls._cache[id(data)][1]
+
+    @classmethod
+    def _entry(cls, data):
+        """Entrada de un DataFrame registrado, o None si no lo está."""
+        entry = cls._cache.get(id(data))
+        # El id puede reutilizarse tras liberar otro objeto
+        if entry is None or entry[0]() is not data:
+            return None
+        ref, profile = entry
+        # La forma detecta además cambios estructurales
+        if profile is not None and (profile.shape != data.shape or profile.columns != list(data.columns)):
+            cls._cache[id(data)] = (ref, None)
+        return cls._cache[id(data)]
+
+    @classmethod
+    def _cached(cls, data):
+        """Perfil ya calculado de unos datos, sin calcular nada."""
+        if not isinstance(data, pd.DataFrame) and isinstance(getattr(data, 'profile', None), DataProfile):
+            return data.profile
+        entry = cls._entry(data)
+        return None if entry is None else entry[1]
+
+    @classmethod
+    def register(cls, data: pd.DataFrame):
+        """
+        Registra un DataFrame creado por el pipeline de limpieza para que su
+        perfil se memorice. Quien lo registra se compromete a llamar a
+        invalidate() tras modificarlo en el sitio.
+
+        Args:
+            data (pd.DataFrame): Datos propiedad del pipeline
+
+        Returns:
+            bool: True si no estaba registrado
+        """
+        if cls._entry(data) is not None:
+            return False
+        key = id(data)
+        ref = weakref.ref(data, lambda _, key=key: cls._cache.pop(key, None))
+        cls._cache[key] = (ref, None)
+        return True
+
+    @classmethod
+    def release(cls, data: pd.DataFrame):
+        """
+        Deja de memorizar el perfil de un DataFrame registrado.
+
+        Args:
+            data (pd.DataFrame): Datos registrados con register()
+        """
+        if cls._entry(data) is not None:
+            cls._cache.pop(id(data), None)
+
+    @classmethod
+    def share(cls, source, target: pd.DataFrame):
+        """
+        Registra `target` y le asigna el perfil ya calculado de `source`, p. ej.
+        tras un DataFrame.copy(). No calcula nada si `source` aún no tiene perfil.
+
+        Args:
+            source (pd.DataFrame): Datos con perfil memorizado (o CleaningSnapshot)
+            target (pd.DataFrame): Copia con el mismo contenido, propiedad del pipeline
+        """
+        if not isinstance(target, pd.DataFrame):
+            raise ValueError("Solo se puede compartir el perfil con un DataFrame")
+        cls.register(target)
+        profile = cls._cached(source)
+        if profile is not None:
+            shared = copy.copy(profile)
+            shared._data_ref = weakref.ref(target)
+            cls._cache[id(target)] = (cls._cache[id(target)][0], shared)
+
+    @classmethod
+    def invalidate(cls, data: pd.DataFrame):
+        """
+        Descarta el perfil memorizado de un DataFrame modificado en el sitio
+        (sigue registrado: el siguiente perfil se vuelve a memorizar).
+
+        Args:
+            data (pd.DataFrame): Los datos modificados
+        """
+        entry = cls._entry(data)
+        if entry is not None:
+            cls._cache[id(data)] = (entry[0], None)
+
+    def detach(self):
+        """
+        Calcula los campos diferidos (memoria, duplicados) y suelta la
+        referencia a los datos, que pueden modificarse después sin afectar
+        al perfil (p. ej. la instantánea del modo ligero).
+
+        Returns:
+            DataProfile: El propio perfil
+        """
+        self.rows_with_nulls, self.duplicate_rows, self.memory_usage
+        self._data_ref = lambda: None
+        return self
+
+    @property
+    def null_percentages(self):
+        """Fracción de nulos por columna (0-1)."""
+        if self.total_rows == 0:
+            return self.null_counts.astype('float64')
+        return self.null_counts / self.total_rows
+
+    @property
+    def non_null_cells(self):
+        """Número de celdas no nulas."""
+        return self.total_cells - self.total_nulls
+
+    @property
+    def quality_score(self):
+        """Puntuación de calidad (0-100%): porcentaje de celdas no nulas."""
+        return (self.non_null_cells / self.total_cells) * 100 if self.total_cells > 0 else 0
+
+    @cached_property
+    def rows_with_nulls(self):
+        """Número de filas con al menos un valor nulo."""
+        return int(self.null_mask.any(axis=1).sum())
+
+    @cached_property
+    def memory_usage(self):
+        """Memoria (deep) ocupada por los datos en bytes."""
+        return self._require_data().memory_usage(deep=True).sum()
+
+    @cached_property
+    def duplicate_rows(self):
+        """Número de filas completamente duplicadas."""
+        return self._require_data().duplicated().sum()
+
+    def _require_data(self):
+        data = self._data_ref()
+        if data is None:
+            raise ValueError("Los datos del perfil ya no están disponibles")
+        return data
@@ -0,0 +1,358 @@
+import io
+import math
+import os
+import random
+import time
+from itertools import islice
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+
+class SampledAnalyzer:
+    """
+    Análisis aproximado de la calidad de un CSV a partir de una muestra.
+
+    Lee solo una parte del archivo, sin cargarlo completo, y ofrece los
+    mismos métodos que DataAnalyzer (analyze_null_values,
+    get_data_quality_score, ...) con estimaciones, sus intervalos de
+    confianza y el número estimado de valores distintos por columna.
+
+    Métodos de muestreo:
+    - 'block': salta a posiciones aleatorias del archivo (una por tramo) y
+      lee bloques de líneas consecutivas. No recorre el archivo; el número
+      total de filas se estima a partir de los bytes por línea.
+    - 'reservoir': recorre todas las líneas sin interpretarlas y guarda una
+      muestra aleatoria simple (algoritmo L). El número de filas es exacto.
+
+    Cada línea debe ser una fila (sin saltos de línea entre comillas). Si la
+    muestra pedida cubre el archivo completo, se lee entero y los
+    resultados son exactos.
+    """
+
+    METHODS = ['block', 'reservoir']
+
+    def __init__(self, csv_path, sample_rows=50_000, method='block', blocks=50, confidence=0.95,
+                 seed=None):
+        """
+        Muestrea el archivo y calcula las estimaciones.
+
+        Args:
+            csv_path (str): Ruta del CSV
+            sample_rows (int): Filas a muestrear
+            method (str): 'block' o 'reservoir'
+            blocks (int): Número de bloques (método 'block')
+            confidence (float): Nivel de confianza de los intervalos (0-1)
+            seed (int): Semilla para repetir la muestra
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Método de muestreo no válido: {method}. Use uno de {self.METHODS}")
+        if sample_rows < 1 or blocks < 1:
+            raise ValueError("sample_rows y blocks deben ser positivos")
+        if not 0 < confidence < 1:
+            raise ValueError("confidence debe estar entre 0 y 1")
+
+        self.csv_path = csv_path
+        self.sample_rows = sample_rows
+        self.method = method
+        self.blocks = blocks
+        self.confidence = confidence
+        self.null_info = {}
+        self._z = NormalDist().inv_cdf((1 + confidence) / 2)
+
+        start = time.perf_counter()
+        rng = np.random.default_rng(seed)
+        with open(csv_path, 'rb') as handle:
+            header = handle.readline()
+            body_start = handle.tell()
+            self.file_size = os.fstat(handle.fileno()).st_size
+            if method == 'block':
+                lines, sizes = self._sample_blocks(handle, body_start, rng)
+            else:
+                lines, sizes = self._sample_reservoir(handle, body_start, rng)
+        self.sample = self._parse(header, lines)
+        self._summarize(sizes)
+        self.seconds = time.perf_counter() - start
+
+    @staticmethod
+    def _count_lines(handle):
+        """Cuenta las líneas desde la posición actual hasta el final del archivo."""
+        count, last = 0, b'\n'
+        for chunk in iter(lambda: handle.read(1 << 20), b''):
+            count += chunk.count(b'\n')
+            last = chunk[-1:]
+        return count + (last != b'\n')
+
+    def _read_all(self, handle, body_start):
+        """Lee el archivo completo: la muestra es la población y los resultados son exactos."""
+        handle.seek(body_start)
+        lines = handle.readlines()
+        self.exact = True
+        self.total_rows = len(lines)
+        self.rows_interval = (self.total_rows, self.total_rows)
+        return lines, np.array([len(lines)])
+
+    def _sample_blocks(self, handle, body_start, rng):
+        """
+        Muestreo por bloques: una posición aleatoria por tramo del archivo,
+        alineada al siguiente inicio de línea, y rows_per_block líneas desde ahí.
+
+        Returns:
+            tuple: (líneas, filas por bloque)
+        """
+        body = self.file_size - body_start
+        head = list(islice(handle, 1000))
+        average_line = sum(map(len, head)) / len(head) if head else 1
+        if len(head) < 1000 or self.sample_rows * average_line >= body:
+            return self._read_all(handle, body_start)
+
+        rows_per_block = -(-self.sample_rows // self.blocks)
+        edges = np.linspace(body_start, self.file_size, self.blocks + 1)
+        starts = (edges[:-1] + rng.random(self.blocks) * np.diff(edges)).astype(np.int64)
+
+        lines, rows, block_bytes = [], [], []
+        next_free = body_start
+        for offset in starts:
+            # Los bloques no se solapan: si el anterior llegó más lejos, se continúa desde ahí
+            if offset <= next_free:
+                handle.seek(next_free)
+            else:
+                handle.seek(offset - 1)
+                handle.readline()
+            block = list(islice(handle, rows_per_block))
+            next_free = handle.tell()
+            if block:
+                lines.extend(block)
+                rows.append(len(block))
+                block_bytes.append(sum(map(len, block)))
+
+        # Filas totales: razón filas/bytes de la muestra, con varianza entre bloques
+        rows, block_bytes = np.array(rows), np.array(block_bytes, dtype=np.float64)
+        ratio = rows.sum() / block_bytes.sum()
+        k = len(rows)
+        variance = (k / (k - 1) * np.sum((rows - ratio * block_bytes) ** 2) / block_bytes.sum() ** 2
+                    if k > 1 else 0.0)
+        margin = self._z * np.sqrt(variance) * body
+        self.exact = False
+        self.total_rows = int(round(ratio * body))
+        self.rows_interval = (max(int(np.floor(ratio * body - margin)), len(lines)),
+                              int(np.ceil(ratio * body + margin)))
+        return lines, rows
+
+    def _sample_reservoir(self, handle, body_start, rng):
+        """
+        Muestreo de reservorio (algoritmo L): recorre las líneas sin
+        interpretarlas y salta entre reemplazos sin generar un número
+        aleatorio por línea.
+
+        Returns:
+            tuple: (líneas, filas por grupo: una fila por grupo)
+        """
+        k = self.sample_rows
+        reservoir = list(islice(handle, k))
+        if len(reservoir) < k:
+            return self._read_all(handle, body_start)
+
+        # Números aleatorios escalares: random es mucho más rápido que NumPy uno a uno
+        draw = random.Random(int(rng.integers(2 ** 63))).random
+        seen = k
+        weight = math.exp(math.log(draw()) / k)
+        while True:
+            skip = int(math.log(draw()) / math.log1p(-weight))
+            position = handle.tell()
+            line = next(islice(handle, skip, None), None)
+            if line is None:
+                handle.seek(position)
+                seen += self._count_lines(handle)
+                break
+            seen += skip + 1
+            reservoir[int(draw() * k)] = line
+            weight *= math.exp(math.log(draw()) / k)
+
+        self.exact = False
+        self.total_rows = seen
+        self.rows_interval = (seen, seen)
+        return reservoir, np.ones(k, dtype=np.int64)
+
+    @staticmethod
+    def _parse(header, lines):
+        """Interpreta las líneas muestreadas como CSV (todo como texto)."""
+        if lines and not lines[-1].endswith(b'\n'):
+            lines[-1] += b'\n'
+        sample = pd.read_csv(io.BytesIO(header + b''.join(lines)), dtype=str)
+        if len(sample) != len(lines):
+            raise ValueError("El CSV tiene saltos de línea dentro de valores entre comillas; "
+                             "el muestreo necesita una fila por línea")
+        return sample
+
+    def _interval(self, counts, sizes):
+        """
+        Proporción de la muestra e intervalo de Wilson con el tamaño efectivo
+        de la muestra (efecto de diseño de los bloques y corrección por
+        población finita).
+
+        Args:
+            counts (np.ndarray): Casos por grupo (grupos x columnas)
+            sizes (np.ndarray): Tamaño de cada grupo
+
+        Returns:
+            tuple: (proporción, límite inferior, límite superior) por columna
+        """
+        n = sizes.sum()
+        if n == 0:
+            zeros = np.zeros(counts.shape[1])
+            return zeros, zeros, zeros
+        p = counts.sum(axis=0) / n
+        population = self.total_rows * (n / self.sample.shape[0]) if len(self.sample) else 0
+        fpc = 1 - n / population if population else 0
+        if self.exact or fpc <= 0:
+            return p, p, p
+
+        k = len(sizes)
+        simple = p * (1 - p) / n
+        design = np.ones_like(p)
+        if k > 1:
+            variance = k / (k - 1) * np.sum((counts - np.outer(sizes, p)) ** 2, axis=0) / n ** 2
+            design = np.where(simple > 0, np.maximum(variance / np.where(simple > 0, simple, 1), 1), 1)
+        n_eff = n / (design * fpc)
+        z2 = self._z ** 2
+        center = (p + z2 / (2 * n_eff)) / (1 + z2 / n_eff)
+        half = self._z * np.sqrt(p * (1 - p) / n_eff + z2 / (4 * n_eff ** 2)) / (1 + z2 / n_eff)
+        return p, np.clip(center - half, 0, 1), np.clip(center + half, 0, 1)
+
+    def _summarize(self, sizes):
+        """Estimaciones por columna a partir de la muestra."""
+        nulls = self.sample.isna().to_numpy()
+        starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        per_group = (np.add.reduceat(nulls, starts, axis=0) if len(nulls)
+                     else np.zeros((len(sizes), nulls.shape[1]), dtype=np.int64))
+
+        fraction, low, high = self._interval(per_group, sizes)
+        self.null_fractions = pd.Series(fraction, index=self.sample.columns)
+        self.null_intervals = pd.DataFrame({'low': low, 'high': high}, index=self.sample.columns)
+        self.null_counts = (self.null_fractions * self.total_rows).round().astype(np.int64)
+
+        # Calidad: celdas no nulas; cada grupo aporta filas x columnas celdas
+        columns = max(nulls.shape[1], 1)
+        quality, low, high = self._interval(per_group.sum(axis=1, keepdims=True), sizes * columns)
+        has_cells = len(self.sample) > 0 and nulls.shape[1] > 0
+        self.quality_score = (1 - quality[0]) * 100 if has_cells else 0
+        self.quality_interval = ((1 - high[0]) * 100, (1 - low[0]) * 100) if has_cells else (0, 0)
+
+        # Valores distintos: los de la muestra son una cota inferior; los del
+        # archivo se estiman con Chao1 para muestreo sin reemplazo (Chao y Lin),
+        # a partir de los valores vistos una (f1) y dos veces (f2):
+        #   D = d + f1² / (2·f2·n/(n-1) + f1·q/(1-q)),  q = n/N
+        # con n y N las filas no nulas de la muestra y (estimadas) del archivo.
+        # Vale d si todos los valores se repiten y N si ninguno lo hace
+        self.distinct_in_sample = {}
+        self.distinct_counts = {}
+        for column in self.sample.columns:
+            counts = self.sample[column].value_counts()
+            n, d = int(counts.sum()), len(counts)
+            population = self.total_rows * (1 - self.null_fractions[column])
+            estimate = d
+            f1, f2 = int((counts == 1).sum()), int((counts == 2).sum())
+            if not self.exact and f1 and n < population:
+                q = n / population
+                unseen = f1 ** 2 / ((2 * f2 * n / (n - 1) if f2 else 0) + f1 * q / (1 - q))
+                estimate = min(d + unseen, d + population - n)
+            self.distinct_in_sample[column] = d
+            self.distinct_counts[column] = int(round(estimate))
+
+    def analyze_null_values(self):
+        """
+        Estima los valores nulos del archivo. Devuelve las mismas claves que
+        DataAnalyzer.analyze_null_values (con recuentos estimados) más la
+        información de la muestra.
+
+        Returns:
+            dict: Información de valores nulos, con 'null_intervals'
+                (columna -> (% inferior, % superior)), 'rows_interval',
+                'sampled_rows', 'method', 'confidence' y 'exact'
+        """
+        percentages = self.null_fractions * 100
+        self.null_info = {
+            'total_rows': self.total_rows,
+            'total_columns': len(self.sample.columns),
+            'columns_with_nulls': self.null_counts[self.null_counts > 0].to_dict(),
+            'null_percentages': percentages[percentages > 0].to_dict(),
+            'total_null_values': self.null_counts.sum(),
+            'columns_names': list(self.sample.columns),
+            'null_intervals': {column: (row.low * 100, row.high * 100)
+                               for column, row in self.null_intervals.iterrows()},
+            'rows_interval': self.rows_interval,
+            'sampled_rows': len(self.sample),
+            'method': self.method,
+            'confidence': self.confidence,
+            'exact': self.exact
+        }
+        return self.null_info
+
+    def get_data_quality_score(self):
+        """
+        Estima la puntuación de calidad de los datos (ver quality_interval).
+
+        Returns:
+            float: Puntuación de calidad (0-100%)
+        """
+        return self.quality_score
+
+    def get_columns_by_null_percentage(self, threshold=0.5):
+        """
+        Obtiene columnas cuya fracción estimada de nulos supera un umbral.
+
+        Args:
+            threshold (float): Umbral de porcentaje de nulos (0-1)
+
+        Returns:
+            list: Lista de columnas que superan el umbral
+        """
+        return self.null_fractions[self.null_fractions > threshold].index.tolist()
+
+    def get_distinct_counts(self):
+        """
+        Estima los valores distintos de cada columna en el archivo a partir de
+        las frecuencias de la muestra (ver distinct_in_sample para la cota
+        inferior). Los resultados son exactos si la muestra cubre el archivo.
+
+        Returns:
+            dict: Columna -> valores distintos estimados
+        """
+        return dict(self.distinct_counts)
+
+    def print_null_analysis(self):
+        """
+        Imprime el análisis aproximado de los valores nulos.
+        """
+        info = self.analyze_null_values()
+        level = f"{self.confidence * 100:g}%"
+
+        print("=== ANÁLISIS APROXIMADO DE VALORES NULOS ===")
+        print(f"Muestra: {info['sampled_rows']} filas ({self.method}, {self.seconds:.3f}s)")
+        if self.exact:
+            print(f"Total de filas: {info['total_rows']} (archivo completo, resultados exactos)")
+        else:
+            print(f"Total de filas: ~{info['total_rows']} (IC {level}: "
+                  f"{info['rows_interval'][0]}-{info['rows_interval'][1]})")
+        print(f"Total de columnas: {info['total_columns']}")
+        print(f"Total de valores nulos: ~{info['total_null_values']}")
+        print(f"Puntuación de calidad: {self.quality_score:.2f}% "
+              f"(IC {level}: {self.quality_interval[0]:.2f}-{self.quality_interval[1]:.2f}%)")
+        print("\nColumnas con valores nulos:")
+
+        if info['columns_with_nulls']:
+            for col, count in info['columns_with_nulls'].items():
+                low, high = info['null_intervals'][col]
+                print(f"  - {col}: ~{count} nulos ({info['null_percentages'][col]:.2f}%, "
+                      f"IC {low:.2f}-{high:.2f}%)")
+        else:
+            print("  ¡No se encontraron valores nulos en la muestra!")
+
+        print("\nValores distintos:")
+        for column, count in self.distinct_counts.items():
+            if self.exact:
+                print(f"  - {column}: {count}")
+            else:
+                print(f"  - {column}: ~{count} (≥{self.distinct_in_sample[column]} en la muestra)")
@@ -2,9 +2,12 @@
 Módulo Analyzer - Análisis y diagnóstico de datos
 
 Este módulo se encarga del análisis de calidad de datos,
-diagnóstico de valores nulos y estadísticas básicas.
+diagnóstico de valores nulos y estadísticas básicas, exactas
+o aproximadas a partir de una muestra del archivo.
 """
 
 from .DataAnalyzer import DataAnalyzer
+from .DataProfile import DataProfile
+from .SampledAnalyzer import SampledAnalyzer
 
-__all__ = ['DataAnalyzer']
+__all__ = ['DataAnalyzer', 'DataProfile', 'SampledAnalyzer']
@@ -0,0 +1,252 @@
+import contextlib
+import glob
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from ..analyzer import DataAnalyzer
+from ..cleaner import DataCleaner
+from ..csv_manager import CSVManager
+from ..report import CleaningReport
+from ..schema import LapTimeParser
+
+
+def _run_stages(csv_path, options):
+    """
+    Ejecuta las etapas de CSVManager.process_csv_file sobre un archivo:
+    carga -> análisis -> limpieza -> reporte -> guardado.
+
+    Returns:
+        dict: Ruta de salida y resumen de limpieza del archivo
+    """
+    data = CSVManager.load_csv(csv_path, schema=options['schema'])
+    if data is None:
+        raise ValueError(f"No se pudo cargar el archivo {csv_path}")
+
+    if options['parse_lap_times']:
+        data = LapTimeParser.parse_columns(data, copy=False)
+
+    DataAnalyzer(data).print_null_analysis()
+
+    cleaner = DataCleaner(data, lean=options['lean'])
+    data = None
+    cleaned_data = cleaner.clean_data(strategy=options['strategy'], threshold=options['threshold'])
+    summary = CleaningReport(cleaner.original_data, cleaned_data,
+                             validation_stats=cleaner.validation_stats).get_cleaning_summary()
+
+    output_filename = CSVManager.generate_clean_filename(csv_path)
+    if options['output_dir'] is not None:
+        output_filename = os.path.join(options['output_dir'], output_filename)
+    output_path = CSVManager.save_csv(cleaned_data, output_filename, show_preview=False)
+    if output_path is None:
+        raise ValueError(f"No se pudo guardar el archivo limpio de {csv_path}")
+
+    return {'output_path': output_path, 'summary': summary}
+
+
+def _process_file(csv_path, options):
+    """
+    Procesa un archivo en un proceso del pool. Los errores se devuelven en el
+    resultado en lugar de propagarse, para no afectar al resto del lote.
+    """
+    start = time.perf_counter()
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output) if options['quiet'] else contextlib.nullcontext():
+            result = _run_stages(csv_path, options)
+        result.update({'file': csv_path, 'status': 'ok', 'error': None})
+    except Exception as e:
+        result = {'file': csv_path, 'status': 'error', 'error': f"{type(e).__name__}: {e}",
+                  'output_path': None, 'summary': None}
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+class BatchProcessor:
+    """
+    Clase responsable de procesar muchos archivos CSV en paralelo.
+    Reparte los archivos de un directorio o patrón glob entre un pool de
+    procesos, aplica a cada uno las etapas de CSVManager.process_csv_file y
+    consolida los resúmenes de limpieza en un único resultado.
+
+    Los fallos de un archivo (excepciones o la caída del proceso) solo
+    marcan ese archivo como erróneo; el resto del lote continúa.
+    """
+
+    def __init__(self, strategy='remove_rows', threshold=0.5, workers=None, schema=None,
+                 parse_lap_times=False, lean=False, output_dir=None, quiet=True):
+        """
+        Inicializa el procesador por lotes.
+
+        Args:
+            strategy (str): Estrategia de limpieza a aplicar
+            threshold (float): Umbral para eliminar columnas (% de nulos)
+            workers (int): Número de procesos (por defecto, número de núcleos)
+            schema: Esquema de tipos para la carga (ver CSVManager.load_csv)
+            parse_lap_times (bool): Si convertir Q1/Q2/Q3 a milisegundos enteros
+            lean (bool): Si limpiar en modo ligero (ver DataCleaner)
+            output_dir (str): Carpeta de salida (por defecto, la de Config.OUTPUT)
+            quiet (bool): Si silenciar la salida por consola de cada archivo
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.options = {
+            'strategy': strategy,
+            'threshold': threshold,
+            'schema': schema,
+            'parse_lap_times': parse_lap_times,
+            'lean': lean,
+            'output_dir': os.path.abspath(output_dir) if output_dir is not None else None,
+            'quiet': quiet
+        }
+
+    @staticmethod
+    def find_files(source):
+        """
+        Obtiene los archivos CSV de un directorio o patrón glob, sin incluir
+        las salidas limpias (*_clean.csv) de ejecuciones anteriores.
+
+        Args:
+            source (str): Directorio o patrón glob (admite **)
+
+        Returns:
+            list: Rutas absolutas ordenadas
+        """
+        if os.path.isdir(source):
+            source = os.path.join(source, '*.csv')
+        files = [os.path.abspath(path) for path in glob.glob(source, recursive=True) if os.path.isfile(path)]
+        return sorted(path for path in files if not path.endswith('_clean.csv'))
+
+    def _check_outputs(self, files):
+        """Comprueba que dos archivos no escriban la misma salida limpia."""
+        outputs = {}
+        for path in files:
+            output_filename = CSVManager.generate_clean_filename(path)
+            if self.options['output_dir'] is not None:
+                output_path = os.path.join(self.options['output_dir'], output_filename)
+            else:
+                output_path = CSVManager.get_output_path(output_filename)
+            if output_path in outputs:
+                raise ValueError(f"Los archivos '{outputs[output_path]}' y '{path}' generarían la misma "
+                                 f"salida '{output_path}'. Usa output_dir o renombra los archivos.")
+            outputs[output_path] = path
+
+    def _run_pool(self, files, workers):
+        """
+        Procesa archivos en un pool. Devuelve los resultados y los archivos
+        cuyo proceso se cayó (pool roto).
+        """
+        results = {}
+        broken = []
+        with ProcessPoolExecutor(max_workers=min(workers, len(files))) as executor:
+            futures = {executor.submit(_process_file, path, self.options): path for path in files}
+            for future, path in futures.items():
+                try:
+                    results[path] = future.result()
+                except BrokenProcessPool:
+                    broken.append(path)
+        return results, broken
+
+    def run(self, source):
+        """
+        Procesa en paralelo todos los archivos de `source`.
+
+        Args:
+            source (str): Directorio o patrón glob con los CSV a procesar
+
+        Returns:
+            dict: Resultado consolidado con los resultados por archivo ('files')
+                y los totales del lote ('totals')
+        """
+        files = self.find_files(source)
+        if not files:
+            raise ValueError(f"No se encontraron archivos CSV en '{source}'")
+        self._check_outputs(files)
+
+        print(f"🚀 Procesando {len(files)} archivos con {min(self.workers, len(files))} procesos...")
+        start = time.perf_counter()
+        results, broken = self._run_pool(files, self.workers)
+
+        # Un proceso caído rompe el pool entero: los archivos afectados se reintentan
+        # de uno en uno para aislar al que provoca la caída
+        for path in broken:
+            retried, still_broken = self._run_pool([path], 1)
+            results.update(retried)
+            for failed_path in still_broken:
+                results[failed_path] = {'file': failed_path, 'status': 'error', 'output_path': None,
+                                        'summary': None, 'seconds': 0.0,
+                                        'error': "BrokenProcessPool: el proceso terminó inesperadamente"}
+
+        elapsed = time.perf_counter() - start
+        return self.consolidate([results[path] for path in files], elapsed, min(self.workers, len(files)))
+
+    @staticmethod
+    def consolidate(file_results, elapsed, workers):
+        """
+        Consolida los resúmenes de limpieza (get_cleaning_summary) por archivo.
+
+        Args:
+            file_results (list): Resultados por archivo
+            elapsed (float): Tiempo total del lote en segundos
+            workers (int): Número de procesos usados
+
+        Returns:
+            dict: Resultado consolidado del lote
+        """
+        summaries = [result['summary'] for result in file_results if result['status'] == 'ok']
+        original_rows = sum(int(s['original_shape'][0]) for s in summaries)
+        current_rows = sum(int(s['current_shape'][0]) for s in summaries)
+        original_cells = sum(int(s['original_shape'][0]) * int(s['original_shape'][1]) for s in summaries)
+        current_cells = sum(int(s['current_shape'][0]) * int(s['current_shape'][1]) for s in summaries)
+        original_nulls = sum(int(s['original_nulls']) for s in summaries)
+        remaining_nulls = sum(int(s['remaining_nulls']) for s in summaries)
+
+        original_quality = (original_cells - original_nulls) / original_cells * 100 if original_cells > 0 else 0
+        cleaned_quality = (current_cells - remaining_nulls) / current_cells * 100 if current_cells > 0 else 0
+
+        totals = {
+            'files': len(file_results),
+            'succeeded': len(summaries),
+            'failed': len(file_results) - len(summaries),
+            'original_rows': original_rows,
+            'current_rows': current_rows,
+            'rows_removed': original_rows - current_rows,
+            'original_nulls': original_nulls,
+            'remaining_nulls': remaining_nulls,
+            'nulls_removed': original_nulls - remaining_nulls,
+            'original_quality_score': original_quality,
+            'data_quality_score': cleaned_quality,
+            'quality_improvement': cleaned_quality - original_quality,
+            'data_reduction_percentage': (original_rows - current_rows) / original_rows * 100 if original_rows > 0 else 0,
+            'workers': workers,
+            'elapsed_seconds': elapsed,
+            'files_per_second': len(file_results) / elapsed if elapsed > 0 else 0,
+            'rows_per_second': original_rows / elapsed if elapsed > 0 else 0
+        }
+        return {'files': file_results, 'totals': totals}
+
+    @staticmethod
+    def print_summary(result):
+        """
+        Imprime el resumen consolidado de un lote.
+
+        Args:
+            result (dict): Resultado de run()
+        """
+        totals = result['totals']
+        print("\n=== RESUMEN DEL LOTE ===")
+        for file_result in result['files']:
+            name = os.path.basename(file_result['file'])
+            if file_result['status'] == 'ok':
+                summary = file_result['summary']
+                print(f"  ✅ {name}: {summary['original_shape']} -> {summary['current_shape']} "
+                      f"({file_result['seconds']:.2f}s)")
+            else:
+                print(f"  ❌ {name}: {file_result['error']}")
+        print(f"📂 Archivos: {totals['succeeded']}/{totals['files']} correctos, {totals['failed']} con errores")
+        print(f"🗑️  Filas eliminadas: {totals['rows_removed']} de {totals['original_rows']}")
+        print(f"✅ Valores nulos eliminados: {totals['nulls_removed']} de {totals['original_nulls']}")
+        print(f"📈 Calidad: {totals['original_quality_score']:.2f}% -> {totals['data_quality_score']:.2f}%")
+        print(f"⏱️  {totals['elapsed_seconds']:.2f}s con {totals['workers']} procesos "
+              f"({totals['files_per_second']:.1f} archivos/s, {totals['rows_per_second']:.0f} filas/s)")
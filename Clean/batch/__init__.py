@@ -0,0 +1,14 @@
+"""
+Módulo Batch - Procesamiento de muchos archivos CSV en paralelo
+
+Este módulo reparte los archivos de un directorio o patrón
+glob entre un pool de procesos, aplica a cada uno las etapas
+de limpieza y consolida los resúmenes en un único resultado.
+
+Uso por línea de comandos:
+    python -m Clean.batch "Sources/*.csv" --strategy fill_mean --workers 4
+"""
+
+from .BatchProcessor import BatchProcessor
+
+__all__ = ['BatchProcessor']
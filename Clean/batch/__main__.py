@@ -0,0 +1,48 @@
+import argparse
+import json
+
+from . import BatchProcessor
+from ..cleaner import StreamingCleaner
+
+
+def main(argv=None):
+    """
+    Punto de entrada por línea de comandos del procesamiento por lotes.
+
+    Args:
+        argv (list): Argumentos (por defecto, los de sys.argv)
+
+    Returns:
+        int: Código de salida (1 si algún archivo falló)
+    """
+    parser = argparse.ArgumentParser(prog='python -m Clean.batch',
+                                     description='Limpia en paralelo muchos archivos CSV')
+    parser.add_argument('source', help='Directorio o patrón glob con los CSV (p. ej. "Sources/**/*.csv")')
+    parser.add_argument('--strategy', default='remove_rows', choices=StreamingCleaner.STRATEGIES)
+    parser.add_argument('--threshold', type=float, default=0.5, help='Umbral de nulos para remove_columns')
+    parser.add_argument('--workers', type=int, default=None, help='Número de procesos (por defecto, núcleos)')
+    parser.add_argument('--schema', default=None, help="Esquema de tipos ('auto' o nombre registrado)")
+    parser.add_argument('--parse-lap-times', action='store_true', help='Convertir Q1/Q2/Q3 a milisegundos')
+    parser.add_argument('--lean', action='store_true', help='Limpiar en modo ligero (sin copias)')
+    parser.add_argument('--output-dir', default=None, help='Carpeta de salida de los CSV limpios')
+    parser.add_argument('--json', default=None, help='Guardar el resultado consolidado en este archivo JSON')
+    parser.add_argument('--verbose', action='store_true', help='Mostrar la salida de cada archivo')
+    args = parser.parse_args(argv)
+
+    processor = BatchProcessor(strategy=args.strategy, threshold=args.threshold, workers=args.workers,
+                               schema=args.schema, parse_lap_times=args.parse_lap_times, lean=args.lean,
+                               output_dir=args.output_dir, quiet=not args.verbose)
+    result = processor.run(args.source)
+    BatchProcessor.print_summary(result)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            # Los resúmenes contienen enteros de NumPy y tuplas
+            json.dump(result, f, indent=2, default=lambda value: value.item() if hasattr(value, 'item') else str(value))
+        print(f"💾 Resultado consolidado guardado en: {args.json}")
+
+    return 1 if result['totals']['failed'] else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
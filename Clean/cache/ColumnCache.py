@@ -0,0 +1,401 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from Config.Config import Config
+
+
+class ColumnCache:
+    """
+    Clase responsable de la caché binaria en disco de los CSV cargados.
+    Guarda cada columna como arrays .npy que se cargan con memory-map,
+    sin volver a analizar el texto del CSV.
+
+    Cada entrada se identifica por la ruta del CSV y una variante (p. ej. el
+    esquema aplicado) y se valida con tamaño, fecha de modificación y hash
+    del contenido. El tamaño total se limita con expulsión LRU y las
+    entradas de archivos que ya no existen se eliminan al guardar otra.
+    """
+
+    META_FILE = 'meta.json'
+    FORMAT_VERSION = 1
+    _HASH_BLOCK = 1024 * 1024
+
+    def __init__(self, cache_dir, max_bytes=512 * 1024 * 1024, mmap=True):
+        """
+        Inicializa la caché.
+
+        Args:
+            cache_dir (str): Carpeta donde se guardan las entradas
+            max_bytes (int): Tamaño máximo total de la caché en bytes
+            mmap (bool): Si cargar los arrays con memory-map (copy-on-write)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.mmap = mmap
+
+    @staticmethod
+    def default():
+        """
+        Crea la caché configurada en Config (CACHE_DIR/columns, CACHE_MAX_BYTES).
+
+        Returns:
+            ColumnCache: Caché de columnas del proyecto
+        """
+        # Raíz del proyecto: cache -> Clean -> F1_DB
+        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        return ColumnCache(os.path.join(project_root, Config.CACHE_DIR, 'columns'), Config.CACHE_MAX_BYTES)
+
+    @staticmethod
+    def variant_for(dataset_schema=None, **options):
+        """
+        Construye la variante de una entrada a partir del esquema y opciones de carga,
+        para que cargas con tipos distintos no compartan entrada.
+
+        Args:
+            dataset_schema (DatasetSchema): Esquema aplicado en la carga (o None)
+            **options: Otras opciones que cambian el resultado de la carga
+
+        Returns:
+            str: Variante de la entrada
+        """
+        description = dict(options)
+        if dataset_schema is not None:
+            description['schema'] = [dataset_schema.name, dataset_schema.categorical, dataset_schema.integer,
+                                     dataset_schema.dates, dataset_schema.date_format]
+        return json.dumps(description, sort_keys=True)
+
+    # ------------------------------------------------------------------
+    # Claves y validación
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def content_hash(csv_path):
+        """
+        Calcula el hash del contenido de un archivo.
+
+        Args:
+            csv_path (str): Ruta del archivo
+
+        Returns:
+            str: Hash BLAKE2b en hexadecimal
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        with open(csv_path, 'rb') as f:
+            for block in iter(lambda: f.read(ColumnCache._HASH_BLOCK), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _entry_dir(self, csv_path, variant):
+        key = f"{os.path.abspath(csv_path)}|{variant}".encode('utf-8')
+        return os.path.join(self.cache_dir, hashlib.sha1(key).hexdigest())
+
+    @staticmethod
+    def _read_meta(entry_dir):
+        try:
+            with open(os.path.join(entry_dir, ColumnCache.META_FILE), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_meta(entry_dir, meta):
+        meta_path = os.path.join(entry_dir, ColumnCache.META_FILE)
+        temp_path = meta_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(temp_path, meta_path)
+
+    def _is_fresh(self, entry_dir, meta, csv_path):
+        """
+        Comprueba si una entrada sigue siendo válida para el archivo actual.
+        Si solo cambió la fecha de modificación, se compara el hash del contenido.
+        """
+        if meta.get('format_version') != self.FORMAT_VERSION:
+            return False
+        stat = os.stat(csv_path)
+        if stat.st_size != meta['size']:
+            return False
+        if stat.st_mtime_ns == meta['mtime_ns']:
+            return True
+        if self.content_hash(csv_path) != meta['content_hash']:
+            return False
+        # Mismo contenido con otra fecha (p. ej. archivo copiado): se actualiza la entrada
+        meta['mtime_ns'] = stat.st_mtime_ns
+        self._write_meta(entry_dir, meta)
+        return True
+
+    # ------------------------------------------------------------------
+    # Lectura y escritura de entradas
+    # ------------------------------------------------------------------
+
+    def get(self, csv_path, variant=''):
+        """
+        Obtiene los datos cacheados de un CSV si la entrada es válida.
+        Las entradas obsoletas se eliminan.
+
+        Args:
+            csv_path (str): Ruta del CSV original
+            variant (str): Variante de carga (p. ej. esquema aplicado)
+
+        Returns:
+            pd.DataFrame: Datos cacheados o None si no hay entrada válida
+        """
+        entry_dir = self._entry_dir(csv_path, variant)
+        meta = self._read_meta(entry_dir)
+        if meta is None:
+            return None
+        if not self._is_fresh(entry_dir, meta, csv_path):
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return None
+
+        data = self._load_columns(entry_dir, meta)
+        meta['last_access'] = time.time()
+        self._write_meta(entry_dir, meta)
+        return data
+
+    def put(self, csv_path, data, variant=''):
+        """
+        Guarda un DataFrame en la caché. Las columnas con tipos no soportados
+        (objetos que no son texto) hacen que la entrada no se guarde.
+
+        Args:
+            csv_path (str): Ruta del CSV original
+            data (pd.DataFrame): Datos cargados del CSV
+            variant (str): Variante de carga (p. ej. esquema aplicado)
+
+        Returns:
+            bool: True si la entrada se guardó
+        """
+        if not isinstance(data.index, pd.RangeIndex) or data.index.start != 0 or data.index.step != 1:
+            return False
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        stat = os.stat(csv_path)
+        temp_dir = tempfile.mkdtemp(prefix='tmp-', dir=self.cache_dir)
+        try:
+            columns = []
+            for position, col in enumerate(data.columns):
+                column_meta = self._save_column(temp_dir, f"c{position}", data[col])
+                if column_meta is None:
+                    return False
+                column_meta['name'] = col
+                columns.append(column_meta)
+
+            nbytes = sum(os.path.getsize(os.path.join(temp_dir, name)) for name in os.listdir(temp_dir))
+            meta = {
+                'format_version': self.FORMAT_VERSION,
+                'path': os.path.abspath(csv_path),
+                'variant': variant,
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'content_hash': self.content_hash(csv_path),
+                'rows': len(data),
+                'columns': columns,
+                'nbytes': nbytes,
+                'last_access': time.time()
+            }
+            self._write_meta(temp_dir, meta)
+
+            entry_dir = self._entry_dir(csv_path, variant)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(temp_dir, entry_dir)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        self.evict()
+        return True
+
+    def load(self, csv_path, reader, variant=''):
+        """
+        Carga un CSV desde la caché o, si no hay entrada válida, con `reader`
+        y guarda el resultado para las siguientes cargas.
+
+        Args:
+            csv_path (str): Ruta del CSV
+            reader (callable): Función reader(csv_path) -> pd.DataFrame
+            variant (str): Variante de carga (p. ej. esquema aplicado)
+
+        Returns:
+            tuple: (pd.DataFrame, bool indicando si vino de la caché)
+        """
+        data = self.get(csv_path, variant)
+        if data is not None:
+            return data, True
+        data = reader(csv_path)
+        self.put(csv_path, data, variant)
+        return data, False
+
+    @staticmethod
+    def _save_array(directory, name, array):
+        np.save(os.path.join(directory, f"{name}.npy"), array, allow_pickle=False)
+        return f"{name}.npy"
+
+    @staticmethod
+    def encode_column(series):
+        """
+        Codifica una columna como arrays NumPy sin objetos Python.
+        - Numéricas, booleanas y fechas: un array tal cual
+        - Texto: códigos int32 + array de valores únicos
+        - Categóricas: códigos + categorías
+        - Enteros con nulos ('Int64', ...): valores + máscara
+
+        Args:
+            series (pd.Series): Columna a codificar
+
+        Returns:
+            tuple: (descripción, lista de (sufijo, array)) o None si el tipo no está soportado
+        """
+        dtype = series.dtype
+
+        if isinstance(dtype, pd.CategoricalDtype):
+            categories = np.asarray(dtype.categories)
+            if categories.dtype == object:
+                if pd.api.types.infer_dtype(categories, skipna=False) != 'string':
+                    return None
+                categories = categories.astype(str)
+            return ({'kind': 'category', 'ordered': bool(dtype.ordered)},
+                    [('_codes', series.cat.codes.to_numpy()), ('_values', categories)])
+
+        if isinstance(dtype, pd.api.extensions.ExtensionDtype):
+            if not isinstance(series.array, pd.arrays.IntegerArray | pd.arrays.FloatingArray
+                              | pd.arrays.BooleanArray):
+                return None
+            return ({'kind': 'masked', 'dtype': str(dtype)},
+                    [('_data', series.array._data), ('_mask', series.array._mask)])
+
+        if dtype == object:
+            if pd.api.types.infer_dtype(series, skipna=True) not in ('string', 'empty'):
+                return None
+            codes, uniques = pd.factorize(series)
+            uniques = np.asarray(uniques, dtype=str) if len(uniques) else np.array([], dtype='U1')
+            return {'kind': 'text'}, [('_codes', codes.astype(np.int32)), ('_values', uniques)]
+
+        if dtype.kind in 'biufmM':
+            return {'kind': 'numpy'}, [('', series.to_numpy())]
+
+        return None
+
+    @staticmethod
+    def decode_column(column, arrays):
+        """
+        Reconstruye los valores de una columna codificada con encode_column.
+
+        Args:
+            column (dict): Descripción de la columna
+            arrays (list): Arrays en el orden de encode_column
+
+        Returns:
+            Valores de la columna (array o Categorical)
+        """
+        kind = column['kind']
+        if kind == 'numpy':
+            # Vista ndarray (sobre el memory-map, sin copiar los datos)
+            return arrays[0].view(np.ndarray)
+        if kind == 'category':
+            categories = arrays[1]
+            if categories.dtype.kind == 'U':
+                categories = categories.astype(object)
+            return pd.Categorical.from_codes(np.asarray(arrays[0]), categories=categories,
+                                             ordered=column['ordered'])
+        if kind == 'masked':
+            array_type = pd.api.types.pandas_dtype(column['dtype']).construct_array_type()
+            return array_type(np.asarray(arrays[0]), np.asarray(arrays[1]))
+        # El código -1 (nulo) apunta al NaN añadido al final de los valores únicos
+        uniques = np.append(arrays[1].astype(object), np.nan)
+        return uniques[arrays[0]]
+
+    @staticmethod
+    def _save_column(directory, prefix, series):
+        """
+        Guarda una columna (ver encode_column) y devuelve su descripción,
+        o None si el tipo no está soportado.
+        """
+        encoded = ColumnCache.encode_column(series)
+        if encoded is None:
+            return None
+        column, arrays = encoded
+        column['files'] = [ColumnCache._save_array(directory, f"{prefix}{suffix}", array)
+                           for suffix, array in arrays]
+        return column
+
+    def _load_columns(self, entry_dir, meta):
+        """Reconstruye el DataFrame a partir de los arrays de una entrada."""
+        mmap_mode = 'c' if self.mmap else None
+
+        def load(file_name):
+            # Los valores únicos y las categorías se cargan en memoria; el resto con memory-map
+            mmap = None if file_name.endswith('_values.npy') else mmap_mode
+            return np.load(os.path.join(entry_dir, file_name), mmap_mode=mmap, allow_pickle=False)
+
+        columns = {}
+        for column in meta['columns']:
+            columns[column['name']] = self.decode_column(column, [load(name) for name in column['files']])
+
+        data = pd.DataFrame(columns, copy=False)
+        if len(columns) == 0:
+            data = pd.DataFrame(index=pd.RangeIndex(meta['rows']))
+        return data
+
+    # ------------------------------------------------------------------
+    # Mantenimiento
+    # ------------------------------------------------------------------
+
+    def entries(self):
+        """
+        Lista las entradas de la caché.
+
+        Returns:
+            list: Tuplas (carpeta, meta) de cada entrada válida
+        """
+        if not os.path.isdir(self.cache_dir):
+            return []
+        result = []
+        for name in os.listdir(self.cache_dir):
+            entry_dir = os.path.join(self.cache_dir, name)
+            if name.startswith('tmp-') or not os.path.isdir(entry_dir):
+                continue
+            meta = self._read_meta(entry_dir)
+            if meta is not None:
+                result.append((entry_dir, meta))
+        return result
+
+    def total_bytes(self):
+        """Tamaño total de las entradas de la caché en bytes."""
+        return sum(meta.get('nbytes', 0) for _, meta in self.entries())
+
+    def evict(self):
+        """
+        Elimina las entradas cuyo CSV ya no existe (p. ej. archivos temporales)
+        y expulsa las usadas menos recientemente hasta respetar max_bytes.
+
+        Returns:
+            int: Número de entradas expulsadas
+        """
+        entries = []
+        evicted = 0
+        for entry_dir, meta in self.entries():
+            if meta.get('path') and not os.path.exists(meta['path']):
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                evicted += 1
+            else:
+                entries.append((entry_dir, meta))
+        entries.sort(key=lambda entry: entry[1].get('last_access', 0))
+        total = sum(meta.get('nbytes', 0) for _, meta in entries)
+        for entry_dir, meta in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= meta.get('nbytes', 0)
+            evicted += 1
+        return evicted
+
+    def clear(self):
+        """Elimina todas las entradas de la caché."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
@@ -0,0 +1,11 @@
+"""
+Módulo Cache - Caché binaria por columnas
+
+Este módulo guarda en disco los CSV ya cargados como arrays
+NumPy por columna, para que las siguientes cargas los lean
+con memory-map en lugar de volver a analizar el texto.
+"""
+
+from .ColumnCache import ColumnCache
+
+__all__ = ['ColumnCache']
@@ -0,0 +1,108 @@
+import pandas as pd
+import numpy as np
+
+
+class CleaningPlan:
+    """
+    Plan de limpieza declarativo por columna.
+
+    Asigna una estrategia a cada columna (por nombre o por tipo de dato) y,
+    opcionalmente, un predicado de eliminación de filas. DataCleaner.clean_plan
+    lo ejecuta en una sola pasada: calcula juntas todas las estadísticas
+    necesarias y escribe cada columna una única vez.
+
+    El resultado equivale a aplicar, en este orden, las estrategias existentes
+    sobre las columnas correspondientes:
+    1. Eliminar las filas que cumplen el predicado y las que tienen nulos en
+       las columnas con 'remove_rows'
+    2. Eliminar las columnas con 'remove_columns' que superan el umbral de nulos
+    3. Rellenar cada columna con su estrategia ('fill_forward', 'fill_mean'
+       -media o moda según el tipo- o 'fill_zero')
+    """
+
+    ROW_STRATEGIES = ['remove_rows']
+    COLUMN_STRATEGIES = ['remove_columns']
+    FILL_STRATEGIES = ['fill_forward', 'fill_mean', 'fill_zero']
+    STRATEGIES = ['keep'] + ROW_STRATEGIES + COLUMN_STRATEGIES + FILL_STRATEGIES
+
+    def __init__(self, columns=None, dtypes=None, default='keep', drop_rows=None, threshold=0.5):
+        """
+        Define el plan.
+
+        Args:
+            columns (dict): Columna -> estrategia (tiene prioridad sobre dtypes)
+            dtypes (dict): Tipo de dato -> estrategia; acepta los selectores de
+                DataFrame.select_dtypes ('number', 'object', 'category', 'Int64'...)
+            default (str): Estrategia del resto de columnas ('keep' las deja igual)
+            drop_rows: Predicado de eliminación de filas: función que recibe el
+                DataFrame y devuelve una máscara booleana (True = eliminar), o
+                lista de columnas cuyas filas con nulos se eliminan
+            threshold (float): Umbral de nulos para 'remove_columns'
+        """
+        self.columns = dict(columns or {})
+        self.dtypes = dict(dtypes or {})
+        self.default = default
+        self.drop_rows = drop_rows
+        self.threshold = threshold
+
+        for strategy in list(self.columns.values()) + list(self.dtypes.values()) + [default]:
+            if strategy not in self.STRATEGIES:
+                raise ValueError(f"Estrategia '{strategy}' no reconocida. "
+                                 f"Estrategias disponibles: {self.STRATEGIES}")
+
+    def __repr__(self):
+        parts = [f"{col}={strategy}" for col, strategy in self.columns.items()]
+        parts += [f"<{dtype}>={strategy}" for dtype, strategy in self.dtypes.items()]
+        parts.append(f"*={self.default}")
+        if self.drop_rows is not None:
+            parts.append("drop_rows")
+        return f"CleaningPlan({', '.join(parts)})"
+
+    def resolve(self, data: pd.DataFrame):
+        """
+        Estrategia de cada columna de los datos.
+
+        Args:
+            data (pd.DataFrame): Datos a limpiar
+
+        Returns:
+            dict: Columna -> estrategia, en el orden de las columnas de los datos
+        """
+        unknown = [col for col in self.columns if col not in data.columns]
+        if unknown:
+            raise ValueError(f"Columnas del plan que no existen en los datos: {unknown}")
+
+        strategies = {col: self.default for col in data.columns}
+        # Los tipos se aplican en el orden declarado; los nombres tienen prioridad
+        for dtype, strategy in self.dtypes.items():
+            for col in data.select_dtypes(include=[dtype]).columns:
+                strategies[col] = strategy
+        for col, strategy in self.columns.items():
+            strategies[col] = strategy
+        return strategies
+
+    def row_mask(self, data: pd.DataFrame, null_mask):
+        """
+        Filas a eliminar según el predicado y las columnas con 'remove_rows'.
+
+        Args:
+            data (pd.DataFrame): Datos a limpiar
+            null_mask (pd.DataFrame): Máscara de nulos de los datos
+
+        Returns:
+            np.ndarray: Máscara booleana (True = eliminar)
+        """
+        strategies = self.resolve(data)
+        columns = [col for col, strategy in strategies.items() if strategy == 'remove_rows']
+        if isinstance(self.drop_rows, (list, tuple)):
+            columns += [col for col in self.drop_rows if col not in columns]
+
+        mask = np.zeros(len(data), dtype=bool)
+        if columns:
+            mask |= null_mask[columns].to_numpy().any(axis=1)
+        if callable(self.drop_rows):
+            predicate = np.asarray(self.drop_rows(data), dtype=bool)
+            if predicate.shape != (len(data),):
+                raise ValueError("El predicado de filas debe devolver una máscara con una entrada por fila")
+            mask |= predicate
+        return mask
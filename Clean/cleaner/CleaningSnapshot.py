@@ -0,0 +1,148 @@
+import copy
+
+import numpy as np
+import pandas as pd
+from ..analyzer import DataProfile
+
+
+class CleaningSnapshot:
+    """
+    Clase responsable de recordar el estado original de unos datos que se
+    limpian en el sitio (modo ligero de DataCleaner) sin guardar una copia
+    completa.
+
+    Guarda el perfil original (máscara de nulos, conteos, forma, tipos) y un
+    registro de cambios compacto: filas y columnas eliminadas y máscaras
+    empaquetadas de las celdas rellenadas. Con él se pueden generar reportes
+    (CleaningReport acepta la instantánea como datos originales) y
+    reconstruir los datos originales con restore().
+    """
+
+    HEAD_ROWS = 5
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Toma la instantánea de los datos antes de limpiarlos.
+
+        Args:
+            data (pd.DataFrame): Los datos originales
+        """
+        self.shape = data.shape
+        self.columns = data.columns
+        self.dtypes = data.dtypes
+        self._head = data.head(self.HEAD_ROWS).copy()
+        self._changes = []
+
+        # La instantánea se comporta como los datos originales ante DataProfile;
+        # los datos se limpian en el sitio, así que el perfil no los referencia
+        self.profile = copy.copy(DataProfile.of(data)).detach()
+
+    def head(self, n=5):
+        """
+        Primeras filas de los datos originales.
+
+        Args:
+            n (int): Número de filas (como máximo HEAD_ROWS)
+
+        Returns:
+            pd.DataFrame: Primeras filas originales
+        """
+        return self._head.head(n)
+
+    @property
+    def changes(self):
+        """Número de cambios registrados desde la instantánea."""
+        return len(self._changes)
+
+    @property
+    def nbytes(self):
+        """Memoria aproximada del registro de cambios en bytes."""
+        total = 0
+        for kind, payload in self._changes:
+            if kind == 'rows':
+                positions, removed = payload
+                total += positions.nbytes + int(removed.memory_usage(deep=True).sum())
+            elif kind == 'columns':
+                total += sum(int(series.memory_usage(deep=True)) for _, _, series in payload)
+            else:
+                total += sum(packed.nbytes for packed, _, _ in payload.values())
+        return total
+
+    def record_removed_rows(self, data: pd.DataFrame, mask):
+        """
+        Registra las filas que se van a eliminar.
+
+        Args:
+            data (pd.DataFrame): Datos antes de eliminar las filas
+            mask (np.ndarray): Máscara booleana de las filas eliminadas
+        """
+        positions = np.flatnonzero(mask)
+        if len(positions) > 0:
+            self._changes.append(('rows', (positions, data.iloc[positions])))
+
+    def record_removed_columns(self, data: pd.DataFrame, columns, rows=None):
+        """
+        Registra las columnas que se van a eliminar. Las columnas no se copian:
+        la instantánea se queda con las series que salen de los datos.
+
+        Args:
+            data (pd.DataFrame): Datos antes de eliminar las columnas
+            columns (list): Columnas a eliminar
+            rows (np.ndarray): Posiciones de las filas que se conservan, si en la
+                misma pasada también se eliminan filas (ver record_removed_rows)
+        """
+        if len(columns) > 0:
+            removed = [(data.columns.get_loc(col), col, data[col] if rows is None else data[col].iloc[rows])
+                       for col in columns]
+            self._changes.append(('columns', sorted(removed, key=lambda item: item[0])))
+
+    def record_filled_cells(self, data: pd.DataFrame, columns=None):
+        """
+        Registra las celdas nulas que se van a rellenar como máscaras de bits.
+
+        Args:
+            data (pd.DataFrame): Datos antes de rellenar
+            columns (list): Columnas a rellenar (por defecto, todas las que tienen nulos)
+        """
+        profile = DataProfile.of(data)
+        if columns is None:
+            columns = profile.null_counts[profile.null_counts > 0].index
+        filled = {}
+        for col in columns:
+            if profile.null_counts[col] > 0:
+                mask = profile.null_mask[col].to_numpy()
+                filled[col] = (np.packbits(mask), len(mask), data[col].dtype)
+        if filled:
+            self._changes.append(('fill', filled))
+
+    def restore(self, data: pd.DataFrame):
+        """
+        Reconstruye los datos originales deshaciendo los cambios registrados
+        sobre los datos actuales (que no se modifican).
+
+        Args:
+            data (pd.DataFrame): Datos limpios actuales
+
+        Returns:
+            pd.DataFrame: Datos originales
+        """
+        restored = data.copy()
+        for kind, payload in reversed(self._changes):
+            if kind == 'fill':
+                for col, (packed, length, dtype) in payload.items():
+                    mask = np.unpackbits(packed, count=length).astype(bool)
+                    restored[col] = restored[col].mask(mask).astype(dtype)
+            elif kind == 'columns':
+                for position, col, series in payload:
+                    restored.insert(position, col, series)
+            else:
+                positions, removed = payload
+                kept = np.ones(len(restored) + len(positions), dtype=bool)
+                kept[positions] = False
+                order = np.argsort(np.concatenate([np.flatnonzero(kept), positions]), kind='stable')
+                restored = pd.concat([restored, removed]).iloc[order]
+        return restored
+
+    def clear(self):
+        """Descarta el registro de cambios (p. ej. tras restaurar los datos)."""
+        self._changes = []
@@ -1,6 +1,12 @@
 import pandas as pd
 import numpy as np
-from ..analyzer import DataAnalyzer
+from ..analyzer import DataAnalyzer, DataProfile
+from ..metrics import PipelineMetrics
+from ..validation import RuleEngine
+from .CleaningSnapshot import CleaningSnapshot
+from .CleaningPlan import CleaningPlan
+from .GroupImputer import GroupImputer
+from .Deduplicator import Deduplicator
 
 
 class DataCleaner:
@@ -9,16 +15,57 @@ class DataCleaner:
     Se enfoca en transformar y limpiar los datos según diferentes estrategias.
     """
     
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, lean=False, metrics=None, shared=False):
         """
         Inicializa el limpiador con un DataFrame.
         
         Args:
             data (pd.DataFrame): Los datos a limpiar
+            lean (bool): Modo ligero: limpia `data` en el sitio sin copiarlo y
+                guarda en `original_data` una CleaningSnapshot (máscara de nulos
+                y registro de cambios) en lugar de una copia completa
+            metrics (PipelineMetrics): Si se indica, clean_data mide cada
+                estrategia como una etapa 'clean.<estrategia>'
+            shared (bool): `data` es una entrada compartida de solo lectura (p. ej.
+                entre varios limpiadores de StrategyEvaluator): no se copia;
+                `original_data` es `data` y las estrategias trabajan sobre una
+                copia superficial (reemplazan columnas, nunca escriben en ellas)
         """
-        self.original_data = data.copy()
-        self.data = data.copy()
+        if lean and shared:
+            raise ValueError("El modo ligero limpia en el sitio: no admite datos compartidos")
+        self.lean = lean
+        self.metrics = metrics or PipelineMetrics.DISABLED
         self.original_shape = data.shape
+        self.dedup_stats = None
+        self.validation_stats = None
+        self.quarantined = None
+        
+        if lean:
+            self.original_data = CleaningSnapshot(data)
+            self.data = data
+        elif shared:
+            self.original_data = data
+            self.data = data.copy(deep=False)
+            DataProfile.share(data, self.data)
+        else:
+            self.original_data = data.copy()
+            self.data = data.copy()
+            
+            # Las copias tienen el mismo contenido: reutilizan el perfil si ya existe
+            DataProfile.share(data, self.original_data)
+            DataProfile.share(data, self.data)
+        
+    def _profile(self):
+        """
+        Perfil de los datos actuales. Los datos que el limpiador crea (todos
+        salvo los del usuario en modo ligero) se registran para memorizarlo.
+        
+        Returns:
+            DataProfile: Perfil de self.data
+        """
+        if not self.lean:
+            DataProfile.register(self.data)
+        return DataProfile.of(self.data)
         
     def clean_remove_rows(self):
         """
@@ -27,7 +74,11 @@ class DataCleaner:
         Returns:
             pd.DataFrame: Datos con filas nulas eliminadas
         """
-        self.data = self.data.dropna()
+        # Reutiliza la máscara de nulos del perfil en lugar de recalcularla (dropna)
+        rows_with_nulls = self._profile().null_mask.any(axis=1).to_numpy()
+        if self.lean:
+            self.original_data.record_removed_rows(self.data, rows_with_nulls)
+        self.data = self.data[~rows_with_nulls]
         return self.data
         
     def clean_remove_columns(self, threshold=0.5):
@@ -42,6 +93,12 @@ class DataCleaner:
         """
         analyzer = DataAnalyzer(self.data)
         columns_to_drop = analyzer.get_columns_by_null_percentage(threshold)
+        if self.lean:
+            self.original_data.record_removed_columns(self.data, columns_to_drop)
+            for col in columns_to_drop:
+                del self.data[col]
+            DataProfile.invalidate(self.data)
+            return self.data
         self.data = self.data.drop(columns=columns_to_drop)
         return self.data
         
@@ -52,6 +109,13 @@ class DataCleaner:
         Returns:
             pd.DataFrame: Datos con valores rellenados hacia adelante
         """
+        if self.lean:
+            self.original_data.record_filled_cells(self.data)
+            self.data.ffill(inplace=True)
+            self.data.bfill(inplace=True)
+            DataProfile.invalidate(self.data)
+            return self.data
+        
         # Rellenar valores nulos con el valor anterior
         self.data = self.data.fillna(method='ffill')
         # Si aún quedan nulos al inicio, usar backward fill
@@ -66,10 +130,18 @@ class DataCleaner:
         Returns:
             pd.DataFrame: Datos con valores rellenados con media/moda
         """
+        if self.lean:
+            self.original_data.record_filled_cells(self.data)
+        
         # Rellenar valores nulos con la media para columnas numéricas
         numeric_columns = self.data.select_dtypes(include=[np.number]).columns
         for col in numeric_columns:
-            self.data[col] = self.data[col].fillna(self.data[col].mean())
+            mean = self.data[col].mean()
+            # Las columnas enteras con nulos ('Int64', p. ej. tiempos en milisegundos)
+            # conservan su tipo: la media se redondea
+            if pd.api.types.is_integer_dtype(self.data[col].dtype) and pd.notna(mean):
+                mean = round(mean)
+            self.data[col] = self.data[col].fillna(mean)
             
         # Para columnas no numéricas, usar el valor más frecuente
         non_numeric_columns = self.data.select_dtypes(exclude=[np.number]).columns
@@ -77,7 +149,9 @@ class DataCleaner:
             most_frequent = self.data[col].mode()
             if len(most_frequent) > 0:
                 self.data[col] = self.data[col].fillna(most_frequent[0])
-                
+        
+        # Los datos se modificaron en el sitio: el perfil memorizado ya no es válido
+        DataProfile.invalidate(self.data)
         return self.data
         
     def clean_fill_zero(self):
@@ -87,10 +161,183 @@ class DataCleaner:
         Returns:
             pd.DataFrame: Datos con valores nulos reemplazados por ceros
         """
-        self.data = self.data.fillna(0)
+        null_counts = self._profile().null_counts
+        null_columns = null_counts[null_counts > 0].index
+        if self.lean:
+            self.original_data.record_filled_cells(self.data, null_columns)
+        
+        # Las columnas categóricas solo aceptan valores de sus categorías
+        for col in null_columns:
+            series = self.data[col]
+            if isinstance(series.dtype, pd.CategoricalDtype) and 0 not in series.cat.categories:
+                self.data[col] = series.cat.add_categories([0])
+                DataProfile.invalidate(self.data)
+                
+        if self.lean:
+            self.data.fillna({col: 0 for col in null_columns}, inplace=True)
+            DataProfile.invalidate(self.data)
+            return self.data
+        self.data = self.data.fillna({col: 0 for col in null_columns})
         return self.data
     
-    def clean_data(self, strategy='remove_rows', threshold=0.5):
+    def clean_fill_group(self, method='mean', groups='race'):
+        """
+        Rellena valores nulos con la media, la mediana o la moda de su grupo
+        (p. ej. la misma carrera) y, si el grupo es todo nulo, con la de un
+        grupo más amplio (ver GroupImputer).
+        
+        Args:
+            method (str): 'mean', 'median' o 'mode'
+            groups (str | list): Jerarquía de agrupación ('race', 'circuit',
+                'constructor') o lista de niveles de columnas
+            
+        Returns:
+            pd.DataFrame: Datos con valores rellenados por grupo
+        """
+        imputer = GroupImputer(method=method, groups=groups)
+        # Las columnas de agrupación no se imputan
+        keys = {col for level in imputer.groups for col in level}
+        null_counts = self._profile().null_counts
+        columns = [col for col in null_counts[null_counts > 0].index if col not in keys]
+        if self.lean:
+            self.original_data.record_filled_cells(self.data, columns)
+        
+        for col, values in imputer.fill_values(self.data, columns).items():
+            self.data[col] = values
+        DataProfile.invalidate(self.data)
+        return self.data
+        
+    def clean_duplicates(self, key=None, policy='latest'):
+        """
+        Resuelve las filas con la misma clave (por defecto Season, Round,
+        DriverID) según una política (ver Deduplicator). Las estadísticas
+        quedan en `dedup_stats`.
+        
+        Args:
+            key (list): Columnas de la clave
+            policy (str): 'latest', 'most_complete' o 'merge'
+            
+        Returns:
+            pd.DataFrame: Datos con una fila por clave
+        """
+        deduplicator = Deduplicator(key=key, policy=policy)
+        with self.metrics.stage('dedup', rows_in=len(self.data)) as stage:
+            deduped = deduplicator.resolve(self.data)
+            if self.lean:
+                self.original_data.record_removed_rows(self.data, ~deduplicator.kept)
+                if deduplicator.stats['merged_cells'] > 0:
+                    # Nulos de las filas conservadas antes de completarlas
+                    self.original_data.record_filled_cells(self.data[deduplicator.kept])
+            self.data = deduped
+            stage.rows_out = len(deduped)
+        self.dedup_stats = deduplicator.stats
+        return self.data
+        
+    def clean_invalid(self, rules=None, quarantine=False):
+        """
+        Elimina las filas que incumplen alguna regla de validación (ver
+        RuleEngine). Las estadísticas quedan en `validation_stats`.
+        
+        Args:
+            rules (list | RuleEngine): Reglas a evaluar (por defecto las de dominio F1)
+            quarantine (bool): Si guardar las filas eliminadas en `quarantined`,
+                con una columna 'Violations' con los nombres de las reglas incumplidas
+            
+        Returns:
+            pd.DataFrame: Datos sin las filas inválidas
+        """
+        engine = rules if isinstance(rules, RuleEngine) else RuleEngine(rules)
+        mask, self.validation_stats = engine.validate(self.data)
+        invalid = mask != 0
+        if quarantine:
+            self.quarantined = self.data[invalid].assign(Violations=engine.describe(mask[invalid]))
+        if invalid.any():
+            if self.lean:
+                self.original_data.record_removed_rows(self.data, invalid)
+            self.data = self.data[~invalid]
+        return self.data
+        
+    @staticmethod
+    def _fill_column(series, strategy):
+        """
+        Rellena una columna igual que la estrategia equivalente sobre todo el DataFrame.
+        """
+        if strategy == 'fill_forward':
+            return series.ffill().bfill()
+        if strategy == 'fill_mean':
+            if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+                mean = series.mean()
+                if pd.api.types.is_integer_dtype(series.dtype) and pd.notna(mean):
+                    mean = round(mean)
+                return series.fillna(mean)
+            most_frequent = series.mode()
+            return series.fillna(most_frequent[0]) if len(most_frequent) > 0 else series
+        # fill_zero: las columnas categóricas solo aceptan valores de sus categorías
+        if isinstance(series.dtype, pd.CategoricalDtype) and 0 not in series.cat.categories:
+            series = series.cat.add_categories([0])
+        return series.fillna(0)
+        
+    def clean_plan(self, plan):
+        """
+        Limpia los datos con un plan por columna (ver CleaningPlan) en una sola
+        pasada: la máscara de filas se calcula una vez con la máscara de nulos
+        del perfil y cada columna se recorta, se rellena y se escribe una vez.
+        
+        Args:
+            plan (CleaningPlan | dict): Plan de limpieza (un dict se interpreta
+                como columna -> estrategia)
+        
+        Returns:
+            pd.DataFrame: Datos limpios
+        """
+        if isinstance(plan, dict):
+            plan = CleaningPlan(columns=plan)
+        strategies = plan.resolve(self.data)
+        null_mask = self._profile().null_mask
+        
+        # 1. Filas: predicado + nulos en las columnas con 'remove_rows'
+        drop = plan.row_mask(self.data, null_mask)
+        positions = np.flatnonzero(~drop) if drop.any() else None
+        nulls = null_mask.to_numpy() if positions is None else null_mask.to_numpy()[positions]
+        null_counts = pd.Series(nulls.sum(axis=0), index=self.data.columns)
+        
+        # 2. Columnas: porcentaje de nulos calculado sobre las filas que quedan
+        total_rows = len(self.data) if positions is None else len(positions)
+        null_percentages = null_counts / total_rows if total_rows else null_counts.astype('float64')
+        dropped = [col for col, strategy in strategies.items()
+                   if strategy == 'remove_columns' and null_percentages[col] > plan.threshold]
+        
+        # 3. Relleno: cada columna se escribe una sola vez
+        columns = {}
+        filled = {}
+        for col in self.data.columns:
+            if col in dropped:
+                continue
+            series = self.data[col] if positions is None else self.data[col].iloc[positions]
+            if strategies[col] in CleaningPlan.FILL_STRATEGIES and null_counts[col] > 0:
+                filled[col] = series
+                series = self._fill_column(series, strategies[col])
+            columns[col] = series
+        
+        if self.lean:
+            # Se registra en el mismo orden que las estrategias encadenadas
+            self.original_data.record_removed_rows(self.data, drop)
+            self.original_data.record_removed_columns(self.data, dropped, positions)
+            self.original_data.record_filled_cells(pd.DataFrame(filled, copy=False))
+        
+        if positions is None:
+            for col in dropped:
+                del self.data[col]
+            for col in filled:
+                self.data[col] = columns[col]
+            DataProfile.invalidate(self.data)
+        else:
+            index = self.data.index[positions]
+            self.data = pd.DataFrame({col: series.array for col, series in columns.items()},
+                                     index=index, columns=list(columns), copy=False)
+        return self.data
+    
+    def clean_data(self, strategy='remove_rows', threshold=0.5, groups='race'):
         """
         Limpia los datos según la estrategia especificada.
         
@@ -101,25 +348,55 @@ class DataCleaner:
                 - 'fill_forward': Rellenar con el valor anterior
                 - 'fill_mean': Rellenar con la media (solo columnas numéricas)
                 - 'fill_zero': Rellenar con ceros
+                - 'fill_group_mean', 'fill_group_median', 'fill_group_mode':
+                  Rellenar con la media/mediana/moda de cada grupo (ver clean_fill_group)
+                - 'remove_invalid': Eliminar filas que incumplen las reglas de dominio
+                - 'quarantine_invalid': Igual, pero apartando esas filas en `quarantined`
+                  (ver clean_invalid)
+                También acepta un CleaningPlan o un dict columna -> estrategia
+                (ver clean_plan)
             threshold (float): Umbral para eliminar columnas (% de nulos)
+            groups (str | list): Jerarquía de grupos de las estrategias 'fill_group_*'
         
         Returns:
             pd.DataFrame: Datos limpios
         """
+        if isinstance(strategy, dict):
+            strategy = CleaningPlan(columns=strategy, threshold=threshold)
+        if isinstance(strategy, CleaningPlan):
+            with self.metrics.stage('clean.plan', rows_in=len(self.data)) as stage:
+                result = self.clean_plan(strategy)
+                stage.rows_out = len(result)
+            return self._own(result)
+        
         strategy_methods = {
             'remove_rows': self.clean_remove_rows,
             'remove_columns': lambda: self.clean_remove_columns(threshold),
             'fill_forward': self.clean_fill_forward,
             'fill_mean': self.clean_fill_mean,
-            'fill_zero': self.clean_fill_zero
+            'fill_zero': self.clean_fill_zero,
+            'fill_group_mean': lambda: self.clean_fill_group('mean', groups),
+            'fill_group_median': lambda: self.clean_fill_group('median', groups),
+            'fill_group_mode': lambda: self.clean_fill_group('mode', groups),
+            'remove_invalid': self.clean_invalid,
+            'quarantine_invalid': lambda: self.clean_invalid(quarantine=True)
         }
         
         if strategy in strategy_methods:
-            return strategy_methods[strategy]()
+            with self.metrics.stage(f'clean.{strategy}', rows_in=len(self.data)) as stage:
+                result = strategy_methods[strategy]()
+                stage.rows_out = len(result)
+            return self._own(result)
         else:
             raise ValueError(f"Estrategia '{strategy}' no reconocida. "
                            f"Estrategias disponibles: {list(strategy_methods.keys())}")
     
+    def _own(self, result):
+        """Registra los datos limpios creados por el limpiador (ver DataProfile.register)."""
+        if not self.lean:
+            DataProfile.register(result)
+        return result
+    
     def get_cleaned_data(self):
         """
         Retorna los datos limpios actuales.
@@ -131,11 +408,14 @@ class DataCleaner:
     
     def get_original_data(self):
         """
-        Retorna los datos originales sin modificar.
+        Retorna los datos originales sin modificar. En modo ligero se
+        reconstruyen a partir de la instantánea.
         
         Returns:
             pd.DataFrame: Datos originales
         """
+        if self.lean:
+            return self.original_data.restore(self.data)
         return self.original_data
     
     def reset_data(self):
@@ -145,5 +425,10 @@ class DataCleaner:
         Returns:
             pd.DataFrame: Datos restaurados al estado original
         """
+        if self.lean:
+            self.data = self.original_data.restore(self.data)
+            self.original_data.clear()
+            DataProfile.share(self.original_data, self.data)
+            return self.data
         self.data = self.original_data.copy()
         return self.data
@@ -0,0 +1,257 @@
+import numpy as np
+import pandas as pd
+
+
+class Deduplicator:
+    """
+    Clase responsable de detectar y resolver duplicados lógicos: filas con la
+    misma clave (por defecto Season, Round, DriverID) aunque otros campos
+    difieran, como ocurre al combinar varias fuentes.
+
+    Políticas de resolución:
+    - 'latest': se conserva la última aparición de la clave
+    - 'most_complete': se conserva la fila con menos nulos (la última si empatan)
+    - 'merge': la última aparición, con sus nulos completados con el valor no
+      nulo más reciente de las apariciones anteriores
+
+    La fila resultante ocupa la posición de la fila conservada (la última
+    aparición en 'latest' y 'merge'). Las claves se reducen a un hash de 64
+    bits por fila (pd.util.hash_pandas_object, por valor, también en columnas
+    categóricas), de modo que el modo por bloques solo necesita 8 bytes por
+    fila y las filas de las claves repetidas.
+    """
+
+    KEY = ['Season', 'Round', 'DriverID']
+    POLICIES = ['latest', 'most_complete', 'merge']
+
+    def __init__(self, key=None, policy='latest'):
+        """
+        Args:
+            key (list): Columnas de la clave (por defecto KEY)
+            policy (str): 'latest', 'most_complete' o 'merge'
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Política '{policy}' no reconocida. Políticas disponibles: {self.POLICIES}")
+        self.key = list(self.KEY if key is None else key)
+        self.policy = policy
+        self.stats = None
+        self.kept = None
+
+    def key_hashes(self, data: pd.DataFrame):
+        """
+        Hash de la clave de cada fila.
+
+        Returns:
+            np.ndarray: uint64 por fila
+        """
+        missing = [col for col in self.key if col not in data.columns]
+        if missing:
+            raise ValueError(f"Columnas de la clave no encontradas: {missing}")
+        return pd.util.hash_pandas_object(data[self.key], index=False).to_numpy()
+
+    @staticmethod
+    def _plan(hashes, null_counts, policy):
+        """
+        Decide qué fila conserva cada clave repetida.
+
+        Args:
+            hashes (np.ndarray): Hash de la clave de cada fila
+            null_counts (np.ndarray): Nulos por fila (solo 'most_complete')
+            policy (str): Política de resolución
+
+        Returns:
+            tuple: (máscara de filas conservadas, códigos de grupo de cada fila,
+                número de grupos con duplicados)
+        """
+        codes, uniques = pd.factorize(hashes)
+        sizes = np.bincount(codes, minlength=len(uniques))
+        positions = np.arange(len(hashes))
+
+        if policy == 'most_complete':
+            # Por grupo: menos nulos primero y, a igualdad, la posición más alta
+            order = np.lexsort((-positions, null_counts, codes))
+            first = np.r_[True, codes[order][1:] != codes[order][:-1]]
+            chosen = order[first]
+        else:
+            chosen = np.full(len(uniques), -1, dtype=np.int64)
+            np.maximum.at(chosen, codes, positions)
+
+        keep = np.zeros(len(hashes), dtype=bool)
+        keep[chosen] = True
+        return keep, codes, int((sizes > 1).sum())
+
+    def resolve(self, data: pd.DataFrame):
+        """
+        Resuelve los duplicados de un DataFrame en memoria.
+
+        Args:
+            data (pd.DataFrame): Datos con posibles claves repetidas
+
+        Returns:
+            pd.DataFrame: Datos con una fila por clave (mismo índice que las filas
+                conservadas, cuya máscara queda en `kept`)
+        """
+        hashes = self.key_hashes(data)
+        null_counts = data.isna().sum(axis=1).to_numpy() if self.policy == 'most_complete' else None
+        keep, codes, groups = self._plan(hashes, null_counts, self.policy)
+        self.kept = keep
+
+        result = data[keep] if not keep.all() else data
+        merged_cells = 0
+        if self.policy == 'merge' and not keep.all():
+            result, merged_cells = self._merge(data, result, keep, codes)
+
+        self.stats = {
+            'rows_in': len(data),
+            'rows_out': len(result),
+            'duplicate_keys': groups,
+            'duplicates_resolved': len(data) - len(result),
+            'merged_cells': merged_cells,
+            'policy': self.policy,
+        }
+        return result
+
+    def _merge(self, data, result, keep, codes):
+        """Completa los nulos de las filas conservadas con las apariciones anteriores de su clave."""
+        sizes = np.bincount(codes)
+        repeated = sizes[codes] > 1
+        # last() toma, por columna, el último valor no nulo de cada grupo
+        merged = data[repeated].groupby(codes[repeated], sort=False).last()
+        kept_codes = codes[keep]
+        targets = np.flatnonzero(sizes[kept_codes] > 1)
+        return self._fill_targets(result, targets, merged.loc[kept_codes[targets]])
+
+    @staticmethod
+    def _fill_targets(result, targets, rows):
+        """
+        Rellena los nulos de las filas `targets` (posiciones) de `result` con
+        los valores de `rows` (una fila por objetivo, en el mismo orden).
+
+        Returns:
+            tuple: (DataFrame resultante, número de celdas rellenadas)
+        """
+        merged_cells = 0
+        copied = False
+        for col in rows.columns:
+            current = result[col].iloc[targets]
+            fill = current.isna().to_numpy() & rows[col].notna().to_numpy()
+            if fill.any():
+                if not copied:
+                    result = result.copy()
+                    copied = True
+                values = result[col].copy()
+                if values.dtype != rows[col].dtype:
+                    # p. ej. un bloque con Q3 todo nulo (float) recibe tiempos de texto
+                    values = values.astype(object)
+                values.iloc[targets[fill]] = rows[col].to_numpy()[fill]
+                result[col] = values
+                merged_cells += int(fill.sum())
+        return result, merged_cells
+
+    def resolve_csv(self, csv_path, output_path, chunksize=100_000, dtype=None):
+        """
+        Resuelve los duplicados de un CSV por bloques con memoria acotada.
+
+        Primera pasada: hash de la clave (y nulos por fila) de cada fila para
+        decidir qué fila conserva cada clave. Segunda pasada: se escriben las
+        filas de claves únicas tal cual y las conservadas de las repetidas; en
+        'merge' solo se retienen en memoria las filas de claves repetidas hasta
+        su última aparición.
+
+        Args:
+            csv_path (str): CSV de entrada
+            output_path (str): CSV de salida
+            chunksize (int): Filas por bloque
+            dtype: Tipos de columna para pd.read_csv (por defecto todo texto: las
+                filas se copian tal cual aunque cada bloque infiera tipos distintos)
+
+        Returns:
+            dict: Estadísticas (ver stats)
+        """
+        dtype = str if dtype is None else dtype
+        hashes, null_counts = [], []
+        columns = None
+        for chunk in pd.read_csv(csv_path, chunksize=chunksize, dtype=dtype):
+            columns = list(chunk.columns)
+            hashes.append(self.key_hashes(chunk))
+            if self.policy == 'most_complete':
+                null_counts.append(chunk.isna().sum(axis=1).to_numpy())
+        if columns is None:
+            columns = list(pd.read_csv(csv_path, nrows=0).columns)
+        hashes = np.concatenate(hashes) if hashes else np.array([], dtype=np.uint64)
+        null_counts = np.concatenate(null_counts) if null_counts else None
+        keep, codes, groups = self._plan(hashes, null_counts, self.policy)
+        repeated = np.bincount(codes)[codes] > 1 if len(codes) else np.zeros(0, dtype=bool)
+        del hashes, null_counts
+
+        rows_out = merged_cells = 0
+        pending = None
+        start = 0
+        first = True
+        for chunk in pd.read_csv(csv_path, chunksize=chunksize, dtype=dtype):
+            stop = start + len(chunk)
+            chunk_keep = keep[start:stop]
+            if self.policy == 'merge':
+                chunk, cells, pending = self._merge_chunk(chunk, chunk_keep, codes[start:stop],
+                                                          repeated[start:stop], pending)
+                merged_cells += cells
+            else:
+                chunk = chunk[chunk_keep]
+            chunk.to_csv(output_path, index=False, header=first, mode='w' if first else 'a')
+            first = False
+            rows_out += len(chunk)
+            start = stop
+        if first:
+            pd.DataFrame(columns=columns).to_csv(output_path, index=False)
+
+        self.stats = {
+            'rows_in': len(keep),
+            'rows_out': rows_out,
+            'duplicate_keys': groups,
+            'duplicates_resolved': len(keep) - rows_out,
+            'merged_cells': merged_cells,
+            'policy': self.policy,
+        }
+        return self.stats
+
+    def _merge_chunk(self, chunk, keep, codes, repeated, pending):
+        """
+        Aplica 'merge' a un bloque. Las claves repetidas cuya última aparición
+        aún no ha llegado se acumulan en `pending` (una fila combinada por
+        código de grupo) hasta el bloque de su fila conservada.
+
+        Returns:
+            tuple: (bloque resuelto, celdas rellenadas, nuevo pending)
+        """
+        if not repeated.any():
+            return chunk[keep], 0, pending
+        # Dentro del bloque: último valor no nulo de cada grupo
+        partial = chunk[repeated].groupby(codes[repeated], sort=False).last()
+        if pending is not None and len(pending):
+            previous = pending.reindex(partial.index)
+            for col in partial.columns:
+                nulls = partial[col].isna()
+                if nulls.any():
+                    column = partial[col].copy()
+                    if column.dtype != previous[col].dtype:
+                        column = column.astype(object)
+                    column[nulls] = previous[col][nulls]
+                    partial[col] = column
+            pending = pending.drop(partial.index, errors='ignore')
+
+        targets = np.flatnonzero(repeated & keep)
+        target_codes = codes[targets]
+        waiting = partial.drop(target_codes)
+        if len(waiting):
+            if pending is None or not len(pending):
+                pending = waiting
+            else:
+                # Tipos distintos entre bloques (p. ej. una columna toda nula): se unifican como object
+                mixed = [col for col in waiting.columns if pending[col].dtype != waiting[col].dtype]
+                if mixed:
+                    pending = pending.astype({col: object for col in mixed})
+                    waiting = waiting.astype({col: object for col in mixed})
+                pending = pd.concat([pending, waiting])
+
+        chunk, merged_cells = self._fill_targets(chunk, targets, partial.loc[target_codes])
+        return chunk[keep], merged_cells, pending
@@ -0,0 +1,149 @@
+import pandas as pd
+import numpy as np
+
+
+class GroupImputer:
+    """
+    Imputación por grupos: rellena los nulos con la media, la mediana o la
+    moda dentro de cada grupo (p. ej. la misma carrera: Season y Round) en
+    lugar de usar el valor de todo el historial.
+
+    Si un grupo tiene todos los valores nulos se pasa al siguiente nivel de
+    la jerarquía, más amplio (p. ej. toda la temporada y, por último, todos
+    los datos). Las estadísticas de cada nivel se calculan siempre sobre los
+    valores originales, nunca sobre los ya imputados.
+
+    Las medias y medianas de todas las columnas se calculan juntas con un
+    único groupby/transform por nivel; la moda se obtiene contando pares
+    (grupo, valor) con factorize y bincount, en tiempo lineal.
+    """
+
+    METHODS = ['mean', 'median', 'mode']
+    # Jerarquías predefinidas, de la más concreta a la más amplia ([] = todos los datos)
+    GROUPS = {
+        'race': [['Season', 'Round'], ['Season'], []],
+        'circuit': [['CircuitID', 'Season'], ['CircuitID'], []],
+        'constructor': [['ConstructorID', 'Season'], ['ConstructorID'], []],
+    }
+
+    def __init__(self, method='mean', groups='race'):
+        """
+        Configura la imputación.
+
+        Args:
+            method (str): 'mean' o 'median' (las columnas no numéricas usan la
+                moda, como en fill_mean) o 'mode' para todas las columnas
+            groups (str | list): Nombre de una jerarquía de GROUPS o lista de
+                niveles (cada nivel es una lista de columnas de agrupación)
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Método '{method}' no reconocido. Métodos disponibles: {self.METHODS}")
+        if isinstance(groups, str):
+            if groups not in self.GROUPS:
+                raise ValueError(f"Jerarquía '{groups}' no reconocida. "
+                                 f"Jerarquías disponibles: {list(self.GROUPS.keys())}")
+            groups = self.GROUPS[groups]
+        self.method = method
+        self.groups = [list(level) for level in groups]
+
+    def _levels(self, data: pd.DataFrame):
+        """Niveles de agrupación con las columnas que existen en los datos, sin repetir."""
+        levels = []
+        for level in self.groups:
+            level = [col for col in level if col in data.columns]
+            if level not in levels:
+                levels.append(level)
+        if [] not in levels:
+            levels.append([])
+        return levels
+
+    @staticmethod
+    def _is_numeric(series):
+        """Mismo criterio que select_dtypes(include=[np.number])."""
+        return pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype)
+
+    @staticmethod
+    def _group_ids(data: pd.DataFrame, keys):
+        """Identificador de grupo de cada fila (las claves nulas forman su propio grupo)."""
+        if not keys:
+            return np.zeros(len(data), dtype=np.int64), 1
+        grouped = data.groupby(keys, observed=True, sort=False, dropna=False)
+        return grouped.ngroup().to_numpy(dtype=np.int64), grouped.ngroups
+
+    @staticmethod
+    def _group_mode(series, group_ids, n_groups):
+        """
+        Moda de cada grupo, propagada a todas sus filas. Ante empates gana el
+        menor valor, como en Series.mode().
+
+        Returns:
+            pd.Series: Moda del grupo de cada fila (nulo si el grupo es todo nulo)
+        """
+        codes, uniques = pd.factorize(series, sort=True)
+        valid = codes >= 0
+        n_values = max(len(uniques), 1)
+        pairs = group_ids[valid] * n_values + codes[valid]
+
+        # Conteo de pares (grupo, valor) con tabla hash: lineal en el número de filas
+        pair_codes, pair_values = pd.factorize(pairs)
+        counts = np.bincount(pair_codes, minlength=len(pair_values))
+        pair_groups, pair_value_codes = np.divmod(pair_values, n_values)
+
+        # Por grupo: mayor conteo y, a igualdad, menor valor (reducciones lineales)
+        max_counts = np.zeros(n_groups, dtype=counts.dtype)
+        np.maximum.at(max_counts, pair_groups, counts)
+        winners = counts == max_counts[pair_groups]
+        mode_codes = np.full(n_groups, n_values, dtype=np.int64)
+        np.minimum.at(mode_codes, pair_groups[winners], pair_value_codes[winners])
+        mode_codes[mode_codes == n_values] = -1
+
+        row_codes = mode_codes[group_ids]
+        values = pd.Series(uniques, dtype=series.dtype) if isinstance(series.dtype, pd.CategoricalDtype) \
+            else pd.Series(uniques)
+        result = values.take(np.maximum(row_codes, 0)).where(row_codes >= 0)
+        result.index = series.index
+        return result
+
+    def fill_values(self, data: pd.DataFrame, columns):
+        """
+        Calcula el valor de relleno de cada celda nula recorriendo la jerarquía.
+
+        Args:
+            data (pd.DataFrame): Datos originales
+            columns (list): Columnas a imputar
+
+        Returns:
+            dict: Columna -> pd.Series con los valores ya imputados
+        """
+        numeric = [col for col in columns if self.method != 'mode' and self._is_numeric(data[col])]
+        categorical = [col for col in columns if col not in numeric]
+
+        filled = {col: data[col] for col in columns}
+        for keys in self._levels(data):
+            pending_numeric = [col for col in numeric if filled[col].isna().any()]
+            pending_categorical = [col for col in categorical if filled[col].isna().any()]
+            if not pending_numeric and not pending_categorical:
+                break
+
+            if pending_numeric:
+                # Una única agregación para todas las columnas numéricas del nivel
+                if keys:
+                    stats = data[pending_numeric].groupby([data[key] for key in keys], observed=True,
+                                                          sort=False, dropna=False).transform(self.method)
+                else:
+                    stats = data[pending_numeric].agg(self.method)
+                for col in pending_numeric:
+                    values = stats[col]
+                    if pd.api.types.is_integer_dtype(data[col].dtype):
+                        # Las columnas enteras ('Int64') conservan su tipo: el estadístico se redondea
+                        if keys:
+                            values = values.round().astype(data[col].dtype)
+                        elif pd.notna(values):
+                            values = round(values)
+                    filled[col] = filled[col].fillna(values)
+
+            if pending_categorical:
+                group_ids, n_groups = self._group_ids(data, keys)
+                for col in pending_categorical:
+                    filled[col] = filled[col].fillna(self._group_mode(data[col], group_ids, n_groups))
+        return filled
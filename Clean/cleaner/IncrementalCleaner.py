@@ -0,0 +1,372 @@
+import hashlib
+import io
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from .DataCleaner import DataCleaner
+from .StreamingCleaner import StreamingCleaner
+
+
+class IncrementalCleaner:
+    """
+    Clase responsable de limpiar solo las filas nuevas de un CSV que crece
+    por el final (p. ej. una carrera más por fin de semana) y añadirlas a la
+    salida limpia existente.
+
+    Guarda un estado en JSON con la marca de agua (Season, Round), los bytes
+    ya procesados y las estadísticas globales que usa cada estrategia
+    (conteos de nulos, medias y modas, último valor válido). Si el archivo
+    cambió en lo ya procesado, los tipos de columna cambian o las
+    estadísticas globales se desplazan lo bastante como para que la salida
+    anterior quede obsoleta, se reconstruye la salida completa.
+    """
+
+    STATE_VERSION = 1
+    WATERMARK_COLUMNS = ['Season', 'Round']
+    _HASH_BLOCK = 1024 * 1024
+
+    def __init__(self, csv_path, output_path, state_path, strategy='remove_rows', threshold=0.5,
+                 drift_tolerance=0.01):
+        """
+        Inicializa el limpiador incremental.
+
+        Args:
+            csv_path (str): Ruta del CSV de entrada
+            output_path (str): Ruta del CSV limpio a mantener
+            state_path (str): Ruta del archivo JSON de estado
+            strategy (str): Estrategia de limpieza (mismas que DataCleaner.clean_data)
+            threshold (float): Umbral para eliminar columnas (% de nulos)
+            drift_tolerance (float): Variación relativa máxima de una media de
+                'fill_mean' antes de reconstruir la salida completa
+        """
+        if strategy not in StreamingCleaner.STRATEGIES:
+            raise ValueError(f"Estrategia '{strategy}' no reconocida. "
+                             f"Estrategias disponibles: {StreamingCleaner.STRATEGIES}")
+        self.csv_path = csv_path
+        self.output_path = output_path
+        self.state_path = state_path
+        self.strategy = strategy
+        self.threshold = threshold
+        self.drift_tolerance = drift_tolerance
+
+    # ------------------------------------------------------------------
+    # Estado
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _to_json_value(value):
+        """Convierte escalares de NumPy/pandas a tipos serializables en JSON."""
+        if value is None or (not isinstance(value, str) and pd.isna(value)):
+            return None
+        return value.item() if isinstance(value, np.generic) else value
+
+    def load_state(self):
+        """
+        Carga el estado guardado si corresponde a este archivo, salida y estrategia.
+
+        Returns:
+            dict: Estado o None si no existe o no es aplicable
+        """
+        try:
+            with open(self.state_path, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        expected = {
+            'version': self.STATE_VERSION,
+            'source': os.path.abspath(self.csv_path),
+            'output': os.path.abspath(self.output_path),
+            'strategy': self.strategy,
+            'threshold': self.threshold
+        }
+        if any(state.get(key) != value for key, value in expected.items()):
+            return None
+        return state
+
+    def _save_state(self, state):
+        os.makedirs(os.path.dirname(os.path.abspath(self.state_path)), exist_ok=True)
+        output_stat = os.stat(self.output_path)
+        state['output_size'] = output_stat.st_size
+        state['output_mtime_ns'] = output_stat.st_mtime_ns
+        temp_path = self.state_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.state_path)
+
+    def _watermark(self, data, previous=None):
+        """Marca de agua (Season, Round) máxima de los datos."""
+        if len(data) == 0 or not all(col in data.columns for col in self.WATERMARK_COLUMNS):
+            return previous
+        last = data[self.WATERMARK_COLUMNS].sort_values(self.WATERMARK_COLUMNS).iloc[-1]
+        return [int(value) for value in last]
+
+    def _statistics(self, data):
+        """
+        Estadísticas globales de los datos que necesita la estrategia para
+        continuar la limpieza sin releer las filas ya procesadas.
+        """
+        stats = {'null_counts': {col: int(count) for col, count in data.isnull().sum().items()}}
+
+        if self.strategy == 'fill_forward':
+            stats['carry'] = {}
+            for col in data.columns:
+                valid_index = data[col].last_valid_index()
+                if valid_index is not None:
+                    stats['carry'][col] = self._to_json_value(data.at[valid_index, col])
+
+        elif self.strategy == 'fill_mean':
+            numeric_columns = data.select_dtypes(include=[np.number]).columns
+            stats['sums'] = {col: [float(data[col].sum()), int(data[col].count())] for col in numeric_columns}
+            stats['frequencies'] = {
+                col: {str(value): int(count) for value, count in data[col].value_counts().items()}
+                for col in data.columns if col not in numeric_columns
+            }
+        return stats
+
+    @staticmethod
+    def _merge_statistics(stats, new_stats):
+        """Acumula en `stats` las estadísticas de las filas nuevas."""
+        for col, count in new_stats['null_counts'].items():
+            stats['null_counts'][col] = stats['null_counts'].get(col, 0) + count
+        if 'carry' in new_stats:
+            stats['carry'].update(new_stats['carry'])
+        if 'sums' in new_stats:
+            for col, (total, count) in new_stats['sums'].items():
+                previous_total, previous_count = stats['sums'].get(col, [0.0, 0])
+                stats['sums'][col] = [previous_total + total, previous_count + count]
+            for col, counts in new_stats['frequencies'].items():
+                merged = stats['frequencies'].setdefault(col, {})
+                for value, count in counts.items():
+                    merged[value] = merged.get(value, 0) + count
+
+    @staticmethod
+    def _mode(frequencies):
+        """Moda a partir de conteos; los empates se resuelven como Series.mode()."""
+        if not frequencies:
+            return None
+        top = max(frequencies.values())
+        return min(value for value, count in frequencies.items() if count == top)
+
+    # ------------------------------------------------------------------
+    # Reconstrucción completa
+    # ------------------------------------------------------------------
+
+    def rebuild(self, reason='sin estado previo'):
+        """
+        Limpia el archivo completo, reescribe la salida y guarda el estado.
+
+        Args:
+            reason (str): Motivo de la reconstrucción (se incluye en el resultado)
+
+        Returns:
+            dict: Resultado del proceso
+        """
+        with open(self.csv_path, 'rb') as f:
+            content = f.read()
+        data = pd.read_csv(io.BytesIO(content))
+
+        cleaner = DataCleaner(data)
+        cleaned = cleaner.clean_data(strategy=self.strategy, threshold=self.threshold)
+        os.makedirs(os.path.dirname(os.path.abspath(self.output_path)), exist_ok=True)
+        cleaned.to_csv(self.output_path, index=False)
+
+        state = {
+            'version': self.STATE_VERSION,
+            'source': os.path.abspath(self.csv_path),
+            'output': os.path.abspath(self.output_path),
+            'strategy': self.strategy,
+            'threshold': self.threshold,
+            'source_offset': len(content),
+            'source_hash': hashlib.blake2b(content, digest_size=20).hexdigest(),
+            'header': content.split(b'\n', 1)[0].decode('utf-8'),
+            'dtypes': {col: str(dtype) for col, dtype in data.dtypes.items()},
+            'total_rows': len(data),
+            'output_columns': list(cleaned.columns),
+            'watermark': self._watermark(data),
+            'statistics': self._statistics(data)
+        }
+        if self.strategy == 'fill_mean':
+            # Valores de relleno usados en la salida (los de DataCleaner.clean_fill_mean)
+            state['fill_values'] = self._fill_values(state['statistics'], data)
+        self._save_state(state)
+
+        return {
+            'mode': 'full',
+            'reason': reason,
+            'rows_processed': len(data),
+            'rows_written': len(cleaned),
+            'watermark': state['watermark'],
+            'output_path': self.output_path
+        }
+
+    @staticmethod
+    def _fill_values(stats, data):
+        fill_values = {}
+        for col in data.columns:
+            if col in stats['sums']:
+                value = data[col].mean()
+            else:
+                value = data[col].mode()
+                value = value[0] if len(value) > 0 else None
+            fill_values[col] = IncrementalCleaner._to_json_value(value)
+        return fill_values
+
+    # ------------------------------------------------------------------
+    # Proceso incremental
+    # ------------------------------------------------------------------
+
+    def _read_new_rows(self, state):
+        """
+        Lee las filas añadidas tras el último proceso con los tipos guardados.
+        El archivo se recorre una sola vez: el hash de la parte ya procesada
+        se comprueba y se continúa con las filas nuevas.
+
+        Returns:
+            tuple: (pd.DataFrame con las filas nuevas o None, motivo de reconstrucción o None,
+                    hash y tamaño de la parte del archivo leída)
+        """
+        offset = state['source_offset']
+        digest = hashlib.blake2b(digest_size=20)
+        with open(self.csv_path, 'rb') as f:
+            remaining = offset
+            while remaining > 0:
+                block = f.read(min(self._HASH_BLOCK, remaining))
+                if not block:
+                    return None, 'el archivo de entrada se ha reducido', None, None
+                digest.update(block)
+                remaining -= len(block)
+            if digest.hexdigest() != state['source_hash']:
+                return None, 'las filas ya procesadas han cambiado', None, None
+            tail = f.read()
+        digest.update(tail)
+
+        if not tail.strip():
+            return pd.DataFrame(columns=list(state['dtypes'])), None, digest.hexdigest(), offset + len(tail)
+
+        header = state['header'].encode('utf-8')
+        try:
+            new_rows = pd.read_csv(io.BytesIO(header + b'\n' + tail), dtype=state['dtypes'])
+        except (ValueError, TypeError):
+            # p. ej. nulos o decimales en una columna entera: cambia el tipo de la columna completa
+            return None, 'los tipos de columna han cambiado', None, None
+        return new_rows, None, digest.hexdigest(), offset + len(tail)
+
+    def _check_watermark(self, state, new_rows):
+        """Las filas nuevas no pueden ser de rondas anteriores a la marca de agua."""
+        watermark = state['watermark']
+        if watermark is None or len(new_rows) == 0 or not all(col in new_rows for col in self.WATERMARK_COLUMNS):
+            return None
+        keys = list(zip(new_rows['Season'], new_rows['Round']))
+        if min(keys) < tuple(watermark):
+            return f"hay filas nuevas anteriores a la marca de agua {tuple(watermark)}"
+        return None
+
+    def _clean_new_rows(self, state, new_rows):
+        """
+        Limpia las filas nuevas con las estadísticas acumuladas.
+
+        Returns:
+            tuple: (pd.DataFrame limpio o None, motivo de reconstrucción o None)
+        """
+        stats = state['statistics']
+        total_rows = state['total_rows']
+
+        if self.strategy in ('remove_rows', 'fill_zero'):
+            # Estrategias por fila: no dependen de las filas anteriores
+            return DataCleaner(new_rows).clean_data(strategy=self.strategy), None
+
+        if self.strategy == 'remove_columns':
+            null_percentages = pd.Series(stats['null_counts'], dtype='float64') / total_rows
+            columns_to_drop = null_percentages[null_percentages > self.threshold].index
+            kept = [col for col in new_rows.columns if col not in set(columns_to_drop)]
+            if kept != state['output_columns']:
+                return None, 'cambian las columnas que superan el umbral de nulos'
+            return new_rows[kept], None
+
+        if self.strategy == 'fill_forward':
+            pending = [col for col in new_rows.columns if col not in stats['carry']]
+            if any(new_rows[col].notna().any() for col in pending):
+                # La salida anterior rellenó esas columnas hacia atrás con un valor ahora distinto
+                return None, 'aparece el primer valor de una columna sin valores previos'
+            filled = new_rows.ffill()
+            carry = {col: value for col, value in stats['carry'].items()
+                     if col in filled.columns and filled[col].iloc[:1].isnull().any()}
+            if carry:
+                filled = filled.fillna(value=carry)
+            return filled, None
+
+        # fill_mean: las medias y modas deben seguir siendo las usadas en la salida
+        fill_values = state['fill_values']
+        columns_with_nulls = {col for col, count in stats['null_counts'].items() if count > 0}
+        for col in columns_with_nulls:
+            used = fill_values.get(col)
+            if col in stats['sums']:
+                total, count = stats['sums'][col]
+                current = total / count if count > 0 else None
+                if (current is None) != (used is None):
+                    return None, f"cambia la media de '{col}'"
+                if current is not None and abs(current - used) > self.drift_tolerance * max(abs(used), 1e-12):
+                    return None, f"la media de '{col}' varía más del {self.drift_tolerance:.2%}"
+            elif self._mode(stats['frequencies'].get(col, {})) != used:
+                return None, f"cambia la moda de '{col}'"
+
+        values = {col: fill_values[col] for col in new_rows.columns
+                  if fill_values.get(col) is not None and new_rows[col].isnull().any()}
+        return new_rows.fillna(value=values) if values else new_rows, None
+
+    def run(self):
+        """
+        Actualiza la salida limpia: añade las filas nuevas si es posible o
+        reconstruye la salida completa si no.
+
+        Returns:
+            dict: Resultado ('mode' es 'incremental', 'up_to_date' o 'full')
+        """
+        state = self.load_state()
+        if state is None:
+            return self.rebuild('sin estado previo')
+
+        if not os.path.exists(self.output_path):
+            return self.rebuild('no existe la salida limpia')
+        output_stat = os.stat(self.output_path)
+        if (output_stat.st_size, output_stat.st_mtime_ns) != (state['output_size'], state['output_mtime_ns']):
+            return self.rebuild('la salida limpia se modificó externamente')
+
+        new_rows, reason, source_hash, source_offset = self._read_new_rows(state)
+        if reason is None:
+            reason = self._check_watermark(state, new_rows)
+        if reason is not None:
+            return self.rebuild(reason)
+
+        if len(new_rows) == 0:
+            return {'mode': 'up_to_date', 'reason': None, 'rows_processed': 0, 'rows_written': 0,
+                    'watermark': state['watermark'], 'output_path': self.output_path}
+
+        # Las estadísticas se acumulan antes de limpiar: la comprobación de
+        # desplazamiento usa los valores globales con las filas nuevas incluidas
+        self._merge_statistics(state['statistics'], self._statistics(new_rows))
+        state['total_rows'] += len(new_rows)
+
+        cleaned, reason = self._clean_new_rows(state, new_rows)
+        if reason is not None:
+            return self.rebuild(reason)
+        if list(cleaned.columns) != state['output_columns']:
+            return self.rebuild('cambian las columnas de la salida')
+
+        cleaned.to_csv(self.output_path, mode='a', header=False, index=False)
+
+        state['source_hash'] = source_hash
+        state['source_offset'] = source_offset
+        state['watermark'] = self._watermark(new_rows, state['watermark'])
+        self._save_state(state)
+
+        return {
+            'mode': 'incremental',
+            'reason': None,
+            'rows_processed': len(new_rows),
+            'rows_written': len(cleaned),
+            'watermark': state['watermark'],
+            'output_path': self.output_path
+        }
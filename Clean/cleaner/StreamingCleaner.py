@@ -0,0 +1,347 @@
+import pandas as pd
+import numpy as np
+from ..writer import CSVWriter, WriterRegistry
+
+
+# Límite de enteros representables exactamente en float64: por debajo de él
+# la suma por bloques coincide bit a bit con la suma de pandas
+_EXACT_SUM_LIMIT = 2 ** 53
+
+
+class StreamingCleaner:
+    """
+    Clase responsable de limpiar archivos CSV por bloques (chunks) con memoria acotada.
+    Produce exactamente la misma salida que DataCleaner sobre el archivo completo,
+    pero sin mantener nunca el dataset entero en memoria.
+
+    Funcionamiento:
+    - Un pre-escaneo calcula los tipos unificados de columna (los que tendría una
+      lectura completa), los conteos de nulos y el primer valor válido por columna.
+    - 'fill_mean' necesita un segundo escaneo para calcular medias y modas globales.
+    - 'fill_forward' arrastra el último valor válido entre bloques.
+    """
+
+    STRATEGIES = ['remove_rows', 'remove_columns', 'fill_forward', 'fill_mean', 'fill_zero']
+
+    def __init__(self, csv_path, strategy='remove_rows', threshold=0.5, chunksize=100_000, dtype=None,
+                 transform=None):
+        """
+        Inicializa el limpiador por bloques.
+
+        Args:
+            csv_path (str): Ruta del archivo CSV a limpiar
+            strategy (str): Estrategia de limpieza (mismas que DataCleaner.clean_data)
+            threshold (float): Umbral para eliminar columnas (% de nulos)
+            chunksize (int): Número de filas por bloque
+            dtype (dict): Tipos de columna conocidos; evita inferirlos en el pre-escaneo
+            transform (callable): Función aplicada a cada bloque tras leerlo
+                (p. ej. LapTimeParser.parse_columns)
+        """
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Estrategia '{strategy}' no reconocida. "
+                             f"Estrategias disponibles: {self.STRATEGIES}")
+        if chunksize is None or chunksize <= 0:
+            raise ValueError("chunksize debe ser un entero positivo")
+
+        self.csv_path = csv_path
+        self.strategy = strategy
+        self.threshold = threshold
+        self.chunksize = chunksize
+        self.dtype = dict(dtype) if dtype else None
+        self.read_dtype = None
+        self.transform = transform
+
+        self.columns = []
+        self.total_rows = 0
+        self.null_counts = None
+        self.first_valid = {}
+        self.fill_values = {}
+        self._integral_columns = set()
+        self._scanned = False
+
+    def _read_chunks(self, usecols=None):
+        """
+        Itera sobre el archivo en bloques de `chunksize` filas con los tipos unificados,
+        aplicando `transform` si se indicó.
+        """
+        for chunk in pd.read_csv(self.csv_path, chunksize=self.chunksize, dtype=self.read_dtype,
+                                 usecols=usecols):
+            if self.transform:
+                chunk = self.transform(chunk)
+                mismatched = {col: dtype for col, dtype in self.dtype.items()
+                              if col in chunk.columns and chunk[col].dtype != dtype}
+                if mismatched:
+                    chunk = chunk.astype(mismatched)
+            yield chunk
+
+    @staticmethod
+    def _filled(fill):
+        """
+        Ejecuta un relleno (fillna, ffill) y convierte después las columnas
+        object que quedan sin nulos (p. ej. a float) con infer_objects. Es lo
+        que pandas hace hoy de forma implícita, y que dejará de hacer; pedirlo
+        de forma explícita evita el aviso y mantiene los bloques idénticos.
+
+        Args:
+            fill (callable): Función sin argumentos que devuelve el bloque rellenado
+        """
+        with pd.option_context('future.no_silent_downcasting', True):
+            return fill().infer_objects(copy=False)
+
+    @staticmethod
+    def _unify_dtypes(chunk_dtypes):
+        """
+        Determina el tipo que tendría cada columna en una lectura completa
+        a partir de los tipos inferidos en cada bloque.
+        """
+        unified = {}
+        for col, kinds in chunk_dtypes.items():
+            if len(kinds) == 1:
+                unified[col] = next(iter(kinds))
+            elif all(kind.kind in 'iuf' for kind in kinds):
+                unified[col] = np.dtype('float64')
+            else:
+                unified[col] = np.dtype('object')
+        return unified
+
+    def scan(self):
+        """
+        Pre-escaneo del archivo: tipos unificados, nulos por columna,
+        primer valor válido y columnas numéricas de valores enteros.
+
+        Returns:
+            dict: Tipos de columna a usar durante la limpieza
+        """
+        raw_dtypes = {}
+        chunk_dtypes = {}
+        null_counts = None
+        abs_sums = {}
+        non_integral = set()
+
+        for chunk in pd.read_csv(self.csv_path, chunksize=self.chunksize, dtype=self.dtype):
+            for col in chunk.columns:
+                raw_dtypes.setdefault(col, set()).add(chunk[col].dtype)
+            if self.transform:
+                chunk = self.transform(chunk)
+
+            if not self.columns:
+                self.columns = list(chunk.columns)
+            self.total_rows += len(chunk)
+
+            chunk_nulls = chunk.isnull().sum()
+            null_counts = chunk_nulls if null_counts is None else null_counts + chunk_nulls
+
+            for col in chunk.columns:
+                chunk_dtypes.setdefault(col, set()).add(chunk[col].dtype)
+
+                if col not in self.first_valid:
+                    valid_index = chunk[col].first_valid_index()
+                    if valid_index is not None:
+                        self.first_valid[col] = chunk.at[valid_index, col]
+
+                if chunk[col].dtype.kind in 'iuf' and col not in non_integral:
+                    values = chunk[col].dropna().to_numpy(dtype='float64')
+                    abs_sums[col] = abs_sums.get(col, 0.0) + np.abs(values).sum()
+                    if np.any(np.mod(values, 1) != 0) or abs_sums[col] >= _EXACT_SUM_LIMIT:
+                        non_integral.add(col)
+
+        self.null_counts = null_counts if null_counts is not None else pd.Series(dtype='int64')
+        # Tipos de lectura (texto del CSV) y tipos tras `transform`
+        self.read_dtype = self._unify_dtypes(raw_dtypes)
+        self.read_dtype.update(self.dtype or {})
+        self.dtype = self._unify_dtypes(chunk_dtypes) if self.transform else dict(self.read_dtype)
+        self._integral_columns = set(abs_sums) - non_integral
+        self._scanned = True
+
+        if self.strategy == 'fill_mean':
+            self._compute_fill_values()
+
+        return self.dtype
+
+    def _compute_fill_values(self):
+        """
+        Segundo escaneo para 'fill_mean': calcula la media de las columnas numéricas
+        y la moda de las no numéricas, solo para columnas que tienen nulos.
+
+        Las columnas de valores enteros acumulan una suma exacta; las columnas con
+        decimales guardan sus valores (8 bytes por fila) para reproducir la media de pandas.
+        """
+        columns_with_nulls = [col for col in self.columns if self.null_counts.get(col, 0) > 0]
+        if not columns_with_nulls:
+            return
+
+        # Misma clasificación que DataCleaner.clean_fill_mean (select_dtypes)
+        empty = pd.DataFrame({col: pd.Series(dtype=self.dtype[col]) for col in columns_with_nulls})
+        numeric_columns = list(empty.select_dtypes(include=[np.number]).columns)
+        non_numeric_columns = [col for col in columns_with_nulls if col not in numeric_columns]
+
+        sums = {col: 0.0 for col in numeric_columns}
+        counts = {col: 0 for col in numeric_columns}
+        collected = {col: [] for col in numeric_columns if col not in self._integral_columns}
+        frequencies = {col: None for col in non_numeric_columns}
+
+        for chunk in self._read_chunks(usecols=columns_with_nulls):
+            for col in numeric_columns:
+                if col in collected:
+                    # Se conservan también los nulos: la suma por pares de pandas
+                    # depende de la posición de cada valor
+                    collected[col].append(chunk[col].to_numpy(dtype='float64'))
+                else:
+                    values = chunk[col].dropna()
+                    sums[col] += values.to_numpy(dtype='float64').sum()
+                    counts[col] += len(values)
+
+            for col in non_numeric_columns:
+                chunk_counts = chunk[col].value_counts()
+                previous = frequencies[col]
+                frequencies[col] = chunk_counts if previous is None else previous.add(chunk_counts, fill_value=0)
+
+        for col in numeric_columns:
+            if col in collected:
+                values = np.concatenate(collected[col]) if collected[col] else np.array([], dtype='float64')
+                self.fill_values[col] = pd.Series(values, dtype='float64').mean()
+            else:
+                self.fill_values[col] = sums[col] / counts[col] if counts[col] > 0 else np.nan
+            # Igual que DataCleaner: las columnas enteras con nulos ('Int64') redondean la media
+            if pd.api.types.is_integer_dtype(self.dtype[col]) and pd.notna(self.fill_values[col]):
+                self.fill_values[col] = round(self.fill_values[col])
+
+        for col in non_numeric_columns:
+            counts_series = frequencies[col]
+            if counts_series is None or len(counts_series) == 0:
+                continue
+            # Los empates se resuelven igual que Series.mode(): valores ordenados
+            top_values = counts_series[counts_series == counts_series.max()].index
+            self.fill_values[col] = pd.Series(top_values, dtype=self.dtype[col]).mode()[0]
+
+    def iter_clean_chunks(self):
+        """
+        Itera sobre los bloques ya limpios según la estrategia configurada.
+
+        Yields:
+            pd.DataFrame: Bloque limpio
+        """
+        if not self._scanned:
+            self.scan()
+
+        columns_to_drop = []
+        if self.strategy == 'remove_columns' and self.total_rows > 0:
+            null_percentages = self.null_counts / self.total_rows
+            columns_to_drop = null_percentages[null_percentages > self.threshold].index.tolist()
+
+        carry = {}
+        for chunk in self._read_chunks():
+            if self.strategy == 'remove_rows':
+                chunk = chunk.dropna()
+            elif self.strategy == 'remove_columns':
+                chunk = chunk.drop(columns=columns_to_drop)
+            elif self.strategy == 'fill_zero':
+                chunk = self._filled(lambda: chunk.fillna(0))
+            elif self.strategy == 'fill_mean':
+                fill_values = {col: value for col, value in self.fill_values.items() if col in chunk.columns}
+                if fill_values:
+                    chunk = self._filled(lambda: chunk.fillna(value=fill_values))
+            elif self.strategy == 'fill_forward':
+                chunk = self._fill_forward_chunk(chunk, carry)
+            yield chunk
+
+    def _fill_forward_chunk(self, chunk, carry):
+        """
+        Aplica forward fill a un bloque continuando el último valor válido
+        del bloque anterior; los nulos iniciales del archivo se rellenan con
+        el primer valor válido (equivalente al backward fill final).
+        """
+        chunk = self._filled(chunk.ffill)
+        for fill_source in (carry, self.first_valid):
+            pending = [col for col in chunk.columns if col in fill_source and chunk[col].iloc[:1].isnull().any()]
+            if pending:
+                values = {col: fill_source[col] for col in pending}
+                chunk = self._filled(lambda: chunk.fillna(value=values))
+
+        if len(chunk) > 0:
+            last_row = chunk.iloc[-1]
+            for col in chunk.columns:
+                if pd.notna(last_row[col]):
+                    carry[col] = last_row[col]
+        return chunk
+
+    def clean_to_csv(self, output_path, writer=None):
+        """
+        Limpia el archivo completo y escribe el resultado bloque a bloque.
+        La salida aparece en output_path solo al terminar (escritura atómica)
+        y se comprime según su extensión (.gz, .bz2, .xz).
+
+        Args:
+            output_path (str): Ruta del archivo CSV de salida
+            writer (CSVWriter): Escritor a usar en lugar del de la extensión
+
+        Returns:
+            dict: Estadísticas del proceso (filas leídas/escritas, nulos antes/después)
+        """
+        writer = writer or WriterRegistry.for_path(output_path)
+        if not isinstance(writer, CSVWriter):
+            raise ValueError(f"La limpieza por bloques solo escribe CSV: {output_path}")
+
+        with writer.open(output_path) as output:
+            stats = self._write_clean_chunks(lambda chunk, first: output.write(chunk))
+            if output.header:
+                # Archivo sin filas: escribir solo la cabecera
+                output.write(pd.DataFrame(columns=self.columns))
+        return stats
+
+    def clean_to_sqlite(self, storage, mode='upsert'):
+        """
+        Limpia el archivo completo y carga el resultado en SQLite bloque a bloque.
+
+        Args:
+            storage (SQLiteStorage): Base de datos de destino
+            mode (str): Modo de carga del primer bloque ('upsert', 'replace' o 'append');
+                los siguientes bloques se cargan con upsert o append
+
+        Returns:
+            dict: Estadísticas del proceso (ver clean_to_csv) más rows_per_second
+        """
+        loads = []
+
+        def write(chunk, first):
+            chunk_mode = mode if first or mode == 'append' else 'upsert'
+            loads.append(storage.write(chunk, mode=chunk_mode))
+
+        stats = self._write_clean_chunks(write)
+        seconds = sum(load['seconds'] for load in loads)
+        stats['load_seconds'] = seconds
+        stats['rows_per_second'] = stats['rows_written'] / seconds if seconds > 0 else 0.0
+        storage.last_load = {'rows': stats['rows_written'], 'batches': sum(load['batches'] for load in loads),
+                             'seconds': seconds, 'rows_per_second': stats['rows_per_second']}
+        return stats
+
+    def _write_clean_chunks(self, write):
+        """
+        Recorre los bloques limpios, los entrega a write(chunk, first) y
+        acumula las estadísticas del proceso.
+        """
+        if not self._scanned:
+            self.scan()
+
+        rows_written = 0
+        remaining_nulls = 0
+        output_columns = list(self.columns)
+        first = True
+
+        for chunk in self.iter_clean_chunks():
+            write(chunk, first)
+            first = False
+            output_columns = list(chunk.columns)
+            rows_written += len(chunk)
+            remaining_nulls += int(chunk.isnull().sum().sum())
+
+        return {
+            'rows_read': self.total_rows,
+            'rows_written': rows_written,
+            'original_columns': len(self.columns),
+            'current_columns': len(output_columns),
+            'original_nulls': int(self.null_counts.sum()),
+            'remaining_nulls': remaining_nulls,
+            'chunksize': self.chunksize,
+            'strategy': self.strategy
+        }
@@ -6,5 +6,12 @@ para limpiar y transformar datos.
 """
 
 from .DataCleaner import DataCleaner
+from .StreamingCleaner import StreamingCleaner
+from .CleaningSnapshot import CleaningSnapshot
+from .IncrementalCleaner import IncrementalCleaner
+from .CleaningPlan import CleaningPlan
+from .GroupImputer import GroupImputer
+from .Deduplicator import Deduplicator
 
-__all__ = ['DataCleaner']
+__all__ = ['DataCleaner', 'StreamingCleaner', 'CleaningSnapshot', 'IncrementalCleaner', 'CleaningPlan', 'GroupImputer',
+           'Deduplicator']
@@ -1,9 +1,16 @@
 import pandas as pd
 import os
 from Config.Config import Config
-from ..analyzer import DataAnalyzer
-from ..cleaner import DataCleaner
+from ..analyzer import DataAnalyzer, DataProfile
+from ..cache import ColumnCache
+from ..evaluation import StrategyEvaluator
+from ..export import StarSchema
+from ..cleaner import DataCleaner, StreamingCleaner, IncrementalCleaner, Deduplicator
+from ..metrics import PipelineMetrics
 from ..report import CleaningReport
+from ..schema import SchemaRegistry, LapTimeParser
+from ..storage import SQLiteStorage
+from ..writer import CSVWriter, WriterRegistry
 
 
 class CSVManager:
@@ -13,19 +20,51 @@ class CSVManager:
     """
     
     @staticmethod
-    def load_csv(csv_filename):
+    def get_input_path(csv_filename):
+        """
+        Resuelve la ruta de un archivo de entrada relativa a la raíz del proyecto.
+        
+        Args:
+            csv_filename (str): Ruta del archivo CSV (relativa al proyecto o absoluta)
+            
+        Returns:
+            str: Ruta completa del archivo
+        """
+        # Obtener la ruta del proyecto (ir 3 niveles arriba: csv_manager -> Clean -> F1_DB)
+        project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        return os.path.join(project_root, csv_filename)
+    
+    @staticmethod
+    def get_output_path(output_filename):
+        """
+        Resuelve la ruta de un archivo de salida usando Config.OUTPUT.
+        
+        Args:
+            output_filename (str): Nombre del archivo de salida
+            
+        Returns:
+            str: Ruta completa del archivo de salida
+        """
+        # Usar Config.OUTPUT para determinar la carpeta de salida
+        output_dir = os.path.dirname(Config.OUTPUT)
+        project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        return os.path.join(project_root, output_dir, output_filename)
+    
+    @staticmethod
+    def load_csv(csv_filename, schema=None, use_cache=None):
         """
         Carga un archivo CSV desde la ruta especificada.
         
         Args:
             csv_filename (str): Ruta del archivo CSV a cargar
+            schema: Esquema de tipos a aplicar: None (sin tipos), 'auto' (detectar
+                por columnas), nombre registrado en SchemaRegistry o DatasetSchema
+            use_cache (bool): Si usar la caché binaria por columnas (None = Config.USE_CACHE)
             
         Returns:
             pd.DataFrame: DataFrame con los datos cargados o None si hay error
         """
-        # Obtener la ruta del proyecto (ir 3 niveles arriba: csv_manager -> Clean -> F1_DB)
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        csv_path = os.path.join(project_root, csv_filename)
+        csv_path = CSVManager.get_input_path(csv_filename)
         
         if not os.path.exists(csv_path):
             print(f"❌ Error: No se encontró el archivo {csv_path}")
@@ -33,7 +72,17 @@ class CSVManager:
         
         try:
             print(f"📂 Cargando datos desde {csv_filename}...")
-            data = pd.read_csv(csv_path)
+            dataset_schema = SchemaRegistry.resolve(schema, csv_path)
+            if dataset_schema is not None:
+                print(f"🧬 Aplicando esquema '{dataset_schema.name}'")
+                reader = dataset_schema.read_csv
+            else:
+                reader = pd.read_csv
+            
+            if Config.USE_CACHE if use_cache is None else use_cache:
+                data = CSVManager._load_cached(csv_path, reader, ColumnCache.variant_for(dataset_schema))
+            else:
+                data = reader(csv_path)
             print(f"✅ Datos cargados exitosamente: {data.shape}")
             return data
         except Exception as e:
@@ -41,29 +90,52 @@ class CSVManager:
             return None
     
     @staticmethod
-    def save_csv(data, output_filename, show_preview=True):
+    def _load_cached(csv_path, reader, variant):
+        """
+        Carga un CSV a través de la caché por columnas. Si la caché falla,
+        se avisa y se carga directamente con `reader`.
+        
+        Args:
+            csv_path (str): Ruta completa del archivo CSV
+            reader (callable): Función de carga reader(csv_path) -> pd.DataFrame
+            variant (str): Variante de la entrada (ver ColumnCache.variant_for)
+            
+        Returns:
+            pd.DataFrame: Datos cargados
+        """
+        try:
+            data, from_cache = ColumnCache.default().load(csv_path, reader, variant)
+        except Exception as e:
+            print(f"⚠️  Caché no disponible ({e}), cargando directamente")
+            return reader(csv_path)
+        if from_cache:
+            print("⚡ Datos cargados desde la caché por columnas")
+        return data
+    
+    @staticmethod
+    def save_csv(data, output_filename, show_preview=True, writer=None):
         """
-        Guarda un DataFrame como archivo CSV.
+        Guarda un DataFrame como archivo CSV de forma atómica (archivo temporal
+        y renombrado), formateando los bloques de filas en paralelo.
+        
+        El formato sale de la extensión (ver WriterRegistry): .csv, CSV
+        comprimido (.gz, .bz2, .xz) o binario por columnas (.npz).
         
         Args:
             data (pd.DataFrame): Datos a guardar
             output_filename (str): Nombre del archivo de salida
             show_preview (bool): Si mostrar vista previa de los datos guardados
+            writer (OutputWriter): Escritor a usar en lugar del de la extensión
             
         Returns:
             str: Ruta completa del archivo guardado o None si hay error
         """
         try:
-            # Usar Config.OUTPUT para determinar la carpeta de salida
-            output_dir = os.path.dirname(Config.OUTPUT)
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-            output_path = os.path.join(project_root, output_dir, output_filename)
-            
-            # Crear directorio si no existe
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            output_path = CSVManager.get_output_path(output_filename)
             
-            # Guardar CSV
-            data.to_csv(output_path, index=False)
+            # Guardar con el escritor de la extensión (crea el directorio si no existe)
+            writer = writer or WriterRegistry.for_path(output_path)
+            writer.write(data, output_path)
             
             print(f"💾 Archivo guardado como: {output_filename}")
             print(f"📁 Ruta completa: {output_path}")
@@ -79,6 +151,46 @@ class CSVManager:
             print(f"❌ Error al guardar el archivo: {e}")
             return None
     
+    @staticmethod
+    def save_sqlite(data, storage, mode='upsert'):
+        """
+        Carga un DataFrame en una base de datos SQLite (ver SQLiteStorage).
+        
+        Args:
+            data (pd.DataFrame): Datos a guardar
+            storage: SQLiteStorage o ruta del archivo .db
+            mode (str): 'upsert', 'replace' o 'append'
+            
+        Returns:
+            str: Ruta de la base de datos o None si hay error
+        """
+        storage = CSVManager.get_storage(storage)
+        try:
+            stats = storage.write(data, mode=mode)
+        except ValueError:
+            raise
+        except Exception as e:
+            print(f"❌ Error al guardar en SQLite: {e}")
+            return None
+        CSVManager.print_storage_load(storage, stats)
+        return storage.db_path
+    
+    @staticmethod
+    def get_storage(storage):
+        """
+        Returns:
+            SQLiteStorage: El propio almacenamiento o uno nuevo para la ruta indicada
+        """
+        if isinstance(storage, SQLiteStorage):
+            return storage
+        return SQLiteStorage(os.path.abspath(storage))
+    
+    @staticmethod
+    def print_storage_load(storage, stats):
+        """Imprime el resultado de una carga en SQLite."""
+        print(f"🗄️  {stats['rows']} filas cargadas en {storage.db_path} (tabla {storage.table}) "
+              f"en {stats['seconds']:.2f}s: {stats['rows_per_second']:,.0f} filas/s")
+    
     @staticmethod
     def generate_clean_filename(original_filename):
         """
@@ -94,7 +206,10 @@ class CSVManager:
         return f"{csv_name}_clean.csv"
     
     @staticmethod
-    def process_csv_file(csv_filename, strategy='remove_rows', threshold=0.5, show_detailed_report=True):
+    def process_csv_file(csv_filename, strategy='remove_rows', threshold=0.5, show_detailed_report=True,
+                         chunksize=None, schema=None, parse_lap_times=False, lean=False, incremental=False,
+                         metrics=None, metrics_path=None, output_path=None, quiet=False, storage=None,
+                         dedup=None, dedup_key=None):
         """
         Procesa un archivo CSV completo: carga, limpia y guarda.
         
@@ -103,43 +218,382 @@ class CSVManager:
             strategy (str): Estrategia de limpieza a aplicar
             threshold (float): Umbral para eliminar columnas (% de nulos)
             show_detailed_report (bool): Si mostrar reporte detallado
+            chunksize (int): Si se indica, procesa el archivo por bloques de este
+                número de filas con memoria acotada (ver process_csv_file_chunked)
+            schema: Esquema de tipos para la carga (ver load_csv)
+            parse_lap_times (bool): Si convertir Q1/Q2/Q3 a milisegundos enteros
+                (los marcadores "0" pasan a ser nulos) antes de limpiar
+            lean (bool): Modo ligero: limpia los datos cargados en el sitio y el
+                reporte usa una instantánea compacta en lugar de una copia
+            incremental (bool): Si limpiar solo las filas añadidas desde la última
+                ejecución (ver process_csv_file_incremental)
+            metrics: True o una instancia de PipelineMetrics para medir cada etapa
+                (carga, vista previa, análisis, limpieza, reporte y guardado)
+            metrics_path (str): Archivo JSON lines al que añadir las métricas
+                (activa la medición)
+            output_path (str): Ruta del CSV limpio (absoluta o relativa a la carpeta
+                de Config.OUTPUT); por defecto <nombre>_clean.csv
+            quiet (bool): Omite la vista previa, el análisis de nulos y los
+                reportes, incluido su cálculo (solo procesamiento en memoria)
+            storage: SQLiteStorage o ruta de un archivo .db: los datos limpios se
+                cargan en SQLite (upsert por Season, Round, DriverID) en lugar de
+                guardarse como CSV
+            dedup (str): Política de deduplicación por clave antes de limpiar
+                ('latest', 'most_complete' o 'merge'; ver Deduplicator)
+            dedup_key (list): Columnas de la clave (por defecto Season, Round, DriverID)
             
         Returns:
-            str: Ruta del archivo CSV limpio generado o None si hay error
+            str: Ruta del archivo CSV limpio generado (o de la base de datos) o None
+                si hay error. Con métricas: tupla (ruta, PipelineMetrics)
         """
+        if quiet:
+            show_detailed_report = False
+        if storage is not None:
+            if incremental:
+                raise ValueError("El modo incremental no admite storage: la carga en SQLite ya es un upsert")
+            storage = CSVManager.get_storage(storage)
+        if dedup is not None and incremental:
+            raise ValueError("El modo incremental no admite dedup: solo limpia las filas nuevas")
+        if incremental and output_path:
+            writer = WriterRegistry.for_path(output_path)
+            if not isinstance(writer, CSVWriter) or writer.compression is not None:
+                raise ValueError("El modo incremental añade filas a un CSV sin comprimir: use una salida .csv")
+        if metrics is None and metrics_path is None:
+            return CSVManager._process_csv_file(csv_filename, strategy, threshold, show_detailed_report, chunksize,
+                                                schema, parse_lap_times, lean, incremental, output_path, quiet,
+                                                storage, dedup, dedup_key, PipelineMetrics.DISABLED)
+        
+        if not isinstance(metrics, PipelineMetrics):
+            metrics = PipelineMetrics()
+        metrics.context.setdefault('file', csv_filename)
+        metrics.context.setdefault('strategy', str(strategy))
+        output_path = CSVManager._process_csv_file(csv_filename, strategy, threshold, show_detailed_report,
+                                                   chunksize, schema, parse_lap_times, lean, incremental,
+                                                   output_path, quiet, storage, dedup, dedup_key, metrics)
+        if show_detailed_report:
+            metrics.print_summary()
+        if metrics_path:
+            metrics.export_jsonl(metrics_path)
+            print(f"📈 Métricas añadidas a: {metrics_path}")
+        return output_path, metrics
+    
+    @staticmethod
+    def _process_csv_file(csv_filename, strategy, threshold, show_detailed_report, chunksize, schema,
+                          parse_lap_times, lean, incremental, output_path, quiet, storage, dedup, dedup_key,
+                          metrics):
+        """Etapas de process_csv_file, cada una medida con `metrics`."""
+        if incremental:
+            with metrics.stage('incremental'):
+                return CSVManager.process_csv_file_incremental(csv_filename, strategy, threshold,
+                                                               show_detailed_report=show_detailed_report,
+                                                               output_path=output_path)
+        if chunksize:
+            with metrics.stage('chunked'):
+                return CSVManager.process_csv_file_chunked(csv_filename, strategy, threshold, chunksize,
+                                                           show_detailed_report, parse_lap_times, output_path,
+                                                           storage, dedup, dedup_key)
+        
         print("🚀 Iniciando procesamiento de CSV...")
         
         # 1. Cargar datos originales
-        original_data = CSVManager.load_csv(csv_filename)
+        with metrics.stage('load') as stage:
+            original_data = CSVManager.load_csv(csv_filename, schema=schema)
+            stage.rows_out = None if original_data is None else len(original_data)
         if original_data is None:
             return None
         
-        # 2. Mostrar vista previa de datos originales
-        print("\n📄 Vista previa de datos originales:")
-        print(original_data.head())
+        if parse_lap_times:
+            with metrics.stage('parse_lap_times', rows_in=len(original_data)) as stage:
+                print("⏱️  Convirtiendo tiempos Q1/Q2/Q3 a milisegundos...")
+                original_data = LapTimeParser.parse_columns(original_data, copy=False)
+                stage.rows_out = len(original_data)
         
-        # 3. Analizar datos originales
-        print("\n🔍 Analizando datos originales...")
-        analyzer = DataAnalyzer(original_data)
-        analyzer.print_null_analysis()
+        # Los datos cargados son del pipeline: analizador, limpiador y reporte comparten su perfil
+        DataProfile.register(original_data)
+        
+        analyzer = None
+        if not quiet:
+            # 2. Mostrar vista previa de datos originales
+            with metrics.stage('preview', rows_in=len(original_data)):
+                print("\n📄 Vista previa de datos originales:")
+                print(original_data.head())
+            
+            # 3. Analizar datos originales
+            with metrics.stage('analysis', rows_in=len(original_data)):
+                print("\n🔍 Analizando datos originales...")
+                analyzer = DataAnalyzer(original_data)
+                analyzer.print_null_analysis()
         
         # 4. Limpiar datos
-        print(f"\n🧹 Limpiando datos con estrategia '{strategy}'...")
-        cleaner = DataCleaner(original_data)
-        cleaned_data = cleaner.clean_data(strategy=strategy, threshold=threshold)
+        with metrics.stage('clean', rows_in=len(original_data)) as stage:
+            print(f"\n🧹 Limpiando datos con estrategia '{strategy}'...")
+            cleaner = DataCleaner(original_data, lean=lean, metrics=metrics)
+            if lean:
+                # El limpiador se queda con los datos: se sueltan las demás referencias
+                original_data = analyzer = None
+            if dedup is not None:
+                cleaner.clean_duplicates(key=dedup_key, policy=dedup)
+                print(f"🔑 Duplicados resueltos: {cleaner.dedup_stats['duplicates_resolved']}")
+            cleaned_data = cleaner.clean_data(strategy=strategy, threshold=threshold)
+            stage.rows_out = len(cleaned_data)
         
         # 5. Generar reporte de limpieza
         if show_detailed_report:
-            report = CleaningReport(original_data, cleaned_data)
-            report.print_cleaning_summary()
-            report.print_before_after_comparison()
+            with metrics.stage('report', rows_in=len(cleaned_data)):
+                report = CleaningReport(cleaner.original_data, cleaned_data, cleaner.dedup_stats,
+                                        cleaner.validation_stats)
+                report.print_cleaning_summary()
+                report.print_before_after_comparison()
         
-        # 6. Guardar archivo limpio
-        output_filename = CSVManager.generate_clean_filename(csv_filename)
-        output_path = CSVManager.save_csv(cleaned_data, output_filename, show_preview=not show_detailed_report)
+        # 6. Guardar archivo limpio (o cargarlo en SQLite)
+        with metrics.stage('save', rows_in=len(cleaned_data)) as stage:
+            if storage is not None:
+                output_path = CSVManager.save_sqlite(cleaned_data, storage)
+            else:
+                output_filename = output_path or CSVManager.generate_clean_filename(csv_filename)
+                output_path = CSVManager.save_csv(cleaned_data, output_filename,
+                                                  show_preview=not (show_detailed_report or quiet))
+            stage.rows_out = len(cleaned_data) if output_path else 0
+            if output_path and cleaner.quarantined is not None and len(cleaner.quarantined) > 0:
+                # Las filas inválidas se guardan aparte, junto a la salida
+                quarantine_path = f"{os.path.splitext(output_path)[0]}_quarantine.csv"
+                cleaner.quarantined.to_csv(quarantine_path, index=False)
+                print(f"🚫 {len(cleaner.quarantined)} filas inválidas en cuarentena: {quarantine_path}")
         
         if output_path:
             print("\n🎉 ¡Procesamiento completado exitosamente!")
             print(f"📁 Archivo limpio disponible en: {output_path}")
         
         return output_path
+
+    
+    @staticmethod
+    def evaluate_strategies(csv_filename, strategies=None, threshold=0.5, schema=None, parse_lap_times=False,
+                            workers=None, write_winner=False, output_path=None, show_detailed_report=True):
+        """
+        Compara varias estrategias de limpieza sobre un CSV: lo carga y lo
+        perfila una vez, ejecuta las estrategias en paralelo sobre los mismos
+        datos (ver StrategyEvaluator) y, opcionalmente, guarda solo el
+        resultado de la mejor.
+        
+        Args:
+            csv_filename (str): Ruta del archivo CSV a evaluar
+            strategies (list): Estrategias a comparar (por defecto las cinco básicas)
+            threshold (float): Umbral para eliminar columnas (% de nulos)
+            schema: Esquema de tipos para la carga (ver load_csv)
+            parse_lap_times (bool): Si convertir Q1/Q2/Q3 a milisegundos antes de limpiar
+            workers (int): Hilos de evaluación
+            write_winner (bool): Si guardar los datos limpios de la mejor estrategia
+            output_path (str): Ruta del CSV de la mejor estrategia (ver process_csv_file)
+            show_detailed_report (bool): Si mostrar la comparación
+            
+        Returns:
+            list: Ranking de estrategias (ver StrategyEvaluator.evaluate) o None si
+                hay error. Con write_winner, la primera entrada incluye 'output_path'
+        """
+        print("🚀 Evaluando estrategias de limpieza...")
+        data = CSVManager.load_csv(csv_filename, schema=schema)
+        if data is None:
+            return None
+        if parse_lap_times:
+            data = LapTimeParser.parse_columns(data, copy=False)
+        
+        evaluator = StrategyEvaluator(strategies, threshold=threshold, workers=workers)
+        ranking = evaluator.evaluate(data)
+        if show_detailed_report:
+            evaluator.print_ranking(ranking)
+        
+        winner = evaluator.winner(ranking)
+        if winner is None:
+            print("❌ Error: Ninguna estrategia se pudo aplicar")
+            return ranking
+        print(f"\n🏆 Mejor estrategia: '{winner}'")
+        if write_winner:
+            output_filename = output_path or CSVManager.generate_clean_filename(csv_filename)
+            ranking[0]['output_path'] = CSVManager.save_csv(evaluator.results[winner], output_filename,
+                                                            show_preview=False)
+        return ranking
+
+    @staticmethod
+    def export_star_schema(csv_filename, directory, strategy=None, threshold=0.5, schema=None, format='.npz'):
+        """
+        Exporta un CSV (limpio o limpiándolo antes) en un esquema en estrella:
+        dimensiones de pilotos, constructores y circuitos más una tabla de
+        hechos de claves enteras (ver StarSchema). Se recarga con StarSchema.load.
+        
+        Args:
+            csv_filename (str): Ruta del archivo CSV
+            directory (str): Directorio de salida (relativo a la carpeta de
+                Config.OUTPUT o absoluto)
+            strategy (str): Estrategia de limpieza previa (None: exportar tal cual)
+            threshold (float): Umbral para eliminar columnas (% de nulos)
+            schema: Esquema de tipos para la carga (ver load_csv)
+            format (str): Formato de las tablas (ver StarSchema.FORMATS)
+            
+        Returns:
+            dict: Estadísticas de la exportación (ver StarSchema.write) o None si hay error
+        """
+        star_schema = StarSchema(format)
+        data = CSVManager.load_csv(csv_filename, schema=schema)
+        if data is None:
+            return None
+        if strategy is not None:
+            data = DataCleaner(data).clean_data(strategy=strategy, threshold=threshold)
+        
+        directory = CSVManager.get_output_path(directory)
+        try:
+            stats = star_schema.write(data, directory)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error al exportar: {e}")
+            return None
+        print(f"⭐ Esquema en estrella guardado en: {directory}")
+        print(f"📦 Tablas: {stats['tables']} ({stats['bytes']} bytes)")
+        return stats
+    
+    @staticmethod
+    def process_csv_file_chunked(csv_filename, strategy='remove_rows', threshold=0.5, chunksize=100_000,
+                                 show_detailed_report=True, parse_lap_times=False, output_path=None, storage=None,
+                                 dedup=None, dedup_key=None):
+        """
+        Procesa un archivo CSV por bloques: lee, limpia y añade la salida bloque a bloque.
+        El resultado es idéntico byte a byte al de process_csv_file en memoria.
+        
+        Args:
+            csv_filename (str): Ruta del archivo CSV a procesar
+            strategy (str): Estrategia de limpieza a aplicar
+            threshold (float): Umbral para eliminar columnas (% de nulos)
+            chunksize (int): Número de filas por bloque
+            show_detailed_report (bool): Si mostrar resumen del procesamiento
+            parse_lap_times (bool): Si convertir Q1/Q2/Q3 a milisegundos en cada bloque
+            output_path (str): Ruta del CSV limpio (ver process_csv_file)
+            storage: SQLiteStorage o ruta .db: cada bloque limpio se carga en SQLite
+                en lugar de añadirse al CSV
+            dedup (str): Política de deduplicación (ver process_csv_file): se
+                resuelve por bloques a un CSV temporal que después se limpia
+            dedup_key (list): Columnas de la clave
+            
+        Returns:
+            str: Ruta del archivo CSV limpio generado (o de la base de datos) o None si hay error
+        """
+        print(f"🚀 Iniciando procesamiento de CSV por bloques de {chunksize} filas...")
+        
+        csv_path = CSVManager.get_input_path(csv_filename)
+        if not os.path.exists(csv_path):
+            print(f"❌ Error: No se encontró el archivo {csv_path}")
+            return None
+        
+        if storage is not None:
+            storage = CSVManager.get_storage(storage)
+            output_path = storage.db_path
+        else:
+            output_path = CSVManager.get_output_path(output_path or CSVManager.generate_clean_filename(csv_filename))
+        output_filename = os.path.basename(output_path)
+        
+        dedup_stats = None
+        dedup_path = None
+        try:
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            if dedup is not None:
+                deduplicator = Deduplicator(key=dedup_key, policy=dedup)
+                dedup_path = f"{output_path}.dedup.tmp"
+                dedup_stats = deduplicator.resolve_csv(csv_path, dedup_path, chunksize=chunksize)
+                print(f"🔑 Duplicados resueltos: {dedup_stats['duplicates_resolved']}")
+            print(f"\n🧹 Limpiando datos con estrategia '{strategy}'...")
+            transform = (lambda chunk: LapTimeParser.parse_columns(chunk, copy=False)) if parse_lap_times else None
+            cleaner = StreamingCleaner(dedup_path or csv_path, strategy=strategy, threshold=threshold,
+                                       chunksize=chunksize, transform=transform)
+            if storage is not None:
+                stats = cleaner.clean_to_sqlite(storage)
+            else:
+                stats = cleaner.clean_to_csv(output_path)
+        except ValueError:
+            raise
+        except Exception as e:
+            print(f"❌ Error al procesar el archivo: {e}")
+            return None
+        finally:
+            if dedup_path is not None and os.path.exists(dedup_path):
+                os.remove(dedup_path)
+        
+        if show_detailed_report:
+            print("\n=== RESUMEN DE LIMPIEZA POR BLOQUES ===")
+            print(f"📊 Filas leídas: {stats['rows_read']}")
+            print(f"📊 Filas escritas: {stats['rows_written']}")
+            print(f"🗑️  Filas eliminadas: {stats['rows_read'] - stats['rows_written']}")
+            print(f"🗑️  Columnas eliminadas: {stats['original_columns'] - stats['current_columns']}")
+            if dedup_stats:
+                print(f"🔑 Duplicados resueltos: {dedup_stats['duplicates_resolved']} "
+                      f"({dedup_stats['duplicate_keys']} claves repetidas, política '{dedup_stats['policy']}')")
+            print(f"❌ Valores nulos originales: {stats['original_nulls']}")
+            print(f"❌ Valores nulos restantes: {stats['remaining_nulls']}")
+        
+        if storage is not None:
+            CSVManager.print_storage_load(storage, {'rows': stats['rows_written'], 'seconds': stats['load_seconds'],
+                                                    'rows_per_second': stats['rows_per_second']})
+        else:
+            print(f"💾 Archivo guardado como: {output_filename}")
+        print("\n🎉 ¡Procesamiento completado exitosamente!")
+        print(f"📁 Archivo limpio disponible en: {output_path}")
+        
+        return output_path
+    
+    @staticmethod
+    def process_csv_file_incremental(csv_filename, strategy='remove_rows', threshold=0.5, drift_tolerance=0.01,
+                                     show_detailed_report=True, output_path=None):
+        """
+        Procesa un archivo CSV de forma incremental: limpia solo las filas añadidas
+        desde la última ejecución y las añade a la salida limpia existente.
+        El estado (marca de agua Season/Round y estadísticas) se guarda en
+        Config.CACHE_DIR/incremental. Si la salida anterior queda obsoleta
+        se reconstruye completa.
+        
+        Args:
+            csv_filename (str): Ruta del archivo CSV a procesar
+            strategy (str): Estrategia de limpieza a aplicar
+            threshold (float): Umbral para eliminar columnas (% de nulos)
+            drift_tolerance (float): Variación relativa máxima de las medias de
+                'fill_mean' antes de reconstruir la salida
+            show_detailed_report (bool): Si mostrar resumen del procesamiento
+            output_path (str): Ruta del CSV limpio (ver process_csv_file)
+            
+        Returns:
+            str: Ruta del archivo CSV limpio generado o None si hay error
+        """
+        print("🚀 Iniciando procesamiento incremental de CSV...")
+        
+        csv_path = CSVManager.get_input_path(csv_filename)
+        if not os.path.exists(csv_path):
+            print(f"❌ Error: No se encontró el archivo {csv_path}")
+            return None
+        
+        output_path = CSVManager.get_output_path(output_path or CSVManager.generate_clean_filename(csv_filename))
+        output_filename = os.path.basename(output_path)
+        project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        state_path = os.path.join(project_root, Config.CACHE_DIR, 'incremental', f"{output_filename}.{strategy}.json")
+        
+        try:
+            cleaner = IncrementalCleaner(csv_path, output_path, state_path, strategy=strategy, threshold=threshold,
+                                         drift_tolerance=drift_tolerance)
+            result = cleaner.run()
+        except ValueError:
+            raise
+        except Exception as e:
+            print(f"❌ Error al procesar el archivo: {e}")
+            return None
+        
+        if show_detailed_report:
+            print("\n=== RESUMEN DE LIMPIEZA INCREMENTAL ===")
+            if result['mode'] == 'full':
+                print(f"🔁 Reconstrucción completa: {result['reason']}")
+            elif result['mode'] == 'up_to_date':
+                print("✅ Sin filas nuevas: la salida ya está al día")
+            print(f"📊 Filas procesadas: {result['rows_processed']}")
+            print(f"📊 Filas escritas: {result['rows_written']}")
+            if result['watermark'] is not None:
+                print(f"🏁 Marca de agua (Season, Round): {tuple(result['watermark'])}")
+        
+        print(f"💾 Archivo guardado como: {output_filename}")
+        print("\n🎉 ¡Procesamiento completado exitosamente!")
+        print(f"📁 Archivo limpio disponible en: {output_path}")
+        
+        return output_path
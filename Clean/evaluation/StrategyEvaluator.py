@@ -0,0 +1,123 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from ..analyzer import DataProfile
+from ..cleaner import DataCleaner
+from ..report import CleaningReport
+
+
+class StrategyEvaluator:
+    """
+    Clase responsable de comparar varias estrategias de limpieza sobre los
+    mismos datos para elegir la mejor.
+
+    Los datos se cargan y se perfilan una sola vez; cada estrategia se ejecuta
+    en un hilo con un DataCleaner en modo compartido (sin copias de la
+    entrada, que es de solo lectura) y reutiliza el perfil original en su
+    CleaningReport. Las estrategias se ordenan por:
+    1. Mayor puntuación de calidad final
+    2. Menor reducción de datos (% de filas eliminadas)
+    3. Más valores nulos eliminados
+    """
+
+    STRATEGIES = ['remove_rows', 'remove_columns', 'fill_forward', 'fill_mean', 'fill_zero']
+    SUMMARY_KEYS = ['data_quality_score', 'quality_improvement', 'data_reduction_percentage', 'nulls_removed',
+                    'rows_removed', 'columns_removed', 'current_shape']
+
+    def __init__(self, strategies=None, threshold=0.5, workers=None):
+        """
+        Args:
+            strategies (list): Estrategias a comparar (por defecto STRATEGIES)
+            threshold (float): Umbral de nulos para 'remove_columns'
+            workers (int): Hilos (por defecto, uno por estrategia hasta el número de núcleos)
+        """
+        self.strategies = list(self.STRATEGIES if strategies is None else strategies)
+        if not self.strategies:
+            raise ValueError("Se necesita al menos una estrategia")
+        self.threshold = threshold
+        self.workers = workers or min(len(self.strategies), os.cpu_count() or 1)
+        self.results = {}
+
+    def _run(self, data, strategy):
+        """Limpia `data` (compartido, solo lectura) con una estrategia y resume el resultado."""
+        start = time.perf_counter()
+        cleaner = DataCleaner(data, shared=True)
+        cleaned = cleaner.clean_data(strategy=strategy, threshold=self.threshold)
+        summary = CleaningReport(data, cleaned, validation_stats=cleaner.validation_stats).get_cleaning_summary()
+        return cleaned, summary, time.perf_counter() - start
+
+    @staticmethod
+    def _rank_key(entry):
+        if entry['error'] is not None:
+            return (1, 0, 0, 0)
+        return (0, -entry['data_quality_score'], entry['data_reduction_percentage'], -entry['nulls_removed'])
+
+    def evaluate(self, data: pd.DataFrame):
+        """
+        Ejecuta todas las estrategias sobre los mismos datos y las ordena.
+        Los datos limpios de cada estrategia quedan en `results`.
+
+        Args:
+            data (pd.DataFrame): Datos originales (no se modifican)
+
+        Returns:
+            list: Un dict por estrategia (strategy, rank, seconds, error y las
+                métricas de SUMMARY_KEYS), de mejor a peor
+        """
+        # El perfil original se calcula una vez y lo comparten todos los limpiadores;
+        # los datos se registran solo mientras dura la evaluación (no se modifican)
+        registered = DataProfile.register(data)
+        DataProfile.of(data)
+        self.results = {}
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = {strategy: executor.submit(self._run, data, strategy) for strategy in self.strategies}
+        finally:
+            if registered:
+                DataProfile.release(data)
+
+        ranking = []
+        for strategy, future in futures.items():
+            entry = {'strategy': strategy, 'error': None}
+            try:
+                cleaned, summary, seconds = future.result()
+            except ValueError as e:
+                entry.update({key: None for key in self.SUMMARY_KEYS})
+                entry.update({'seconds': None, 'error': str(e)})
+            else:
+                self.results[strategy] = cleaned
+                entry.update({key: summary[key] for key in self.SUMMARY_KEYS})
+                entry['seconds'] = seconds
+            ranking.append(entry)
+
+        ranking.sort(key=self._rank_key)
+        for rank, entry in enumerate(ranking, start=1):
+            entry['rank'] = rank if entry['error'] is None else None
+        return ranking
+
+    @staticmethod
+    def winner(ranking):
+        """
+        Returns:
+            str: Mejor estrategia del ranking (None si todas fallaron)
+        """
+        if not ranking or ranking[0]['error'] is not None:
+            return None
+        return ranking[0]['strategy']
+
+    @staticmethod
+    def print_ranking(ranking):
+        """
+        Imprime la comparación de estrategias.
+        """
+        print("\n=== COMPARACIÓN DE ESTRATEGIAS ===")
+        for entry in ranking:
+            if entry['error'] is not None:
+                print(f"❌ {entry['strategy']}: {entry['error']}")
+                continue
+            print(f"{entry['rank']}. {entry['strategy']}: calidad {entry['data_quality_score']:.2f}%, "
+                  f"reducción {entry['data_reduction_percentage']:.2f}%, "
+                  f"nulos eliminados {entry['nulls_removed']}, forma {entry['current_shape']} "
+                  f"({entry['seconds']:.3f}s)")
@@ -0,0 +1,11 @@
+"""
+Módulo Evaluation - Comparación de estrategias de limpieza
+
+Este módulo ejecuta varias estrategias de limpieza en paralelo sobre
+unos datos cargados y perfilados una sola vez, y las ordena según sus
+resúmenes de limpieza para elegir la mejor.
+"""
+
+from .StrategyEvaluator import StrategyEvaluator
+
+__all__ = ['StrategyEvaluator']
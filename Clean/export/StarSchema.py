@@ -0,0 +1,256 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from ..schema import LapTimeParser
+from ..writer import ColumnarWriter, OutputWriter, WriterRegistry
+
+
+class StarSchema:
+    """
+    Clase responsable de exportar los datos de clasificación en un esquema
+    en estrella y de reconstruirlos.
+
+    Los atributos repetidos en cada fila se separan en tablas de dimensiones
+    (pilotos, constructores y circuitos), una fila por combinación distinta
+    con una clave entera; la tabla de hechos guarda solo esas claves, los
+    enteros (Season, Round, Position) con el tipo más pequeño posible y los
+    tiempos Q1/Q2/Q3 en milisegundos. Una combinación distinta por fila de
+    dimensión hace que la reconstrucción sea exacta aunque un mismo piloto
+    aparezca con atributos distintos; los tiempos que no se reconstruyen igual
+    desde los milisegundos (nulos, textos mal formados o no canónicos) se
+    guardan tal cual en una tabla aparte.
+
+    Estructura del directorio exportado:
+    - drivers, constructors, circuits y qualifying con la extensión del formato
+    - lap_time_exceptions (solo si hace falta): fila, columna y texto original
+    - star.json: columnas originales, tipos y dimensiones
+    """
+
+    # nombre de la tabla -> (clave natural, atributos, clave entera)
+    DIMENSIONS = {
+        'drivers': ('DriverID', ['Code', 'PermanentNumber', 'GivenName', 'FamilyName', 'DateOfBirth', 'Nationality'],
+                    'DriverKey'),
+        'constructors': ('ConstructorID', ['ConstructorName', 'ConstructorNationality'], 'ConstructorKey'),
+        'circuits': ('CircuitID', [], 'CircuitKey'),
+    }
+    FACT_TABLE = 'qualifying'
+    LAP_TIME_TABLE = 'lap_time_exceptions'
+    META_FILE = 'star.json'
+    FORMAT_VERSION = 1
+    FORMATS = ['.npz', '.csv', '.csv.gz', '.csv.bz2', '.csv.xz']
+
+    def __init__(self, format='.npz'):
+        """
+        Args:
+            format (str): Formato de las tablas (ver FORMATS)
+        """
+        if format not in self.FORMATS:
+            raise ValueError(f"Formato '{format}' no soportado. Use uno de {self.FORMATS}")
+        self.format = format
+
+    @staticmethod
+    def _key_dtype(size):
+        """Entero con signo más pequeño capaz de numerar `size` filas."""
+        for dtype in (np.int8, np.int16, np.int32):
+            if size <= np.iinfo(dtype).max:
+                return dtype
+        return np.int64
+
+    @staticmethod
+    def _compact(series):
+        """Reduce enteros y milisegundos al tipo más pequeño que conserva los valores."""
+        if series.dtype == 'Int64':
+            valid = series.dropna()
+            if valid.empty or (valid.min() >= np.iinfo(np.int32).min and valid.max() <= np.iinfo(np.int32).max):
+                return series.astype('Int32')
+            return series
+        if pd.api.types.is_integer_dtype(series.dtype) and not isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+            return pd.to_numeric(series, downcast='integer')
+        return series
+
+    @staticmethod
+    def _parse_lap_times(series):
+        """
+        Convierte una columna de tiempos en texto a milisegundos y separa las
+        filas cuyo texto no se reconstruye igual con LapTimeParser.format.
+
+        Returns:
+            tuple: (milisegundos 'Int64', posiciones de las excepciones, textos originales)
+        """
+        parsed = LapTimeParser.parse(series)
+        original = series.to_numpy(dtype=object)
+        rows = np.flatnonzero(LapTimeParser.format(parsed).to_numpy(dtype=object) != original)
+        return parsed, rows, original[rows]
+
+    def split(self, data: pd.DataFrame):
+        """
+        Divide los datos en tablas de dimensiones y tabla de hechos.
+
+        Args:
+            data (pd.DataFrame): Datos de clasificación (limpios o no)
+
+        Returns:
+            tuple: (dict tabla -> pd.DataFrame, dict de metadatos)
+        """
+        tables = {}
+        keys = {}
+        dimensions = {}
+        used = set()
+        for name, (natural, attributes, key) in self.DIMENSIONS.items():
+            if natural not in data.columns:
+                continue
+            columns = [natural] + [col for col in attributes if col in data.columns]
+            groups = data.groupby(columns, dropna=False, sort=False, observed=True).ngroup().to_numpy()
+            first_rows = np.unique(groups, return_index=True)[1]
+            key_dtype = self._key_dtype(len(first_rows))
+            dimension = data.iloc[first_rows][columns].reset_index(drop=True)
+            dimension.insert(0, key, np.arange(len(dimension), dtype=key_dtype))
+            tables[name] = dimension
+            keys[key] = groups.astype(key_dtype)
+            dimensions[name] = {'key': key, 'columns': columns}
+            used.update(columns)
+
+        # Solo tiempos en texto o ya en milisegundos; el resto se guarda como llega
+        lap_times = [col for col in LapTimeParser.LAP_TIME_COLUMNS
+                     if col in data.columns and col not in used and (data[col].dtype == object
+                                                                     or data[col].dtype == 'Int64')]
+        fact = dict(keys)
+        original_dtypes = {}
+        exceptions = []
+        for col in data.columns:
+            if col in used:
+                continue
+            series = data[col]
+            original_dtypes[col] = str(series.dtype)
+            if col in lap_times and series.dtype != 'Int64':
+                series, rows, texts = self._parse_lap_times(series)
+                if len(rows):
+                    exceptions.append((col, rows, texts))
+            fact[col] = self._compact(series).array
+        tables[self.FACT_TABLE] = pd.DataFrame(fact, copy=False)
+        if exceptions:
+            tables[self.LAP_TIME_TABLE] = pd.DataFrame({
+                'Row': np.concatenate([rows for _, rows, _ in exceptions]).astype(self._key_dtype(len(data))),
+                'Column': np.concatenate([np.full(len(rows), col, dtype=object) for col, rows, _ in exceptions]),
+                'Text': np.concatenate([texts for _, _, texts in exceptions]),
+            })
+
+        meta = {
+            'format_version': self.FORMAT_VERSION,
+            'format': self.format,
+            'rows': len(data),
+            'columns': [str(col) for col in data.columns],
+            'dimensions': dimensions,
+            'lap_times': lap_times,
+            'lap_time_exceptions': bool(exceptions),
+            'original_dtypes': original_dtypes,
+            'dtypes': {name: {str(col): str(dtype) for col, dtype in table.dtypes.items()}
+                       for name, table in tables.items()},
+        }
+        return tables, meta
+
+    def write(self, data: pd.DataFrame, directory):
+        """
+        Exporta los datos a un directorio. Cada tabla se escribe de forma
+        atómica y star.json se escribe al final: un directorio sin él no es
+        una exportación completa.
+
+        Args:
+            data (pd.DataFrame): Datos de clasificación
+            directory (str): Directorio de salida (se crea si no existe)
+
+        Returns:
+            dict: Estadísticas (directory, rows, tables: filas por tabla, bytes)
+        """
+        tables, meta = self.split(data)
+        os.makedirs(directory, exist_ok=True)
+        total_bytes = 0
+        for name, table in tables.items():
+            path = os.path.join(directory, name + self.format)
+            WriterRegistry.for_path(path).write(table, path)
+            total_bytes += os.path.getsize(path)
+
+        with OutputWriter.atomic(os.path.join(directory, self.META_FILE)) as handle:
+            handle.write(json.dumps(meta, indent=2).encode('utf-8'))
+        return {'directory': directory, 'rows': len(data),
+                'tables': {name: len(table) for name, table in tables.items()}, 'bytes': total_bytes}
+
+    @classmethod
+    def _read_table(cls, directory, name, meta):
+        path = os.path.join(directory, name + meta['format'])
+        if meta['format'] == '.npz':
+            return ColumnarWriter.read(path)
+        # read_csv no acepta tipos de fecha en dtype: se leen como texto y se
+        # convierten después
+        dtypes = meta['dtypes'][name]
+        dates = {col: dtype for col, dtype in dtypes.items() if dtype.startswith('datetime64')}
+        table = pd.read_csv(path, dtype={col: ('object' if col in dates else dtype) for col, dtype in dtypes.items()})
+        for col, dtype in dates.items():
+            table[col] = pd.to_datetime(table[col], format='ISO8601').astype(dtype)
+        return table
+
+    @classmethod
+    def load(cls, directory, lap_times=None, categorical=False):
+        """
+        Carga una exportación y reconstruye la tabla original: las columnas
+        de cada dimensión se expanden indexando con las claves enteras.
+
+        Args:
+            directory (str): Directorio exportado con write
+            lap_times (str): 'text' (texto "m:ss.fff" con el marcador "0", como
+                el CSV original), 'ms' (milisegundos 'Int64', como parse_lap_times)
+                o None (la representación de los datos exportados)
+            categorical (bool): Devolver los textos de las dimensiones como
+                categóricas (sin crear un objeto Python por fila)
+
+        Returns:
+            pd.DataFrame: Datos con las columnas y el orden originales
+        """
+        if lap_times not in (None, 'text', 'ms'):
+            raise ValueError("lap_times debe ser None, 'text' o 'ms'")
+        with open(os.path.join(directory, cls.META_FILE), encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('format_version') != cls.FORMAT_VERSION:
+            raise ValueError(f"Versión de formato no soportada: {meta.get('format_version')}")
+
+        fact = cls._read_table(directory, cls.FACT_TABLE, meta)
+        exceptions = None
+        if meta.get('lap_time_exceptions'):
+            exceptions = cls._read_table(directory, cls.LAP_TIME_TABLE, meta)
+        columns = {}
+        for name, dimension in meta['dimensions'].items():
+            table = cls._read_table(directory, name, meta)
+            keys = fact[dimension['key']].to_numpy()
+            for col in dimension['columns']:
+                values = table[col]
+                if isinstance(values.dtype, pd.CategoricalDtype):
+                    columns[col] = pd.Categorical.from_codes(values.cat.codes.to_numpy()[keys], dtype=values.dtype)
+                elif categorical and values.dtype == object:
+                    codes, uniques = pd.factorize(values)
+                    columns[col] = pd.Categorical.from_codes(codes[keys], categories=uniques)
+                else:
+                    columns[col] = values.array.take(keys)
+
+        for col, dtype in meta['original_dtypes'].items():
+            series = fact[col]
+            if col in meta['lap_times']:
+                series = series.astype('Int64')
+                if lap_times == 'text' or lap_times is None and dtype != 'Int64':
+                    series = LapTimeParser.format(series)
+                    if exceptions is not None and (exceptions['Column'] == col).any():
+                        # Textos originales que los milisegundos no reconstruyen
+                        selected = (exceptions['Column'] == col).to_numpy()
+                        values = series.to_numpy(dtype=object, copy=True)
+                        texts = exceptions['Text'].to_numpy(dtype=object)
+                        values[exceptions['Row'].to_numpy()[selected]] = texts[selected]
+                        series = pd.Series(values)
+            elif str(series.dtype) != dtype:
+                series = series.astype(dtype)
+            columns[col] = series.array
+
+        data = pd.DataFrame({col: columns[col] for col in meta['columns']}, copy=False)
+        if not meta['columns']:
+            data = pd.DataFrame(index=pd.RangeIndex(meta['rows']))
+        return data
@@ -0,0 +1,12 @@
+"""
+Módulo Export - Exportación normalizada de los datos
+
+Este módulo se encarga de exportar los datos de clasificación
+en un esquema en estrella (dimensiones de pilotos, constructores
+y circuitos más una tabla de hechos de enteros) y de
+reconstruir la tabla original a partir de él.
+"""
+
+from .StarSchema import StarSchema
+
+__all__ = ['StarSchema']
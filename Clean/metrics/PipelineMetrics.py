@@ -0,0 +1,224 @@
+import json
+import os
+import time
+import tracemalloc
+import uuid
+
+
+class StageMetrics:
+    """
+    Medidas de una etapa del pipeline: tiempo real, tiempo de CPU, filas de
+    entrada y salida y pico de memoria por encima de la memoria al empezar.
+    """
+
+    def __init__(self, name, rows_in=None, parent=None):
+        self.name = name
+        self.parent = parent
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.started_at = None
+        self.wall_seconds = None
+        self.cpu_seconds = None
+        self.memory_delta_mb = None
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: Medidas de la etapa serializables a JSON
+        """
+        return {
+            'stage': self.name,
+            'parent': self.parent,
+            'started_at': self.started_at,
+            'wall_seconds': self.wall_seconds,
+            'cpu_seconds': self.cpu_seconds,
+            'rows_in': self.rows_in,
+            'rows_out': self.rows_out,
+            'memory_delta_mb': self.memory_delta_mb,
+        }
+
+
+class _StageTimer:
+    """Contexto que mide una etapa y la entrega a PipelineMetrics al salir."""
+
+    def __init__(self, metrics, stage):
+        self.metrics = metrics
+        self.stage = stage
+
+    def __enter__(self):
+        self.metrics._start(self.stage)
+        return self.stage
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.metrics._finish(self.stage)
+        return False
+
+
+class _DisabledStage:
+    """Contexto sin efecto de las métricas desactivadas (admite rows_out = ...)."""
+
+    name = parent = rows_in = rows_out = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_DISABLED_STAGE = _DisabledStage()
+
+
+class PipelineMetrics:
+    """
+    Instrumentación por etapas del pipeline de limpieza.
+
+    Cada etapa se mide con un contexto:
+
+        with metrics.stage('load') as stage:
+            data = ...
+            stage.rows_out = len(data)
+
+    Las etapas pueden anidarse (p. ej. la estrategia dentro de 'clean'). El pico
+    de memoria se mide con tracemalloc, que se activa solo mientras hay una
+    etapa abierta si no estaba ya activo. Al cerrar cada etapa se llama a los
+    hooks registrados con su StageMetrics.
+
+    Desactivadas (PipelineMetrics.DISABLED), stage() devuelve siempre el mismo
+    contexto vacío: no se mide nada ni se crea ningún objeto.
+    """
+
+    DISABLED = None
+
+    def __init__(self, enabled=True, track_memory=True, hooks=None, context=None):
+        """
+        Args:
+            enabled (bool): Si medir las etapas
+            track_memory (bool): Si medir el pico de memoria con tracemalloc
+                (ralentiza algo las asignaciones de objetos Python)
+            hooks (list): Funciones hook(stage_metrics) llamadas al cerrar cada etapa
+            context (dict): Datos comunes de la ejecución (archivo, estrategia...)
+                incluidos en la exportación
+        """
+        self.enabled = enabled
+        self.track_memory = track_memory
+        self.hooks = list(hooks or [])
+        self.context = dict(context or {})
+        self.run_id = uuid.uuid4().hex[:12]
+        self.stages = []
+        self._open = []
+        self._started_tracing = False
+
+    def add_hook(self, hook):
+        """Registra una función hook(stage_metrics) para cada etapa cerrada."""
+        self.hooks.append(hook)
+
+    def stage(self, name, rows_in=None):
+        """
+        Contexto que mide una etapa.
+
+        Args:
+            name (str): Nombre de la etapa
+            rows_in (int): Filas de entrada
+
+        Returns:
+            Contexto que entrega la StageMetrics de la etapa
+        """
+        if not self.enabled:
+            return _DISABLED_STAGE
+        parent = self._open[-1][0].name if self._open else None
+        return _StageTimer(self, StageMetrics(name, rows_in=rows_in, parent=parent))
+
+    def _start(self, stage):
+        memory = None
+        if self.track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            current, peak = tracemalloc.get_traced_memory()
+            # El pico hasta ahora pertenece a la etapa padre: se guarda antes de reiniciarlo
+            if self._open:
+                self._open[-1][1]['peak'] = max(self._open[-1][1]['peak'], peak)
+            tracemalloc.reset_peak()
+            memory = {'start': current, 'peak': current}
+        self._open.append((stage, memory))
+        stage.started_at = time.time()
+        stage._wall = time.perf_counter()
+        stage._cpu = time.process_time()
+
+    def _finish(self, stage):
+        stage.wall_seconds = time.perf_counter() - stage._wall
+        stage.cpu_seconds = time.process_time() - stage._cpu
+        del stage._wall, stage._cpu
+        _, memory = self._open.pop()
+
+        if memory is not None:
+            _, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, memory['peak'])
+            stage.memory_delta_mb = (peak - memory['start']) / 1024 ** 2
+            if self._open:
+                self._open[-1][1]['peak'] = max(self._open[-1][1]['peak'], peak)
+            elif self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+        self.stages.append(stage)
+        for hook in self.hooks:
+            hook(stage)
+
+    def get(self, name):
+        """
+        Returns:
+            StageMetrics: Última etapa con ese nombre o None
+        """
+        for stage in reversed(self.stages):
+            if stage.name == name:
+                return stage
+        return None
+
+    @property
+    def total_seconds(self):
+        """Tiempo real de las etapas de primer nivel."""
+        return sum(stage.wall_seconds for stage in self.stages if stage.parent is None)
+
+    def to_dicts(self):
+        """
+        Returns:
+            list: Una entrada por etapa con el identificador de ejecución y el contexto
+        """
+        return [{'run_id': self.run_id, **self.context, **stage.to_dict()} for stage in self.stages]
+
+    def export_jsonl(self, path, append=True):
+        """
+        Exporta las etapas como JSON lines (una línea por etapa).
+
+        Args:
+            path (str): Ruta del archivo .jsonl
+            append (bool): Si añadir al final del archivo en lugar de sobrescribirlo
+
+        Returns:
+            str: Ruta del archivo escrito
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'a' if append else 'w', encoding='utf-8') as f:
+            for entry in self.to_dicts():
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        return path
+
+    def print_summary(self):
+        """Imprime una tabla con las medidas de cada etapa."""
+        print("\n⏱️  MÉTRICAS POR ETAPA")
+        print("=" * 80)
+        print(f"{'etapa':<30}{'real (s)':>10}{'CPU (s)':>10}{'filas in':>10}{'filas out':>10}{'mem (MB)':>10}")
+        for stage in self.stages:
+            name = f"  {stage.name}" if stage.parent else stage.name
+            rows_in = '' if stage.rows_in is None else stage.rows_in
+            rows_out = '' if stage.rows_out is None else stage.rows_out
+            memory = '' if stage.memory_delta_mb is None else f"{stage.memory_delta_mb:.1f}"
+            print(f"{name:<30}{stage.wall_seconds:>10.3f}{stage.cpu_seconds:>10.3f}"
+                  f"{rows_in:>10}{rows_out:>10}{memory:>10}")
+        print(f"{'total':<30}{self.total_seconds:>10.3f}")
+
+
+PipelineMetrics.DISABLED = PipelineMetrics(enabled=False)
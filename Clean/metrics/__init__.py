@@ -0,0 +1,11 @@
+"""
+Módulo Metrics - Instrumentación del pipeline
+
+Este módulo mide cada etapa del procesamiento (tiempo real, CPU, filas y
+memoria), con exportación a JSON lines y hooks para enviar las medidas
+a otros sistemas.
+"""
+
+from .PipelineMetrics import PipelineMetrics, StageMetrics
+
+__all__ = ['PipelineMetrics', 'StageMetrics']
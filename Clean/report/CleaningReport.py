@@ -1,5 +1,6 @@
 import pandas as pd
 from ..analyzer import DataAnalyzer
+from .DataDiff import DataDiff
 
 
 class CleaningReport:
@@ -8,16 +9,24 @@ class CleaningReport:
     Se enfoca únicamente en reportar y documentar los cambios realizados.
     """
     
-    def __init__(self, original_data: pd.DataFrame, cleaned_data: pd.DataFrame):
+    def __init__(self, original_data: pd.DataFrame, cleaned_data: pd.DataFrame, dedup_stats=None,
+                 validation_stats=None):
         """
         Inicializa el generador de reportes.
         
         Args:
-            original_data (pd.DataFrame): Datos originales
+            original_data (pd.DataFrame): Datos originales (o la CleaningSnapshot
+                de un DataCleaner en modo ligero)
             cleaned_data (pd.DataFrame): Datos después de la limpieza
+            dedup_stats (dict): Estadísticas de la deduplicación, si se aplicó
+                (ver DataCleaner.clean_duplicates)
+            validation_stats (dict): Estadísticas de la validación, si se aplicó
+                (ver DataCleaner.clean_invalid)
         """
         self.original_data = original_data
         self.cleaned_data = cleaned_data
+        self.dedup_stats = dedup_stats
+        self.validation_stats = validation_stats
         self.original_analyzer = DataAnalyzer(original_data)
         self.cleaned_analyzer = DataAnalyzer(cleaned_data)
         
@@ -31,6 +40,9 @@ class CleaningReport:
         original_shape = self.original_data.shape
         current_shape = self.cleaned_data.shape
         
+        original_profile = self.original_analyzer.profile
+        cleaned_profile = self.cleaned_analyzer.profile
+        
         # Análisis de calidad antes y después
         original_quality = self.original_analyzer.get_data_quality_score()
         cleaned_quality = self.cleaned_analyzer.get_data_quality_score()
@@ -40,9 +52,12 @@ class CleaningReport:
             'current_shape': current_shape,
             'rows_removed': original_shape[0] - current_shape[0],
             'columns_removed': original_shape[1] - current_shape[1],
-            'original_nulls': self.original_data.isnull().sum().sum(),
-            'remaining_nulls': self.cleaned_data.isnull().sum().sum(),
-            'nulls_removed': self.original_data.isnull().sum().sum() - self.cleaned_data.isnull().sum().sum(),
+            'original_nulls': original_profile.null_counts.sum(),
+            'remaining_nulls': cleaned_profile.null_counts.sum(),
+            'nulls_removed': original_profile.null_counts.sum() - cleaned_profile.null_counts.sum(),
+            'duplicates_resolved': self.dedup_stats['duplicates_resolved'] if self.dedup_stats else 0,
+            'invalid_rows': self.validation_stats['rows_invalid'] if self.validation_stats else 0,
+            'violations': dict(self.validation_stats['violations']) if self.validation_stats else {},
             'original_quality_score': original_quality,
             'data_quality_score': cleaned_quality,
             'quality_improvement': cleaned_quality - original_quality,
@@ -62,6 +77,14 @@ class CleaningReport:
         print(f"📊 Forma actual: {summary['current_shape']}")
         print(f"🗑️  Filas eliminadas: {summary['rows_removed']}")
         print(f"🗑️  Columnas eliminadas: {summary['columns_removed']}")
+        if self.dedup_stats:
+            print(f"🔑 Duplicados resueltos: {summary['duplicates_resolved']} "
+                  f"({self.dedup_stats['duplicate_keys']} claves repetidas, política '{self.dedup_stats['policy']}')")
+        if self.validation_stats:
+            print(f"🚫 Filas inválidas: {summary['invalid_rows']}")
+            for rule, count in summary['violations'].items():
+                if count > 0:
+                    print(f"   - {rule}: {count}")
         print(f"❌ Valores nulos originales: {summary['original_nulls']}")
         print(f"❌ Valores nulos restantes: {summary['remaining_nulls']}")
         print(f"✅ Valores nulos eliminados: {summary['nulls_removed']}")
@@ -81,15 +104,32 @@ class CleaningReport:
         print("Primeras 5 filas:")
         print(self.original_data.head())
         print("\nInformación de valores nulos:")
-        print(self.original_data.isnull().sum())
+        print(self.original_analyzer.profile.null_counts)
         
         print("\n✨ DATOS LIMPIOS:")
         print(f"Forma: {self.cleaned_data.shape}")
         print("Primeras 5 filas:")
         print(self.cleaned_data.head())
         print("\nInformación de valores nulos:")
-        print(self.cleaned_data.isnull().sum())
+        print(self.cleaned_analyzer.profile.null_counts)
     
+    def get_row_diff(self, key=None):
+        """
+        Compara fila a fila los datos originales con los limpios.
+
+        Args:
+            key: Emparejamiento de filas (ver DataDiff): None por índice,
+                'content' o lista de columnas clave
+
+        Returns:
+            DataDiff: Filas eliminadas, añadidas y modificadas con sus celdas
+        """
+        original = self.original_data
+        if not isinstance(original, pd.DataFrame):
+            # Modo ligero: los datos originales se reconstruyen con la instantánea
+            original = original.restore(self.cleaned_data)
+        return DataDiff(original, self.cleaned_data, key=key)
+
     def get_detailed_analysis(self):
         """
         Obtiene un análisis detallado de los cambios realizados.
@@ -0,0 +1,304 @@
+import numpy as np
+import pandas as pd
+
+
+class DataDiff:
+    """
+    Clase responsable de comparar fila a fila los datos originales con los
+    datos limpios.
+
+    Las filas se emparejan en forma vectorizada por etiqueta del índice, por
+    el hash de unas columnas clave o por el hash del contenido completo. El
+    resultado se guarda de forma compacta, sin copiar DataFrames:
+
+    - removed: posiciones de las filas originales sin pareja (eliminadas)
+    - added: posiciones de las filas limpias sin pareja (añadidas)
+    - original_rows / cleaned_rows: posiciones de las filas emparejadas
+    - modified: índices (sobre las filas emparejadas) de las filas con cambios
+    - cell_mask: máscara booleana (modified x columns) de las celdas cambiadas
+
+    Los valores anteriores y nuevos se leen de los datos originales y limpios
+    (referencias, no copias) solo cuando se piden con cell_changes.
+    """
+
+    MODES = ['index', 'key', 'content']
+    # Constante impar de 64 bits para combinar el hash de la clave con el
+    # número de aparición de las claves repetidas
+    _OCCURRENCE_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+    def __init__(self, original_data: pd.DataFrame, cleaned_data: pd.DataFrame, key=None):
+        """
+        Compara los datos y guarda las diferencias.
+
+        Args:
+            original_data (pd.DataFrame): Los datos originales
+            cleaned_data (pd.DataFrame): Los datos limpios
+            key: None (emparejar por etiqueta del índice, lo que conserva la
+                limpieza en memoria), 'content' (por el contenido completo de
+                la fila; una fila modificada cuenta como eliminada y añadida)
+                o lista de columnas clave (p. ej. ['Season', 'Round', 'DriverID'])
+        """
+        if not isinstance(original_data, pd.DataFrame) or not isinstance(cleaned_data, pd.DataFrame):
+            raise ValueError("DataDiff necesita los datos originales y limpios como DataFrame")
+        self.original_data = original_data
+        self.cleaned_data = cleaned_data
+        self.columns = [col for col in original_data.columns if col in cleaned_data.columns]
+        self.removed_columns = [col for col in original_data.columns if col not in cleaned_data.columns]
+        self.added_columns = [col for col in cleaned_data.columns if col not in original_data.columns]
+
+        if key is None:
+            self.mode, self.key = 'index', None
+            self.original_rows, self.cleaned_rows = self._match_index()
+        elif isinstance(key, str) and key == 'content':
+            self.mode, self.key = 'content', list(self.columns)
+            self.original_rows, self.cleaned_rows = self._match_hashes()
+        else:
+            self.mode, self.key = 'key', [key] if isinstance(key, str) else list(key)
+            missing = [col for col in self.key if col not in self.columns]
+            if missing:
+                raise ValueError(f"Columnas clave no encontradas en ambos datos: {missing}")
+            self.original_rows, self.cleaned_rows = self._match_hashes()
+
+        self.removed = self._unmatched(len(original_data), self.original_rows)
+        self.added = self._unmatched(len(cleaned_data), self.cleaned_rows)
+        self.modified, self.cell_mask = self._compare_cells()
+
+    @staticmethod
+    def _position_dtype(size):
+        """Entero más pequeño capaz de guardar posiciones de `size` filas."""
+        return np.int32 if size <= np.iinfo(np.int32).max else np.int64
+
+    @staticmethod
+    def _unmatched(size, matched):
+        """Posiciones de 0..size-1 que no aparecen en matched."""
+        mask = np.ones(size, dtype=bool)
+        mask[matched] = False
+        return np.flatnonzero(mask).astype(DataDiff._position_dtype(size))
+
+    def _match_index(self):
+        """Empareja las filas por etiqueta del índice."""
+        original_index = self.original_data.index
+        if not original_index.is_unique or not self.cleaned_data.index.is_unique:
+            raise ValueError("El índice tiene etiquetas repetidas; empareje por columnas clave o por 'content'")
+        positions = original_index.get_indexer(self.cleaned_data.index)
+        found = positions >= 0
+        dtype = self._position_dtype(max(len(self.original_data), len(self.cleaned_data)))
+        return positions[found].astype(dtype), np.flatnonzero(found).astype(dtype)
+
+    @classmethod
+    def _row_hashes(cls, data, columns):
+        """
+        Hash de 64 bits por fila sobre las columnas dadas. Los números se
+        comparan como float64 (2020 y 2020.0 son la misma clave tras un
+        relleno que cambia el tipo) y las categóricas por su valor. Las filas
+        repetidas se distinguen por su número de aparición, de modo que la
+        primera se empareja con la primera, la segunda con la segunda...
+        """
+        normalized = {}
+        for col in columns:
+            series = data[col]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                series = series.astype(object)
+            elif pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+                series = series.astype('float64')
+            normalized[col] = series.array
+        frame = pd.DataFrame(normalized, copy=False)
+        hashes = pd.util.hash_pandas_object(frame, index=False).to_numpy()
+        occurrence = pd.Series(hashes).groupby(hashes, sort=False).cumcount().to_numpy().astype(np.uint64)
+        return hashes + occurrence * cls._OCCURRENCE_MIX
+
+    def _match_hashes(self):
+        """Empareja las filas por el hash de las columnas clave (o de todas)."""
+        original_ids = pd.Index(self._row_hashes(self.original_data, self.key))
+        if not original_ids.is_unique:
+            raise ValueError("Colisión de hash entre filas distintas; use otras columnas clave")
+        positions = original_ids.get_indexer(self._row_hashes(self.cleaned_data, self.key))
+        found = positions >= 0
+        dtype = self._position_dtype(max(len(self.original_data), len(self.cleaned_data)))
+        return positions[found].astype(dtype), np.flatnonzero(found).astype(dtype)
+
+    @staticmethod
+    def _take(series, rows):
+        """Valores de una columna en las posiciones dadas (sin crear una Series)."""
+        if isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+            return series.array.take(rows)
+        return series.to_numpy().take(rows)
+
+    @staticmethod
+    def _changed(before, after):
+        """
+        Máscara de celdas distintas; dos nulos cuentan como iguales. Los
+        nulos solo se comprueban en las celdas que no son iguales, que son
+        pocas: casi todas las filas emparejadas no cambian.
+        """
+        try:
+            equal = before == after
+        except (TypeError, ValueError):
+            # Categóricas con categorías distintas o tipos no comparables
+            equal = np.asarray(before, dtype=object) == np.asarray(after, dtype=object)
+        if isinstance(equal, pd.api.extensions.ExtensionArray):
+            equal = equal.to_numpy(dtype=bool, na_value=False)
+        changed = ~np.asarray(equal, dtype=bool)
+        candidates = np.flatnonzero(changed)
+        if len(candidates):
+            both_null = pd.isna(before[candidates]) & pd.isna(after[candidates])
+            changed[candidates[np.asarray(both_null, dtype=bool)]] = False
+        return changed
+
+    def _compare_cells(self):
+        """Compara columna a columna las filas emparejadas."""
+        changed = {}
+        for col in self.columns:
+            if self.mode == 'content':
+                break  # filas emparejadas por contenido: idénticas por construcción
+            mask = self._changed(self._take(self.original_data[col], self.original_rows),
+                                 self._take(self.cleaned_data[col], self.cleaned_rows))
+            if mask.any():
+                changed[col] = mask
+
+        if not changed:
+            return np.empty(0, dtype=self.original_rows.dtype), np.zeros((0, len(self.columns)), dtype=bool)
+        any_change = np.logical_or.reduce(list(changed.values()))
+        modified = np.flatnonzero(any_change).astype(self.original_rows.dtype)
+        cell_mask = np.zeros((len(modified), len(self.columns)), dtype=bool)
+        for col, mask in changed.items():
+            cell_mask[:, self.columns.index(col)] = mask[modified]
+        return modified, cell_mask
+
+    @property
+    def nbytes(self):
+        """Memoria de la diferencia guardada en bytes (sin contar los datos comparados)."""
+        return sum(array.nbytes for array in (self.removed, self.added, self.original_rows,
+                                              self.cleaned_rows, self.modified, self.cell_mask))
+
+    def summary(self):
+        """
+        Resumen de las diferencias.
+
+        Returns:
+            dict: Filas eliminadas, añadidas y modificadas, celdas cambiadas
+                (en total, por columna y rellenadas: de nulo a valor) y columnas
+                eliminadas y añadidas
+        """
+        cells_by_column = {}
+        filled_by_column = {}
+        for j, col in enumerate(self.columns):
+            count = int(self.cell_mask[:, j].sum())
+            if count:
+                cells_by_column[col] = count
+                rows = self.original_rows[self.modified[self.cell_mask[:, j]]]
+                filled_by_column[col] = int(self.original_data[col].iloc[rows].isna().sum())
+        return {
+            'mode': self.mode,
+            'original_rows': len(self.original_data),
+            'cleaned_rows': len(self.cleaned_data),
+            'rows_removed': len(self.removed),
+            'rows_added': len(self.added),
+            'rows_modified': len(self.modified),
+            'cells_changed': int(self.cell_mask.sum()),
+            'cells_filled': sum(filled_by_column.values()),
+            'cells_by_column': cells_by_column,
+            'filled_by_column': {col: count for col, count in filled_by_column.items() if count},
+            'removed_columns': list(self.removed_columns),
+            'added_columns': list(self.added_columns),
+            'nbytes': self.nbytes,
+        }
+
+    def removed_rows(self):
+        """
+        Filas originales eliminadas en la limpieza.
+
+        Returns:
+            pd.DataFrame: Filas de los datos originales con su índice original
+        """
+        return self.original_data.iloc[self.removed]
+
+    def added_rows(self):
+        """
+        Filas limpias sin pareja en los datos originales.
+
+        Returns:
+            pd.DataFrame: Filas de los datos limpios con su índice
+        """
+        return self.cleaned_data.iloc[self.added]
+
+    def modified_rows(self):
+        """
+        Pares de filas emparejadas con algún cambio.
+
+        Returns:
+            tuple: (filas originales, filas limpias) como pd.DataFrame
+        """
+        return (self.original_data.iloc[self.original_rows[self.modified]],
+                self.cleaned_data.iloc[self.cleaned_rows[self.modified]])
+
+    def cell_changes(self, columns=None, limit=None):
+        """
+        Cambios celda a celda en formato largo.
+
+        Args:
+            columns (list): Columnas a incluir (por defecto todas las comunes)
+            limit (int): Número máximo de cambios por columna
+
+        Returns:
+            pd.DataFrame: Columnas 'row' (etiqueta original), 'cleaned_row'
+                (etiqueta limpia), 'column', 'before', 'after' y 'kind'
+                ('filled': de nulo a valor, 'nulled': de valor a nulo,
+                'changed': de un valor a otro)
+        """
+        parts = []
+        for col in (self.columns if columns is None else columns):
+            if col not in self.columns:
+                raise ValueError(f"Columna '{col}' no encontrada en ambos datos")
+            pairs = self.modified[self.cell_mask[:, self.columns.index(col)]]
+            if limit is not None:
+                pairs = pairs[:limit]
+            if len(pairs) == 0:
+                continue
+            original_rows = self.original_rows[pairs]
+            cleaned_rows = self.cleaned_rows[pairs]
+            before = np.asarray(self._take(self.original_data[col], original_rows), dtype=object)
+            after = np.asarray(self._take(self.cleaned_data[col], cleaned_rows), dtype=object)
+            before_null = pd.isna(before)
+            after_null = pd.isna(after)
+            kind = np.where(before_null, 'filled', np.where(after_null, 'nulled', 'changed'))
+            parts.append(pd.DataFrame({
+                'row': self.original_data.index[original_rows],
+                'cleaned_row': self.cleaned_data.index[cleaned_rows],
+                'column': col,
+                'before': before,
+                'after': after,
+                'kind': kind,
+            }))
+        if not parts:
+            return pd.DataFrame(columns=['row', 'cleaned_row', 'column', 'before', 'after', 'kind'])
+        return pd.concat(parts, ignore_index=True)
+
+    def print_diff(self, limit=5):
+        """
+        Imprime el resumen de diferencias y unos ejemplos de cada tipo.
+
+        Args:
+            limit (int): Filas y celdas de ejemplo a mostrar
+        """
+        summary = self.summary()
+        print("\n=== DIFERENCIAS FILA A FILA ===")
+        print(f"🔗 Emparejamiento: {summary['mode']}" + (f" {self.key}" if self.mode == 'key' else ""))
+        print(f"➖ Filas eliminadas: {summary['rows_removed']}")
+        print(f"➕ Filas añadidas: {summary['rows_added']}")
+        print(f"✏️  Filas modificadas: {summary['rows_modified']} "
+              f"({summary['cells_changed']} celdas, {summary['cells_filled']} rellenadas)")
+        for col, count in summary['cells_by_column'].items():
+            print(f"   - {col}: {count} celdas ({summary['filled_by_column'].get(col, 0)} rellenadas)")
+        if summary['removed_columns']:
+            print(f"🗑️  Columnas eliminadas: {summary['removed_columns']}")
+        if summary['added_columns']:
+            print(f"🆕 Columnas añadidas: {summary['added_columns']}")
+        print(f"💾 Tamaño de la diferencia: {summary['nbytes'] / 1024:.1f} KB")
+
+        if summary['rows_removed']:
+            print("\nPrimeras filas eliminadas:")
+            print(self.removed_rows().head(limit))
+        if summary['cells_changed']:
+            print("\nPrimeros cambios de celdas:")
+            print(self.cell_changes(limit=limit).head(limit))
@@ -2,9 +2,11 @@
 Módulo Report - Generación de reportes y resúmenes
 
 Este módulo se encarga de generar reportes detallados
-sobre el proceso de limpieza de datos.
+sobre el proceso de limpieza de datos y la comparación
+fila a fila de los datos originales con los limpios.
 """
 
 from .CleaningReport import CleaningReport
+from .DataDiff import DataDiff
 
-__all__ = ['CleaningReport']
+__all__ = ['CleaningReport', 'DataDiff']
@@ -0,0 +1,312 @@
+import numpy as np
+import pandas as pd
+
+
+class LapTimeParser:
+    """
+    Clase responsable de convertir tiempos de vuelta entre texto y milisegundos.
+    Trabaja sobre matrices de códigos de carácter de NumPy, sin apply ni bucles por fila.
+
+    Formato de texto: "m:ss.fff" (también "mm:ss.fff", "mmm:ss.fff" y "ss.fff").
+    El valor "0" es el marcador de "no participó" y se convierte en NA.
+    """
+
+    LAP_TIME_COLUMNS = ['Q1', 'Q2', 'Q3']
+    PLACEHOLDER = '0'
+
+    # Ancho máximo aceptado ("mmm:ss.fff") y ancho de la matriz de caracteres;
+    # los textos más largos que _MAX_LENGTH se consideran inválidos
+    _MAX_LENGTH = 10
+    _WIDTH = 16
+    # Filas por bloque: mantiene los temporales de NumPy en caché
+    _BLOCK_ROWS = 1 << 16
+
+    @staticmethod
+    def _to_char_matrix(values):
+        """
+        Convierte un array de textos en una matriz (n, _WIDTH) de códigos de carácter.
+        Usa 1 byte por carácter si todo es ASCII y 4 bytes (UCS-4) en caso contrario.
+        Los nulos (NaN/None) se convierten en textos inválidos ('nan'/'None').
+        """
+        width = LapTimeParser._WIDTH
+        if values.dtype.kind == 'S':
+            chars = values.astype(f'S{width}')
+        else:
+            try:
+                chars = values.astype(f'S{width}')
+            except UnicodeEncodeError:
+                chars = values.astype(f'U{width}')
+
+        code_type = np.uint8 if chars.dtype.kind == 'S' else np.uint32
+        return chars.view(code_type).reshape(len(chars), width)
+
+    @staticmethod
+    def _parse_fixed(chars):
+        """
+        Ruta rápida para el formato habitual "m:ss.fff" (8 caracteres):
+        solo usa columnas fijas de la matriz, sin indexación por fila.
+        """
+        zero = chars.dtype.type(48)
+        minutes = chars[:, 0] - zero
+        sec_tens = chars[:, 2] - zero
+        sec_units = chars[:, 3] - zero
+        ms_hundreds = chars[:, 5] - zero
+        ms_tens = chars[:, 6] - zero
+        ms_units = chars[:, 7] - zero
+
+        # La resta sin signo convierte cualquier no-dígito en un valor > 9
+        valid = ((minutes <= 9) & (chars[:, 1] == 58) & (sec_tens <= 5) & (sec_units <= 9)
+                 & (chars[:, 4] == 46) & (ms_hundreds <= 9) & (ms_tens <= 9) & (ms_units <= 9)
+                 & (chars[:, 8] == 0))
+        milliseconds = ((minutes.astype(np.int64) * 60 + sec_tens * 10 + sec_units) * 1000
+                        + ms_hundreds.astype(np.int64) * 100 + ms_tens * 10 + ms_units)
+        return milliseconds, valid
+
+    @staticmethod
+    def _parse_general(chars):
+        """
+        Ruta general para cualquier longitud: localiza cada carácter
+        relativo al final del texto (len - k).
+        """
+        rows, width = chars.shape
+        lengths = np.count_nonzero(chars, axis=1)
+        row_index = np.arange(rows)
+
+        def char_at(offset_from_end):
+            position = np.clip(lengths - offset_from_end, 0, width - 1)
+            return np.where(lengths >= offset_from_end, chars[row_index, position], 0).astype(np.int64)
+
+        def digit_at(offset_from_end):
+            code = char_at(offset_from_end) - 48
+            return code, (code >= 0) & (code <= 9)
+
+        ms_units, ok_units = digit_at(1)
+        ms_tens, ok_tens = digit_at(2)
+        ms_hundreds, ok_hundreds = digit_at(3)
+        sec_units, ok_sec_units = digit_at(5)
+        sec_tens, ok_sec_tens = digit_at(6)
+
+        # 7 caracteres no es válido: "ss.fff" lleva 6 y "m:ss.fff" al menos 8
+        valid = ((lengths >= 6) & (lengths <= LapTimeParser._MAX_LENGTH) & (lengths != 7)
+                 & ok_units & ok_tens & ok_hundreds & ok_sec_units & ok_sec_tens
+                 & (sec_tens <= 5) & (char_at(4) == ord('.')))
+        valid &= (lengths < 8) | (char_at(7) == ord(':'))
+
+        minutes = np.zeros(rows, dtype=np.int64)
+        for digit_number in range(LapTimeParser._MAX_LENGTH - 7):
+            # Dígitos de minutos de derecha a izquierda: posiciones len-8, len-9, len-10
+            present = lengths >= 8 + digit_number
+            digit, ok = digit_at(8 + digit_number)
+            valid &= ~present | ok
+            minutes += np.where(present & ok, digit, 0) * 10 ** digit_number
+
+        milliseconds = ((minutes * 60 + sec_tens * 10 + sec_units) * 1000
+                        + ms_hundreds * 100 + ms_tens * 10 + ms_units)
+        return milliseconds, valid
+
+    @staticmethod
+    def _factorize(values):
+        """
+        Codifica los valores como (códigos, únicos); los nulos reciben el código -1.
+        Las columnas categóricas reutilizan sus categorías sin volver a calcular hashes.
+        """
+        if isinstance(values, pd.Series) and isinstance(values.dtype, pd.CategoricalDtype):
+            return values.cat.codes.to_numpy(), values.cat.categories.to_numpy()
+        codes, uniques = pd.factorize(values)
+        return np.asarray(codes), uniques
+
+    @staticmethod
+    def _parse_unique(texts):
+        """
+        Analiza un array de textos por bloques.
+
+        Returns:
+            tuple: (milisegundos, válido, vacío o marcador "0")
+        """
+        rows = len(texts)
+        milliseconds = np.zeros(rows, dtype=np.int64)
+        valid = np.zeros(rows, dtype=bool)
+        blank = np.zeros(rows, dtype=bool)
+
+        for start in range(0, rows, LapTimeParser._BLOCK_ROWS):
+            stop = min(start + LapTimeParser._BLOCK_ROWS, rows)
+            chars = LapTimeParser._to_char_matrix(texts[start:stop])
+
+            block_ms, block_valid = LapTimeParser._parse_fixed(chars)
+            placeholder = (chars[:, 0] == ord(LapTimeParser.PLACEHOLDER)) & (chars[:, 1] == 0)
+            empty = chars[:, 0] == 0
+
+            # Solo las filas que no encajan en la ruta rápida pasan por la general
+            pending = np.flatnonzero(~block_valid & ~placeholder & ~empty)
+            if len(pending):
+                pending_ms, pending_valid = LapTimeParser._parse_general(chars[pending])
+                block_ms[pending] = pending_ms
+                block_valid[pending] = pending_valid
+
+            milliseconds[start:stop] = block_ms
+            valid[start:stop] = block_valid
+            blank[start:stop] = placeholder | empty
+
+        return milliseconds, valid, blank
+
+    @staticmethod
+    def parse(values, errors='coerce'):
+        """
+        Convierte tiempos "m:ss.fff" en milisegundos enteros.
+        Cada texto distinto se analiza una sola vez (los tiempos se repiten mucho
+        a escala) y el resultado se expande con los códigos de factorize.
+
+        Args:
+            values (pd.Series | array-like): Tiempos en texto
+            errors (str): 'coerce' convierte los valores mal formados en NA;
+                'raise' lanza ValueError si hay alguno (nulos, vacíos y "0" siguen siendo NA)
+
+        Returns:
+            pd.Series: Milisegundos con dtype 'Int64' y NA para los marcadores
+        """
+        if errors not in ('coerce', 'raise'):
+            raise ValueError("errors debe ser 'coerce' o 'raise'")
+
+        is_series = isinstance(values, pd.Series)
+        index = values.index if is_series else None
+        name = values.name if is_series else None
+
+        codes, uniques = LapTimeParser._factorize(values if is_series else np.asarray(values))
+        uniques = np.asarray(uniques)
+        if uniques.dtype.kind not in 'SUO':
+            uniques = uniques.astype(object)
+
+        unique_ms, unique_valid, unique_blank = LapTimeParser._parse_unique(uniques)
+
+        if errors == 'raise':
+            malformed = ~unique_valid & ~unique_blank
+            if malformed.any():
+                occurrences = int(np.isin(codes, np.flatnonzero(malformed)).sum())
+                examples = list(uniques[malformed][:3])
+                raise ValueError(f"{occurrences} tiempos con formato inválido, p. ej.: {examples}")
+
+        # El código -1 (nulo) apunta al centinela añadido al final: 0 ms y no válido
+        unique_ms = np.append(np.where(unique_valid, unique_ms, 0), 0)
+        unique_valid = np.append(unique_valid, False)
+        result = pd.arrays.IntegerArray(unique_ms[codes], ~unique_valid[codes])
+        return pd.Series(result, index=index, name=name)
+
+    @staticmethod
+    def _format_block(milliseconds):
+        """
+        Construye los textos "m:ss.fff" de un bloque de milisegundos válidos
+        como una matriz de caracteres UCS-4 alineada a la izquierda.
+        """
+        rows = len(milliseconds)
+        total_seconds = milliseconds // 1000
+        fraction = (milliseconds - total_seconds * 1000).astype(np.uint32)
+        minutes = total_seconds // 60
+        seconds = (total_seconds - minutes * 60).astype(np.uint32)
+
+        minute_digits = np.ones(rows, dtype=np.int64)
+        for limit in (10, 100, 1000, 10_000):
+            minute_digits += minutes >= limit
+        width = 7 + int(minute_digits.max()) if rows else 8
+
+        # Matriz alineada a la derecha: "...m:ss.fff"
+        right = np.zeros((rows, width), dtype=np.uint32)
+        hundreds = fraction // 100
+        tens = (fraction - hundreds * 100) // 10
+        right[:, width - 1] = fraction - hundreds * 100 - tens * 10 + 48
+        right[:, width - 2] = tens + 48
+        right[:, width - 3] = hundreds + 48
+        right[:, width - 4] = ord('.')
+        seconds_tens = seconds // 10
+        right[:, width - 5] = seconds - seconds_tens * 10 + 48
+        right[:, width - 6] = seconds_tens + 48
+        right[:, width - 7] = ord(':')
+        if width == 8:
+            right[:, 0] = minutes.astype(np.uint32) + 48
+            return right.view('U8').ravel()
+
+        for digit_number in range(width - 7):
+            present = minute_digits > digit_number
+            right[:, width - 8 - digit_number] = np.where(present, 48 + (minutes // 10 ** digit_number) % 10, 0)
+
+        # Alinear a la izquierda desplazando cada fila según su longitud
+        shift = (width - (7 + minute_digits))[:, None]
+        source = np.arange(width)[None, :] + shift
+        left = np.take_along_axis(right, np.minimum(source, width - 1), axis=1)
+        left[source >= width] = 0
+        return left.view(f'U{width}').ravel()
+
+    @staticmethod
+    def format(values, na_rep=PLACEHOLDER):
+        """
+        Convierte milisegundos enteros en texto "m:ss.fff".
+        Cada valor distinto se formatea una sola vez y se expande con factorize.
+
+        Args:
+            values (pd.Series | array-like): Milisegundos (admite NA)
+            na_rep (str): Texto para los NA y valores negativos (por defecto el marcador "0")
+
+        Returns:
+            pd.Series: Tiempos en texto (dtype object)
+        """
+        is_series = isinstance(values, pd.Series)
+        index = values.index if is_series else None
+        name = values.name if is_series else None
+
+        codes, uniques = LapTimeParser._factorize(values if is_series else pd.Series(values))
+        milliseconds = np.asarray(uniques, dtype='float64').astype(np.int64)
+        invalid = milliseconds < 0
+
+        # El código -1 (nulo) apunta al centinela añadido al final: na_rep
+        text = np.empty(len(milliseconds) + 1, dtype=object)
+        for start in range(0, len(milliseconds), LapTimeParser._BLOCK_ROWS):
+            stop = min(start + LapTimeParser._BLOCK_ROWS, len(milliseconds))
+            block = np.where(invalid[start:stop], 0, milliseconds[start:stop])
+            text[start:stop] = LapTimeParser._format_block(block)
+        text[np.append(invalid, True)] = na_rep
+
+        return pd.Series(text[codes], index=index, name=name)
+
+    @staticmethod
+    def parse_columns(data, columns=None, errors='coerce', copy=True):
+        """
+        Convierte las columnas de tiempos de un DataFrame a milisegundos.
+
+        Args:
+            data (pd.DataFrame): Datos con columnas de tiempos en texto
+            columns (list): Columnas a convertir (por defecto Q1, Q2 y Q3 presentes)
+            errors (str): 'coerce' o 'raise' (ver parse)
+            copy (bool): Si trabajar sobre una copia (False modifica `data`)
+
+        Returns:
+            pd.DataFrame: Datos con las columnas de tiempos en milisegundos ('Int64')
+        """
+        columns = columns or [col for col in LapTimeParser.LAP_TIME_COLUMNS if col in data.columns]
+        if copy:
+            data = data.copy()
+        for col in columns:
+            # Una columna con solo marcadores "0" llega como int64 y también se convierte
+            if data[col].dtype != 'Int64':
+                data[col] = LapTimeParser.parse(data[col], errors=errors)
+        return data
+
+    @staticmethod
+    def format_columns(data, columns=None, na_rep=PLACEHOLDER, copy=True):
+        """
+        Convierte las columnas de milisegundos de un DataFrame a texto "m:ss.fff".
+
+        Args:
+            data (pd.DataFrame): Datos con columnas de tiempos en milisegundos
+            columns (list): Columnas a convertir (por defecto Q1, Q2 y Q3 presentes)
+            na_rep (str): Texto para los NA
+            copy (bool): Si trabajar sobre una copia (False modifica `data`)
+
+        Returns:
+            pd.DataFrame: Datos con las columnas de tiempos en texto
+        """
+        columns = columns or [col for col in LapTimeParser.LAP_TIME_COLUMNS if col in data.columns]
+        if copy:
+            data = data.copy()
+        for col in columns:
+            if pd.api.types.is_numeric_dtype(data[col].dtype):
+                data[col] = LapTimeParser.format(data[col], na_rep=na_rep)
+        return data
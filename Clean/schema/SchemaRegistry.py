@@ -0,0 +1,234 @@
+import sys
+import pandas as pd
+import numpy as np
+
+
+# Tamaño (sys.getsizeof) de una fecha ISO 'YYYY-MM-DD' cargada como texto
+_ISO_DATE_TEXT_SIZE = sys.getsizeof('0000-00-00')
+# Tamaño de un NaN almacenado en una columna de tipo object
+_NAN_OBJECT_SIZE = sys.getsizeof(np.nan)
+
+
+class DatasetSchema:
+    """
+    Clase responsable de declarar los tipos de columna de un dataset.
+    Se enfoca únicamente en traducir la declaración a tipos compactos de pandas.
+    """
+
+    def __init__(self, name, categorical=(), integer=(), dates=(), date_format='%Y-%m-%d'):
+        """
+        Inicializa el esquema de un dataset.
+
+        Args:
+            name (str): Nombre del dataset (p. ej. 'qualifying_results')
+            categorical (iterable): Columnas de texto de baja cardinalidad (se cargan como 'category')
+            integer (iterable): Columnas enteras (se reducen al menor ancho posible)
+            dates (iterable): Columnas de fecha (se convierten a datetime64)
+            date_format (str): Formato de las columnas de fecha
+        """
+        self.name = name
+        self.categorical = list(categorical)
+        self.integer = list(integer)
+        self.dates = list(dates)
+        self.date_format = date_format
+
+    @property
+    def columns(self):
+        """Columnas declaradas en el esquema."""
+        return self.categorical + self.integer + self.dates
+
+    def matches(self, columns):
+        """
+        Indica si un conjunto de columnas contiene todas las columnas del esquema.
+
+        Args:
+            columns (iterable): Columnas del dataset
+
+        Returns:
+            bool: True si el esquema es aplicable
+        """
+        return set(self.columns).issubset(columns)
+
+    def get_read_dtypes(self, columns=None):
+        """
+        Obtiene los tipos que se pueden pasar directamente a pd.read_csv.
+        Las categóricas se construyen en el propio parser, sin columna intermedia de objetos.
+
+        Args:
+            columns (iterable): Restringir a estas columnas (opcional)
+
+        Returns:
+            dict: Mapeo columna -> dtype
+        """
+        dtypes = {col: 'category' for col in self.categorical}
+        if columns is not None:
+            dtypes = {col: dtype for col, dtype in dtypes.items() if col in columns}
+        return dtypes
+
+    def read_csv(self, csv_path, **kwargs):
+        """
+        Carga un CSV aplicando el esquema.
+
+        Args:
+            csv_path (str): Ruta del archivo CSV
+            **kwargs: Argumentos adicionales para pd.read_csv
+
+        Returns:
+            pd.DataFrame: Datos con tipos compactos
+        """
+        dtype = self.get_read_dtypes()
+        dtype.update(kwargs.pop('dtype', None) or {})
+        data = pd.read_csv(csv_path, dtype=dtype, **kwargs)
+        return self.apply(data, copy=False)
+
+    def apply(self, data, copy=True):
+        """
+        Aplica el esquema a un DataFrame ya cargado.
+
+        Args:
+            data (pd.DataFrame): Datos a convertir
+            copy (bool): Si trabajar sobre una copia (False modifica `data`)
+
+        Returns:
+            pd.DataFrame: Datos con tipos compactos
+        """
+        if copy:
+            data = data.copy()
+
+        for col in self.categorical:
+            if col in data.columns and not isinstance(data[col].dtype, pd.CategoricalDtype):
+                data[col] = data[col].astype('category')
+
+        for col in self.integer:
+            # Las columnas con nulos se cargan como float y se dejan tal cual
+            if col in data.columns and pd.api.types.is_integer_dtype(data[col].dtype):
+                data[col] = pd.to_numeric(data[col], downcast='integer')
+
+        for col in self.dates:
+            if col in data.columns and not pd.api.types.is_datetime64_any_dtype(data[col].dtype):
+                data[col] = pd.to_datetime(data[col], format=self.date_format, errors='coerce')
+
+        return data
+
+    @staticmethod
+    def estimate_untyped_memory(data):
+        """
+        Calcula la memoria (deep) que ocuparía el DataFrame cargado sin esquema,
+        es decir, con texto como object, enteros como int64 y fechas como texto ISO.
+        Se calcula a partir de las categorías, sin reconstruir las columnas.
+
+        Args:
+            data (pd.DataFrame): Datos (tipados o no)
+
+        Returns:
+            int: Memoria estimada en bytes
+        """
+        total = data.index.memory_usage()
+        rows = len(data)
+        for col in data.columns:
+            series = data[col]
+            dtype = series.dtype
+            if isinstance(dtype, pd.CategoricalDtype):
+                counts = series.value_counts(sort=False, dropna=True)
+                text_sizes = np.fromiter((sys.getsizeof(value) for value in counts.index),
+                                         dtype='int64', count=len(counts))
+                nulls = rows - int(counts.sum())
+                total += 8 * rows + int((text_sizes * counts.to_numpy()).sum()) + nulls * _NAN_OBJECT_SIZE
+            elif pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+                total += 8 * rows
+            elif pd.api.types.is_datetime64_any_dtype(dtype):
+                nulls = int(series.isna().sum())
+                total += 8 * rows + (rows - nulls) * _ISO_DATE_TEXT_SIZE + nulls * _NAN_OBJECT_SIZE
+            else:
+                total += int(series.memory_usage(deep=True, index=False))
+        return int(total)
+
+
+class SchemaRegistry:
+    """
+    Registro de esquemas declarados para los datasets F1.
+    Permite obtener un esquema por nombre o detectarlo a partir de las columnas.
+    """
+
+    _schemas = {}
+
+    @classmethod
+    def register(cls, schema):
+        """
+        Registra (o reemplaza) un esquema.
+
+        Args:
+            schema (DatasetSchema): Esquema a registrar
+
+        Returns:
+            DatasetSchema: El esquema registrado
+        """
+        cls._schemas[schema.name] = schema
+        return schema
+
+    @classmethod
+    def get(cls, name):
+        """
+        Obtiene un esquema registrado por nombre.
+
+        Args:
+            name (str): Nombre del esquema
+
+        Returns:
+            DatasetSchema: Esquema registrado
+        """
+        if name not in cls._schemas:
+            raise ValueError(f"Esquema '{name}' no registrado. "
+                             f"Esquemas disponibles: {list(cls._schemas.keys())}")
+        return cls._schemas[name]
+
+    @classmethod
+    def detect(cls, columns):
+        """
+        Detecta el esquema aplicable a un conjunto de columnas.
+        Si varios encajan, gana el que declara más columnas.
+
+        Args:
+            columns (iterable): Columnas del dataset
+
+        Returns:
+            DatasetSchema: Esquema detectado o None si ninguno encaja
+        """
+        columns = set(columns)
+        candidates = [schema for schema in cls._schemas.values() if schema.matches(columns)]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda schema: len(schema.columns))
+
+    @classmethod
+    def resolve(cls, schema, csv_path=None):
+        """
+        Traduce el argumento `schema` usado por los cargadores a un DatasetSchema.
+
+        Args:
+            schema: None, 'auto', nombre registrado o instancia de DatasetSchema
+            csv_path (str): Ruta del CSV (necesaria para 'auto'; solo se lee la cabecera)
+
+        Returns:
+            DatasetSchema: Esquema a aplicar o None para cargar sin tipos
+        """
+        if schema is None or isinstance(schema, DatasetSchema):
+            return schema
+        if schema == 'auto':
+            header = pd.read_csv(csv_path, nrows=0).columns
+            return cls.detect(header)
+        return cls.get(schema)
+
+    @classmethod
+    def names(cls):
+        """Nombres de los esquemas registrados."""
+        return list(cls._schemas.keys())
+
+
+QUALIFYING_RESULTS_SCHEMA = SchemaRegistry.register(DatasetSchema(
+    name='qualifying_results',
+    categorical=['CircuitID', 'DriverID', 'Code', 'GivenName', 'FamilyName', 'Nationality',
+                 'ConstructorID', 'ConstructorName', 'ConstructorNationality'],
+    integer=['Season', 'Round', 'Position', 'PermanentNumber'],
+    dates=['DateOfBirth'],
+))
@@ -0,0 +1,13 @@
+"""
+Módulo Schema - Esquemas tipados de los datasets F1
+
+Este módulo declara los tipos de columna de cada dataset
+(categóricas, enteras y fechas) para cargarlos con una
+representación compacta en memoria, y convierte los tiempos
+de vuelta Q1/Q2/Q3 entre texto y milisegundos.
+"""
+
+from .SchemaRegistry import DatasetSchema, SchemaRegistry
+from .LapTimeParser import LapTimeParser
+
+__all__ = ['DatasetSchema', 'SchemaRegistry', 'LapTimeParser']
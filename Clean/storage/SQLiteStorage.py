@@ -0,0 +1,302 @@
+import os
+import sqlite3
+import time
+
+import numpy as np
+import pandas as pd
+
+
+class SQLiteStorage:
+    """
+    Clase responsable de guardar los datos limpios en una base de datos SQLite.
+
+    La carga se hace por lotes: cada lote es una transacción con una única
+    sentencia preparada ejecutada con executemany. Las filas se insertan o
+    actualizan (upsert) según la clave (Season, Round, DriverID), de modo que
+    volver a cargar una temporada reemplaza sus filas en lugar de duplicarlas.
+    Las columnas de la clave son NOT NULL: SQLite admite NULL en una clave
+    primaria que no es INTEGER, y cada fila con la clave nula se insertaría
+    de nuevo en cada carga.
+
+    La tabla tiene índices sobre (Season, Round), DriverID y ConstructorID para
+    que las consultas pequeñas no tengan que releer todo el CSV.
+    """
+
+    KEY = ['Season', 'Round', 'DriverID']
+    INDEXES = [['Season', 'Round'], ['DriverID'], ['ConstructorID']]
+    MODES = ['upsert', 'replace', 'append']
+
+    def __init__(self, db_path, table='qualifying_results', batch_size=50_000, key=None, indexes=None):
+        """
+        Args:
+            db_path (str): Ruta del archivo .db (se crea si no existe)
+            table (str): Nombre de la tabla
+            batch_size (int): Filas por transacción
+            key (list): Columnas de la clave del upsert (por defecto KEY)
+            indexes (list): Listas de columnas a indexar (por defecto INDEXES)
+        """
+        if batch_size is None or batch_size <= 0:
+            raise ValueError("batch_size debe ser un entero positivo")
+        self.db_path = db_path
+        self.table = table
+        self.batch_size = batch_size
+        self.key = list(self.KEY if key is None else key)
+        self.indexes = [list(columns) for columns in (self.INDEXES if indexes is None else indexes)]
+        self.last_load = None
+
+    # ------------------------------------------------------------------
+    # Conexión y esquema
+    # ------------------------------------------------------------------
+
+    def connect(self):
+        """
+        Abre una conexión en modo autocommit (las transacciones se controlan a mano).
+
+        Returns:
+            sqlite3.Connection: Conexión a la base de datos
+        """
+        directory = os.path.dirname(os.path.abspath(self.db_path))
+        os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.db_path, isolation_level=None)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        return connection
+
+    @staticmethod
+    def _quote(name):
+        return '"' + str(name).replace('"', '""') + '"'
+
+    @staticmethod
+    def sql_type(dtype):
+        """
+        Tipo SQLite de una columna de pandas.
+
+        Returns:
+            str: INTEGER, REAL o TEXT
+        """
+        if isinstance(dtype, pd.CategoricalDtype):
+            return SQLiteStorage.sql_type(dtype.categories.dtype)
+        if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+            return 'INTEGER'
+        if pd.api.types.is_float_dtype(dtype):
+            return 'REAL'
+        return 'TEXT'
+
+    def table_columns(self, connection):
+        """
+        Returns:
+            list: Columnas de la tabla (vacía si no existe)
+        """
+        rows = connection.execute(f"PRAGMA table_info({self._quote(self.table)})").fetchall()
+        return [row[1] for row in rows]
+
+    def _create_table(self, connection, data):
+        key = [col for col in self.key if col in data.columns]
+        has_key = key and len(key) == len(self.key)
+        definitions = [f"{self._quote(col)} {self.sql_type(data[col].dtype)}"
+                       + (" NOT NULL" if has_key and col in key else "") for col in data.columns]
+        if has_key:
+            definitions.append(f"PRIMARY KEY ({', '.join(self._quote(col) for col in key)})")
+        connection.execute(f"CREATE TABLE {self._quote(self.table)} ({', '.join(definitions)})")
+
+    def _create_indexes(self, connection, columns):
+        for index_columns in self.indexes:
+            if not all(col in columns for col in index_columns):
+                continue
+            name = self._quote(f"idx_{self.table}_{'_'.join(index_columns)}")
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {self._quote(self.table)} "
+                               f"({', '.join(self._quote(col) for col in index_columns)})")
+
+    def _insert_statement(self, columns, upsert):
+        """Sentencia preparada de inserción (con ON CONFLICT ... DO UPDATE en modo upsert)."""
+        names = ', '.join(self._quote(col) for col in columns)
+        placeholders = ', '.join('?' * len(columns))
+        statement = f"INSERT INTO {self._quote(self.table)} ({names}) VALUES ({placeholders})"
+        if upsert:
+            updates = [col for col in columns if col not in self.key]
+            target = ', '.join(self._quote(col) for col in self.key)
+            if updates:
+                assignments = ', '.join(f"{self._quote(col)} = excluded.{self._quote(col)}" for col in updates)
+                statement += f" ON CONFLICT ({target}) DO UPDATE SET {assignments}"
+            else:
+                statement += f" ON CONFLICT ({target}) DO NOTHING"
+        return statement
+
+    # ------------------------------------------------------------------
+    # Carga
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _column_values(series):
+        """Valores de una columna como objetos de Python que sqlite3 sabe enlazar (nulos -> None)."""
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype(series.cat.categories.dtype)
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            values = series.dt.tz_localize(None) if series.dt.tz is not None else series
+            midnight = values.isna() | (values == values.dt.normalize())
+            text = values.dt.strftime('%Y-%m-%d' if midnight.all() else '%Y-%m-%d %H:%M:%S')
+            return text.astype(object).where(series.notna(), None).tolist()
+        if pd.api.types.is_bool_dtype(series.dtype) and not isinstance(series.dtype, np.dtype):
+            series = series.astype(object)
+        nulls = series.isna()
+        if nulls.any():
+            return series.astype(object).where(~nulls, None).tolist()
+        # tolist() convierte los escalares de NumPy a int/float/str de Python
+        return series.tolist()
+
+    def write(self, data, mode='upsert'):
+        """
+        Carga un DataFrame en la tabla por lotes. Si alguna fila tiene nulos
+        en la clave, se lanza ValueError sin escribir nada.
+
+        Args:
+            data (pd.DataFrame): Datos a cargar
+            mode (str): 'upsert' (insertar o actualizar por la clave), 'replace'
+                (recrear la tabla) o 'append' (solo insertar: una clave repetida
+                hace fallar el lote, que se deshace entero)
+
+        Returns:
+            dict: rows, batches, seconds y rows_per_second de la carga
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Modo '{mode}' no reconocido. Modos disponibles: {self.MODES}")
+        start = time.perf_counter()
+        columns = list(data.columns)
+        if all(col in columns for col in self.key):
+            # Se rechaza antes de tocar la tabla (en 'replace', antes de borrarla)
+            null_keys = data[self.key].isna().any(axis=1)
+            if null_keys.any():
+                raise ValueError(f"{int(null_keys.sum())} filas tienen nulos en la clave {self.key} "
+                                 f"(p. ej. las posiciones {np.flatnonzero(null_keys.to_numpy())[:5].tolist()})")
+        connection = self.connect()
+        batches = 0
+        try:
+            if mode == 'replace':
+                connection.execute(f"DROP TABLE IF EXISTS {self._quote(self.table)}")
+            existing = self.table_columns(connection)
+            new_table = not existing
+            if new_table:
+                self._create_table(connection, data)
+            else:
+                for col in columns:
+                    if col not in existing:
+                        connection.execute(f"ALTER TABLE {self._quote(self.table)} "
+                                           f"ADD COLUMN {self._quote(col)} {self.sql_type(data[col].dtype)}")
+                # Las tablas existentes ya tienen sus índices: se mantienen durante la carga
+                self._create_indexes(connection, set(existing) | set(columns))
+
+            upsert = mode == 'upsert' and all(col in columns for col in self.key)
+            statement = self._insert_statement(columns, upsert)
+            for batch_start in range(0, len(data), self.batch_size):
+                batch = data.iloc[batch_start:batch_start + self.batch_size]
+                rows = zip(*(self._column_values(batch[col]) for col in columns))
+                connection.execute('BEGIN')
+                try:
+                    connection.executemany(statement, rows)
+                    connection.execute('COMMIT')
+                except Exception:
+                    connection.execute('ROLLBACK')
+                    raise
+                batches += 1
+
+            if new_table:
+                # En una tabla nueva es más rápido crear los índices tras la carga masiva
+                self._create_indexes(connection, set(columns))
+        finally:
+            connection.close()
+
+        seconds = time.perf_counter() - start
+        self.last_load = {
+            'rows': len(data),
+            'batches': batches,
+            'seconds': seconds,
+            'rows_per_second': len(data) / seconds if seconds > 0 else float('inf'),
+        }
+        return self.last_load
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def read(self, where=None, params=(), columns=None, order_by=None):
+        """
+        Lee filas de la tabla.
+
+        Args:
+            where (str): Condición SQL con marcadores ? (p. ej. '"Season" = ?')
+            params (tuple): Valores de los marcadores
+            columns (list): Columnas a leer (por defecto todas)
+            order_by (list): Columnas de ordenación
+
+        Returns:
+            pd.DataFrame: Filas encontradas
+        """
+        names = ', '.join(self._quote(col) for col in columns) if columns else '*'
+        sql = f"SELECT {names} FROM {self._quote(self.table)}"
+        if where:
+            sql += f" WHERE {where}"
+        if order_by:
+            sql += f" ORDER BY {', '.join(self._quote(col) for col in order_by)}"
+        connection = self.connect()
+        try:
+            data = pd.read_sql_query(sql, connection, params=tuple(params))
+        finally:
+            connection.close()
+        # Los NULL de texto llegan como None: se usan NaN, como en pd.read_csv
+        for col in data.columns[data.dtypes == object]:
+            nulls = data[col].isna()
+            if nulls.any():
+                data[col] = data[col].where(~nulls, np.nan)
+        return data
+
+    def query(self, season=None, round=None, driver=None, constructor=None, columns=None):
+        """
+        Consulta por las columnas indexadas.
+
+        Args:
+            season (int): Temporada
+            round (int): Ronda
+            driver (str): DriverID
+            constructor (str): ConstructorID
+            columns (list): Columnas a leer (por defecto todas)
+
+        Returns:
+            pd.DataFrame: Filas ordenadas por Season, Round y Position si existe
+        """
+        conditions, params = [], []
+        for col, value in (('Season', season), ('Round', round), ('DriverID', driver),
+                           ('ConstructorID', constructor)):
+            if value is not None:
+                conditions.append(f"{self._quote(col)} = ?")
+                params.append(value.item() if isinstance(value, np.generic) else value)
+        connection = self.connect()
+        try:
+            order_by = [col for col in ('Season', 'Round', 'Position') if col in self.table_columns(connection)]
+        finally:
+            connection.close()
+        return self.read(' AND '.join(conditions) or None, params, columns, order_by)
+
+    def count(self):
+        """
+        Returns:
+            int: Filas de la tabla (0 si no existe)
+        """
+        connection = self.connect()
+        try:
+            if not self.table_columns(connection):
+                return 0
+            return connection.execute(f"SELECT COUNT(*) FROM {self._quote(self.table)}").fetchone()[0]
+        finally:
+            connection.close()
+
+    def index_names(self):
+        """
+        Returns:
+            list: Nombres de los índices de la tabla (incluido el de la clave primaria)
+        """
+        connection = self.connect()
+        try:
+            rows = connection.execute(f"PRAGMA index_list({self._quote(self.table)})").fetchall()
+            return sorted(row[1] for row in rows)
+        finally:
+            connection.close()
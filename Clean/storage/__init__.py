@@ -0,0 +1,11 @@
+"""
+Módulo Storage - Almacenamiento de los datos limpios
+
+Este módulo carga los datos limpios en una base de datos SQLite
+indexada, por lotes y con upsert por (Season, Round, DriverID),
+para consultarlos sin volver a leer el CSV completo.
+"""
+
+from .SQLiteStorage import SQLiteStorage
+
+__all__ = ['SQLiteStorage']
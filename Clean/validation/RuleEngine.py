@@ -0,0 +1,294 @@
+import numpy as np
+import pandas as pd
+from ..schema import LapTimeParser
+
+
+class ValidationRule:
+    """
+    Regla de validación declarativa sobre una o varias columnas.
+
+    Cada regla se compila en una función vectorizada que recibe el DataFrame
+    y devuelve una máscara booleana de filas que la incumplen (True = violación).
+    Los nulos nunca son violaciones: de ellos se ocupan las estrategias de
+    limpieza. Las comprobaciones sobre texto se evalúan una vez por valor
+    distinto y se expanden con los códigos de factorize.
+    """
+
+    def __init__(self, name, columns, check, description=''):
+        """
+        Args:
+            name (str): Nombre único de la regla (aparece en los conteos)
+            columns (list): Columnas necesarias; si falta alguna la regla se omite
+            check (callable): Función data -> np.ndarray booleano de violaciones
+            description (str): Descripción legible de la restricción
+        """
+        self.name = name
+        self.columns = list(columns)
+        self.check = check
+        self.description = description
+
+    def __repr__(self):
+        return f"ValidationRule({self.name}: {self.description or ', '.join(self.columns)})"
+
+    def applies_to(self, data: pd.DataFrame):
+        """
+        Returns:
+            bool: Si los datos tienen todas las columnas de la regla
+        """
+        return all(col in data.columns for col in self.columns)
+
+    # ------------------------------------------------------------------
+    # Evaluación por valores únicos
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _factorize(series):
+        """Códigos y únicos de una columna (las categóricas reutilizan sus categorías)."""
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return series.cat.codes.to_numpy(), pd.Series(series.cat.categories)
+        codes, uniques = pd.factorize(series)
+        return np.asarray(codes), pd.Series(uniques)
+
+    @staticmethod
+    def _per_unique(series, unique_check):
+        """
+        Evalúa `unique_check` (Serie de únicos -> máscara) una vez por valor
+        distinto y la expande a todas las filas. Los nulos (código -1) no violan.
+        """
+        codes, uniques = ValidationRule._factorize(series)
+        invalid = np.append(np.asarray(unique_check(uniques), dtype=bool), False)
+        return invalid[codes]
+
+    # ------------------------------------------------------------------
+    # Tipos de regla
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def in_range(cls, name, column, minimum=None, maximum=None):
+        """
+        Valores numéricos dentro de [minimum, maximum]; el texto no numérico es violación.
+        """
+        def to_numbers(values):
+            return pd.to_numeric(values.astype(object) if isinstance(values.dtype, pd.CategoricalDtype)
+                                 else values, errors='coerce')
+
+        def outside(values):
+            numbers = to_numbers(values)
+            invalid = numbers.isna().to_numpy() & values.notna().to_numpy()
+            if minimum is not None:
+                invalid |= (numbers < minimum).fillna(False).to_numpy(dtype=bool)
+            if maximum is not None:
+                invalid |= (numbers > maximum).fillna(False).to_numpy(dtype=bool)
+            return invalid
+
+        def check(data):
+            series = data[column]
+            if pd.api.types.is_numeric_dtype(series.dtype):
+                return outside(series)
+            return cls._per_unique(series, outside)
+
+        bounds = f"{'-∞' if minimum is None else minimum}..{'∞' if maximum is None else maximum}"
+        return cls(name, [column], check, f"{column} en {bounds}")
+
+    @classmethod
+    def lap_time(cls, name, column, maximum_ms=600_000):
+        """
+        Tiempo de vuelta bien formado ("m:ss.fff"; el marcador "0" es válido).
+        Si la columna es numérica (milisegundos, o solo marcadores "0") debe
+        estar en [0, maximum_ms].
+        """
+        def malformed(values):
+            text = values.astype(str)
+            parsed = LapTimeParser.parse(text)
+            blank = text.str.strip().isin(['', LapTimeParser.PLACEHOLDER])
+            return parsed.isna().to_numpy() & ~blank.to_numpy()
+
+        def check(data):
+            series = data[column]
+            if pd.api.types.is_numeric_dtype(series.dtype):
+                return ((series < 0) | (series > maximum_ms)).fillna(False).to_numpy(dtype=bool)
+            return cls._per_unique(series, malformed)
+
+        return cls(name, [column], check, f"{column} con formato m:ss.fff")
+
+    @classmethod
+    def before_season(cls, name, column, season_column='Season', date_format='%Y-%m-%d'):
+        """
+        Fecha anterior al inicio de la temporada (p. ej. DateOfBirth). Una
+        fecha mal formada también es violación.
+        """
+        def check(data):
+            dates = data[column]
+            if pd.api.types.is_datetime64_any_dtype(dates.dtype):
+                years = dates.dt.year.to_numpy(dtype=float, na_value=np.nan)
+                malformed = np.zeros(len(dates), dtype=bool)
+            else:
+                codes, uniques = cls._factorize(dates)
+                parsed = pd.to_datetime(uniques.astype(object), format=date_format, errors='coerce')
+                unique_years = np.append(parsed.dt.year.to_numpy(dtype=float, na_value=np.nan), np.nan)
+                malformed = np.append(parsed.isna().to_numpy(), False)[codes]
+                years = unique_years[codes]
+            seasons = pd.to_numeric(data[season_column].astype(object)
+                                    if isinstance(data[season_column].dtype, pd.CategoricalDtype)
+                                    else data[season_column], errors='coerce')
+            seasons = np.asarray(seasons, dtype=float)
+            with np.errstate(invalid='ignore'):
+                late = years >= seasons
+            return malformed | late
+
+        return cls(name, [column, season_column], check, f"{column} anterior a {season_column}")
+
+    @classmethod
+    def consistent(cls, name, key, value):
+        """
+        Correspondencia estable key -> value (p. ej. ConstructorID -> ConstructorName):
+        cada clave tiene un valor dominante (el más frecuente) y las filas con
+        otro valor son violaciones.
+        """
+        def check(data):
+            key_codes, _ = cls._factorize(data[key])
+            value_codes, value_uniques = cls._factorize(data[value])
+            present = (key_codes >= 0) & (value_codes >= 0)
+            invalid = np.zeros(len(data), dtype=bool)
+            if not present.any():
+                return invalid
+            pairs = key_codes.astype(np.int64) * (len(value_uniques) + 1) + value_codes
+            # factorize (hash) en lugar de np.unique (ordenación) sobre todas las filas
+            inverse, unique_pairs = pd.factorize(pairs[present])
+            counts = np.bincount(inverse, minlength=len(unique_pairs))
+            pair_keys = unique_pairs // (len(value_uniques) + 1)
+            # Por clave: el par más frecuente primero (a igualdad, el primer valor)
+            order = np.lexsort((unique_pairs, -counts, pair_keys))
+            dominant = np.zeros(len(unique_pairs), dtype=bool)
+            dominant[order[np.r_[True, pair_keys[order][1:] != pair_keys[order][:-1]]]] = True
+            invalid[present] = ~dominant[inverse]
+            return invalid
+
+        return cls(name, [key, value], check, f"{key} -> {value} consistente")
+
+    @classmethod
+    def pattern(cls, name, column, regex):
+        """
+        Texto que cumple una expresión regular completa (p. ej. Code de tres letras).
+        """
+        def check(data):
+            return cls._per_unique(data[column],
+                                   lambda values: ~values.astype(str).str.fullmatch(regex).to_numpy(dtype=bool))
+
+        return cls(name, [column], check, f"{column} ~ {regex}")
+
+
+class RuleEngine:
+    """
+    Clase responsable de evaluar un conjunto de reglas de validación en una
+    sola pasada y devolver una máscara de bits de violaciones por fila: el
+    bit i indica que la fila incumple la regla i. La máscara usa el entero
+    sin signo más pequeño que admite todas las reglas (uint8 hasta 8 reglas).
+
+    Las reglas de dominio F1 por defecto (DEFAULT_RULES) cubren rangos de
+    Season, Round, Position y PermanentNumber, el formato de Q1/Q2/Q3, la
+    fecha de nacimiento anterior a la temporada y la correspondencia de
+    ConstructorID/ConstructorName y DriverID/Code.
+    """
+
+    DEFAULT_RULES = [
+        ValidationRule.in_range('season_range', 'Season', 1950, 2100),
+        ValidationRule.in_range('round_range', 'Round', 1, 30),
+        ValidationRule.in_range('position_range', 'Position', 1, 26),
+        ValidationRule.in_range('permanent_number_range', 'PermanentNumber', 0, 99),
+        ValidationRule.lap_time('q1_format', 'Q1'),
+        ValidationRule.lap_time('q2_format', 'Q2'),
+        ValidationRule.lap_time('q3_format', 'Q3'),
+        ValidationRule.before_season('birth_before_season', 'DateOfBirth'),
+        ValidationRule.consistent('constructor_name', 'ConstructorID', 'ConstructorName'),
+        ValidationRule.consistent('driver_code', 'DriverID', 'Code'),
+    ]
+
+    def __init__(self, rules=None):
+        """
+        Args:
+            rules (list): Reglas a evaluar (por defecto DEFAULT_RULES)
+        """
+        self.rules = list(self.DEFAULT_RULES if rules is None else rules)
+        names = [rule.name for rule in self.rules]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Nombres de regla repetidos: {names}")
+        if len(self.rules) > 64:
+            raise ValueError("La máscara de violaciones admite como máximo 64 reglas")
+        self.skipped = []
+
+    @property
+    def mask_dtype(self):
+        """Tipo entero de la máscara de bits según el número de reglas."""
+        for dtype in (np.uint8, np.uint16, np.uint32, np.uint64):
+            if len(self.rules) <= np.iinfo(dtype).bits:
+                return np.dtype(dtype)
+
+    def evaluate(self, data: pd.DataFrame):
+        """
+        Evalúa todas las reglas que aplican a los datos (las que necesitan
+        columnas ausentes se anotan en `skipped`).
+
+        Args:
+            data (pd.DataFrame): Datos a validar
+
+        Returns:
+            np.ndarray: Máscara de bits de violaciones por fila
+        """
+        dtype = self.mask_dtype
+        mask = np.zeros(len(data), dtype=dtype)
+        self.skipped = []
+        for bit, rule in enumerate(self.rules):
+            if not rule.applies_to(data):
+                self.skipped.append(rule.name)
+                continue
+            violations = np.asarray(rule.check(data), dtype=bool)
+            mask |= violations.astype(dtype) << dtype.type(bit)
+        return mask
+
+    def counts(self, mask):
+        """
+        Filas que incumplen cada regla.
+
+        Args:
+            mask (np.ndarray): Máscara de bits de evaluate
+
+        Returns:
+            dict: Nombre de regla -> número de filas
+        """
+        mask = np.asarray(mask)
+        return {rule.name: int(np.count_nonzero(mask & mask.dtype.type(1 << bit)))
+                for bit, rule in enumerate(self.rules)}
+
+    def describe(self, mask):
+        """
+        Nombres de las reglas incumplidas por cada fila ('' si ninguna).
+        Cada combinación distinta de bits se traduce una sola vez.
+
+        Args:
+            mask (np.ndarray): Máscara de bits de evaluate
+
+        Returns:
+            np.ndarray: Textos 'regla1,regla2' por fila
+        """
+        combinations, inverse = np.unique(np.asarray(mask), return_inverse=True)
+        names = np.array([','.join(rule.name for bit, rule in enumerate(self.rules) if int(value) >> bit & 1)
+                          for value in combinations], dtype=object)
+        return names[inverse.reshape(-1)]
+
+    def validate(self, data: pd.DataFrame):
+        """
+        Evalúa los datos y resume las violaciones.
+
+        Returns:
+            tuple: (máscara de bits, dict con rows_checked, rows_invalid,
+                violations por regla y skipped)
+        """
+        mask = self.evaluate(data)
+        stats = {
+            'rows_checked': len(data),
+            'rows_invalid': int(np.count_nonzero(mask)),
+            'violations': self.counts(mask),
+            'skipped': list(self.skipped),
+        }
+        return mask, stats
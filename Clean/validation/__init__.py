@@ -0,0 +1,11 @@
+"""
+Módulo Validation - Reglas de dominio de los datos F1
+
+Este módulo declara reglas de validación (rangos, formato de tiempos,
+fechas y correspondencias entre columnas) que se evalúan vectorizadas
+en una sola pasada y producen una máscara de bits de violaciones por fila.
+"""
+
+from .RuleEngine import RuleEngine, ValidationRule
+
+__all__ = ['RuleEngine', 'ValidationRule']
@@ -0,0 +1,78 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from ..cache import ColumnCache
+from .OutputWriter import OutputWriter
+
+
+class ColumnarWriter(OutputWriter):
+    """
+    Escritor en un formato binario por columnas: un archivo .npz (zip de
+    arrays .npy) con la misma codificación que la caché de columnas
+    (texto como códigos + valores únicos, categóricas, enteros con nulos y
+    fechas sin pasar por texto) y una descripción JSON en '__meta__'.
+
+    Se lee con ColumnarWriter.read sin interpretar texto. Las columnas de
+    objetos que no son texto (p. ej. números y cadenas mezclados tras
+    'fill_zero') se guardan como texto, igual que en un CSV.
+    """
+
+    EXTENSION = '.npz'
+    FORMAT_VERSION = 1
+    META_KEY = '__meta__'
+
+    def __init__(self, compress=False, workers=None):
+        """
+        Args:
+            compress (bool): Si comprimir los arrays (zip deflate; más lento y más pequeño)
+            workers (int): Hilos para codificar columnas (por defecto, uno por núcleo)
+        """
+        self.compress = compress
+        self.workers = workers or os.cpu_count() or 1
+
+    @staticmethod
+    def _encode(position, name, series):
+        """Codifica una columna; devuelve su descripción y sus arrays por nombre."""
+        encoded = ColumnCache.encode_column(series)
+        if encoded is None and series.dtype == object:
+            encoded = ColumnCache.encode_column(series.astype(str).where(series.notna()))
+        if encoded is None:
+            raise ValueError(f"Columna '{name}' con tipo no soportado: {series.dtype}")
+        column, arrays = encoded
+        column['name'] = str(name)
+        column['files'] = [f"c{position}{suffix}" for suffix, _ in arrays]
+        return column, {key: array for key, (_, array) in zip(column['files'], arrays)}
+
+    def _write(self, data, handle):
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            encoded = list(executor.map(self._encode, range(data.shape[1]), data.columns,
+                                        (data.iloc[:, position] for position in range(data.shape[1]))))
+        meta = {'format_version': self.FORMAT_VERSION, 'rows': len(data),
+                'columns': [column for column, _ in encoded]}
+        arrays = {key: array for _, column_arrays in encoded for key, array in column_arrays.items()}
+        arrays[self.META_KEY] = np.frombuffer(json.dumps(meta).encode('utf-8'), dtype=np.uint8)
+        (np.savez_compressed if self.compress else np.savez)(handle, **arrays)
+
+    @classmethod
+    def read(cls, path):
+        """
+        Lee un archivo escrito por ColumnarWriter.
+
+        Args:
+            path (str): Ruta del archivo .npz
+
+        Returns:
+            pd.DataFrame: Datos con sus tipos originales
+        """
+        with np.load(path, allow_pickle=False) as archive:
+            meta = json.loads(archive[cls.META_KEY].tobytes())
+            if meta.get('format_version') != cls.FORMAT_VERSION:
+                raise ValueError(f"Versión de formato no soportada: {meta.get('format_version')}")
+            columns = {column['name']: ColumnCache.decode_column(column, [archive[key] for key in column['files']])
+                       for column in meta['columns']}
+        if not columns:
+            return pd.DataFrame(index=pd.RangeIndex(meta['rows']))
+        return pd.DataFrame(columns, copy=False)
@@ -0,0 +1,83 @@
+import contextlib
+import os
+
+import pandas as pd
+
+
+class OutputWriter:
+    """
+    Base de los escritores de salida.
+
+    Todas las escrituras son atómicas: el resultado se escribe en un archivo
+    temporal de la misma carpeta y se renombra sobre el destino al terminar,
+    de modo que un fallo a mitad nunca deja un archivo incompleto (y el
+    archivo anterior, si existía, se conserva). Las subclases implementan
+    _write(data, handle) sobre el archivo temporal abierto en binario.
+    """
+
+    EXTENSION = None
+
+    # Intentos de crear un nombre temporal libre antes de rendirse
+    TEMP_ATTEMPTS = 100
+
+    @staticmethod
+    def _create_temp(directory, name):
+        """
+        Crea un archivo temporal nuevo en `directory`. A diferencia de mkstemp
+        (0600), se crea con 0666 y el sistema aplica la umask del proceso: el
+        resultado tiene los mismos permisos que un archivo creado con open().
+
+        Returns:
+            tuple: (descriptor abierto para escritura, ruta del temporal)
+        """
+        flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0)
+        for _ in range(OutputWriter.TEMP_ATTEMPTS):
+            temp_path = os.path.join(directory, f".{name}.{os.urandom(6).hex()}.tmp")
+            try:
+                return os.open(temp_path, flags, 0o666), temp_path
+            except FileExistsError:
+                continue
+        raise FileExistsError(f"No se pudo crear un archivo temporal en {directory}")
+
+    @staticmethod
+    @contextlib.contextmanager
+    def atomic(path):
+        """
+        Abre un archivo temporal junto a `path` y lo renombra sobre él al
+        cerrar el bloque sin errores. Si hay un error, el temporal se elimina.
+
+        Args:
+            path (str): Ruta final del archivo
+
+        Yields:
+            file: Archivo temporal abierto en modo binario
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        descriptor, temp_path = OutputWriter._create_temp(directory, os.path.basename(path))
+        try:
+            with os.fdopen(descriptor, 'wb') as handle:
+                yield handle
+            os.replace(temp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+
+    def write(self, data: pd.DataFrame, path):
+        """
+        Escribe un DataFrame (sin el índice) de forma atómica.
+
+        Args:
+            data (pd.DataFrame): Datos a escribir
+            path (str): Ruta del archivo de salida
+
+        Returns:
+            str: Ruta del archivo escrito
+        """
+        with self.atomic(path) as handle:
+            self._write(data, handle)
+        return path
+
+    def _write(self, data, handle):
+        raise NotImplementedError
@@ -0,0 +1,57 @@
+import functools
+
+from .CSVWriter import CSVWriter
+from .ColumnarWriter import ColumnarWriter
+
+
+class WriterRegistry:
+    """
+    Registro de escritores de salida por extensión de archivo.
+    Permite elegir el escritor a partir de la ruta de salida y añadir formatos propios.
+    """
+
+    _writers = {}
+
+    @classmethod
+    def register(cls, suffix, factory):
+        """
+        Registra (o reemplaza) el escritor de una extensión.
+
+        Args:
+            suffix (str): Extensión (p. ej. '.csv.gz'); gana la más larga que coincida
+            factory (callable): factory(**opciones) -> OutputWriter
+
+        Returns:
+            callable: La fábrica registrada
+        """
+        cls._writers[suffix.lower()] = factory
+        return factory
+
+    @classmethod
+    def for_path(cls, path, **options):
+        """
+        Crea el escritor correspondiente a una ruta de salida. Las extensiones
+        no registradas se escriben como CSV sin comprimir.
+
+        Args:
+            path (str): Ruta del archivo de salida
+            **options: Opciones del escritor (p. ej. workers)
+
+        Returns:
+            OutputWriter: Escritor de la ruta
+        """
+        name = str(path).lower()
+        matches = [suffix for suffix in cls._writers if name.endswith(suffix)]
+        factory = cls._writers[max(matches, key=len)] if matches else CSVWriter
+        return factory(**options)
+
+    @classmethod
+    def suffixes(cls):
+        """Extensiones registradas."""
+        return list(cls._writers.keys())
+
+
+WriterRegistry.register('.csv', CSVWriter)
+for _suffix, _compression in CSVWriter.SUFFIXES.items():
+    WriterRegistry.register(_suffix, functools.partial(CSVWriter, compression=_compression))
+WriterRegistry.register('.npz', ColumnarWriter)
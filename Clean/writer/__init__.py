@@ -0,0 +1,15 @@
+"""
+Módulo Writer - Escritores de salida
+
+Este módulo se encarga de escribir los datos limpios de forma
+atómica (archivo temporal y renombrado) en CSV, comprimido con
+gzip/bz2/xz, o en un formato binario por columnas, formateando
+los bloques de filas en paralelo.
+"""
+
+from .OutputWriter import OutputWriter
+from .CSVWriter import CSVWriter
+from .ColumnarWriter import ColumnarWriter
+from .WriterRegistry import WriterRegistry
+
+__all__ = ['OutputWriter', 'CSVWriter', 'ColumnarWriter', 'WriterRegistry']
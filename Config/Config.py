@@ -1,3 +1,10 @@
 class Config:
     INPUT = r"Sources\qualifying_results.csv"
-    OUTPUT = r"Sources\output.csv"
\ No newline at end of file
+    OUTPUT = r"Sources\output.csv"
+    # Carpeta de cachés locales (relativa a la raíz del proyecto)
+    CACHE_DIR = ".cache"
+    # Caché binaria por columnas de los CSV cargados
+    USE_CACHE = True
+    CACHE_MAX_BYTES = 512 * 1024 * 1024
+    # Caché de respuestas de la API de Fórmula 1 (Extract/ErgastExtract)
+    HTTP_CACHE_MAX_BYTES = 64 * 1024 * 1024
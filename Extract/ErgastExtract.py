@@ -0,0 +1,349 @@
+import asyncio
+import datetime
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+from Clean.writer import CSVWriter
+
+
+class _RateLimiter:
+    """Limita el ritmo de inicio de peticiones (peticiones por segundo, con ráfaga)."""
+
+    def __init__(self, rate, burst=1):
+        self.interval = 1.0 / rate if rate else 0.0
+        self.burst = max(1, burst)
+        self._next = None
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            # Con huecos sin peticiones se acumula como mucho una ráfaga de `burst`
+            earliest = now - self.interval * (self.burst - 1)
+            if self._next is None or self._next < earliest:
+                self._next = earliest
+            delay = self._next - now
+            self._next += self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class ErgastExtract:
+    """
+    Clase responsable de descargar los resultados de clasificación de una API
+    con el formato de Ergast (/{season}.json, /{season}/{round}/qualifying.json).
+
+    Las peticiones se hacen de forma concurrente con asyncio sobre una sesión
+    HTTP con conexiones reutilizadas (requests en un pool de hilos), con
+    límite de peticiones simultáneas, límite de ritmo, reintentos con espera
+    exponencial y paginación (limit/offset). Cada carrera se convierte al
+    esquema de 17 columnas de qualifying_results.csv en cuanto llega.
+
+    Con una HTTPCache, las respuestas de temporadas terminadas se leen del
+    disco sin ir a la red y las de la temporada actual se revalidan con
+    ETag/Last-Modified.
+    """
+
+    BASE_URL = "https://api.jolpi.ca/ergast/f1"
+    COLUMNS = ['Season', 'Round', 'CircuitID', 'Position', 'DriverID', 'Code', 'PermanentNumber',
+               'GivenName', 'FamilyName', 'DateOfBirth', 'Nationality', 'ConstructorID',
+               'ConstructorName', 'ConstructorNationality', 'Q1', 'Q2', 'Q3']
+    # Marcador de sesión no disputada en qualifying_results.csv
+    NO_TIME = '0'
+    RETRY_STATUS = {429, 500, 502, 503, 504}
+
+    def __init__(self, base_url=BASE_URL, concurrency=4, rate_limit=4.0, burst=4, retries=4,
+                 backoff=0.5, page_size=100, timeout=30, cache=None, current_season=None):
+        """
+        Args:
+            base_url (str): URL base de la API (sin barra final)
+            concurrency (int): Peticiones simultáneas como máximo (y conexiones del pool)
+            rate_limit (float): Peticiones por segundo como máximo (None o 0 = sin límite)
+            burst (int): Peticiones que pueden salir seguidas tras un periodo sin actividad
+            retries (int): Reintentos ante errores de red, 429 y 5xx
+            backoff (float): Espera base en segundos (se duplica en cada reintento)
+            page_size (int): Resultados por página (parámetro limit)
+            timeout (float): Tiempo máximo de cada petición en segundos
+            cache (HTTPCache): Caché de respuestas en disco (None = sin caché)
+            current_season (int): Temporada en curso, cuyas respuestas se revalidan
+                (por defecto, el año actual); las anteriores se consideran inmutables
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency debe ser al menos 1")
+        self.base_url = base_url.rstrip('/')
+        self.concurrency = concurrency
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.retries = retries
+        self.backoff = backoff
+        self.page_size = page_size
+        self.timeout = timeout
+        self.cache = cache
+        self.current_season = current_season or datetime.date.today().year
+        self.requests_made = 0
+        self.retries_made = 0
+        self.cache_hits = 0
+        self.revalidated = 0
+        self._session = None
+        self._executor = None
+        self._semaphore = None
+        self._limiter = None
+
+    # ------------------------------------------------------------------ HTTP
+
+    def _open(self):
+        """Crea la sesión con un pool de `concurrency` conexiones y los hilos que la usan."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers['Accept'] = 'application/json'
+        self._session = session
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='ergast')
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._limiter = _RateLimiter(self.rate_limit, self.burst)
+
+    def _close(self):
+        self._executor.shutdown(wait=True)
+        self._session.close()
+        self._session = self._executor = self._semaphore = self._limiter = None
+
+    def _get(self, url, params, headers=None):
+        """Petición bloqueante (se ejecuta en el pool de hilos)."""
+        return self._session.get(url, params=params, headers=headers, timeout=self.timeout)
+
+    def _retry_delay(self, attempt, response=None):
+        """Espera exponencial con jitter; respeta Retry-After si la API lo envía."""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                return float(retry_after)
+        return self.backoff * 2 ** attempt * (0.5 + random.random() / 2)
+
+    async def fetch_json(self, path, params=None, immutable=False):
+        """
+        Descarga un recurso JSON de la API con límite de concurrencia y de ritmo
+        y reintentos, pasando por la caché si la hay.
+
+        Args:
+            path (str): Ruta relativa a base_url (p. ej. '2024/1/qualifying.json')
+            params (dict): Parámetros de la consulta
+            immutable (bool): Si la respuesta no puede cambiar (temporada terminada):
+                una entrada en caché se usa sin revalidarla
+
+        Returns:
+            dict: Respuesta decodificada
+
+        Raises:
+            requests.HTTPError: Respuesta de error no recuperable o reintentos agotados
+            requests.RequestException: Error de red con los reintentos agotados
+        """
+        url = f"{self.base_url}/{path}"
+        entry = self.cache.get(url, params) if self.cache is not None else None
+        if entry is not None and entry['immutable']:
+            self.cache_hits += 1
+            return entry['body']
+        headers = self.cache.validators(entry) if entry is not None else None
+
+        loop = asyncio.get_running_loop()
+        for attempt in range(self.retries + 1):
+            response = error = None
+            await self._limiter.wait()
+            async with self._semaphore:
+                self.requests_made += 1
+                try:
+                    response = await loop.run_in_executor(self._executor, self._get, url, params, headers)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    error = e
+
+            if response is not None and response.status_code == 304 and entry is not None:
+                self.revalidated += 1
+                if immutable:
+                    # La temporada terminó desde que se guardó: ya no se revalidará
+                    self.cache.put(url, params, entry['body'], entry['etag'], entry['last_modified'], True)
+                return entry['body']
+            if response is not None and response.status_code not in self.RETRY_STATUS:
+                response.raise_for_status()
+                body = response.json()
+                if self.cache is not None:
+                    self.cache.put(url, params, body, response.headers.get('ETag'),
+                                   response.headers.get('Last-Modified'), immutable)
+                return body
+            if attempt == self.retries:
+                if error is not None:
+                    raise error
+                response.raise_for_status()
+            self.retries_made += 1
+            await asyncio.sleep(self._retry_delay(attempt, response))
+
+    async def fetch_paginated(self, path, table, items, immutable=False):
+        """
+        Descarga todas las páginas de un recurso: la primera indica el total y
+        las restantes se piden a la vez.
+
+        Args:
+            path (str): Ruta del recurso
+            table (str): Tabla de MRData con los elementos (p. ej. 'RaceTable')
+            items (str): Lista de la tabla (p. ej. 'Races')
+            immutable (bool): Si el recurso no puede cambiar (ver fetch_json)
+
+        Returns:
+            list: Elementos de todas las páginas en orden
+        """
+        first = (await self.fetch_json(path, {'limit': self.page_size, 'offset': 0}, immutable))['MRData']
+        total = int(first['total'])
+        pages = await asyncio.gather(*(
+            self.fetch_json(path, {'limit': self.page_size, 'offset': offset}, immutable)
+            for offset in range(self.page_size, total, self.page_size)))
+        result = list(first[table][items])
+        for page in pages:
+            result.extend(page['MRData'][table][items])
+        return result
+
+    # ------------------------------------------------------------ Conversión
+
+    @classmethod
+    def qualifying_rows(cls, races):
+        """
+        Convierte las carreras de una respuesta de clasificación a filas del
+        esquema de qualifying_results.csv.
+
+        Los resultados de una carrera pueden venir repartidos en varias páginas
+        (la misma carrera aparece en cada una con parte de QualifyingResults).
+
+        Args:
+            races (list): Elementos Races de la API
+
+        Returns:
+            list: Tuplas con las 17 columnas
+        """
+        rows = []
+        for race in races:
+            season, round_number = int(race['season']), int(race['round'])
+            circuit = race['Circuit']['circuitId']
+            for result in race.get('QualifyingResults', []):
+                driver, constructor = result['Driver'], result['Constructor']
+                rows.append((
+                    season, round_number, circuit, int(result['position']),
+                    driver['driverId'], driver.get('code'), int(driver.get('permanentNumber') or 0),
+                    driver['givenName'], driver['familyName'], driver['dateOfBirth'], driver['nationality'],
+                    constructor['constructorId'], constructor['name'], constructor['nationality'],
+                    result.get('Q1') or cls.NO_TIME, result.get('Q2') or cls.NO_TIME,
+                    result.get('Q3') or cls.NO_TIME,
+                ))
+        return rows
+
+    @classmethod
+    def to_frame(cls, rows):
+        """
+        Returns:
+            pd.DataFrame: Filas con los mismos tipos que pd.read_csv da a qualifying_results.csv
+        """
+        data = pd.DataFrame.from_records(rows, columns=cls.COLUMNS)
+        return data.astype({'Season': 'int64', 'Round': 'int64', 'Position': 'int64',
+                            'PermanentNumber': 'int64'})
+
+    # ------------------------------------------------------------- Descarga
+
+    def is_immutable(self, season):
+        """Las temporadas anteriores a la actual ya no cambian."""
+        return int(season) < self.current_season
+
+    async def season_rounds(self, season):
+        """
+        Returns:
+            list: Números de ronda del calendario de la temporada
+        """
+        races = await self.fetch_paginated(f"{season}.json", 'RaceTable', 'Races', self.is_immutable(season))
+        return sorted({int(race['round']) for race in races})
+
+    async def round_qualifying(self, season, round_number):
+        """
+        Returns:
+            pd.DataFrame: Clasificación de una carrera (vacía si aún no se disputó)
+        """
+        races = await self.fetch_paginated(f"{season}/{round_number}/qualifying.json", 'RaceTable', 'Races',
+                                           self.is_immutable(season))
+        data = self.to_frame(self.qualifying_rows(races))
+        return data.sort_values('Position', kind='stable', ignore_index=True)
+
+    async def stream(self, seasons):
+        """
+        Descarga la clasificación de todas las carreras de las temporadas.
+
+        Los calendarios y las carreras se piden de forma concurrente, pero cada
+        carrera se entrega en orden (Season, Round) en cuanto ella y las
+        anteriores han llegado.
+
+        Args:
+            seasons (iterable): Temporadas (p. ej. range(2000, 2025))
+
+        Yields:
+            pd.DataFrame: Filas de una carrera con las 17 columnas
+        """
+        seasons = list(seasons)
+        self._open()
+        schedules = [asyncio.ensure_future(self.season_rounds(season)) for season in seasons]
+        races = []
+        try:
+            for season, schedule in zip(seasons, schedules):
+                for round_number in await schedule:
+                    races.append(asyncio.ensure_future(self.round_qualifying(season, round_number)))
+            for race in races:
+                data = await race
+                if len(data):
+                    yield data
+        finally:
+            # Si la descarga falla o se interrumpe, se cancelan las peticiones pendientes
+            for task in schedules + races:
+                task.cancel()
+            await asyncio.gather(*schedules, *races, return_exceptions=True)
+            self._close()
+
+    async def extract_async(self, seasons, csv_path=None):
+        """
+        Versión asíncrona de extract().
+        """
+        if csv_path is None:
+            frames = [data async for data in self.stream(seasons)]
+            if not frames:
+                return self.to_frame([])
+            return pd.concat(frames, ignore_index=True)
+
+        # Las carreras se escriben en un temporal de la misma carpeta que solo
+        # sustituye al CSV si la descarga termina: un fallo a mitad conserva
+        # el archivo anterior intacto
+        writer = CSVWriter(CSVWriter.infer_compression(csv_path), workers=1)
+        with writer.open(csv_path) as output:
+            async for data in self.stream(seasons):
+                output.write(data)
+            if output.rows == 0:
+                output.write(self.to_frame([]))
+        return csv_path
+
+    def extract(self, seasons, csv_path=None):
+        """
+        Descarga las temporadas indicadas.
+
+        Args:
+            seasons (iterable): Temporadas a descargar
+            csv_path (str): Si se indica, cada carrera se añade al CSV según llega
+                (sin acumular el historial en memoria) y se devuelve la ruta; el
+                CSV solo se reemplaza si la descarga termina sin errores
+
+        Returns:
+            pd.DataFrame | str: Datos con el esquema de qualifying_results.csv o ruta del CSV
+        """
+        seasons = list(seasons)
+        if csv_path is not None:
+            directory = os.path.dirname(os.path.abspath(csv_path))
+            os.makedirs(directory, exist_ok=True)
+        return asyncio.run(self.extract_async(seasons, csv_path))
@@ -1,7 +1,12 @@
-import requests
 import pandas as pd
 import numpy as np
 from Clean.DataClean import DataClean
+from Clean.analyzer import DataProfile
+from Clean.cache import ColumnCache
+from Clean.cleaner import CleaningSnapshot
+from Config.Config import Config
+from Clean.schema import SchemaRegistry, LapTimeParser
+from Extract.QualifyingIndex import QualifyingIndex
 
 
 class Formula1Extract:
@@ -10,13 +15,64 @@ class Formula1Extract:
         self.data = None
         self.cleaned_data = None
         self.data_cleaner = None
+        self.index = None
 
-    def queries(self):
-        """Carga los datos desde el archivo CSV."""
-        self.data = pd.read_csv(self.csv)
+    def download(self, seasons, use_cache=None, **options):
+        """
+        Reconstruye el CSV descargando las temporadas de la API (ver ErgastExtract).
+        Cada carrera se escribe en el CSV según llega; después se carga con queries().
+
+        Args:
+            seasons (iterable): Temporadas a descargar (p. ej. range(2000, 2025))
+            use_cache (bool): Si usar la caché de respuestas en disco (None = Config.USE_CACHE);
+                las temporadas terminadas se leen de ella sin ir a la red
+            **options: Opciones de ErgastExtract (concurrency, rate_limit, retries...)
+
+        Returns:
+            str: Ruta del CSV escrito
+        """
+        # requests solo se importa si se descarga
+        from Extract.ErgastExtract import ErgastExtract
+        from Extract.HTTPCache import HTTPCache
+
+        if Config.USE_CACHE if use_cache is None else use_cache:
+            options.setdefault('cache', HTTPCache.default())
+        ErgastExtract(**options).extract(seasons, csv_path=self.csv)
+        self.data = self.cleaned_data = self.data_cleaner = self.index = None
+        return self.csv
+
+    def queries(self, schema=None, parse_lap_times=False, use_cache=None):
+        """
+        Carga los datos desde el archivo CSV.
+        
+        Args:
+            schema: Esquema de tipos a aplicar: None (sin tipos), 'auto' (detectar
+                por columnas), nombre registrado en SchemaRegistry o DatasetSchema
+            parse_lap_times (bool): Si convertir Q1/Q2/Q3 a milisegundos enteros
+                (los marcadores "0" pasan a ser nulos)
+            use_cache (bool): Si usar la caché binaria por columnas (None = Config.USE_CACHE)
+        
+        Returns:
+            pd.DataFrame: Datos cargados
+        """
+        dataset_schema = SchemaRegistry.resolve(schema, self.csv)
+        reader = dataset_schema.read_csv if dataset_schema is not None else pd.read_csv
+        if Config.USE_CACHE if use_cache is None else use_cache:
+            variant = ColumnCache.variant_for(dataset_schema)
+            try:
+                self.data, _ = ColumnCache.default().load(self.csv, reader, variant)
+            except Exception as e:
+                # Como CSVManager._load_cached: una caché dañada o sin permisos no impide cargar
+                print(f"⚠️  Caché no disponible ({e}), cargando directamente")
+                self.data = reader(self.csv)
+        else:
+            self.data = reader(self.csv)
+        if parse_lap_times:
+            self.data = LapTimeParser.parse_columns(self.data, copy=False)
+        self.index = None
         return self.data
 
-    def clean_data(self, strategy='remove_rows', threshold=0.5, verbose=False):
+    def clean_data(self, strategy='remove_rows', threshold=0.5, verbose=False, lean=False):
         """
         Limpia los datos utilizando la clase DataClean.
         
@@ -24,6 +80,9 @@ class Formula1Extract:
             strategy (str): Estrategia de limpieza
             threshold (float): Umbral para eliminar columnas
             verbose (bool): Si mostrar información detallada del proceso
+            lean (bool): Modo ligero: limpia los datos cargados en el sitio y
+                `data` pasa a ser una instantánea compacta de los originales
+                (ver get_original_data)
         
         Returns:
             pd.DataFrame: Datos limpios
@@ -32,7 +91,7 @@ class Formula1Extract:
             raise ValueError("Los datos no han sido cargados. Llama al método queries() primero.")
         
         # Crear instancia de DataClean
-        self.data_cleaner = DataClean(self.data)
+        self.data_cleaner = DataClean(self.data, lean=lean)
         
         if verbose:
             # Analizar valores nulos
@@ -42,6 +101,10 @@ class Formula1Extract:
         
         # Limpiar datos
         self.cleaned_data = self.data_cleaner.clean_data(strategy=strategy, threshold=threshold)
+        self.index = None
+        if lean:
+            # Los datos originales se limpiaron en el sitio: solo se conserva la instantánea
+            self.data = self.data_cleaner.get_original_snapshot()
         
         if verbose:
             # Mostrar resumen de limpieza
@@ -60,6 +123,8 @@ class Formula1Extract:
         """Retorna los datos originales sin limpiar."""
         if self.data is None:
             raise ValueError("Los datos no han sido cargados. Llama al método queries() primero.")
+        if isinstance(self.data, CleaningSnapshot):
+            return self.data_cleaner.get_original_data()
         return self.data
 
     def get_cleaned_data(self):
@@ -82,7 +147,7 @@ class Formula1Extract:
         if use_cleaned and self.cleaned_data is not None:
             return self.cleaned_data
         elif self.data is not None:
-            return self.data
+            return self.get_original_data()
         else:
             raise ValueError("Los datos no han sido cargados. Llama al método queries() primero.")
 
@@ -96,5 +161,38 @@ class Formula1Extract:
         print("=== COMPARACIÓN DE DATOS ===")
         print(f"Datos originales: {self.data.shape}")
         print(f"Datos limpios: {self.cleaned_data.shape}")
-        print(f"Valores nulos originales: {self.data.isnull().sum().sum()}")
-        print(f"Valores nulos después de limpieza: {self.cleaned_data.isnull().sum().sum()}")
+        print(f"Valores nulos originales: {DataProfile.of(self.data).total_nulls}")
+        print(f"Valores nulos después de limpieza: {DataProfile.of(self.cleaned_data).total_nulls}")
+
+    def build_index(self):
+        """
+        Construye los índices de consulta sobre los datos actuales
+        (limpios si están disponibles, si no los originales).
+        
+        Returns:
+            QualifyingIndex: Índices de consulta
+        """
+        self.index = QualifyingIndex(self.response())
+        return self.index
+
+    def query(self, season=None, round=None, driver=None, constructor=None, circuit=None):
+        """
+        Consulta indexada de resultados de clasificación. Los índices se
+        construyen en la primera consulta y se reutilizan hasta que los datos
+        cambian (queries() o clean_data()).
+        
+        Args:
+            season: Temporada (int) o rango inclusivo (inicio, fin)
+            round: Ronda (int) o rango inclusivo; requiere una única temporada
+            driver: DriverID o lista de DriverID
+            constructor: ConstructorID o lista de ConstructorID
+            circuit: CircuitID o lista de CircuitID
+        
+        Returns:
+            pd.DataFrame: Filas encontradas (vista de los datos si solo se
+                filtra por temporada/ronda)
+        """
+        if self.index is None:
+            self.build_index()
+        return self.index.query(season=season, round=round, driver=driver, constructor=constructor,
+                                circuit=circuit)
@@ -0,0 +1,208 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from Config.Config import Config
+
+
+class HTTPCache:
+    """
+    Clase responsable de la caché en disco de las respuestas JSON de la API.
+
+    Cada entrada se identifica por la URL y los parámetros de la petición y
+    guarda el cuerpo junto con los validadores ETag y Last-Modified. Las
+    entradas inmutables (temporadas terminadas) se sirven sin ir a la red;
+    las demás se revalidan con una petición condicional (304 Not Modified).
+
+    Cada entrada es un archivo JSON; su fecha de modificación marca el último
+    acceso y el tamaño total se limita con expulsión LRU.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, cache_dir, max_bytes=64 * 1024 * 1024):
+        """
+        Inicializa la caché.
+
+        Args:
+            cache_dir (str): Carpeta donde se guardan las entradas
+            max_bytes (int): Tamaño máximo total de la caché en bytes
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._total = None
+
+    @staticmethod
+    def default():
+        """
+        Crea la caché configurada en Config (CACHE_DIR/http, HTTP_CACHE_MAX_BYTES).
+
+        Returns:
+            HTTPCache: Caché HTTP del proyecto
+        """
+        # Raíz del proyecto: Extract -> F1_DB
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return HTTPCache(os.path.join(project_root, Config.CACHE_DIR, 'http'), Config.HTTP_CACHE_MAX_BYTES)
+
+    @staticmethod
+    def key(url, params=None):
+        """
+        Clave de una petición (los parámetros se ordenan: el orden no cambia la respuesta).
+
+        Returns:
+            str: Hash SHA-1 en hexadecimal
+        """
+        description = json.dumps([url, sorted((str(k), str(v)) for k, v in (params or {}).items())])
+        return hashlib.sha1(description.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, url, params):
+        return os.path.join(self.cache_dir, f"{self.key(url, params)}.json")
+
+    # ------------------------------------------------------------------
+    # Lectura y escritura de entradas
+    # ------------------------------------------------------------------
+
+    def get(self, url, params=None):
+        """
+        Obtiene la entrada de una petición y la marca como usada.
+
+        Args:
+            url (str): URL de la petición
+            params (dict): Parámetros de la consulta
+
+        Returns:
+            dict: Entrada (body, etag, last_modified, immutable, stored_at) o None
+        """
+        path = self._entry_path(url, params)
+        try:
+            with open(path, encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('format_version') != self.FORMAT_VERSION or entry.get('url') != url:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, url, params, body, etag=None, last_modified=None, immutable=False):
+        """
+        Guarda la respuesta de una petición (escritura atómica).
+
+        Args:
+            url (str): URL de la petición
+            params (dict): Parámetros de la consulta
+            body: Respuesta JSON decodificada
+            etag (str): Cabecera ETag de la respuesta
+            last_modified (str): Cabecera Last-Modified de la respuesta
+            immutable (bool): Si la respuesta no puede cambiar (no se revalida)
+
+        Returns:
+            dict: Entrada guardada
+        """
+        entry = {
+            'format_version': self.FORMAT_VERSION,
+            'url': url,
+            'params': {str(k): str(v) for k, v in (params or {}).items()},
+            'etag': etag,
+            'last_modified': last_modified,
+            'immutable': bool(immutable),
+            'stored_at': time.time(),
+            'body': body,
+        }
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._entry_path(url, params)
+        previous = os.path.getsize(path) if os.path.exists(path) else 0
+
+        fd, temp_path = tempfile.mkstemp(prefix='tmp-', suffix='.json', dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        if self._total is not None:
+            self._total += os.path.getsize(path) - previous
+        if self.total_bytes() > self.max_bytes:
+            self.evict()
+        return entry
+
+    @staticmethod
+    def validators(entry):
+        """
+        Cabeceras de una petición condicional para revalidar una entrada.
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since (vacío si no hay entrada o validadores)
+        """
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    # ------------------------------------------------------------------
+    # Mantenimiento
+    # ------------------------------------------------------------------
+
+    def entries(self):
+        """
+        Lista las entradas de la caché.
+
+        Returns:
+            list: Tuplas (ruta, tamaño en bytes, último acceso) de cada entrada
+        """
+        if not os.path.isdir(self.cache_dir):
+            return []
+        result = []
+        with os.scandir(self.cache_dir) as scan:
+            for item in scan:
+                if item.name.endswith('.json') and not item.name.startswith('tmp-'):
+                    stat = item.stat()
+                    result.append((item.path, stat.st_size, stat.st_mtime))
+        return result
+
+    def total_bytes(self):
+        """Tamaño total de las entradas de la caché en bytes (se calcula una vez y se actualiza)."""
+        if self._total is None:
+            self._total = sum(size for _, size, _ in self.entries())
+        return self._total
+
+    def evict(self):
+        """
+        Expulsa las entradas usadas menos recientemente hasta respetar max_bytes.
+
+        Returns:
+            int: Número de entradas expulsadas
+        """
+        entries = sorted(self.entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+        self._total = total
+        return evicted
+
+    def clear(self):
+        """Elimina todas las entradas de la caché."""
+        for path, _, _ in self.entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._total = 0
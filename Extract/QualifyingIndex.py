@@ -0,0 +1,209 @@
+import numpy as np
+import pandas as pd
+
+
+class QualifyingIndex:
+    """
+    Índices de consulta sobre los resultados de clasificación.
+
+    Se construyen una sola vez:
+    - Un índice ordenado por (Season, Round): las consultas por temporada,
+      ronda o rango de ellas son búsquedas binarias y, si los datos ya
+      están ordenados (como el CSV original), devuelven vistas (slices)
+      de los datos sin copiarlos.
+    - Índices hash por DriverID, ConstructorID y CircuitID: cada valor
+      apunta a la lista ordenada de posiciones de sus filas.
+
+    Las consultas combinadas parten de la lista de posiciones más corta y
+    filtran solo esas filas, sin recorrer el DataFrame completo.
+    """
+
+    KEY_COLUMNS = ['Season', 'Round']
+    HASH_COLUMNS = {'driver': 'DriverID', 'constructor': 'ConstructorID', 'circuit': 'CircuitID'}
+    # Las rondas de una temporada caben en este factor de la clave compuesta
+    _ROUND_FACTOR = 1000
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Construye los índices sobre los datos.
+
+        Args:
+            data (pd.DataFrame): Resultados de clasificación con Season, Round y
+                las columnas de HASH_COLUMNS que existan
+        """
+        missing = [col for col in self.KEY_COLUMNS if col not in data.columns]
+        if missing:
+            raise ValueError(f"Faltan las columnas necesarias para el índice: {missing}")
+
+        self.data = data
+        position_dtype = np.int32 if len(data) < 2 ** 31 else np.int64
+
+        # Índice ordenado: clave compuesta Season * 1000 + Round
+        keys = (data['Season'].to_numpy(dtype='int64') * self._ROUND_FACTOR
+                + data['Round'].to_numpy(dtype='int64'))
+        self._keys = keys
+        if len(keys) == 0 or np.all(keys[1:] >= keys[:-1]):
+            self._order = None
+            self._sorted_keys = keys
+        else:
+            self._order = np.argsort(keys, kind='stable').astype(position_dtype)
+            self._sorted_keys = keys[self._order]
+
+        # Índices hash: valor -> posiciones (ordenadas) de sus filas
+        self._hash = {}
+        for name, col in self.HASH_COLUMNS.items():
+            if col in data.columns:
+                self._hash[name] = self._build_hash_index(data[col], position_dtype)
+
+    @property
+    def is_clustered(self):
+        """True si los datos están ordenados por (Season, Round) y los rangos son vistas."""
+        return self._order is None
+
+    @staticmethod
+    def _build_hash_index(values, position_dtype):
+        """
+        Agrupa las posiciones de cada valor con un único ordenamiento estable.
+        Guarda también el código de cada fila para filtrar candidatos en O(k).
+        """
+        codes, uniques = pd.factorize(values)
+        codes = codes.astype(np.int32)
+        valid = codes >= 0
+        order = np.flatnonzero(valid)[np.argsort(codes[valid], kind='stable')].astype(position_dtype)
+        offsets = np.zeros(len(uniques) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes[valid], minlength=len(uniques)), out=offsets[1:])
+        return {'values': pd.Index(uniques), 'codes': codes, 'order': order, 'offsets': offsets}
+
+    def _key_bounds(self, season=None, round=None):
+        """Claves compuestas [inferior, superior) del filtro por temporada/ronda (o None)."""
+        if round is not None and (season is None or isinstance(season, tuple)):
+            raise ValueError("Para filtrar por ronda hay que indicar una única temporada")
+        if season is None:
+            return None
+        first_season, last_season = season if isinstance(season, tuple) else (season, season)
+        if round is None:
+            return first_season * self._ROUND_FACTOR, (last_season + 1) * self._ROUND_FACTOR
+        first_round, last_round = round if isinstance(round, tuple) else (round, round)
+        return (first_season * self._ROUND_FACTOR + first_round,
+                first_season * self._ROUND_FACTOR + last_round + 1)
+
+    def _key_range(self, bounds):
+        """Rango [inicio, fin) de posiciones en el índice ordenado."""
+        if bounds is None:
+            return 0, len(self._sorted_keys)
+        start, stop = np.searchsorted(self._sorted_keys, bounds, side='left')
+        return int(start), int(stop)
+
+    def _codes_for(self, name, value):
+        """Códigos del índice hash para un valor o lista de valores (sin los desconocidos)."""
+        values = value if isinstance(value, (list, tuple, set, np.ndarray, pd.Index)) else [value]
+        codes = self._hash[name]['values'].get_indexer(list(values))
+        return np.unique(codes[codes >= 0])
+
+    def _postings(self, name, codes):
+        """Posiciones ordenadas de las filas con alguno de los códigos."""
+        index = self._hash[name]
+        parts = [index['order'][index['offsets'][code]:index['offsets'][code + 1]] for code in codes]
+        if len(parts) == 1:
+            return parts[0]
+        if not parts:
+            return index['order'][:0]
+        return np.sort(np.concatenate(parts))
+
+    def positions(self, season=None, round=None, driver=None, constructor=None, circuit=None):
+        """
+        Posiciones (iloc) de las filas que cumplen todos los filtros.
+
+        Args:
+            season: Temporada (int) o rango inclusivo (inicio, fin)
+            round: Ronda (int) o rango inclusivo; requiere una única temporada
+            driver: DriverID o lista de DriverID
+            constructor: ConstructorID o lista de ConstructorID
+            circuit: CircuitID o lista de CircuitID
+
+        Returns:
+            np.ndarray: Posiciones ordenadas de las filas
+        """
+        bounds = self._key_bounds(season, round)
+        start, stop = self._key_range(bounds)
+        filters = {'driver': driver, 'constructor': constructor, 'circuit': circuit}
+        filters = {name: value for name, value in filters.items() if value is not None}
+
+        unknown = [name for name in filters if name not in self._hash]
+        if unknown:
+            raise ValueError(f"No hay índice para los filtros: {unknown}")
+
+        if not filters:
+            if self._order is None:
+                return np.arange(start, stop)
+            return np.sort(self._order[start:stop])
+
+        # Se parte de la lista de posiciones más corta (incluido el rango de
+        # temporadas si los datos están ordenados) y se filtran solo esas filas
+        codes = {name: self._codes_for(name, value) for name, value in filters.items()}
+        sizes = {name: int(sum(self._hash[name]['offsets'][c + 1] - self._hash[name]['offsets'][c]
+                               for c in codes[name])) for name in filters}
+        first = min(sizes, key=sizes.get)
+
+        if self._order is None and stop - start < sizes[first]:
+            result = np.arange(start, stop)
+            remaining = list(filters)
+        else:
+            result = self._postings(first, codes[first])
+            remaining = [name for name in filters if name != first]
+            if bounds is not None:
+                if self._order is None:
+                    low, high = np.searchsorted(result, [start, stop])
+                    result = result[low:high]
+                else:
+                    row_keys = self._keys[result]
+                    result = result[(row_keys >= bounds[0]) & (row_keys < bounds[1])]
+
+        for name in remaining:
+            result = result[np.isin(self._hash[name]['codes'][result], codes[name])]
+        return result
+
+    def query(self, season=None, round=None, driver=None, constructor=None, circuit=None):
+        """
+        Filas que cumplen todos los filtros (ver positions).
+
+        Si solo se filtra por temporada/ronda y los datos están ordenados, el
+        resultado es una vista (slice) de los datos; en otro caso se copian
+        únicamente las filas encontradas.
+
+        Returns:
+            pd.DataFrame: Filas encontradas
+        """
+        filters = (driver, constructor, circuit)
+        if all(value is None for value in filters) and self._order is None:
+            start, stop = self._key_range(self._key_bounds(season, round))
+            return self.data.iloc[start:stop]
+        return self.data.iloc[self.positions(season, round, driver, constructor, circuit)]
+
+    def grid(self, season, round):
+        """Parrilla de clasificación de una ronda."""
+        return self.query(season=season, round=round)
+
+    def season(self, season):
+        """Resultados de una temporada (o rango inclusivo de temporadas)."""
+        return self.query(season=season)
+
+    def driver_history(self, driver, season=None):
+        """Historial de clasificación de un piloto (opcionalmente en una temporada o rango)."""
+        return self.query(season=season, driver=driver)
+
+    def constructor_season(self, constructor, season):
+        """Resultados de un constructor en una temporada."""
+        return self.query(season=season, constructor=constructor)
+
+    def values(self, name):
+        """
+        Valores indexados de un filtro hash.
+
+        Args:
+            name (str): 'driver', 'constructor' o 'circuit'
+
+        Returns:
+            pd.Index: Valores distintos
+        """
+        return self._hash[name]['values']
@@ -0,0 +1,98 @@
+"""
+Pruebas del procesamiento por lotes en paralelo (BatchProcessor)
+"""
+
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+
+import pandas as pd
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from Clean.batch import BatchProcessor
+from Clean.cleaner import DataCleaner
+from Clean.csv_manager import CSVManager
+from Clean.report import CleaningReport
+from Test_CLI import temporary_cache
+
+# El paquete exporta la clase con el mismo nombre que su módulo
+batch_module = importlib.import_module('Clean.batch.BatchProcessor')
+
+
+def _split_by_season(directory, seasons):
+    data = CSVManager.load_csv("Sources/qualifying_results.csv", use_cache=False)
+    for season in seasons:
+        data[data['Season'] == season].to_csv(os.path.join(directory, f"qualifying_{season}.csv"), index=False)
+
+
+def test_batch_matches_sequential_processing():
+    """Los resúmenes consolidados coinciden con procesar cada archivo por separado"""
+    print("\n📦 === LOTE EN PARALELO ===")
+    work_dir = tempfile.mkdtemp()
+    source_dir = os.path.join(work_dir, 'sources')
+    output_dir = os.path.join(work_dir, 'clean')
+    os.makedirs(source_dir)
+    try:
+        _split_by_season(source_dir, range(2000, 2006))
+        # Un archivo vacío falla sin afectar al resto del lote
+        open(os.path.join(source_dir, 'empty.csv'), 'w').close()
+
+        # Los procesos del pool se crean con fork y heredan la caché temporal
+        with temporary_cache():
+            result = BatchProcessor(strategy='remove_rows', workers=2, output_dir=output_dir).run(source_dir)
+        totals = result['totals']
+        assert totals['files'] == 7 and totals['succeeded'] == 6 and totals['failed'] == 1
+        failed = [r for r in result['files'] if r['status'] == 'error']
+        assert os.path.basename(failed[0]['file']) == 'empty.csv'
+
+        expected_nulls = 0
+        for file_result in result['files']:
+            if file_result['status'] == 'error':
+                continue
+            original = pd.read_csv(file_result['file'])
+            cleaned = DataCleaner(original).clean_data(strategy='remove_rows')
+            expected = CleaningReport(original, cleaned).get_cleaning_summary()
+            assert file_result['summary'] == expected
+            pd.testing.assert_frame_equal(pd.read_csv(file_result['output_path']), cleaned.reset_index(drop=True))
+            expected_nulls += expected['original_nulls']
+
+        assert totals['original_nulls'] == expected_nulls
+        BatchProcessor.print_summary(result)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def test_worker_crash_is_isolated():
+    """La caída de un proceso solo marca como erróneo el archivo que la provoca"""
+    print("\n📦 === CAÍDA DE UN PROCESO ===")
+    work_dir = tempfile.mkdtemp()
+    run_stages = batch_module._run_stages
+
+    def crashing_run_stages(csv_path, options):
+        if csv_path.endswith('2001.csv'):
+            os._exit(1)
+        return run_stages(csv_path, options)
+
+    # Los procesos del pool se crean con fork y heredan la función sustituida
+    batch_module._run_stages = crashing_run_stages
+    try:
+        _split_by_season(work_dir, range(2000, 2004))
+        with temporary_cache():
+            result = BatchProcessor(workers=2, output_dir=os.path.join(work_dir, 'clean')).run(work_dir)
+        statuses = {os.path.basename(r['file']): r['status'] for r in result['files']}
+        assert statuses == {'qualifying_2000.csv': 'ok', 'qualifying_2001.csv': 'error',
+                            'qualifying_2002.csv': 'ok', 'qualifying_2003.csv': 'ok'}
+        print(f"  ✅ {statuses}")
+    finally:
+        batch_module._run_stages = run_stages
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_batch_matches_sequential_processing()
+    test_worker_crash_is_isolated()
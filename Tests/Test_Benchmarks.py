@@ -0,0 +1,76 @@
+"""
+Pruebas del generador sintético y de la comparación con líneas base
+(Benchmarks/SyntheticQualifying.py y Benchmarks/Benchmark_Pipeline.py)
+"""
+
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Benchmarks"))
+
+from Benchmark_Pipeline import compare, measure
+from SyntheticQualifying import SOURCE_CSV, generate, write_csv
+
+
+def test_synthetic_data_matches_source():
+    """El generador reproduce columnas, tipos y patrones de nulos del CSV real"""
+    print("\n🧪 === DATOS SINTÉTICOS ===")
+    source = pd.read_csv(SOURCE_CSV)
+    synthetic = generate(50_000, seed=1)
+
+    assert list(synthetic.columns) == list(source.columns)
+    assert (synthetic.dtypes == source.dtypes).all()
+    assert len(synthetic) == 50_000
+    # Claves (Season, Round, DriverID) únicas y ordenadas
+    assert not synthetic.duplicated(['Season', 'Round', 'DriverID']).any()
+    assert synthetic['Season'].is_monotonic_increasing
+
+    for col in ['Code', 'Q1', 'Q2', 'Q3']:
+        source_rate = (source[col].isna() | (source[col] == '0')).mean()
+        synthetic_rate = (synthetic[col].isna() | (synthetic[col] == '0')).mean()
+        assert abs(source_rate - synthetic_rate) < 0.03, col
+        print(f"  ✅ {col}: {source_rate:.3f} real / {synthetic_rate:.3f} sintético")
+
+    typed = generate(1000, seed=1, schema='auto')
+    assert isinstance(typed['DriverID'].dtype, pd.CategoricalDtype)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        path = write_csv(2500, os.path.join(work_dir, 'synthetic.csv'), chunk_rows=1000)
+        written = pd.read_csv(path)
+        assert len(written) == 2500
+        assert not written.duplicated(['Season', 'Round', 'DriverID']).any()
+    print("  ✅ CSV por bloques sin claves repetidas")
+
+
+def test_compare_flags_regressions():
+    """La comparación marca solo los casos que superan el umbral"""
+    print("\n🧪 === COMPARACIÓN CON LÍNEA BASE ===")
+    baseline = {'results': {'1000': {
+        'a': {'seconds': 1.0, 'peak_mb': 100.0},
+        'b': {'seconds': 1.0, 'peak_mb': 100.0},
+        'c': {'seconds': 0.001, 'peak_mb': 0.1},
+    }}}
+    current = {'results': {'1000': {
+        'a': {'seconds': 1.2, 'peak_mb': 100.0},
+        'b': {'seconds': 1.0, 'peak_mb': 180.0},
+        'c': {'seconds': 0.003, 'peak_mb': 0.5},
+        'nuevo': {'seconds': 5.0, 'peak_mb': 500.0},
+    }}}
+    regressions = compare(current, baseline, threshold=0.25)
+    assert [(item['case'], item['metric']) for item in regressions] == [('b', 'peak_mb')]
+    assert len(compare(current, baseline, threshold=0.1)) == 2
+    print(f"  ✅ Regresiones: {regressions}")
+
+    measurement = measure(lambda: [0] * 1_000_000, repeat=2)
+    assert measurement['seconds'] > 0 and measurement['peak_mb'] > 5
+    print(f"  ✅ Medición: {measurement}")
+
+
+if __name__ == "__main__":
+    test_synthetic_data_matches_source()
+    test_compare_flags_regressions()
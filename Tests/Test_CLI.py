@@ -0,0 +1,119 @@
+"""
+Pruebas de la línea de comandos (python -m Clean) y de la carga perezosa del paquete
+"""
+
+import contextlib
+import os
+import subprocess
+import sys
+import tempfile
+
+import pandas as pd
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Config.Config import Config
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE = os.path.join("Sources", "qualifying_results.csv")
+
+
+@contextlib.contextmanager
+def temporary_cache():
+    """
+    Apunta Config.CACHE_DIR a una carpeta temporal durante el bloque, para que
+    las cargas de CSV temporales no dejen entradas en la caché del proyecto.
+    """
+    previous = Config.CACHE_DIR
+    with tempfile.TemporaryDirectory() as cache_dir:
+        Config.CACHE_DIR = cache_dir
+        try:
+            yield cache_dir
+        finally:
+            Config.CACHE_DIR = previous
+
+
+def run_cli(*arguments, module=True):
+    """Ejecuta python -m Clean (o python -c) en un proceso nuevo desde la raíz del proyecto."""
+    command = [sys.executable, '-m', 'Clean', *arguments] if module else [sys.executable, '-c', *arguments]
+    return subprocess.run(command, cwd=PROJECT_ROOT, capture_output=True, text=True, encoding='utf-8')
+
+
+def test_lazy_import():
+    """import Clean no carga pandas hasta acceder a una clase"""
+    print("\n💤 === CARGA PEREZOSA ===")
+    result = run_cli("import sys, Clean; print('pandas' in sys.modules); "
+                     "Clean.CSVManager; print('pandas' in sys.modules)", module=False)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ['False', 'True']
+
+    result = run_cli("import Clean; print(all(name in dir(Clean) for name in Clean.__all__))", module=False)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == 'True'
+    print("✅ pandas solo se importa al usar el paquete")
+
+
+def test_help_and_errors():
+    """--help responde sin cargar los datos y los errores terminan con código distinto de 0"""
+    print("\n❓ === AYUDA Y ERRORES ===")
+    result = run_cli('--help')
+    assert result.returncode == 0
+    for command in ('analyze', 'clean', 'report', 'batch'):
+        assert command in result.stdout
+
+    assert run_cli().returncode != 0
+    assert run_cli('analyze', 'no_existe.csv', '-q').returncode != 0
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        result = run_cli('clean', SOURCE, '-q', '-s', 'no_existe', '-o', os.path.join(work_dir, 'out.csv'))
+        assert result.returncode != 0
+        assert 'no_existe' in result.stderr
+    print("✅ Ayuda y errores correctos")
+
+
+def test_analyze_quiet():
+    """analyze --quiet imprime una sola línea con el resumen"""
+    print("\n🔎 === ANALYZE --quiet ===")
+    result = run_cli('analyze', SOURCE, '--quiet')
+    assert result.returncode == 0, result.stderr
+    lines = result.stdout.strip().splitlines()
+    assert len(lines) == 1
+    assert '8918 filas' in lines[0] and '17 columnas' in lines[0]
+
+    verbose = run_cli('analyze', SOURCE)
+    assert verbose.returncode == 0
+    assert len(verbose.stdout.splitlines()) > 1
+    print(f"✅ {lines[0]}")
+
+
+def test_clean_and_report():
+    """clean escribe en la ruta indicada y report compara original y limpio"""
+    print("\n🧹 === CLEAN Y REPORT ===")
+    with tempfile.TemporaryDirectory() as work_dir:
+        output = os.path.join(work_dir, 'limpio.csv')
+        result = run_cli('clean', SOURCE, '-s', 'fill_mean', '-o', output, '--quiet')
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == output
+        cleaned = pd.read_csv(output)
+        assert cleaned.shape == (8918, 17)
+        assert cleaned['Code'].isnull().sum() == 0
+
+        result = run_cli('report', SOURCE, output, '--quiet', '--no-cache')
+        assert result.returncode == 0, result.stderr
+        lines = result.stdout.strip().splitlines()
+        assert len(lines) == 1
+        assert 'nulos 244 -> 0' in lines[0]
+
+        # Sin CSV limpio, report limpia en memoria
+        result = run_cli('report', SOURCE, '-s', 'remove_rows', '--quiet')
+        assert result.returncode == 0, result.stderr
+        assert '(8674, 17)' in result.stdout
+    print("✅ clean y report correctos")
+
+
+if __name__ == "__main__":
+    test_lazy_import()
+    test_help_and_errors()
+    test_analyze_quiet()
+    test_clean_and_report()
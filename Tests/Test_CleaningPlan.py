@@ -0,0 +1,101 @@
+"""
+Pruebas de los planes de limpieza por columna (CleaningPlan)
+Verifica que la pasada única equivale a encadenar las estrategias existentes
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Clean.cleaner import DataCleaner, CleaningPlan
+from Clean.csv_manager import CSVManager
+from Clean.schema import LapTimeParser
+
+SOURCE = "Sources/qualifying_results.csv"
+
+
+def _sequential(data, plan):
+    """Aplica el plan encadenando limpiadores sobre subconjuntos de columnas."""
+    strategies = plan.resolve(data)
+    by_strategy = {}
+    for col, strategy in strategies.items():
+        by_strategy.setdefault(strategy, []).append(col)
+
+    drop = np.zeros(len(data), dtype=bool)
+    if callable(plan.drop_rows):
+        drop |= np.asarray(plan.drop_rows(data), dtype=bool)
+    row_columns = by_strategy.get('remove_rows', []) + list(plan.drop_rows if isinstance(plan.drop_rows, list) else [])
+    if row_columns:
+        kept = DataCleaner(data[row_columns]).clean_data('remove_rows').index
+        drop |= ~data.index.isin(kept)
+    data = data[~drop].copy()
+
+    if by_strategy.get('remove_columns'):
+        cols = by_strategy['remove_columns']
+        kept = DataCleaner(data[cols]).clean_data('remove_columns', threshold=plan.threshold).columns
+        data = data.drop(columns=[col for col in cols if col not in kept])
+
+    for strategy in CleaningPlan.FILL_STRATEGIES:
+        cols = [col for col in by_strategy.get(strategy, []) if col in data.columns]
+        if cols:
+            cleaned = DataCleaner(data[cols]).clean_data(strategy)
+            for col in cols:
+                data[col] = cleaned[col]
+    return data
+
+
+PLANS = [
+    CleaningPlan(columns={'Q1': 'fill_forward', 'Q2': 'fill_forward', 'Q3': 'fill_forward',
+                          'Code': 'fill_mean', 'PermanentNumber': 'fill_zero'},
+                 drop_rows=['DriverID']),
+    CleaningPlan(dtypes={'number': 'fill_mean', 'object': 'fill_forward', 'category': 'fill_forward'},
+                 columns={'Code': 'remove_rows'}),
+    CleaningPlan(columns={'Code': 'remove_columns', 'Q3': 'remove_columns', 'Q2': 'fill_zero'},
+                 default='fill_mean', threshold=0.3,
+                 drop_rows=lambda data: data['Season'] < 2003),
+    CleaningPlan(default='fill_zero'),
+]
+
+
+def test_plan_matches_sequential_strategies():
+    """Cada plan da el mismo resultado que aplicar las estrategias una tras otra"""
+    print("\n🗺️  === PLANES DE LIMPIEZA ===")
+    untyped = CSVManager.load_csv(SOURCE, use_cache=False)
+    typed = CSVManager.load_csv(SOURCE, schema='auto', use_cache=False)
+    # Con los tiempos en milisegundos Q2/Q3 tienen nulos ('Int64')
+    datasets = {'sin esquema': untyped, 'tipado': typed, 'milisegundos': LapTimeParser.parse_columns(typed)}
+    for name, data in datasets.items():
+        for plan in PLANS:
+            expected = _sequential(data, plan)
+            result = DataCleaner(data).clean_data(strategy=plan)
+            pd.testing.assert_frame_equal(result, expected)
+
+            # Modo ligero: mismo resultado y los originales se pueden restaurar
+            lean_data = data.copy()
+            cleaner = DataCleaner(lean_data, lean=True)
+            pd.testing.assert_frame_equal(cleaner.clean_plan(plan), expected)
+            pd.testing.assert_frame_equal(cleaner.get_original_data(), data)
+            print(f"  ✅ {plan} ({name}): {result.shape}")
+
+
+def test_invalid_plans():
+    """Estrategias y columnas desconocidas lanzan ValueError"""
+    print("\n🗺️  === PLANES NO VÁLIDOS ===")
+    data = pd.DataFrame({'Season': [2024, None], 'Q1': ['1:30.000', None]})
+    for make in (lambda: CleaningPlan(columns={'Q1': 'fill_median'}),
+                 lambda: DataCleaner(data).clean_data(strategy={'Q9': 'fill_zero'})):
+        try:
+            make()
+            raise AssertionError("Se esperaba ValueError")
+        except ValueError as e:
+            print(f"  ✅ Error esperado: {e}")
+
+
+if __name__ == "__main__":
+    test_plan_matches_sequential_strategies()
+    test_invalid_plans()
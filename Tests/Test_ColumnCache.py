@@ -0,0 +1,130 @@
+"""
+Pruebas de la caché binaria por columnas (ColumnCache)
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Clean.cache import ColumnCache
+from Clean.csv_manager import CSVManager
+from Clean.schema import SchemaRegistry
+from Extract.Formula1Extract import Formula1Extract
+
+SOURCE = CSVManager.get_input_path("Sources/qualifying_results.csv")
+
+
+def test_round_trip_matches_read_csv():
+    """Los datos cacheados (con y sin esquema) son idénticos a los del CSV"""
+    print("\n⚡ === IDA Y VUELTA POR LA CACHÉ ===")
+    cache = ColumnCache(tempfile.mkdtemp())
+    try:
+        for dataset_schema in (None, SchemaRegistry.get('qualifying_results')):
+            reader = dataset_schema.read_csv if dataset_schema is not None else pd.read_csv
+            variant = ColumnCache.variant_for(dataset_schema)
+
+            _, from_cache = cache.load(SOURCE, reader, variant)
+            assert not from_cache
+
+            start = time.perf_counter()
+            cached, from_cache = cache.load(SOURCE, reader, variant)
+            seconds = time.perf_counter() - start
+            assert from_cache
+            pd.testing.assert_frame_equal(cached, reader(SOURCE))
+
+            # Los arrays con memory-map son copy-on-write: se pueden modificar
+            cached.loc[0, 'Season'] = 0
+            print(f"  ✅ {variant}: {seconds * 1000:.1f} ms desde caché")
+
+        assert len(cache.entries()) == 2
+    finally:
+        cache.clear()
+
+
+def test_invalidation_on_file_change():
+    """Cambiar el contenido invalida la entrada; cambiar solo la fecha no"""
+    print("\n⚡ === INVALIDACIÓN ===")
+    work_dir = tempfile.mkdtemp()
+    cache = ColumnCache(os.path.join(work_dir, 'cache'))
+    csv_path = os.path.join(work_dir, 'data.csv')
+    try:
+        pd.DataFrame({'a': [1, 2, 3], 'b': ['x', None, 'z']}).to_csv(csv_path, index=False)
+        cache.load(csv_path, pd.read_csv)
+
+        # Misma información con otra fecha de modificación: se compara el hash
+        stat = os.stat(csv_path)
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        _, from_cache = cache.load(csv_path, pd.read_csv)
+        assert from_cache
+
+        # Mismo tamaño pero distinto contenido: la entrada queda obsoleta
+        pd.DataFrame({'a': [1, 2, 4], 'b': ['x', None, 'z']}).to_csv(csv_path, index=False)
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+        data, from_cache = cache.load(csv_path, pd.read_csv)
+        assert not from_cache
+        assert data['a'].tolist() == [1, 2, 4]
+        print("  ✅ Entradas obsoletas descartadas automáticamente")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def test_lru_eviction():
+    """Al superar el tamaño máximo se expulsa la entrada usada hace más tiempo"""
+    print("\n⚡ === EXPULSIÓN LRU ===")
+    work_dir = tempfile.mkdtemp()
+    paths = [os.path.join(work_dir, f"data_{i}.csv") for i in range(3)]
+    for i, path in enumerate(paths):
+        pd.DataFrame({'value': range(i, i + 1000)}).to_csv(path, index=False)
+
+    cache = ColumnCache(os.path.join(work_dir, 'cache'))
+    try:
+        cache.load(paths[0], pd.read_csv)
+        entry_bytes = cache.total_bytes()
+        cache.max_bytes = 2 * entry_bytes
+
+        cache.load(paths[1], pd.read_csv)
+        # Usar la primera entrada la convierte en la más reciente
+        assert cache.load(paths[0], pd.read_csv)[1]
+        cache.load(paths[2], pd.read_csv)
+
+        assert cache.total_bytes() <= cache.max_bytes
+        assert cache.get(paths[1]) is None
+        assert cache.get(paths[0]) is not None and cache.get(paths[2]) is not None
+        print(f"  ✅ {len(cache.entries())} entradas, {cache.total_bytes()} bytes")
+
+        # Las entradas de archivos borrados se eliminan aunque quepan en la caché
+        cache.max_bytes = 100 * entry_bytes
+        os.remove(paths[0])
+        assert cache.evict() == 1
+        assert [meta['path'] for _, meta in cache.entries()] == [os.path.abspath(paths[2])]
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def test_broken_cache_falls_back_to_csv(monkeypatch):
+    """Con la caché inutilizable, CSVManager y Formula1Extract cargan el CSV directamente"""
+    print("\n⚡ === CACHÉ INUTILIZABLE ===")
+    with tempfile.TemporaryDirectory() as work_dir:
+        # La carpeta de la caché es un archivo: no se puede crear ni leer
+        blocked = os.path.join(work_dir, 'cache')
+        with open(blocked, 'w') as f:
+            f.write('no es una carpeta')
+        monkeypatch.setattr(ColumnCache, 'default', staticmethod(lambda: ColumnCache(blocked)))
+
+        expected = pd.read_csv(SOURCE)
+        pd.testing.assert_frame_equal(Formula1Extract(SOURCE).queries(use_cache=True), expected)
+        pd.testing.assert_frame_equal(CSVManager.load_csv(SOURCE, use_cache=True), expected)
+    print("  ✅ Carga directa sin caché")
+
+
+if __name__ == "__main__":
+    test_round_trip_matches_read_csv()
+    test_invalidation_on_file_change()
+    test_lru_eviction()
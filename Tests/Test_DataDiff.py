@@ -0,0 +1,111 @@
+"""
+Pruebas de la comparación fila a fila (DataDiff) entre los datos originales
+y los limpios
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from Clean.cleaner import DataCleaner
+from Clean.report import CleaningReport, DataDiff
+from Test_CLI import run_cli
+
+SOURCE = "Sources/qualifying_results.csv"
+KEY = ['Season', 'Round', 'DriverID']
+
+
+def test_cleaning_strategies():
+    """Las filas eliminadas y las celdas rellenadas coinciden con lo que hizo la limpieza"""
+    print("\n🔍 === DIFERENCIAS POR ESTRATEGIA ===")
+    data = pd.read_csv(SOURCE)
+    null_rows = np.flatnonzero(data.isna().any(axis=1).to_numpy())
+
+    removed = DataDiff(data, DataCleaner(data).clean_data(strategy='remove_rows'))
+    assert np.array_equal(removed.removed, null_rows)
+    assert len(removed.added) == 0 and len(removed.modified) == 0
+    pd.testing.assert_frame_equal(removed.removed_rows(), data.iloc[null_rows])
+
+    filled = DataCleaner(data).clean_data(strategy='fill_zero')
+    diff = DataDiff(data, filled)
+    summary = diff.summary()
+    assert summary['rows_removed'] == 0 and summary['rows_modified'] == len(null_rows)
+    assert summary['cells_changed'] == summary['cells_filled'] == int(data.isna().sum().sum())
+    changes = diff.cell_changes()
+    assert (changes['kind'] == 'filled').all() and changes['before'].isna().all()
+    assert (changes['after'] == filled.loc[changes['row'], 'Code'].to_numpy()).all()
+    assert diff.cell_mask.shape == (len(null_rows), len(data.columns))
+
+    # Modo ligero: los datos originales se reconstruyen con la instantánea
+    lean = DataCleaner(data.copy(), lean=True)
+    lean_clean = lean.clean_data(strategy='fill_zero')
+    lean_summary = CleaningReport(lean.original_data, lean_clean).get_row_diff().summary()
+    assert lean_summary['cells_filled'] == summary['cells_filled']
+    print(f"✅ {len(null_rows)} filas eliminadas o rellenadas")
+
+
+def test_key_and_content_matching():
+    """Tras perder el índice, la clave empareja filas; el contenido solo detecta filas iguales"""
+    print("\n🔑 === EMPAREJAMIENTO POR CLAVE Y CONTENIDO ===")
+    data = pd.read_csv(SOURCE)
+    cleaned = DataCleaner(data).clean_data(strategy='remove_rows').reset_index(drop=True)
+    cleaned.loc[3, 'Position'] = 99
+    cleaned.loc[4, 'Q1'] = np.nan
+    cleaned = pd.concat([cleaned, cleaned.iloc[[7]]], ignore_index=True)
+
+    diff = DataDiff(data, cleaned, key=KEY)
+    summary = diff.summary()
+    assert summary['rows_removed'] == 244 and summary['rows_added'] == 1
+    assert summary['rows_modified'] == 2 and summary['cells_by_column'] == {'Position': 1, 'Q1': 1}
+    changes = diff.cell_changes().set_index('column')
+    assert changes.loc['Position', 'before'] != 99 and changes.loc['Position', 'after'] == 99
+    assert changes.loc['Q1', 'kind'] == 'nulled'
+    assert diff.added_rows().index.tolist() == [len(cleaned) - 1]
+
+    content = DataDiff(data, cleaned, key='content').summary()
+    assert content['rows_removed'] == 246 and content['rows_added'] == 3 and content['rows_modified'] == 0
+
+    # Tipos distintos (entero frente a float) no rompen el emparejamiento
+    typed = data.astype({'Season': 'float64', 'Code': 'category'})
+    assert DataDiff(data, typed, key=KEY).summary()['cells_changed'] == 0
+    with pytest.raises(ValueError):
+        DataDiff(data, cleaned, key=['NoExiste'])
+    with pytest.raises(ValueError):
+        DataDiff(pd.concat([data, data]), cleaned)
+    print("✅ Filas emparejadas por clave")
+
+
+def test_large_and_cli():
+    """Un millón de filas se compara en segundos y report --diff lo resume"""
+    print("\n⏱️  === DIFERENCIAS A GRAN ESCALA ===")
+    data = pd.concat([pd.read_csv(SOURCE)] * 112, ignore_index=True)
+    cleaned = DataCleaner(data).clean_data(strategy='fill_mean')
+    start = time.perf_counter()
+    diff = DataDiff(data, cleaned)
+    seconds = time.perf_counter() - start
+    assert diff.summary()['cells_filled'] == int(data.isna().sum().sum())
+    assert diff.nbytes < int(data.memory_usage(deep=True).sum()) / 20
+    assert seconds < 10
+    print(f"✅ {len(data)} filas en {seconds:.2f}s, {diff.nbytes} bytes")
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        output = os.path.join(work_dir, 'limpio.csv')
+        DataCleaner(pd.read_csv(SOURCE)).clean_data(strategy='remove_rows').to_csv(output, index=False)
+        result = run_cli('report', SOURCE, output, '--diff', '-q', '--no-cache')
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip().splitlines()[-1] == 'filas -244 +0 ~0, celdas 0 (0 rellenadas)'
+
+
+if __name__ == "__main__":
+    test_cleaning_strategies()
+    test_key_and_content_matching()
+    test_large_and_cli()
@@ -0,0 +1,96 @@
+"""
+Pruebas del perfil memorizado (DataProfile) compartido por analizador y reportes
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Clean.analyzer import DataAnalyzer, DataProfile
+from Clean.cleaner import DataCleaner
+from Clean.csv_manager import CSVManager
+from Clean.report import CleaningReport
+
+
+def test_profile_is_shared_and_matches_full_scan():
+    """Un único perfil por DataFrame con los mismos valores que un escaneo completo"""
+    print("\n🧾 === PERFIL COMPARTIDO ===")
+    data = CSVManager.load_csv("Sources/qualifying_results.csv")
+
+    cleaner = DataCleaner(data)
+    analyzer = DataAnalyzer(cleaner.original_data)
+    cleaned = cleaner.clean_data(strategy='remove_rows')
+    report = CleaningReport(cleaner.original_data, cleaned)
+
+    assert analyzer.profile is report.original_analyzer.profile
+    assert report.cleaned_analyzer.profile is DataProfile.of(cleaned)
+
+    summary = report.get_cleaning_summary()
+    assert summary['original_nulls'] == data.isnull().sum().sum()
+    assert summary['remaining_nulls'] == cleaned.isnull().sum().sum()
+    assert summary['original_quality_score'] == data.notna().sum().sum() / data.size * 100
+    print(f"  ✅ Nulos originales: {summary['original_nulls']}, restantes: {summary['remaining_nulls']}")
+
+
+def test_profile_invalidated_on_in_place_cleaning():
+    """fill_mean modifica los datos en el sitio y descarta el perfil anterior"""
+    print("\n🧾 === INVALIDACIÓN DEL PERFIL ===")
+    data = CSVManager.load_csv("Sources/qualifying_results.csv")
+    cleaner = DataCleaner(data)
+
+    before = DataProfile.of(cleaner.data)
+    assert before.total_nulls > 0
+
+    cleaned = cleaner.clean_data(strategy='fill_mean')
+    after = DataProfile.of(cleaned)
+    assert after is not before
+    assert after.total_nulls == 0
+    print(f"  ✅ Nulos antes: {before.total_nulls}, después: {after.total_nulls}")
+
+
+def test_user_data_mutated_in_place_is_reanalyzed():
+    """Los datos del usuario modificados en el sitio se vuelven a perfilar"""
+    print("\n🧾 === DATOS DEL USUARIO MODIFICADOS EN EL SITIO ===")
+    data = pd.DataFrame({'a': [1.0, np.nan, 3.0], 'b': ['x', None, 'z']})
+    analyzer = DataAnalyzer(data)
+    assert analyzer.analyze_null_values()['total_null_values'] == 2
+
+    data.fillna(0, inplace=True)
+    assert DataAnalyzer(data).analyze_null_values()['total_null_values'] == data.isna().sum().sum() == 0
+    assert analyzer.get_data_quality_score() == 100
+    data.loc[0, 'a'] = np.nan
+    assert analyzer.get_data_quality_score() == data.notna().sum().sum() / data.size * 100
+
+    # Los datos del limpiador sí se memorizan
+    cleaned = DataCleaner(data).clean_data(strategy='fill_zero')
+    assert DataProfile.of(cleaned) is DataProfile.of(cleaned)
+    assert DataProfile.of(data) is not DataProfile.of(data)
+    print("  ✅ Perfil recalculado tras fillna(inplace=True) y df.loc[...]")
+
+
+def test_lean_snapshot_profile_is_detached():
+    """El perfil de la instantánea del modo ligero no depende de los datos limpiados en el sitio"""
+    print("\n🧾 === PERFIL DE LA INSTANTÁNEA ===")
+    data = CSVManager.load_csv("Sources/qualifying_results.csv")
+    duplicates = data.duplicated().sum()
+    memory = data.memory_usage(deep=True).sum()
+    cleaner = DataCleaner(data, lean=True)
+    cleaner.clean_data(strategy='fill_zero')
+    profile = DataAnalyzer(cleaner.original_data).profile
+    assert profile.memory_usage == memory and profile.duplicate_rows == duplicates
+    with pytest.raises(ValueError):
+        DataProfile.share(data, cleaner.original_data)
+    print(f"  ✅ Memoria {memory} bytes, duplicados {duplicates}")
+
+
+if __name__ == "__main__":
+    test_profile_is_shared_and_matches_full_scan()
+    test_profile_invalidated_on_in_place_cleaning()
+    test_user_data_mutated_in_place_is_reanalyzed()
+    test_lean_snapshot_profile_is_detached()
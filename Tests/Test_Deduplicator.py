@@ -0,0 +1,143 @@
+"""
+Pruebas de la deduplicación por clave (Deduplicator) en memoria y por bloques
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from Clean.cleaner import DataCleaner, Deduplicator
+from Clean.csv_manager import CSVManager
+from Clean.report import CleaningReport
+from Test_CLI import temporary_cache
+
+SOURCE = "Sources/qualifying_results.csv"
+KEY = ['Season', 'Round', 'DriverID']
+
+
+def duplicated_feed(seed=7):
+    """
+    Fuente con duplicados sintéticos: una segunda fuente repite 300 filas
+    (algunas dos veces) con Q1/Q2/Q3 borrados o cambiados, mezcladas al azar.
+    """
+    rng = np.random.default_rng(seed)
+    data = pd.read_csv(SOURCE)
+    repeats = data.sample(300, random_state=seed)
+    repeats = pd.concat([repeats, repeats.iloc[:50]])
+    for col in ('Q1', 'Q2', 'Q3'):
+        repeats[col] = repeats[col].where(rng.random(len(repeats)) < 0.5)
+    repeats['Position'] = repeats['Position'] + 100
+    feed = pd.concat([data, repeats])
+    return feed.iloc[rng.permutation(len(feed))].reset_index(drop=True)
+
+
+def test_policies():
+    """Cada política deja una fila por clave y elige la fila esperada"""
+    print("\n🔑 === POLÍTICAS DE DEDUPLICACIÓN ===")
+    data = pd.DataFrame({
+        'Season': [2024, 2024, 2024, 2024, 2023],
+        'Round': [1, 1, 1, 2, 1],
+        'DriverID': ['max', 'max', 'max', 'max', 'max'],
+        'Q1': ['1:30.000', None, '1:29.000', '1:31.000', '1:32.000'],
+        'Q2': [None, '1:28.500', None, None, None],
+        'Q3': ['1:27.000', '1:27.500', None, None, None],
+    })
+
+    latest = Deduplicator(policy='latest')
+    result = latest.resolve(data)
+    assert list(result.index) == [2, 3, 4]
+    assert latest.stats['duplicates_resolved'] == 2 and latest.stats['duplicate_keys'] == 1
+
+    complete = Deduplicator(policy='most_complete').resolve(data)
+    assert list(complete.index) == [1, 3, 4]
+
+    merger = Deduplicator(policy='merge')
+    merged = merger.resolve(data)
+    assert list(merged.index) == [2, 3, 4]
+    assert merged.loc[2, ['Q1', 'Q2', 'Q3']].tolist() == ['1:29.000', '1:28.500', '1:27.500']
+    assert merger.stats['merged_cells'] == 2
+    # Las filas sin duplicados no cambian
+    pd.testing.assert_frame_equal(merged.loc[[3, 4]], data.loc[[3, 4]])
+
+    with pytest.raises(ValueError):
+        Deduplicator(policy='first')
+    with pytest.raises(ValueError):
+        Deduplicator(key=['Season', 'Carrera']).resolve(data)
+    print("✅ latest, most_complete y merge correctos")
+
+
+def test_streaming_matches_memory():
+    """La deduplicación por bloques da el mismo resultado que en memoria"""
+    print("\n🌊 === DEDUPLICACIÓN POR BLOQUES ===")
+    feed = duplicated_feed()
+    with tempfile.TemporaryDirectory() as work_dir:
+        source = os.path.join(work_dir, 'feed.csv')
+        feed.to_csv(source, index=False)
+        original = pd.read_csv(source)
+        for policy in Deduplicator.POLICIES:
+            expected = Deduplicator(policy=policy).resolve(original)
+            assert not expected.duplicated(KEY).any()
+            assert len(expected) == len(original) - 350
+
+            streaming = Deduplicator(policy=policy)
+            output = os.path.join(work_dir, f'{policy}.csv')
+            stats = streaming.resolve_csv(source, output, chunksize=700)
+            pd.testing.assert_frame_equal(pd.read_csv(output), expected.reset_index(drop=True))
+            assert stats['duplicates_resolved'] == len(original) - len(expected)
+            print(f"✅ {policy}: {stats['duplicates_resolved']} duplicados, {stats['merged_cells']} celdas combinadas")
+
+
+def test_cleaner_report_and_lean():
+    """DataCleaner informa los duplicados en el reporte y el modo ligero recupera los originales"""
+    print("\n📋 === DEDUPLICACIÓN EN DATACLEANER ===")
+    feed = duplicated_feed()
+    cleaner = DataCleaner(feed)
+    cleaner.clean_duplicates(policy='merge')
+    cleaned = cleaner.clean_data(strategy='fill_mean')
+    summary = CleaningReport(cleaner.original_data, cleaned, cleaner.dedup_stats).get_cleaning_summary()
+    assert summary['duplicates_resolved'] == len(feed) - len(cleaned) == 350
+    assert CleaningReport(feed, feed).get_cleaning_summary()['duplicates_resolved'] == 0
+
+    lean = DataCleaner(feed.copy(), lean=True)
+    lean.clean_duplicates(policy='merge')
+    lean_cleaned = lean.clean_data(strategy='fill_mean')
+    pd.testing.assert_frame_equal(lean_cleaned, cleaned)
+    pd.testing.assert_frame_equal(lean.get_original_data(), feed)
+    print(f"✅ {summary['duplicates_resolved']} duplicados resueltos y originales recuperados")
+
+
+def test_process_csv_file_dedup():
+    """process_csv_file deduplica igual en memoria y por bloques"""
+    print("\n🚀 === process_csv_file CON DEDUP ===")
+    with tempfile.TemporaryDirectory() as work_dir, temporary_cache():
+        source = os.path.join(work_dir, 'feed.csv')
+        duplicated_feed().to_csv(source, index=False)
+        memory = os.path.join(work_dir, 'memoria.csv')
+        chunked = os.path.join(work_dir, 'bloques.csv')
+        assert CSVManager.process_csv_file(source, strategy='fill_zero', quiet=True, output_path=memory,
+                                           dedup='most_complete') == memory
+        assert CSVManager.process_csv_file(source, strategy='fill_zero', chunksize=900, output_path=chunked,
+                                           show_detailed_report=False, dedup='most_complete') == chunked
+        with open(memory, 'rb') as first, open(chunked, 'rb') as second:
+            assert first.read() == second.read()
+        assert sorted(os.listdir(work_dir)) == ['bloques.csv', 'feed.csv', 'memoria.csv']
+        assert not pd.read_csv(memory).duplicated(KEY).any()
+
+        with pytest.raises(ValueError):
+            CSVManager.process_csv_file(source, incremental=True, dedup='latest')
+    print("✅ Resultados idénticos en memoria y por bloques")
+
+
+if __name__ == "__main__":
+    test_policies()
+    test_streaming_matches_memory()
+    test_cleaner_report_and_lean()
+    test_process_csv_file_dedup()
@@ -0,0 +1,293 @@
+"""
+Pruebas de la descarga concurrente desde una API estilo Ergast (ErgastExtract)
+contra un servidor HTTP local que sirve qualifying_results.csv
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pytest
+import requests
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Extract.ErgastExtract import ErgastExtract
+from Extract.Formula1Extract import Formula1Extract
+
+SOURCE = "Sources/qualifying_results.csv"
+SEASONS = [2023, 2024]
+
+
+class StubErgastServer:
+    """
+    Servidor HTTP local con el formato de Ergast construido a partir del CSV.
+
+    Permite simular fallos: `failures` indica cuántas veces debe fallar cada
+    ruta (con `failure_status`) antes de responder bien. Registra las
+    peticiones recibidas y el máximo de peticiones atendidas a la vez.
+
+    Con `validators` ('etag' o 'last-modified') envía el validador de cada
+    respuesta y contesta 304 a las peticiones condicionales que coinciden.
+    """
+
+    LAST_MODIFIED = 'Mon, 01 Jan 2024 00:00:00 GMT'
+
+    def __init__(self, data, delay=0.0, failures=None, failure_status=503, validators=None):
+        self.data = data
+        self.validators = validators
+        self.not_modified = 0
+        self.delay = delay
+        self.failures = dict(failures or {})
+        self.failure_status = failure_status
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}/api/f1"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _races(self, path):
+        """Carreras (en formato Ergast) y elementos paginables de una ruta."""
+        parts = path[len('/api/f1/'):].removesuffix('.json').split('/')
+        if len(parts) == 1:
+            season = self.data[self.data['Season'] == int(parts[0])]
+            rounds = season.drop_duplicates('Round')
+            races = [{'season': str(row.Season), 'round': str(row.Round),
+                      'Circuit': {'circuitId': row.CircuitID}} for row in rounds.itertuples()]
+            return None, races
+        if len(parts) == 3 and parts[2] == 'qualifying':
+            race = self.data[(self.data['Season'] == int(parts[0])) & (self.data['Round'] == int(parts[1]))]
+            return race, None
+        return None, None
+
+    @staticmethod
+    def _result(row):
+        driver = {'driverId': row.DriverID, 'givenName': row.GivenName, 'familyName': row.FamilyName,
+                  'dateOfBirth': row.DateOfBirth, 'nationality': row.Nationality}
+        if isinstance(row.Code, str):
+            driver['code'] = row.Code
+        if row.PermanentNumber:
+            driver['permanentNumber'] = str(row.PermanentNumber)
+        result = {'number': '1', 'position': str(row.Position), 'Driver': driver,
+                  'Constructor': {'constructorId': row.ConstructorID, 'name': row.ConstructorName,
+                                  'nationality': row.ConstructorNationality}}
+        for session in ('Q1', 'Q2', 'Q3'):
+            if getattr(row, session) != '0':
+                result[session] = getattr(row, session)
+        return result
+
+    def respond(self, path, query):
+        """Devuelve (estado, cuerpo) de una petición."""
+        with self._lock:
+            self.requests.append((path, query.get('offset', ['0'])[0]))
+            remaining = self.failures.get(path, 0)
+            if remaining:
+                self.failures[path] = remaining - 1
+                return self.failure_status, {}
+
+        limit, offset = int(query.get('limit', ['30'])[0]), int(query.get('offset', ['0'])[0])
+        race, races = self._races(path)
+        if race is None and races is None:
+            return 404, {}
+        if races is not None:
+            items = races
+            total = len(races)
+            page = races[offset:offset + limit]
+        else:
+            rows = list(race.itertuples())
+            total = len(rows)
+            page = []
+            if rows and offset < total:
+                first = rows[0]
+                page = [{'season': str(first.Season), 'round': str(first.Round),
+                         'Circuit': {'circuitId': first.CircuitID},
+                         'QualifyingResults': [self._result(row) for row in rows[offset:offset + limit]]}]
+        return 200, {'MRData': {'limit': str(limit), 'offset': str(offset), 'total': str(total),
+                                'RaceTable': {'Races': page}}}
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with stub._lock:
+                    stub.active += 1
+                    stub.max_active = max(stub.max_active, stub.active)
+                try:
+                    if stub.delay:
+                        time.sleep(stub.delay)
+                    url = urlparse(self.path)
+                    status, body = stub.respond(url.path, parse_qs(url.query))
+                finally:
+                    with stub._lock:
+                        stub.active -= 1
+                payload = json.dumps(body).encode('utf-8')
+                validator = None
+                if status == 200 and stub.validators == 'etag':
+                    validator = ('ETag', f'"{hashlib.sha1(payload).hexdigest()}"', 'If-None-Match')
+                elif status == 200 and stub.validators == 'last-modified':
+                    validator = ('Last-Modified', stub.LAST_MODIFIED, 'If-Modified-Since')
+                if validator is not None and self.headers.get(validator[2]) == validator[1]:
+                    with stub._lock:
+                        stub.not_modified += 1
+                    self.send_response(304)
+                    self.send_header(validator[0], validator[1])
+                    self.end_headers()
+                    return
+
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                if validator is not None:
+                    self.send_header(validator[0], validator[1])
+                self.send_header('Content-Length', str(len(payload)))
+                if status == 429:
+                    self.send_header('Retry-After', '0')
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def expected_rows():
+    data = pd.read_csv(SOURCE)
+    return data[data['Season'].isin(SEASONS)].reset_index(drop=True)
+
+
+def test_extract_matches_csv():
+    """La descarga paginada y concurrente reproduce el CSV original con sus tipos"""
+    print("\n🌐 === DESCARGA CONCURRENTE ===")
+    expected = expected_rows()
+    with StubErgastServer(expected, delay=0.01) as server:
+        extractor = ErgastExtract(server.url, concurrency=4, rate_limit=None, page_size=8)
+        start = time.perf_counter()
+        data = extractor.extract(SEASONS)
+        elapsed = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(data, expected)
+    # Una petición por página de 8 elementos de cada calendario y de cada carrera
+    pages = lambda sizes: int(sum(-(-sizes // 8)))
+    rounds = expected.groupby('Season')['Round'].nunique()
+    assert extractor.requests_made == pages(rounds) + pages(expected.groupby(['Season', 'Round']).size())
+    rounds = rounds.sum()
+    assert 1 < server.max_active <= 4
+    print(f"✅ {len(data)} filas de {rounds} carreras en {elapsed:.2f}s "
+          f"({extractor.requests_made} peticiones, {server.max_active} a la vez)")
+
+
+def test_retries_and_errors():
+    """Los 503/429 y los errores transitorios se reintentan; los 404 fallan al momento"""
+    print("\n🔁 === REINTENTOS ===")
+    expected = expected_rows()
+    failures = {'/api/f1/2023.json': 2, '/api/f1/2024/3/qualifying.json': 1}
+    with StubErgastServer(expected, failures=failures) as server:
+        extractor = ErgastExtract(server.url, rate_limit=None, backoff=0.01)
+        data = extractor.extract(SEASONS)
+    pd.testing.assert_frame_equal(data, expected)
+    assert extractor.retries_made == 3
+
+    with StubErgastServer(expected, failures={'/api/f1/2023.json': 1}, failure_status=429) as server:
+        data = ErgastExtract(server.url, rate_limit=None, backoff=5).extract([2023])
+    assert len(data) == (expected['Season'] == 2023).sum()
+
+    with StubErgastServer(expected, failures={'/api/f1/2023.json': 5}) as server:
+        with pytest.raises(requests.HTTPError):
+            ErgastExtract(server.url, rate_limit=None, retries=2, backoff=0.01).extract([2023])
+
+    with StubErgastServer(expected) as server:
+        extractor = ErgastExtract(server.url + '/missing', rate_limit=None, backoff=0.01)
+        with pytest.raises(requests.HTTPError):
+            extractor.extract([2023])
+        assert extractor.retries_made == 0
+
+    # Sin servidor: errores de conexión, reintentados y después propagados
+    with pytest.raises(requests.ConnectionError):
+        ErgastExtract(server.url, rate_limit=None, retries=1, backoff=0.01, timeout=1).extract([2023])
+    print("✅ Reintentos con espera exponencial correctos")
+
+
+def test_rate_limit():
+    """El límite de ritmo espacia las peticiones tras la ráfaga inicial"""
+    print("\n🚦 === LÍMITE DE RITMO ===")
+    expected = expected_rows()
+    with StubErgastServer(expected) as server:
+        extractor = ErgastExtract(server.url, concurrency=8, rate_limit=50, burst=2, page_size=100)
+        start = time.perf_counter()
+        data = extractor.extract([2023])
+        elapsed = time.perf_counter() - start
+    requests_made = extractor.requests_made
+    assert len(data) == (expected['Season'] == 2023).sum()
+    assert elapsed >= (requests_made - 2) / 50 * 0.9
+    print(f"✅ {requests_made} peticiones en {elapsed:.2f}s (mínimo {(requests_made - 2) / 50:.2f}s)")
+
+
+def test_stream_to_csv():
+    """Las carreras se escriben en el CSV según llegan y Formula1Extract las carga"""
+    print("\n💾 === DESCARGA A CSV ===")
+    expected = expected_rows()
+    with tempfile.TemporaryDirectory() as work_dir, StubErgastServer(expected) as server:
+        csv_path = os.path.join(work_dir, 'descarga', 'qualifying_results.csv')
+        extractor = Formula1Extract(csv_path)
+        assert extractor.download(SEASONS, use_cache=False, base_url=server.url, rate_limit=None) == csv_path
+
+        with open(csv_path, encoding='utf-8') as f, open(SOURCE, encoding='utf-8') as source:
+            assert f.readline() == source.readline()
+        data = extractor.queries(use_cache=False)
+        pd.testing.assert_frame_equal(data, expected)
+
+        empty_path = os.path.join(work_dir, 'vacio.csv')
+        ErgastExtract(server.url, rate_limit=None).extract([1990], csv_path=empty_path)
+        assert list(pd.read_csv(empty_path).columns) == ErgastExtract.COLUMNS
+    print("✅ CSV reconstruido idéntico al original")
+
+
+def test_failed_download_keeps_csv():
+    """Un fallo a mitad de la descarga deja el CSV anterior intacto"""
+    print("\n🛟 === DESCARGA FALLIDA ===")
+    expected = expected_rows()
+    with tempfile.TemporaryDirectory() as work_dir:
+        csv_path = os.path.join(work_dir, 'qualifying_results.csv')
+        shutil.copyfile(SOURCE, csv_path)
+        with open(csv_path, 'rb') as f:
+            original = f.read()
+        with StubErgastServer(expected, failures={'/api/f1/2024/10/qualifying.json': 1},
+                              failure_status=404) as server:
+            with pytest.raises(requests.HTTPError):
+                Formula1Extract(csv_path).download(SEASONS, use_cache=False, base_url=server.url,
+                                                   rate_limit=None, backoff=0.01)
+        with open(csv_path, 'rb') as f:
+            assert f.read() == original
+        assert os.listdir(work_dir) == ['qualifying_results.csv']
+    print("✅ CSV original conservado byte a byte")
+
+
+if __name__ == "__main__":
+    test_extract_matches_csv()
+    test_retries_and_errors()
+    test_rate_limit()
+    test_stream_to_csv()
+    test_failed_download_keeps_csv()
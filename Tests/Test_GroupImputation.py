@@ -0,0 +1,107 @@
+"""
+Pruebas de la imputación por grupos (GroupImputer y estrategias fill_group_*)
+Compara la imputación vectorizada con un cálculo celda a celda en Python
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Clean.cleaner import DataCleaner, GroupImputer
+from Clean.csv_manager import CSVManager
+from Clean.schema import LapTimeParser
+
+SOURCE = "Sources/qualifying_results.csv"
+
+
+def _statistic(values, method, numeric, integer):
+    if len(values) == 0:
+        return None
+    if method == 'mode' or not numeric:
+        return pd.Series(values).mode()[0]
+    value = float(np.mean(values)) if method == 'mean' else float(np.median(values))
+    return round(value) if integer else value
+
+
+def _reference(data, method, levels):
+    """Imputación celda a celda: primer nivel cuyo grupo tiene algún valor."""
+    result = data.copy()
+    for col in data.columns[data.isna().any()]:
+        if any(col in level for level in levels):
+            continue
+        numeric = GroupImputer._is_numeric(data[col])
+        integer = pd.api.types.is_integer_dtype(data[col].dtype)
+        groups = {}
+        for level in levels:
+            keys = list(zip(*(data[key] for key in level))) if level else [()] * len(data)
+            values = {}
+            for key, value in zip(keys, data[col]):
+                if not pd.isna(value):
+                    values.setdefault(key, []).append(value)
+            groups[tuple(level)] = (keys, values)
+        fills = []
+        for position in np.flatnonzero(data[col].isna().to_numpy()):
+            fill = None
+            for level in levels:
+                keys, values = groups[tuple(level)]
+                fill = _statistic(values.get(keys[position], []), method, numeric, integer)
+                if fill is not None:
+                    break
+            fills.append(fill)
+        column = result[col].copy()
+        column.iloc[np.flatnonzero(data[col].isna().to_numpy())] = fills
+        result[col] = column
+    return result
+
+
+def test_group_imputation_matches_reference():
+    """Media, mediana y moda por carrera y por circuito sobre los tiempos en milisegundos"""
+    print("\n🧩 === IMPUTACIÓN POR GRUPOS ===")
+    data = LapTimeParser.parse_columns(CSVManager.load_csv(SOURCE, schema='auto', use_cache=False))
+    for method in GroupImputer.METHODS:
+        for groups in ('race', 'circuit'):
+            result = DataCleaner(data).clean_data(strategy=f'fill_group_{method}', groups=groups)
+            expected = _reference(data, method, GroupImputer.GROUPS[groups])
+            pd.testing.assert_frame_equal(result, expected)
+            assert result.isna().sum().sum() == 0
+            print(f"  ✅ fill_group_{method} ({groups})")
+
+
+def test_fallback_to_wider_groups():
+    """Los grupos completamente nulos usan el siguiente nivel de la jerarquía"""
+    print("\n🧩 === NIVELES MÁS AMPLIOS ===")
+    data = pd.DataFrame({
+        'Season': [2020, 2020, 2020, 2020, 2021, 2021, 2021],
+        'Round': [1, 1, 2, 2, 1, 1, 2],
+        'LapTime': [90.0, 92.0, np.nan, np.nan, 80.0, np.nan, np.nan],
+        'Team': ['a', 'b', np.nan, 'b', np.nan, np.nan, np.nan],
+    })
+    levels = [['Season', 'Round'], ['Season'], []]
+    result = DataCleaner(data).clean_fill_group('mean', levels)
+    # 2020/2 sin tiempos -> media de 2020; 2021/2 -> media de 2021; 2021 sin equipos -> moda global
+    assert result['LapTime'].tolist() == [90.0, 92.0, 91.0, 91.0, 80.0, 80.0, 80.0]
+    assert result['Team'].tolist() == ['a', 'b', 'b', 'b', 'b', 'b', 'b']
+    pd.testing.assert_frame_equal(result, _reference(data, 'mean', levels))
+    print(f"  ✅ Relleno con niveles más amplios: {result['LapTime'].tolist()}")
+
+    # Modo ligero: mismo resultado y los originales se pueden restaurar
+    cleaner = DataCleaner(data.copy(), lean=True)
+    pd.testing.assert_frame_equal(cleaner.clean_fill_group('mean', levels), result)
+    pd.testing.assert_frame_equal(cleaner.get_original_data(), data)
+    print("  ✅ Modo ligero restaurable")
+
+    try:
+        GroupImputer(method='mean', groups='team')
+        raise AssertionError("Se esperaba ValueError")
+    except ValueError as e:
+        print(f"  ✅ Error esperado: {e}")
+
+
+if __name__ == "__main__":
+    test_group_imputation_matches_reference()
+    test_fallback_to_wider_groups()
@@ -0,0 +1,122 @@
+"""
+Pruebas de la caché en disco de las respuestas de la API (HTTPCache)
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from Extract.ErgastExtract import ErgastExtract
+from Extract.HTTPCache import HTTPCache
+from Test_ErgastExtract import StubErgastServer, expected_rows
+
+
+def test_completed_seasons_are_local_reads():
+    """Las temporadas terminadas se sirven desde el disco sin ninguna petición"""
+    print("\n📦 === TEMPORADAS TERMINADAS ===")
+    expected = expected_rows()
+    season = expected[expected['Season'] == 2023].reset_index(drop=True)
+    with tempfile.TemporaryDirectory() as cache_dir, StubErgastServer(expected, validators='etag') as server:
+        cache = HTTPCache(cache_dir)
+        first = ErgastExtract(server.url, rate_limit=None, cache=cache, current_season=2024)
+        pd.testing.assert_frame_equal(first.extract([2023]), season)
+        assert first.requests_made > 0 and first.cache_hits == 0
+
+        received = len(server.requests)
+        second = ErgastExtract(server.url, rate_limit=None, cache=HTTPCache(cache_dir), current_season=2024)
+        start = time.perf_counter()
+        pd.testing.assert_frame_equal(second.extract([2023]), season)
+        elapsed = time.perf_counter() - start
+        assert second.requests_made == 0
+        assert second.cache_hits == first.requests_made
+        assert len(server.requests) == received
+    print(f"✅ {second.cache_hits} respuestas leídas del disco en {elapsed:.3f}s")
+
+
+def test_current_season_is_revalidated():
+    """La temporada actual se revalida con ETag o Last-Modified y detecta cambios"""
+    print("\n🔄 === REVALIDACIÓN DE LA TEMPORADA ACTUAL ===")
+    expected = expected_rows()
+    season = expected[expected['Season'] == 2024].reset_index(drop=True)
+    for validators in ('etag', 'last-modified'):
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                StubErgastServer(season.copy(), validators=validators) as server:
+            cache = HTTPCache(cache_dir)
+            first = ErgastExtract(server.url, rate_limit=None, cache=cache, current_season=2024)
+            first.extract([2024])
+
+            second = ErgastExtract(server.url, rate_limit=None, cache=cache, current_season=2024)
+            pd.testing.assert_frame_equal(second.extract([2024]), season)
+            assert second.requests_made == first.requests_made
+            assert second.revalidated == server.not_modified == first.requests_made
+
+            if validators == 'etag':
+                # Una carrera cambia: solo su respuesta deja de coincidir con el ETag
+                server.data.loc[server.data['Round'] == 3, 'Q1'] = '1:00.000'
+                third = ErgastExtract(server.url, rate_limit=None, cache=cache, current_season=2024)
+                data = third.extract([2024])
+                assert (data.loc[data['Round'] == 3, 'Q1'] == '1:00.000').all()
+                assert third.revalidated == first.requests_made - 1
+    print("✅ Respuestas revalidadas (304) y cambios detectados")
+
+
+def test_finished_season_becomes_immutable():
+    """Al terminar la temporada, la siguiente revalidación marca las entradas como inmutables"""
+    print("\n🏁 === FIN DE TEMPORADA ===")
+    expected = expected_rows()
+    with tempfile.TemporaryDirectory() as cache_dir, StubErgastServer(expected, validators='etag') as server:
+        cache = HTTPCache(cache_dir)
+        ErgastExtract(server.url, rate_limit=None, cache=cache, current_season=2023).extract([2023])
+        revalidation = ErgastExtract(server.url, rate_limit=None, cache=cache, current_season=2024)
+        revalidation.extract([2023])
+        assert revalidation.revalidated == revalidation.requests_made > 0
+
+        local = ErgastExtract(server.url, rate_limit=None, cache=cache, current_season=2024)
+        local.extract([2023])
+        assert local.requests_made == 0
+    print("✅ Entradas de la temporada terminada servidas sin red")
+
+
+def test_keys_and_eviction():
+    """Claves independientes del orden de los parámetros y expulsión LRU por tamaño"""
+    print("\n🧹 === CLAVES Y EXPULSIÓN ===")
+    url = 'http://example.test/api/f1/2020.json'
+    assert HTTPCache.key(url, {'limit': 100, 'offset': 0}) == HTTPCache.key(url, {'offset': '0', 'limit': '100'})
+    assert HTTPCache.key(url, {'offset': 0}) != HTTPCache.key(url, {'offset': 100})
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        body = {'MRData': {'value': 'x' * 1000}}
+        cache = HTTPCache(cache_dir, max_bytes=4000)
+        for offset in range(3):
+            cache.put(url, {'offset': offset}, body, etag=f'"{offset}"', immutable=True)
+        assert len(cache.entries()) == 3
+        assert cache.get(url, {'offset': 1})['etag'] == '"1"'
+        assert HTTPCache.validators(cache.get(url, {'offset': 1})) == {'If-None-Match': '"1"'}
+        assert cache.get(url, {'offset': 9}) is None
+
+        # Último acceso: 0 el más antiguo, después 2 y 1
+        now = time.time()
+        for offset, age in ((0, 30), (2, 20), (1, 10)):
+            os.utime(cache._entry_path(url, {'offset': offset}), (now - age, now - age))
+        cache.put(url, {'offset': 3}, body)
+        assert cache.total_bytes() <= cache.max_bytes
+        assert cache.get(url, {'offset': 0}) is None
+        assert cache.get(url, {'offset': 1}) is not None and cache.get(url, {'offset': 3}) is not None
+
+        cache.clear()
+        assert cache.entries() == [] and cache.total_bytes() == 0
+    print("✅ Claves y expulsión correctas")
+
+
+if __name__ == "__main__":
+    test_completed_seasons_are_local_reads()
+    test_current_season_is_revalidated()
+    test_finished_season_becomes_immutable()
+    test_keys_and_eviction()
@@ -0,0 +1,104 @@
+"""
+Pruebas de la limpieza incremental (IncrementalCleaner)
+Verifica que añadir rondas de forma incremental produce la misma salida que una limpieza completa
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Clean.cleaner import DataCleaner, IncrementalCleaner
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_CSV = os.path.join(PROJECT_ROOT, "Sources", "qualifying_results.csv")
+STRATEGIES = ['remove_rows', 'remove_columns', 'fill_forward', 'fill_mean', 'fill_zero']
+
+
+def _full_clean(csv_path, strategy, threshold):
+    cleaned = DataCleaner(pd.read_csv(csv_path)).clean_data(strategy=strategy, threshold=threshold)
+    return cleaned.to_csv(index=False)
+
+
+def _append_rounds(data, work_dir, strategy, threshold=0.5, drift_tolerance=0.01, rounds=4):
+    """Procesa la temporada base y añade las últimas rondas de una en una."""
+    csv_path = os.path.join(work_dir, 'input.csv')
+    output_path = os.path.join(work_dir, 'input_clean.csv')
+    cleaner = IncrementalCleaner(csv_path, output_path, os.path.join(work_dir, 'state.json'),
+                                 strategy=strategy, threshold=threshold, drift_tolerance=drift_tolerance)
+
+    keys = data[['Season', 'Round']].drop_duplicates()
+    split_keys = [tuple(key) for key in keys.iloc[-rounds:].itertuples(index=False)]
+    is_new = data.set_index(['Season', 'Round']).index.isin(split_keys)
+    data[~is_new].to_csv(csv_path, index=False)
+    modes = [cleaner.run()['mode']]
+
+    for key in split_keys:
+        round_rows = data[(data['Season'] == key[0]) & (data['Round'] == key[1])]
+        round_rows.to_csv(csv_path, mode='a', header=False, index=False)
+        modes.append(cleaner.run()['mode'])
+        with open(output_path, encoding='utf-8') as f:
+            assert f.read() == _full_clean(csv_path, strategy, threshold), f"Salida distinta para '{strategy}'"
+
+    modes.append(cleaner.run()['mode'])
+    return modes
+
+
+def test_incremental_matches_full_clean_on_source():
+    """Añadir rondas al CSV real da la misma salida que limpiarlo completo"""
+    print("\n🏁 === LIMPIEZA INCREMENTAL SOBRE qualifying_results.csv ===")
+    data = pd.read_csv(SOURCE_CSV)
+    for strategy in STRATEGIES:
+        work_dir = tempfile.mkdtemp()
+        try:
+            modes = _append_rounds(data, work_dir, strategy)
+            assert modes[-1] == 'up_to_date'
+            print(f"  ✅ {strategy}: {modes}")
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def test_rebuild_when_statistics_shift():
+    """Cambios de tipos, de medias y de las filas ya procesadas fuerzan la reconstrucción"""
+    print("\n🏁 === RECONSTRUCCIÓN AUTOMÁTICA ===")
+    rng = np.random.default_rng(3)
+    rows = 400
+    data = pd.DataFrame({
+        'Season': np.repeat([2023, 2024], rows // 2),
+        'Round': np.tile(np.repeat(np.arange(1, 11), rows // 20), 2),
+        'LapTime': rng.normal(90.0, 1.0, rows),
+        'Position': rng.integers(1, 21, rows),
+    }).sort_values(['Season', 'Round'], kind='stable').reset_index(drop=True)
+    data.loc[rng.choice(rows, 30, replace=False), 'LapTime'] = np.nan
+    # Las últimas rondas son mucho más lentas: la media global se desplaza
+    data.loc[data.index[-60:], 'LapTime'] += 40
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        modes = _append_rounds(data, work_dir, 'fill_mean', drift_tolerance=0.01, rounds=3)
+        assert 'full' in modes[1:], modes
+        print(f"  ✅ Desplazamiento de la media: {modes}")
+
+        # Una fila ya procesada que cambia obliga a reconstruir
+        csv_path = os.path.join(work_dir, 'input.csv')
+        with open(csv_path, 'r+b') as f:
+            f.seek(len(b'Season,Round,LapTime,Position\n'))
+            f.write(b'2022')
+        cleaner = IncrementalCleaner(csv_path, os.path.join(work_dir, 'input_clean.csv'),
+                                     os.path.join(work_dir, 'state.json'), strategy='fill_mean')
+        result = cleaner.run()
+        assert result['mode'] == 'full'
+        print(f"  ✅ Filas procesadas modificadas: {result['reason']}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_incremental_matches_full_clean_on_source()
+    test_rebuild_when_statistics_shift()
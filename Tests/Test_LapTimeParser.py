@@ -0,0 +1,76 @@
+"""
+Pruebas del conversor vectorizado de tiempos de vuelta (LapTimeParser)
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Clean.cleaner import DataCleaner
+from Clean.csv_manager import CSVManager
+from Clean.schema import LapTimeParser
+
+
+def test_parse_and_format_values():
+    """Formatos válidos, marcadores "0", nulos y valores mal formados"""
+    print("\n⏱️  === CONVERSIÓN DE TIEMPOS ===")
+    times = pd.Series(['1:30.556', '0', None, '10:02.001', '59.999', '1:3.556', '1:60.000', 'Häkkinen', ''])
+    parsed = LapTimeParser.parse(times)
+
+    assert str(parsed.dtype) == 'Int64'
+    assert parsed.tolist() == [90556, pd.NA, pd.NA, 602001, 59999, pd.NA, pd.NA, pd.NA, pd.NA]
+    assert LapTimeParser.format(parsed).tolist() == ['1:30.556', '0', '0', '10:02.001', '0:59.999',
+                                                     '0', '0', '0', '0']
+
+    try:
+        LapTimeParser.parse(times, errors='raise')
+        raise AssertionError("Se esperaba ValueError")
+    except ValueError as e:
+        print(f"  ✅ Error esperado: {e}")
+
+
+def test_round_trip_source_file():
+    """Texto -> milisegundos -> texto reproduce exactamente las columnas originales"""
+    print("\n⏱️  === IDA Y VUELTA SOBRE qualifying_results.csv ===")
+    data = CSVManager.load_csv("Sources/qualifying_results.csv")
+    parsed = LapTimeParser.parse_columns(data)
+
+    for col in LapTimeParser.LAP_TIME_COLUMNS:
+        placeholders = (data[col] == '0').sum()
+        assert parsed[col].isna().sum() == placeholders
+        assert LapTimeParser.format(parsed[col]).equals(data[col])
+        print(f"  ✅ {col}: {placeholders} marcadores convertidos a NA")
+
+    # fill_mean trata ahora los tiempos como numéricos y conserva el tipo entero
+    filled = DataCleaner(parsed).clean_data(strategy='fill_mean')
+    assert str(filled['Q3'].dtype) == 'Int64' and filled['Q3'].notna().all()
+
+
+def test_parse_throughput():
+    """Rendimiento a escala (informativo)"""
+    print("\n⏱️  === RENDIMIENTO ===")
+    data = CSVManager.load_csv("Sources/qualifying_results.csv")
+    times = pd.Series(np.tile(data['Q1'].to_numpy(dtype=object), 2_000_000 // len(data) + 1)[:2_000_000])
+
+    start = time.perf_counter()
+    parsed = LapTimeParser.parse(times)
+    parse_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    LapTimeParser.format(parsed)
+    format_seconds = time.perf_counter() - start
+
+    print(f"  parse: {len(times) / parse_seconds / 1e6:.1f} M celdas/s")
+    print(f"  format: {len(times) / format_seconds / 1e6:.1f} M celdas/s")
+
+
+if __name__ == "__main__":
+    test_parse_and_format_values()
+    test_round_trip_source_file()
+    test_parse_throughput()
@@ -0,0 +1,70 @@
+"""
+Pruebas del modo ligero de limpieza (en el sitio con CleaningSnapshot)
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Clean.cleaner import DataCleaner, CleaningSnapshot
+from Clean.csv_manager import CSVManager
+from Clean.report import CleaningReport
+from Extract.Formula1Extract import Formula1Extract
+
+STRATEGY_CHAINS = [
+    ['remove_rows'],
+    ['remove_columns'],
+    ['fill_forward'],
+    ['fill_mean'],
+    ['fill_zero'],
+    ['fill_zero', 'remove_columns'],
+    ['remove_columns', 'fill_mean', 'remove_rows'],
+]
+
+
+def test_lean_matches_copying_cleaner():
+    """Mismo resultado, mismo reporte y datos originales recuperables sin copias"""
+    print("\n🪶 === MODO LIGERO ===")
+    for schema in (None, 'auto'):
+        original = CSVManager.load_csv("Sources/qualifying_results.csv", schema=schema, use_cache=False)
+
+        for chain in STRATEGY_CHAINS:
+            reference = DataCleaner(original)
+            data = original.copy()
+            lean = DataCleaner(data, lean=True)
+            assert isinstance(lean.original_data, CleaningSnapshot)
+
+            for strategy in chain:
+                expected = reference.clean_data(strategy=strategy, threshold=0.05)
+                cleaned = lean.clean_data(strategy=strategy, threshold=0.05)
+
+            pd.testing.assert_frame_equal(cleaned, expected)
+            assert (CleaningReport(lean.original_data, cleaned).get_cleaning_summary()
+                    == CleaningReport(reference.original_data, expected).get_cleaning_summary())
+
+            pd.testing.assert_frame_equal(lean.get_original_data(), original)
+            pd.testing.assert_frame_equal(lean.reset_data(), original)
+            print(f"  ✅ {schema or 'sin esquema'}: {' -> '.join(chain)}")
+
+
+def test_formula1_extract_lean():
+    """Formula1Extract solo conserva la instantánea de los datos originales"""
+    print("\n🪶 === FORMULA1EXTRACT LIGERO ===")
+    extractor = Formula1Extract(CSVManager.get_input_path("Sources/qualifying_results.csv"))
+    original = extractor.queries(use_cache=False).copy()
+    cleaned = extractor.clean_data(strategy='fill_mean', lean=True)
+
+    assert isinstance(extractor.data, CleaningSnapshot)
+    assert extractor.data.shape == original.shape
+    assert cleaned.isnull().sum().sum() == 0
+    pd.testing.assert_frame_equal(extractor.get_original_data(), original)
+    print(f"  ✅ Registro de cambios: {extractor.data.nbytes} bytes")
+
+
+if __name__ == "__main__":
+    test_lean_matches_copying_cleaner()
+    test_formula1_extract_lean()
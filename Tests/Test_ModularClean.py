@@ -15,6 +15,8 @@ from Clean.analyzer import DataAnalyzer
 from Clean.cleaner import DataCleaner  
 from Clean.report import CleaningReport
 from Clean.csv_manager import CSVManager
+from Clean.DataClean import DataClean
+from Extract.Formula1Extract import Formula1Extract
 
 def test_modular_clean():
     """Ejemplo paso a paso usando cada módulo por separado"""
@@ -107,6 +109,20 @@ def test_uso_directo():
     else:
         print("❌ Error en procesamiento")
 
+def test_dataclean_silent_by_default(capsys):
+    """DataClean y Formula1Extract no muestran los consejos de migración salvo con verbose"""
+    data = pd.read_csv("Sources/qualifying_results.csv")
+    DataClean(data).clean_data('fill_zero')
+    extractor = Formula1Extract("Sources/qualifying_results.csv")
+    extractor.queries(use_cache=False)
+    extractor.clean_data()
+    assert 'Consejo' not in capsys.readouterr().out
+
+    DataClean(data, verbose=True)
+    assert 'Consejo' in capsys.readouterr().out
+    print("✅ Sin consejos por defecto")
+
+
 if __name__ == "__main__":
     # Ejecutar ejemplos
     test_modular_clean()
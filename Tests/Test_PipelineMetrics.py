@@ -0,0 +1,87 @@
+"""
+Pruebas de la instrumentación por etapas (PipelineMetrics)
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Clean.csv_manager import CSVManager
+from Clean.metrics import PipelineMetrics
+
+SOURCE = "Sources/qualifying_results.csv"
+
+
+def test_process_csv_file_metrics():
+    """process_csv_file devuelve las métricas de cada etapa y las exporta como JSON lines"""
+    print("\n⏱️  === MÉTRICAS DE process_csv_file ===")
+    received = []
+    metrics = PipelineMetrics(hooks=[received.append], context={'run': 'test'})
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        metrics_path = os.path.join(work_dir, 'metrics.jsonl')
+        output_path, result = CSVManager.process_csv_file(SOURCE, strategy='remove_rows', metrics=metrics,
+                                                          metrics_path=metrics_path,
+                                                          output_path=os.path.join(work_dir, 'out.csv'))
+        assert os.path.exists(output_path)
+        assert result is metrics
+
+        names = [stage.name for stage in metrics.stages]
+        assert names == ['load', 'preview', 'analysis', 'clean.remove_rows', 'clean', 'report', 'save']
+        assert [stage.name for stage in received] == names
+
+        load, clean, strategy = metrics.get('load'), metrics.get('clean'), metrics.get('clean.remove_rows')
+        assert load.rows_out == 8918
+        assert strategy.parent == 'clean' and strategy.rows_in == 8918 and strategy.rows_out == clean.rows_out
+        assert clean.wall_seconds >= strategy.wall_seconds
+        assert all(stage.memory_delta_mb is not None and stage.cpu_seconds >= 0 for stage in metrics.stages)
+        assert metrics.total_seconds == sum(s.wall_seconds for s in metrics.stages if s.parent is None)
+
+        with open(metrics_path, encoding='utf-8') as f:
+            lines = [json.loads(line) for line in f]
+        assert [line['stage'] for line in lines] == names
+        assert all(line['run_id'] == metrics.run_id and line['run'] == 'test' for line in lines)
+        assert lines[0]['file'] == SOURCE and lines[0]['strategy'] == 'remove_rows'
+        print(f"  ✅ {len(lines)} etapas medidas y exportadas ({metrics.total_seconds:.3f}s)")
+
+        # Sin métricas se mantiene el valor de retorno original
+        assert isinstance(CSVManager.process_csv_file(SOURCE, show_detailed_report=False,
+                                                      output_path=os.path.join(work_dir, 'out.csv')), str)
+    print("  ✅ Sin métricas devuelve solo la ruta")
+
+
+def test_nested_memory_and_disabled_overhead():
+    """El pico de memoria de las etapas anidadas llega a la etapa padre; desactivadas no miden nada"""
+    print("\n⏱️  === MEMORIA Y SOBRECOSTE ===")
+    metrics = PipelineMetrics()
+    with metrics.stage('outer'):
+        with metrics.stage('inner') as inner:
+            block = np.ones(8 * 1024 ** 2)  # 64 MB
+            inner.rows_out = len(block)
+            del block
+        small = np.ones(1024)
+    assert metrics.get('inner').memory_delta_mb > 60
+    assert metrics.get('outer').memory_delta_mb > 60
+    assert metrics.get('inner').parent == 'outer'
+    print(f"  ✅ Pico anidado: {metrics.get('outer').memory_delta_mb:.1f} MB")
+
+    disabled = PipelineMetrics.DISABLED
+    start = time.perf_counter()
+    for _ in range(100_000):
+        with disabled.stage('noop') as stage:
+            stage.rows_out = 1
+    elapsed = time.perf_counter() - start
+    assert disabled.stages == [] and elapsed < 1.0
+    print(f"  ✅ 100.000 etapas desactivadas en {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    test_process_csv_file_metrics()
+    test_nested_memory_and_disabled_overhead()
@@ -0,0 +1,96 @@
+"""
+Pruebas de las estadísticas de clasificación (QualifyingAnalytics)
+Compara los resultados vectorizados con cálculos fila a fila en Python
+"""
+
+import os
+import sys
+import time
+from collections import Counter
+
+import pandas as pd
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Clean.analytics import QualifyingAnalytics
+from Clean.schema import LapTimeParser
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_CSV = os.path.join(PROJECT_ROOT, "Sources", "qualifying_results.csv")
+
+
+def _knockout_best(row):
+    """Mejor tiempo de la sesión más avanzada con tiempo (Q3, Q2 o Q1)."""
+    for session in ('Q3', 'Q2', 'Q1'):
+        if not pd.isna(row[session]):
+            return row[session]
+    return None
+
+
+def test_statistics_match_python_loops():
+    """Poles, duelos y diferencia con la pole coinciden con bucles fila a fila"""
+    print("\n📊 === ESTADÍSTICAS DE CLASIFICACIÓN ===")
+    data = pd.read_csv(SOURCE_CSV)
+
+    start = time.perf_counter()
+    analytics = QualifyingAnalytics(data)
+    poles = analytics.poles()
+    duels = analytics.teammate_head_to_head()
+    gaps = analytics.gap_to_pole()
+    print(f"  ⏱️  Historial completo ({len(data)} filas) en {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    # Poles
+    expected_poles = Counter(row.DriverID for row in data.itertuples() if row.Position == 1)
+    assert poles.to_dict() == dict(expected_poles)
+    print(f"  ✅ Poles: {poles.index[0]} ({poles.iloc[0]})")
+
+    # Duelos entre compañeros
+    expected_duels = Counter()
+    for _, grid in data.groupby(['Season', 'Round', 'ConstructorID']):
+        rows = list(grid[['DriverID', 'Position']].itertuples(index=False))
+        for a in rows:
+            for b in rows:
+                if a.DriverID < b.DriverID:
+                    expected_duels[(a.DriverID, b.DriverID, 'races')] += 1
+                    expected_duels[(a.DriverID, b.DriverID, 'wins')] += int(a.Position < b.Position)
+    for row in duels.itertuples():
+        assert row.Races == expected_duels[(row.DriverA, row.DriverB, 'races')]
+        assert row.WinsA == expected_duels[(row.DriverA, row.DriverB, 'wins')]
+        assert row.WinsA + row.WinsB == row.Races
+    assert duels['Races'].sum() == sum(v for k, v in expected_duels.items() if k[2] == 'races')
+    top = duels.iloc[0]
+    print(f"  ✅ Duelos: {top.DriverA} {top.WinsA}-{top.WinsB} {top.DriverB}")
+
+    # Diferencia con la pole según el formato eliminatorio
+    times = LapTimeParser.parse_columns(data)
+    best = times.apply(_knockout_best, axis=1)
+    pole_times = {}
+    for row, value in zip(times.itertuples(), best):
+        if row.Position == 1:
+            pole_times[(row.Season, row.Round)] = value
+    for row, value, gap in zip(times.itertuples(), best, gaps['PoleGap']):
+        pole = pole_times.get((row.Season, row.Round))
+        if pd.isna(value) or pole is None or pd.isna(pole):
+            assert pd.isna(gap)
+        else:
+            assert gap == value - pole
+    q1_min = times.groupby(['Season', 'Round'])['Q1'].transform('min')
+    pd.testing.assert_series_equal(gaps['Q1Gap'], times['Q1'] - q1_min, check_names=False)
+    assert (gaps.loc[gaps['Position'] == 1, 'PoleGap'].dropna() == 0).all()
+    print(f"  ✅ Diferencia con la pole: mediana {gaps['PoleGapPercentage'].median():.3f}%")
+
+
+def test_missing_columns():
+    """Sin las columnas necesarias se lanza ValueError"""
+    print("\n📊 === COLUMNAS NECESARIAS ===")
+    try:
+        QualifyingAnalytics(pd.DataFrame({'Season': [2024], 'Round': [1]}))
+        raise AssertionError("Se esperaba ValueError")
+    except ValueError as e:
+        print(f"  ✅ Error esperado: {e}")
+
+
+if __name__ == "__main__":
+    test_statistics_match_python_loops()
+    test_missing_columns()
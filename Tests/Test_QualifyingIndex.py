@@ -0,0 +1,86 @@
+"""
+Pruebas de las consultas indexadas (QualifyingIndex y Formula1Extract.query)
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Clean.csv_manager import CSVManager
+from Extract.Formula1Extract import Formula1Extract
+from Extract.QualifyingIndex import QualifyingIndex
+
+SOURCE = "Sources/qualifying_results.csv"
+
+
+def _mask_query(data, season=None, round=None, driver=None, constructor=None, circuit=None):
+    mask = pd.Series(True, index=data.index)
+    if season is not None:
+        first, last = season if isinstance(season, tuple) else (season, season)
+        mask &= data['Season'].between(first, last)
+    if round is not None:
+        first, last = round if isinstance(round, tuple) else (round, round)
+        mask &= data['Round'].between(first, last)
+    for col, value in (('DriverID', driver), ('ConstructorID', constructor), ('CircuitID', circuit)):
+        if value is not None:
+            mask &= data[col].isin(value if isinstance(value, list) else [value])
+    return data[mask]
+
+
+def test_queries_match_boolean_masks():
+    """Consultas puntuales, por rango y combinadas, con datos ordenados y desordenados"""
+    print("\n🗂️  === CONSULTAS INDEXADAS ===")
+    data = CSVManager.load_csv(SOURCE, use_cache=False)
+    queries = [
+        {'season': 2010, 'round': 3},
+        {'season': 2021, 'round': (5, 9)},
+        {'season': (2005, 2008)},
+        {'driver': 'hamilton'},
+        {'driver': ['alonso', 'raikkonen', 'unknown']},
+        {'season': 2012, 'constructor': 'ferrari'},
+        {'season': (2014, 2020), 'driver': 'hamilton', 'circuit': 'monza'},
+        {'season': 1990},
+        {'driver': 'unknown'},
+    ]
+    for frame in (data, data.sample(frac=1, random_state=7)):
+        index = QualifyingIndex(frame)
+        for filters in queries:
+            pd.testing.assert_frame_equal(index.query(**filters), _mask_query(frame, **filters))
+        print(f"  ✅ {len(queries)} consultas correctas (ordenado: {index.is_clustered})")
+
+    # Los rangos de temporada/ronda sobre datos ordenados son vistas
+    grid = QualifyingIndex(data).grid(2010, 3)
+    assert np.shares_memory(grid['Season'].to_numpy(), data['Season'].to_numpy())
+
+    try:
+        QualifyingIndex(data).query(round=3)
+        raise AssertionError("Se esperaba ValueError")
+    except ValueError as e:
+        print(f"  ✅ Error esperado: {e}")
+
+
+def test_formula1_extract_query():
+    """Formula1Extract construye el índice en la primera consulta y lo renueva al limpiar"""
+    print("\n🗂️  === FORMULA1EXTRACT.QUERY ===")
+    extractor = Formula1Extract(CSVManager.get_input_path(SOURCE))
+    extractor.queries(use_cache=False)
+
+    history = extractor.query(driver='vettel', season=(2010, 2013))
+    assert extractor.index is not None
+    assert len(history) == len(_mask_query(extractor.data, season=(2010, 2013), driver='vettel'))
+
+    extractor.clean_data(strategy='remove_rows')
+    assert extractor.index is None
+    cleaned_history = extractor.query(driver='vettel', season=(2010, 2013))
+    assert extractor.index.data is extractor.cleaned_data
+    print(f"  ✅ Vettel 2010-2013: {len(history)} filas originales, {len(cleaned_history)} limpias")
+
+
+if __name__ == "__main__":
+    test_queries_match_boolean_masks()
+    test_formula1_extract_query()
@@ -0,0 +1,148 @@
+"""
+Pruebas del almacenamiento en SQLite (SQLiteStorage) y de su uso desde CSVManager
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Clean.cleaner import DataCleaner
+from Clean.csv_manager import CSVManager
+from Clean.schema import LapTimeParser
+from Clean.storage import SQLiteStorage
+
+SOURCE = "Sources/qualifying_results.csv"
+KEY = ['Season', 'Round', 'DriverID']
+
+
+def sorted_rows(data):
+    return data.sort_values(KEY, ignore_index=True)
+
+
+def test_bulk_load_and_indexes():
+    """La carga por lotes conserva los datos y crea la clave y los índices"""
+    print("\n🗄️  === CARGA EN SQLITE ===")
+    data = pd.read_csv(SOURCE)
+    with tempfile.TemporaryDirectory() as work_dir:
+        storage = SQLiteStorage(os.path.join(work_dir, 'f1.db'), batch_size=1000)
+        stats = storage.write(data, mode='replace')
+        assert stats['rows'] == len(data) and stats['batches'] == 9
+        assert stats['rows_per_second'] > 0
+        assert storage.count() == len(data)
+
+        indexes = storage.index_names()
+        for name in ('idx_qualifying_results_Season_Round', 'idx_qualifying_results_DriverID',
+                     'idx_qualifying_results_ConstructorID'):
+            assert name in indexes
+        with sqlite3.connect(storage.db_path) as connection:
+            plan = connection.execute('EXPLAIN QUERY PLAN SELECT * FROM qualifying_results '
+                                      'WHERE "DriverID" = ?', ('hamilton',)).fetchall()
+        assert 'idx_qualifying_results_DriverID' in str(plan)
+
+        stored = sorted_rows(storage.read())
+        pd.testing.assert_frame_equal(stored, sorted_rows(data))
+
+        grid = storage.query(season=2024, round=np.int64(1))
+        expected = data[(data['Season'] == 2024) & (data['Round'] == 1)].reset_index(drop=True)
+        pd.testing.assert_frame_equal(grid, expected)
+        assert len(storage.query(driver='hamilton', constructor='mercedes')) == \
+            ((data['DriverID'] == 'hamilton') & (data['ConstructorID'] == 'mercedes')).sum()
+        print(f"✅ {stats['rows']} filas en {stats['batches']} lotes ({stats['rows_per_second']:,.0f} filas/s)")
+
+
+def test_upsert_and_transactions():
+    """El upsert actualiza por (Season, Round, DriverID) y cada lote es atómico"""
+    print("\n🔁 === UPSERT ===")
+    data = pd.read_csv(SOURCE)
+    with tempfile.TemporaryDirectory() as work_dir:
+        storage = SQLiteStorage(os.path.join(work_dir, 'f1.db'))
+        storage.write(data[data['Season'] < 2024], mode='replace')
+
+        # Se recarga 2023 con un cambio y se añade 2024
+        update = data[data['Season'] >= 2023].copy()
+        update.loc[update['Season'] == 2023, 'Q1'] = '1:11.111'
+        storage.write(update)
+        assert storage.count() == len(data)
+        season_2023 = storage.query(season=2023)
+        assert (season_2023['Q1'] == '1:11.111').all()
+        assert len(storage.query(season=2024)) == (data['Season'] == 2024).sum()
+
+        # append solo inserta: el lote con claves repetidas falla y se deshace entero
+        with pytest.raises(sqlite3.IntegrityError):
+            storage.write(data[data['Season'] == 2024], mode='append')
+        assert storage.count() == len(data)
+
+        with pytest.raises(ValueError):
+            storage.write(data, mode='merge')
+
+        # Filas con la clave nula: se rechazan antes de escribir y la columna es NOT NULL
+        keyed = SQLiteStorage(os.path.join(work_dir, 'clave.db'))
+        partial = data.head(3).copy()
+        partial.loc[1, 'DriverID'] = np.nan
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                keyed.write(partial)
+        keyed.write(data.head(3))
+        keyed.write(data.head(3))
+        assert keyed.count() == 3
+        connection = keyed.connect()
+        try:
+            with pytest.raises(sqlite3.IntegrityError):
+                connection.execute(f"INSERT INTO {keyed.table} (Season, Round) VALUES (2030, 1)")
+        finally:
+            connection.close()
+    print("✅ Upsert y transacciones correctos")
+
+
+def test_typed_columns():
+    """Categóricas, fechas y enteros con nulos se guardan con su tipo SQL y los nulos como NULL"""
+    print("\n🔤 === TIPOS ===")
+    data = LapTimeParser.parse_columns(CSVManager.load_csv(SOURCE, schema='auto', use_cache=False))
+    with tempfile.TemporaryDirectory() as work_dir:
+        storage = SQLiteStorage(os.path.join(work_dir, 'f1.db'))
+        storage.write(data, mode='replace')
+        with sqlite3.connect(storage.db_path) as connection:
+            types = {row[1]: row[2] for row in connection.execute('PRAGMA table_info(qualifying_results)')}
+            nulls = connection.execute('SELECT COUNT(*) FROM qualifying_results WHERE "Q3" IS NULL').fetchone()[0]
+            date = connection.execute('SELECT "DateOfBirth" FROM qualifying_results LIMIT 1').fetchone()[0]
+        assert types['Season'] == 'INTEGER' and types['DriverID'] == 'TEXT' and types['Q1'] == 'INTEGER'
+        assert types['DateOfBirth'] == 'TEXT' and date == '1968-09-28'
+        assert nulls == data['Q3'].isna().sum()
+    print("✅ Tipos y nulos correctos")
+
+
+def test_process_csv_file_to_sqlite():
+    """process_csv_file carga en SQLite en memoria y por bloques con el mismo resultado"""
+    print("\n🚀 === process_csv_file -> SQLITE ===")
+    with tempfile.TemporaryDirectory() as work_dir:
+        memory_path = os.path.join(work_dir, 'memoria.db')
+        assert CSVManager.process_csv_file(SOURCE, strategy='fill_mean', quiet=True,
+                                           storage=memory_path) == memory_path
+        chunked = SQLiteStorage(os.path.join(work_dir, 'bloques.db'), batch_size=500)
+        assert CSVManager.process_csv_file(SOURCE, strategy='fill_mean', chunksize=1000,
+                                           show_detailed_report=False, storage=chunked) == chunked.db_path
+
+        expected = DataCleaner(pd.read_csv(SOURCE)).clean_data(strategy='fill_mean')
+        memory = sorted_rows(SQLiteStorage(memory_path).read())
+        pd.testing.assert_frame_equal(memory, sorted_rows(expected))
+        pd.testing.assert_frame_equal(sorted_rows(chunked.read()), memory)
+        assert chunked.last_load['rows'] == len(expected)
+
+        with pytest.raises(ValueError):
+            CSVManager.process_csv_file(SOURCE, incremental=True, storage=memory_path)
+    print("✅ Resultados idénticos en memoria y por bloques")
+
+
+if __name__ == "__main__":
+    test_bulk_load_and_indexes()
+    test_upsert_and_transactions()
+    test_typed_columns()
+    test_process_csv_file_to_sqlite()
@@ -0,0 +1,124 @@
+"""
+Pruebas del análisis aproximado por muestreo (SampledAnalyzer)
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from Clean.analyzer import DataAnalyzer, SampledAnalyzer
+from Test_CLI import run_cli
+
+SOURCE = "Sources/qualifying_results.csv"
+
+
+def write_large_csv(path, copies=20):
+    """Datos reales repetidos con nulos aleatorios en Q1 y PermanentNumber."""
+    data = pd.concat([pd.read_csv(SOURCE, dtype=str)] * copies, ignore_index=True)
+    rng = np.random.default_rng(7)
+    data.loc[rng.random(len(data)) < 0.05, 'Q1'] = np.nan
+    data.loc[rng.random(len(data)) < 0.3, 'PermanentNumber'] = np.nan
+    data.to_csv(path, index=False)
+    return data
+
+
+def test_exact_when_sample_covers_file():
+    """Con una muestra mayor que el archivo, los resultados coinciden con DataAnalyzer"""
+    print("\n🎯 === MUESTRA COMPLETA ===")
+    analyzer = DataAnalyzer(pd.read_csv(SOURCE))
+    expected = analyzer.analyze_null_values()
+    for method in SampledAnalyzer.METHODS:
+        sampled = SampledAnalyzer(SOURCE, sample_rows=20_000, method=method)
+        info = sampled.analyze_null_values()
+        assert info['exact'] and info['rows_interval'] == (8918, 8918)
+        for key, value in expected.items():
+            assert info[key] == value, (method, key)
+        assert sampled.get_data_quality_score() == pytest.approx(analyzer.get_data_quality_score())
+        assert sampled.quality_interval[0] == sampled.quality_interval[1]
+    print(f"✅ Resultados exactos: {expected['total_null_values']} nulos")
+
+
+def test_estimates_within_intervals():
+    """Las estimaciones por bloques y de reservorio contienen los valores reales"""
+    print("\n📐 === ESTIMACIONES POR MUESTREO ===")
+    with tempfile.TemporaryDirectory() as work_dir:
+        path = os.path.join(work_dir, 'grande.csv')
+        data = write_large_csv(path)
+
+        start = time.perf_counter()
+        full = DataAnalyzer(pd.read_csv(path))
+        expected = full.analyze_null_values()
+        full_seconds = time.perf_counter() - start
+
+        for method in SampledAnalyzer.METHODS:
+            sampled = SampledAnalyzer(path, sample_rows=10_000, method=method, seed=3)
+            info = sampled.analyze_null_values()
+            assert not info['exact'] and info['sampled_rows'] == 10_000
+            assert info['columns_names'] == expected['columns_names']
+            low, high = info['rows_interval']
+            assert low <= len(data) <= high
+            for column, percentage in expected['null_percentages'].items():
+                low, high = info['null_intervals'][column]
+                assert low <= percentage <= high, (method, column)
+            low, high = sampled.quality_interval
+            assert low <= full.get_data_quality_score() <= high
+            assert sampled.get_columns_by_null_percentage(0.2) == ['PermanentNumber']
+
+            # Valores distintos: la muestra da una cota inferior; en columnas de
+            # pocos valores la estimación es exacta
+            distinct = sampled.get_distinct_counts()
+            assert sampled.distinct_in_sample == sampled.sample.nunique().to_dict()
+            assert all(sampled.distinct_in_sample[column] <= distinct[column] for column in data.columns)
+            assert distinct['ConstructorNationality'] == data['ConstructorNationality'].nunique()
+        assert SampledAnalyzer(path, method='reservoir', sample_rows=500).total_rows == len(data)
+
+        block = SampledAnalyzer(path, sample_rows=10_000)
+        assert block.seconds < full_seconds
+        print(f"✅ Muestra en {block.seconds:.3f}s frente a {full_seconds:.3f}s de la carga completa")
+
+        result = run_cli('analyze', path, '--sample', '2000', '-q')
+        assert result.returncode == 0, result.stderr
+        assert '17 columnas' in result.stdout and 'IC' in result.stdout
+        with pytest.raises(ValueError):
+            SampledAnalyzer(path, method='sistemático')
+
+
+def test_distinct_estimates():
+    """Los valores distintos del archivo se estiman a partir de las frecuencias de la muestra"""
+    print("\n🔢 === VALORES DISTINTOS ===")
+    rng = np.random.default_rng(11)
+    rows = 200_000
+    data = pd.DataFrame({'id': np.arange(rows), 'medio': rng.integers(0, 40_000, rows),
+                         'bajo': rng.integers(0, 20, rows)})
+    data['id'] = data['id'].where(rng.random(rows) >= 0.2)
+    expected = data.nunique()
+    with tempfile.TemporaryDirectory() as work_dir:
+        path = os.path.join(work_dir, 'distintos.csv')
+        data.to_csv(path, index=False)
+        for method in SampledAnalyzer.METHODS:
+            sampled = SampledAnalyzer(path, sample_rows=10_000, method=method, seed=5)
+            distinct = sampled.get_distinct_counts()
+            assert sampled.distinct_in_sample['id'] < expected['id'] / 15
+            assert distinct['id'] == pytest.approx(expected['id'], rel=0.05), method
+            assert distinct['medio'] == pytest.approx(expected['medio'], rel=0.25), method
+            assert distinct['bajo'] == expected['bajo']
+            print(f"✅ {method}: {distinct} (reales {expected.to_dict()})")
+
+        # Muestra completa: exactos
+        assert SampledAnalyzer(SOURCE, sample_rows=20_000).get_distinct_counts() == \
+            pd.read_csv(SOURCE, dtype=str).nunique().to_dict()
+
+
+if __name__ == "__main__":
+    test_exact_when_sample_covers_file()
+    test_estimates_within_intervals()
+    test_distinct_estimates()
@@ -0,0 +1,57 @@
+"""
+Pruebas del esquema tipado de qualifying_results
+Verifica los tipos compactos, el ahorro de memoria y que la limpieza no cambie
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Clean.analyzer import DataAnalyzer
+from Clean.cleaner import DataCleaner
+from Clean.csv_manager import CSVManager
+from Clean.schema import SchemaRegistry
+
+SOURCE_CSV = "Sources/qualifying_results.csv"
+STRATEGIES = ['remove_rows', 'remove_columns', 'fill_forward', 'fill_mean', 'fill_zero']
+
+
+def test_schema_load_types():
+    """La carga con esquema usa categóricas, enteros reducidos y fechas"""
+    print("\n🧬 === CARGA CON ESQUEMA ===")
+    data = CSVManager.load_csv(SOURCE_CSV, schema='auto')
+    schema = SchemaRegistry.get('qualifying_results')
+
+    for col in schema.categorical:
+        assert isinstance(data[col].dtype, pd.CategoricalDtype), col
+    for col in schema.integer:
+        assert data[col].dtype.itemsize < 8, col
+    assert pd.api.types.is_datetime64_any_dtype(data['DateOfBirth'])
+
+    stats = DataAnalyzer(data).get_basic_statistics()
+    untyped_memory = pd.read_csv(CSVManager.get_input_path(SOURCE_CSV)).memory_usage(deep=True).sum()
+    assert stats['untyped_memory_usage'] == untyped_memory
+    assert stats['memory_saved'] > 0
+    print(f"Memoria: {stats['memory_usage']} bytes (ahorro {stats['memory_saved_percentage']:.1f}%)")
+
+
+def test_schema_cleaning_output_unchanged():
+    """Todas las estrategias producen el mismo CSV con y sin esquema"""
+    print("\n🧬 === LIMPIEZA CON ESQUEMA ===")
+    untyped = CSVManager.load_csv(SOURCE_CSV)
+    typed = CSVManager.load_csv(SOURCE_CSV, schema='qualifying_results')
+
+    for strategy in STRATEGIES:
+        expected = DataCleaner(untyped).clean_data(strategy).to_csv(index=False)
+        actual = DataCleaner(typed).clean_data(strategy).to_csv(index=False)
+        assert expected == actual, f"Salida distinta para '{strategy}'"
+        print(f"  ✅ {strategy}")
+
+
+if __name__ == "__main__":
+    test_schema_load_types()
+    test_schema_cleaning_output_unchanged()
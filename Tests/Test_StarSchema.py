@@ -0,0 +1,124 @@
+"""
+Pruebas de la exportación en esquema en estrella (StarSchema) y de su recarga
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from Clean.csv_manager import CSVManager
+from Clean.export import StarSchema
+from Clean.schema import LapTimeParser
+from Test_CLI import run_cli
+
+SOURCE = "Sources/qualifying_results.csv"
+
+
+def test_roundtrip_formats():
+    """La recarga reconstruye exactamente los datos en todos los formatos"""
+    print("\n⭐ === ESQUEMA EN ESTRELLA ===")
+    data = pd.read_csv(SOURCE)
+    with tempfile.TemporaryDirectory() as work_dir:
+        for star_format in StarSchema.FORMATS:
+            directory = os.path.join(work_dir, star_format.strip('.'))
+            stats = StarSchema(star_format).write(data, directory)
+            assert stats['tables'] == {'drivers': 122, 'constructors': 38, 'circuits': 38, 'qualifying': len(data)}
+            pd.testing.assert_frame_equal(StarSchema.load(directory), data)
+            print(f"✅ {star_format}: {stats['bytes']} bytes")
+
+        directory = os.path.join(work_dir, 'npz')
+        pd.testing.assert_frame_equal(StarSchema.load(directory, lap_times='ms'), LapTimeParser.parse_columns(data))
+        categorical = StarSchema.load(directory, categorical=True)
+        assert categorical['DriverID'].dtype == 'category'
+        pd.testing.assert_frame_equal(categorical.astype(data.dtypes.to_dict()), data)
+
+        # Tabla de hechos: solo enteros pequeños
+        fact = StarSchema().split(data)[0]['qualifying']
+        assert list(fact.columns) == ['DriverKey', 'ConstructorKey', 'CircuitKey', 'Season', 'Round', 'Position',
+                                      'Q1', 'Q2', 'Q3']
+        assert fact['DriverKey'].dtype == np.int8 and fact['Season'].dtype == np.int16
+        assert all(str(dtype) == 'Int32' for dtype in fact[['Q1', 'Q2', 'Q3']].dtypes)
+        with pytest.raises(ValueError):
+            StarSchema('.parquet')
+
+
+def test_varying_attributes_and_typed_input():
+    """Atributos distintos de un mismo piloto y datos tipados se reconstruyen sin pérdidas"""
+    print("\n🧬 === ATRIBUTOS VARIABLES Y DATOS TIPADOS ===")
+    data = pd.read_csv(SOURCE)
+    data.loc[5, 'PermanentNumber'] = 99
+    data.loc[::11, 'Code'] = np.nan
+    schema_typed = CSVManager.load_csv(SOURCE, schema='auto', use_cache=False)
+    typed = LapTimeParser.parse_columns(schema_typed)
+    with tempfile.TemporaryDirectory() as work_dir:
+        stats = StarSchema().write(data, os.path.join(work_dir, 'variable'))
+        assert stats['tables']['drivers'] > 122
+        pd.testing.assert_frame_equal(StarSchema.load(os.path.join(work_dir, 'variable')), data)
+
+        # Datos tipados (fechas, categóricas, tiempos en ms) en todos los formatos
+        assert schema_typed['DateOfBirth'].dtype == 'datetime64[ns]'
+        for star_format in StarSchema.FORMATS:
+            for name, frame in (('tipado', schema_typed), ('tiempos_ms', typed)):
+                directory = os.path.join(work_dir, name + star_format.replace('.', '_'))
+                StarSchema(star_format).write(frame, directory)
+                pd.testing.assert_frame_equal(StarSchema.load(directory), frame)
+
+        # Nulos reales y tiempos mal formados o no canónicos se conservan tal cual
+        times = pd.read_csv(SOURCE)
+        times.loc[0, 'Q1'] = np.nan
+        times.loc[1, 'Q2'] = 'bad'
+        times.loc[2, 'Q3'] = '01:30.556'
+        for star_format in ('.npz', '.csv'):
+            directory = os.path.join(work_dir, 'tiempos' + star_format.replace('.', '_'))
+            assert StarSchema(star_format).write(times, directory)['tables'][StarSchema.LAP_TIME_TABLE] == 3
+            restored = StarSchema.load(directory)
+            pd.testing.assert_frame_equal(restored, times)
+            assert pd.isna(restored.loc[0, 'Q1']) and restored.loc[1, 'Q2'] == 'bad'
+        pd.testing.assert_frame_equal(StarSchema.load(directory, lap_times='ms'), LapTimeParser.parse_columns(times))
+
+        # Sin columnas de una dimensión: se exporta el resto
+        partial = data.drop(columns=['ConstructorID', 'ConstructorName', 'ConstructorNationality'])
+        assert 'constructors' not in StarSchema().write(partial, os.path.join(work_dir, 'parcial'))['tables']
+        pd.testing.assert_frame_equal(StarSchema.load(os.path.join(work_dir, 'parcial')), partial)
+    print("✅ Reconstrucción exacta")
+
+
+def test_size_and_load_time():
+    """La exportación ocupa mucho menos que el CSV y se recarga más rápido"""
+    print("\n📦 === TAMAÑO Y TIEMPO DE CARGA ===")
+    data = pd.concat([pd.read_csv(SOURCE)] * 10, ignore_index=True)
+    with tempfile.TemporaryDirectory() as work_dir:
+        source = os.path.join(work_dir, 'datos.csv')
+        data.to_csv(source, index=False)
+        directory = os.path.join(work_dir, 'estrella')
+        result = run_cli('export', source, directory, '-q', '--no-cache')
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == directory
+
+        star_bytes = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        assert star_bytes * 3 < os.path.getsize(source)
+
+        start = time.perf_counter()
+        pd.read_csv(source)
+        csv_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        loaded = StarSchema.load(directory, lap_times='ms', categorical=True)
+        star_seconds = time.perf_counter() - start
+        assert len(loaded) == len(data) and star_seconds < csv_seconds
+        print(f"✅ {star_bytes} bytes frente a {os.path.getsize(source)}; "
+              f"carga {star_seconds:.3f}s frente a {csv_seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    test_roundtrip_formats()
+    test_varying_attributes_and_typed_input()
+    test_size_and_load_time()
@@ -0,0 +1,111 @@
+"""
+Pruebas de la evaluación de varias estrategias en paralelo (StrategyEvaluator)
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from Clean.analyzer import DataProfile
+from Clean.cleaner import DataCleaner
+from Clean.csv_manager import CSVManager
+from Clean.evaluation import StrategyEvaluator
+from Clean.report import CleaningReport
+from Test_CLI import run_cli, temporary_cache
+
+SOURCE = "Sources/qualifying_results.csv"
+
+
+def data_with_gaps():
+    """Datos reales con nulos añadidos en tiempos y números para que las estrategias difieran."""
+    data = pd.read_csv(SOURCE)
+    data.loc[::9, 'Q1'] = np.nan
+    data['PermanentNumber'] = data['PermanentNumber'].astype(float)
+    data.loc[::13, 'PermanentNumber'] = np.nan
+    return data
+
+
+def test_matches_individual_runs():
+    """Cada estrategia da el mismo resultado y resumen que un DataCleaner independiente"""
+    print("\n⚖️  === EVALUACIÓN DE ESTRATEGIAS ===")
+    data = data_with_gaps()
+    snapshot = data.copy()
+    evaluator = StrategyEvaluator(workers=3)
+    ranking = evaluator.evaluate(data)
+
+    # La entrada compartida no se modifica
+    pd.testing.assert_frame_equal(data, snapshot)
+    assert [entry['rank'] for entry in ranking] == [1, 2, 3, 4, 5]
+    assert sorted(entry['strategy'] for entry in ranking) == sorted(StrategyEvaluator.STRATEGIES)
+
+    for entry in ranking:
+        expected = DataCleaner(snapshot.copy()).clean_data(strategy=entry['strategy'])
+        pd.testing.assert_frame_equal(evaluator.results[entry['strategy']], expected)
+        summary = CleaningReport(snapshot, expected).get_cleaning_summary()
+        for key in StrategyEvaluator.SUMMARY_KEYS:
+            assert entry[key] == summary[key], (entry['strategy'], key)
+
+    # Orden: más calidad, menos reducción y más nulos eliminados
+    keys = [(-entry['data_quality_score'], entry['data_reduction_percentage'], -entry['nulls_removed'])
+            for entry in ranking]
+    assert keys == sorted(keys)
+    assert StrategyEvaluator.winner(ranking) == ranking[0]['strategy']
+    assert ranking[-1]['strategy'] == 'remove_columns'
+    print(f"✅ Mejor estrategia: {ranking[0]['strategy']}")
+
+
+def test_shared_cleaner_and_errors():
+    """El modo compartido no copia ni modifica la entrada y las estrategias inválidas no rompen el ranking"""
+    print("\n🔗 === ENTRADA COMPARTIDA ===")
+    data = data_with_gaps()
+    # Como en StrategyEvaluator.evaluate: la entrada compartida se registra
+    DataProfile.register(data)
+    DataProfile.of(data)
+    cleaner = DataCleaner(data, shared=True)
+    assert cleaner.original_data is data
+    assert DataProfile.of(cleaner.data).null_mask is DataProfile.of(data).null_mask
+    cleaner.clean_data(strategy='fill_mean')
+    assert data['Q1'].isna().sum() > 0 and cleaner.data['Q1'].isna().sum() == 0
+    with pytest.raises(ValueError):
+        DataCleaner(data, lean=True, shared=True)
+
+    ranking = StrategyEvaluator(['fill_zero', 'no_existe']).evaluate(data)
+    assert ranking[0]['strategy'] == 'fill_zero' and ranking[0]['rank'] == 1
+    assert ranking[1]['rank'] is None and 'no_existe' in ranking[1]['error']
+    assert StrategyEvaluator.winner(StrategyEvaluator(['no_existe']).evaluate(data)) is None
+    print("✅ Entrada intacta y errores aislados")
+
+
+def test_evaluate_strategies_writes_winner():
+    """CSVManager.evaluate_strategies y python -m Clean evaluate guardan solo la mejor estrategia"""
+    print("\n🏆 === GUARDAR LA MEJOR ESTRATEGIA ===")
+    with tempfile.TemporaryDirectory() as work_dir, temporary_cache():
+        source = os.path.join(work_dir, 'datos.csv')
+        data_with_gaps().to_csv(source, index=False)
+        output = os.path.join(work_dir, 'mejor.csv')
+        ranking = CSVManager.evaluate_strategies(source, write_winner=True, output_path=output,
+                                                 show_detailed_report=False)
+        assert ranking[0]['output_path'] == output
+        expected = DataCleaner(pd.read_csv(source)).clean_data(strategy=ranking[0]['strategy'])
+        pd.testing.assert_frame_equal(pd.read_csv(output), expected.reset_index(drop=True), check_dtype=False)
+        assert sorted(os.listdir(work_dir)) == ['datos.csv', 'mejor.csv']
+
+        result = run_cli('evaluate', source, '-s', 'remove_rows', 'fill_zero', '--quiet', '--no-cache')
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.splitlines()[0].startswith('1. fill_zero')
+        assert sorted(os.listdir(work_dir)) == ['datos.csv', 'mejor.csv']
+    print("✅ Solo se guarda la mejor estrategia")
+
+
+if __name__ == "__main__":
+    test_matches_individual_runs()
+    test_shared_cleaner_and_errors()
+    test_evaluate_strategies_writes_winner()
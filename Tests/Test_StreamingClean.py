@@ -0,0 +1,75 @@
+"""
+Pruebas del modo de limpieza por bloques (StreamingCleaner)
+Verifica que la salida por bloques sea idéntica byte a byte a la limpieza en memoria
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Clean.cleaner import DataCleaner, StreamingCleaner
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_CSV = os.path.join(PROJECT_ROOT, "Sources", "qualifying_results.csv")
+STRATEGIES = ['remove_rows', 'remove_columns', 'fill_forward', 'fill_mean', 'fill_zero']
+
+
+def _clean_in_memory(csv_path, output_path, strategy, threshold):
+    cleaner = DataCleaner(pd.read_csv(csv_path))
+    cleaner.clean_data(strategy=strategy, threshold=threshold).to_csv(output_path, index=False)
+
+
+def _assert_identical(csv_path, chunksize, threshold=0.5):
+    with tempfile.TemporaryDirectory() as tmp:
+        for strategy in STRATEGIES:
+            expected_path = os.path.join(tmp, f"{strategy}_memory.csv")
+            streamed_path = os.path.join(tmp, f"{strategy}_chunks.csv")
+
+            _clean_in_memory(csv_path, expected_path, strategy, threshold)
+            stats = StreamingCleaner(csv_path, strategy, threshold, chunksize).clean_to_csv(streamed_path)
+
+            with open(expected_path, 'rb') as expected, open(streamed_path, 'rb') as streamed:
+                assert expected.read() == streamed.read(), f"Salida distinta para '{strategy}'"
+            print(f"  ✅ {strategy} (chunksize={chunksize}): {stats['rows_read']} -> {stats['rows_written']} filas")
+
+
+def test_streaming_matches_in_memory_on_source():
+    """La limpieza por bloques del CSV real coincide con la limpieza en memoria"""
+    print("\n🧪 === LIMPIEZA POR BLOQUES SOBRE qualifying_results.csv ===")
+    for chunksize in (1000, 4096):
+        _assert_identical(SOURCE_CSV, chunksize)
+
+
+def test_streaming_matches_in_memory_on_edge_cases():
+    """Nulos al inicio, enteros con nulos en bloques tardíos y decimales"""
+    print("\n🧪 === LIMPIEZA POR BLOQUES EN CASOS LÍMITE ===")
+    rng = np.random.default_rng(7)
+    rows = 2500
+    data = pd.DataFrame({
+        'Season': rng.integers(2000, 2025, rows),
+        'Position': rng.integers(1, 21, rows).astype('float64'),
+        'LapTime': rng.normal(90.0, 3.0, rows),
+        'Code': rng.choice(['HAM', 'VER', 'LEC', 'NOR'], rows),
+        'Sparse': np.nan,
+    })
+    data.loc[:40, 'Code'] = None
+    data.loc[2300:2310, 'Position'] = np.nan
+    data.loc[rng.choice(rows, 200, replace=False), 'LapTime'] = np.nan
+    data.loc[1800, 'Sparse'] = 3.5
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "edge_cases.csv")
+        data.to_csv(csv_path, index=False)
+        for chunksize in (7, 500, 10_000):
+            _assert_identical(csv_path, chunksize, threshold=0.5)
+
+
+if __name__ == "__main__":
+    test_streaming_matches_in_memory_on_source()
+    test_streaming_matches_in_memory_on_edge_cases()
@@ -0,0 +1,155 @@
+"""
+Pruebas del motor de reglas de validación (RuleEngine) y de las estrategias
+remove_invalid / quarantine_invalid
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from Clean.cleaner import DataCleaner
+from Clean.csv_manager import CSVManager
+from Clean.report import CleaningReport
+from Clean.schema import LapTimeParser
+from Clean.validation import RuleEngine, ValidationRule
+from Test_CLI import temporary_cache
+
+SOURCE = "Sources/qualifying_results.csv"
+
+
+def corrupted_data():
+    """
+    Datos reales con errores inyectados en filas conocidas.
+
+    Returns:
+        tuple: (datos, dict regla -> posiciones de las filas que la incumplen)
+    """
+    data = pd.read_csv(SOURCE)
+    data['Position'] = data['Position'].astype(object)
+    data.loc[10, 'Position'] = 0
+    data.loc[11, 'Position'] = 27
+    data.loc[12, 'Position'] = 'P3'
+    data.loc[20, 'Q1'] = '1:3O.556'
+    data.loc[21, 'Q2'] = '90.5.1'
+    data.loc[30, 'DateOfBirth'] = '2031-01-01'
+    data.loc[31, 'DateOfBirth'] = 'desconocida'
+    mclaren = np.flatnonzero(data['ConstructorID'] == 'mclaren')
+    data.loc[mclaren[5], 'ConstructorName'] = 'Williams'
+    # Una fila con dos violaciones a la vez
+    data.loc[40, 'Position'] = -1
+    data.loc[40, 'Q3'] = 'x'
+    expected = {
+        'position_range': [10, 11, 12, 40],
+        'q1_format': [20],
+        'q2_format': [21],
+        'q3_format': [40],
+        'birth_before_season': [30, 31],
+        'constructor_name': [int(mclaren[5])],
+    }
+    return data, expected
+
+
+def test_rules_and_bitmask():
+    """Cada regla marca exactamente sus filas en su bit de la máscara"""
+    print("\n🚦 === MÁSCARA DE VIOLACIONES ===")
+    data, expected = corrupted_data()
+    engine = RuleEngine()
+    mask, stats = engine.validate(data)
+    assert mask.dtype == np.uint16 and len(mask) == len(data)
+
+    names = [rule.name for rule in engine.rules]
+    for rule, positions in expected.items():
+        bit = np.uint16(1 << names.index(rule))
+        assert list(np.flatnonzero(mask & bit)) == sorted(positions), rule
+    invalid = sorted({position for positions in expected.values() for position in positions})
+    assert list(np.flatnonzero(mask)) == invalid
+    assert stats['rows_invalid'] == len(invalid)
+    assert stats['violations'] == {name: len(expected.get(name, [])) for name in names}
+    assert engine.describe(mask)[40] == 'position_range,q3_format' and engine.describe(mask)[0] == ''
+
+    # Datos limpios y tipados (categóricas, fechas y milisegundos): sin violaciones
+    typed = LapTimeParser.parse_columns(CSVManager.load_csv(SOURCE, schema='auto', use_cache=False))
+    assert engine.validate(typed)[1]['rows_invalid'] == 0
+    assert engine.validate(pd.read_csv(SOURCE))[1]['rows_invalid'] == 0
+    print(f"✅ {stats['rows_invalid']} filas inválidas: {stats['violations']}")
+
+
+def test_custom_rules():
+    """Reglas propias, columnas ausentes y límites del número de reglas"""
+    print("\n🧩 === REGLAS PROPIAS ===")
+    data = pd.DataFrame({'Code': ['HAM', 'ham', None, 'VER1'], 'Season': [2020, 1900, 2021, 2022]})
+    engine = RuleEngine([ValidationRule.pattern('code_format', 'Code', r'[A-Z]{3}'),
+                         ValidationRule.in_range('season_range', 'Season', 1950),
+                         ValidationRule.in_range('position_range', 'Position', 1, 26)])
+    mask, stats = engine.validate(data)
+    assert mask.dtype == np.uint8
+    assert mask.tolist() == [0, 3, 0, 1]
+    assert stats['skipped'] == ['position_range'] and stats['violations']['position_range'] == 0
+
+    with pytest.raises(ValueError):
+        RuleEngine([ValidationRule.in_range('a', 'Season'), ValidationRule.in_range('a', 'Round')])
+    with pytest.raises(ValueError):
+        RuleEngine([ValidationRule.in_range(f'r{i}', 'Season') for i in range(65)])
+    print("✅ Reglas propias correctas")
+
+
+def test_cleaner_strategies():
+    """remove_invalid y quarantine_invalid eliminan las filas y el reporte cuenta las violaciones"""
+    print("\n🧹 === ESTRATEGIAS DE VALIDACIÓN ===")
+    data, expected = corrupted_data()
+    invalid = sorted({position for positions in expected.values() for position in positions})
+
+    cleaner = DataCleaner(data)
+    cleaned = cleaner.clean_data(strategy='remove_invalid')
+    assert len(cleaned) == len(data) - len(invalid) and cleaner.quarantined is None
+
+    quarantine = DataCleaner(data)
+    pd.testing.assert_frame_equal(quarantine.clean_data(strategy='quarantine_invalid'), cleaned)
+    assert list(quarantine.quarantined.index) == invalid
+    assert quarantine.quarantined.loc[40, 'Violations'] == 'position_range,q3_format'
+
+    summary = CleaningReport(cleaner.original_data, cleaned,
+                             validation_stats=cleaner.validation_stats).get_cleaning_summary()
+    assert summary['invalid_rows'] == len(invalid) == summary['rows_removed']
+    assert summary['violations']['position_range'] == 4
+
+    lean = DataCleaner(data.copy(), lean=True)
+    pd.testing.assert_frame_equal(lean.clean_data(strategy='remove_invalid'), cleaned)
+    pd.testing.assert_frame_equal(lean.get_original_data(), data)
+    print(f"✅ {len(invalid)} filas eliminadas o en cuarentena")
+
+
+def test_process_csv_file_quarantine():
+    """process_csv_file guarda las filas en cuarentena junto a la salida"""
+    print("\n🚀 === process_csv_file CON CUARENTENA ===")
+    data, expected = corrupted_data()
+    invalid = {position for positions in expected.values() for position in positions}
+    with tempfile.TemporaryDirectory() as work_dir, temporary_cache():
+        source = os.path.join(work_dir, 'datos.csv')
+        data.to_csv(source, index=False)
+        output = os.path.join(work_dir, 'limpio.csv')
+        assert CSVManager.process_csv_file(source, strategy='quarantine_invalid', quiet=True,
+                                           output_path=output) == output
+        quarantined = pd.read_csv(os.path.join(work_dir, 'limpio_quarantine.csv'))
+        assert len(quarantined) == len(invalid) and 'Violations' in quarantined.columns
+        assert len(pd.read_csv(output)) == len(data) - len(invalid)
+
+        # La estrategia necesita todas las filas: no existe por bloques
+        with pytest.raises(ValueError):
+            CSVManager.process_csv_file(source, strategy='remove_invalid', chunksize=1000, output_path=output)
+    print("✅ Cuarentena guardada")
+
+
+if __name__ == "__main__":
+    test_rules_and_bitmask()
+    test_custom_rules()
+    test_cleaner_strategies()
+    test_process_csv_file_quarantine()
@@ -0,0 +1,164 @@
+"""
+Pruebas de los escritores de salida (CSV comprimido, formato por columnas,
+escritura atómica) y de su uso desde CSVManager
+"""
+
+import gzip
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from Clean.cleaner import DataCleaner
+from Clean.csv_manager import CSVManager
+from Clean.schema import LapTimeParser
+from Clean.writer import CSVWriter, ColumnarWriter, WriterRegistry
+from Test_CLI import temporary_cache
+
+SOURCE = "Sources/qualifying_results.csv"
+
+
+def test_csv_writer_matches_to_csv():
+    """La salida por bloques en paralelo es idéntica a to_csv y la comprimida se lee igual"""
+    print("\n🗜️  === CSV POR BLOQUES Y COMPRIMIDO ===")
+    data = pd.read_csv(SOURCE)
+    with tempfile.TemporaryDirectory() as work_dir:
+        expected = os.path.join(work_dir, 'esperado.csv')
+        data.to_csv(expected, index=False)
+        plain = CSVWriter(workers=3, block_rows=700).write(data, os.path.join(work_dir, 'bloques.csv'))
+        with open(expected, 'rb') as f, open(plain, 'rb') as g:
+            assert f.read() == g.read()
+
+        for compression in CSVWriter.COMPRESSIONS:
+            path = os.path.join(work_dir, f"datos.csv{'.gz' if compression == 'gzip' else '.' + compression}")
+            CSVWriter(compression, workers=3, block_rows=1000).write(data, path)
+            pd.testing.assert_frame_equal(pd.read_csv(path), data)
+            print(f"✅ {compression}: {os.path.getsize(path)} bytes de {os.path.getsize(expected)}")
+        with gzip.open(os.path.join(work_dir, 'datos.csv.gz'), 'rb') as f, open(expected, 'rb') as g:
+            assert f.read() == g.read()
+
+        # Fechas: el formato (solo fecha, segundos, fracciones) se decide con
+        # toda la columna, no bloque a bloque
+        dates = pd.DataFrame({
+            'dia': pd.to_datetime(['2020-01-01', '2020-01-02', '2020-01-01 10:30', None], format='ISO8601'),
+            'fecha': pd.to_datetime(['2020-01-01', '2020-01-02', '2020-01-03', '2020-01-04']),
+            'ms': pd.to_datetime(['2020-01-01', '2020-01-02', '2020-01-01 00:00:00.250', None], format='ISO8601'),
+            'ns': pd.to_datetime(['2020-01-01', None, '2020-01-01', '2020-01-01'])
+            + pd.to_timedelta([0, 0, 0, 7], 'ns'),
+        })
+        for compression in [None, 'gzip']:
+            path = os.path.join(work_dir, 'fechas.csv' + ('.gz' if compression else ''))
+            CSVWriter(compression, workers=2, block_rows=2).write(dates, path)
+            opener = gzip.open if compression else open
+            with opener(path, 'rb') as f:
+                assert f.read() == dates.to_csv(index=False).encode('utf-8')
+        with CSVWriter(block_rows=2).open(os.path.join(work_dir, 'fechas.csv')) as output:
+            output.write(dates.iloc[:3])
+            output.write(dates.iloc[3:])
+        assert pd.read_csv(os.path.join(work_dir, 'fechas.csv'))['dia'].tolist()[:2] == \
+            ['2020-01-01 00:00:00', '2020-01-02 00:00:00']
+
+        empty = CSVWriter().write(data.iloc[:0], os.path.join(work_dir, 'vacio.csv'))
+        assert list(pd.read_csv(empty).columns) == list(data.columns)
+        with pytest.raises(ValueError):
+            CSVWriter('zip')
+
+
+def test_atomic_write():
+    """Un fallo a mitad de escritura conserva el archivo anterior y no deja temporales"""
+    print("\n🛡️  === ESCRITURA ATÓMICA ===")
+    data = pd.read_csv(SOURCE)
+    with tempfile.TemporaryDirectory() as work_dir:
+        path = os.path.join(work_dir, 'salida.csv')
+        CSVWriter().write(data.head(10), path)
+        umask = os.umask(0)
+        os.umask(umask)
+        assert os.stat(path).st_mode & 0o777 == 0o666 & ~umask
+        # La umask vigente al escribir es la que se aplica (no una leída al importar)
+        previous = os.umask(0o027)
+        try:
+            CSVWriter().write(data.head(10), path)
+        finally:
+            os.umask(previous)
+        assert os.stat(path).st_mode & 0o777 == 0o640
+
+        with pytest.raises(RuntimeError):
+            with CSVWriter(block_rows=100).open(path) as output:
+                output.write(data)
+                raise RuntimeError("fallo simulado")
+        assert len(pd.read_csv(path)) == 10
+        assert os.listdir(work_dir) == ['salida.csv']
+
+        with CSVWriter(block_rows=1000).open(path) as output:
+            for start in range(0, len(data), 3000):
+                output.write(data.iloc[start:start + 3000])
+        assert output.rows == len(data) and output.bytes == os.path.getsize(path)
+        pd.testing.assert_frame_equal(pd.read_csv(path), data)
+    print("✅ Archivo anterior intacto tras el fallo")
+
+
+def test_columnar_roundtrip():
+    """El formato por columnas conserva los tipos y el registro elige el escritor por extensión"""
+    print("\n🧱 === FORMATO POR COLUMNAS ===")
+    typed = LapTimeParser.parse_columns(CSVManager.load_csv(SOURCE, schema='auto', use_cache=False))
+    mixed = DataCleaner(pd.read_csv(SOURCE)).clean_data(strategy='fill_zero')
+    with tempfile.TemporaryDirectory() as work_dir:
+        for compress in (False, True):
+            path = ColumnarWriter(compress=compress, workers=2).write(typed, os.path.join(work_dir, 'datos.npz'))
+            pd.testing.assert_frame_equal(ColumnarWriter.read(path), typed)
+
+        # Texto y números mezclados: se guardan como texto, como en un CSV
+        path = ColumnarWriter().write(mixed, os.path.join(work_dir, 'mixto.npz'))
+        restored = ColumnarWriter.read(path)
+        assert restored['Code'].isna().sum() == 0
+        assert (restored['Code'] == mixed['Code'].astype(str)).all()
+
+    assert isinstance(WriterRegistry.for_path('a/b.npz'), ColumnarWriter)
+    assert WriterRegistry.for_path('b.csv.XZ').compression == 'xz'
+    assert WriterRegistry.for_path('b.txt', workers=2).compression is None
+    print("✅ Tipos conservados")
+
+
+def test_csv_manager_outputs():
+    """process_csv_file y save_csv escriben comprimido o por columnas según la extensión"""
+    print("\n🚀 === SALIDAS DE CSVManager ===")
+    data = pd.read_csv(SOURCE)
+    data.loc[::7, 'Q1'] = np.nan
+    with tempfile.TemporaryDirectory() as work_dir, temporary_cache():
+        source = os.path.join(work_dir, 'datos.csv')
+        data.to_csv(source, index=False)
+        plain = CSVManager.process_csv_file(source, strategy='fill_mean', quiet=True,
+                                            output_path=os.path.join(work_dir, 'limpio.csv'))
+        expected = pd.read_csv(plain)
+
+        compressed = CSVManager.process_csv_file(source, strategy='fill_mean', quiet=True,
+                                                 output_path=os.path.join(work_dir, 'limpio.csv.gz'))
+        pd.testing.assert_frame_equal(pd.read_csv(compressed), expected)
+        chunked = CSVManager.process_csv_file(source, strategy='fill_mean', chunksize=2000,
+                                              show_detailed_report=False,
+                                              output_path=os.path.join(work_dir, 'bloques.csv.bz2'))
+        pd.testing.assert_frame_equal(pd.read_csv(chunked), expected)
+
+        columnar = CSVManager.save_csv(expected, os.path.join(work_dir, 'limpio.npz'), show_preview=False)
+        pd.testing.assert_frame_equal(ColumnarWriter.read(columnar), expected)
+
+        with pytest.raises(ValueError):
+            CSVManager.process_csv_file(source, incremental=True, output_path=os.path.join(work_dir, 'x.csv.gz'))
+        with pytest.raises(ValueError):
+            CSVManager.process_csv_file_chunked(source, output_path=os.path.join(work_dir, 'x.npz'),
+                                                show_detailed_report=False)
+    print("✅ Salidas comprimidas iguales a la salida sin comprimir")
+
+
+if __name__ == "__main__":
+    test_csv_writer_matches_to_csv()
+    test_atomic_write()
+    test_columnar_roundtrip()
+    test_csv_manager_outputs()
@@ -1,35 +1,48 @@
-from Extract.Formula1Extract import Formula1Extract
-from Config.Config import Config
-from Clean.csv_manager import CSVManager
-
-# Procesamiento con método legacy (compatibilidad hacia atrás)
-print("🔄 PROCESAMIENTO CON MÉTODO LEGACY")
-print("="*60)
-extractor = Formula1Extract(Config.INPUT)
-
-# Cargar y limpiar datos automáticamente
-extractor.queries()
-extractor.clean_data(strategy='fill_mean')
-
-# Mostrar datos 
-print(extractor.response())
-
-# Procesamiento con nueva arquitectura modular
-print("\n" + "="*60)
-print("🔄 INICIANDO PROCESAMIENTO CON ARQUITECTURA MODULAR")
-print("="*60)
-
-clean_csv_path = CSVManager.process_csv_file(
-    csv_filename=Config.INPUT, 
-    strategy='remove_rows',
-    show_detailed_report=True
-)
-
-if clean_csv_path:
+import sys
+
+
+def main():
+    from Extract.Formula1Extract import Formula1Extract
+    from Config.Config import Config
+    from Clean.csv_manager import CSVManager
+
+    # Procesamiento con método legacy (compatibilidad hacia atrás)
+    print("🔄 PROCESAMIENTO CON MÉTODO LEGACY")
+    print("="*60)
+    extractor = Formula1Extract(Config.INPUT)
+
+    # Cargar y limpiar datos automáticamente
+    extractor.queries(schema='auto')
+    extractor.clean_data(strategy='fill_mean')
+
+    # Mostrar datos 
+    print(extractor.response())
+
+    # Procesamiento con nueva arquitectura modular
     print("\n" + "="*60)
-    print("🎉 ¡Archivo CSV limpio generado exitosamente!")
-    print(f"📁 Ubicación: {clean_csv_path}")
-    print("✅ El archivo ha sido almacenado y está listo para su uso.")
+    print("🔄 INICIANDO PROCESAMIENTO CON ARQUITECTURA MODULAR")
     print("="*60)
-else:
-    print("\n❌ Error: No se pudo generar el archivo CSV limpio.")
\ No newline at end of file
+
+    clean_csv_path = CSVManager.process_csv_file(
+        csv_filename=Config.INPUT, 
+        strategy='remove_rows',
+        show_detailed_report=True,
+        schema='auto'
+    )
+
+    if clean_csv_path:
+        print("\n" + "="*60)
+        print("🎉 ¡Archivo CSV limpio generado exitosamente!")
+        print(f"📁 Ubicación: {clean_csv_path}")
+        print("✅ El archivo ha sido almacenado y está listo para su uso.")
+        print("="*60)
+    else:
+        print("\n❌ Error: No se pudo generar el archivo CSV limpio.")
+
+
+if __name__ == "__main__":
+    # Con argumentos se usa la línea de comandos (python main.py clean archivo.csv ...)
+    if len(sys.argv) > 1:
+        from Clean.__main__ import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+    main()